@@ -0,0 +1,62 @@
+"""Micro-benchmark for compute_answer_id on ~40 KB solutions.
+
+Run from the repository root:
+
+    python benchmarks/bench_answer_id.py
+
+Reported per call: `cold` is a cache miss (canonicalize + SHA-256), `same object`
+a repeat with the identical string object, `equal copy` a repeat with an equal
+string built separately (as when an agent echoes its solution back).
+"""
+
+from __future__ import annotations
+
+import random
+import sys
+import timeit
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from freemad import CanonicalizationMode, compute_answer_id  # noqa: E402
+from freemad.utils import canon  # noqa: E402
+
+
+def _solutions(size: int = 40 * 1024) -> dict[str, str]:
+    rnd = random.Random(0)
+    lines = [f"    x_{i} = compute({i}, {rnd.random():.6f})  # step {i}" for i in range(size // 40)]
+    code = ("def solve():\n" + "\n".join(lines))[:size]
+    return {
+        "plain": code,
+        "fenced": "Here is the code:\n```python\n" + code + "\n```\nDone.",
+    }
+
+
+def _per_call_us(fn, number: int) -> float:
+    return timeit.timeit(fn, number=number) / number * 1e6
+
+
+def main() -> None:
+    print(f"{'text':8} {'mode':11} {'cold':>10} {'same object':>12} {'equal copy':>11}")
+    for name, text in _solutions().items():
+        for mode in CanonicalizationMode:
+            if mode == CanonicalizationMode.PYTHON_AST and name == "plain":
+                continue
+
+            def cold() -> None:
+                canon._answer_id.cache_clear()
+                canon._canonicalize.cache_clear()
+                compute_answer_id(text, mode)
+
+            compute_answer_id(text, mode)
+            copy = "".join(list(text))
+            rounds = 20 if mode == CanonicalizationMode.PYTHON_AST else 500
+            print(
+                f"{name:8} {mode.value:11} {_per_call_us(cold, rounds):8.1f}us"
+                f" {_per_call_us(lambda: compute_answer_id(text, mode), 20000):10.2f}us"
+                f" {_per_call_us(lambda: compute_answer_id(copy, mode), 2000):9.2f}us"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,51 @@
+"""Startup benchmark: wall time of fresh interpreters importing freemad entrypoints.
+
+Run from the repository root:
+
+    python benchmarks/bench_import.py [runs]
+
+Each case runs in a new interpreter; the median is reported next to the
+baseline `python -c pass`. `heavy` lists web-stack modules the case loaded.
+"""
+
+from __future__ import annotations
+
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+HEAVY = ("fastapi", "starlette", "jinja2", "anyio", "uvicorn")
+CASES = {
+    "python (baseline)": "pass",
+    "import freemad": "import freemad",
+    "import freemad.cli": "import freemad.cli",
+    "freemad.load_config": "import freemad; freemad.load_config()",
+    "import freemad.dashboard.app": "import freemad.dashboard.app",
+}
+
+
+def _run(code: str) -> float:
+    started = time.perf_counter()
+    subprocess.run([sys.executable, "-c", code], cwd=ROOT, check=True)
+    return time.perf_counter() - started
+
+
+def _heavy(code: str) -> list[str]:
+    probe = f"{code}\nimport sys\nprint(','.join(m for m in {HEAVY!r} if m in sys.modules))"
+    out = subprocess.run([sys.executable, "-c", probe], cwd=ROOT, check=True, capture_output=True, text=True)
+    return [m for m in out.stdout.strip().split(",") if m]
+
+
+def main() -> None:
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 10
+    print(f"{'case':30} {'median':>9}  heavy")
+    for name, code in CASES.items():
+        median = statistics.median(_run(code) for _ in range(runs))
+        print(f"{name:30} {median * 1000:7.1f}ms  {','.join(_heavy(code)) or '-'}")
+
+
+if __name__ == "__main__":
+    main()
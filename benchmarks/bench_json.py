@@ -0,0 +1,71 @@
+"""Throughput of freemad.utils.jsonio against the stdlib json module.
+
+Run from the repository root (set FREEMAD_JSON_BACKEND to compare backends):
+
+    python benchmarks/bench_json.py
+
+Cases: a ~70 KB debate transcript written with indent, a live-run event
+encoded for the websocket, and loading the transcript back.
+"""
+
+from __future__ import annotations
+
+import json
+import sys
+import timeit
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from freemad import RunEvent, RunEventKind  # noqa: E402
+from freemad.types import RoundType  # noqa: E402
+from freemad.utils import jsonio  # noqa: E402
+
+
+def _transcript(agents: int = 8, rounds: int = 6) -> dict:
+    solution = "def solve():\n" + "\n".join(f"    x_{i} = f({i})" for i in range(60))
+    return {
+        "final_answer_id": "a" * 16,
+        "scores": {f"{i:016x}": i * 1.5 for i in range(agents)},
+        "transcript": [
+            {
+                "round": r,
+                "agents": {
+                    f"agent{a}": {"response": {"solution": solution, "reasoning": "because " * 20, "answer_id": f"{a:016x}"}}
+                    for a in range(agents)
+                },
+            }
+            for r in range(rounds)
+        ],
+    }
+
+
+def _per_call_us(fn, number: int) -> float:
+    return timeit.timeit(fn, number=number) / number * 1e6
+
+
+def main() -> None:
+    transcript = _transcript()
+    text = json.dumps(transcript, indent=2)
+    event = RunEvent(
+        kind=RunEventKind.SCORES_UPDATED,
+        run_id="r" * 36,
+        ts_ms=1,
+        round_index=2,
+        round_type=RoundType.CRITIQUE,
+        scores={f"a{i}": i * 1.5 for i in range(8)},
+    )
+    cases = [
+        ("transcript dump", lambda: json.dumps(transcript, indent=2), lambda: jsonio.dumps(transcript, indent=True), 50),
+        ("transcript load", lambda: json.loads(text), lambda: jsonio.loads(text), 50),
+        ("event encode", lambda: json.dumps({"event": event.to_dict()}), lambda: jsonio.encode(event, wrap="event"), 20000),
+    ]
+    print(f"backend: {jsonio.BACKEND}; transcript {len(text) // 1024} KB")
+    print(f"{'case':16} {'stdlib':>10} {'jsonio':>10} {'speedup':>8}")
+    for name, std, fast, n in cases:
+        a, b = _per_call_us(std, n), _per_call_us(fast, n)
+        print(f"{name:16} {a:8.1f}us {b:8.1f}us {a / b:7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,113 +1,255 @@
-from __future__ import annotations
-
 """FREE-MAD Orchestrator package (public API re-exports).
 
 This module re-exports commonly used classes/functions so imports like
 `from freemad import X` continue to work after the namespace rename.
+
+Exports are resolved lazily on first attribute access (PEP 562), so
+`import freemad` and short CLI calls do not pay for the dashboard web stack,
+the task orchestrator or the agent adapters unless they use them.
 """
 
-__version__ = "0.2.0"
+from __future__ import annotations
 
-# Config
-from freemad.config import (
-    Config,
-    ConfigError,
-    load_config,
-    AgentConfig,
-    AgentRuntimeConfig,
-    SecurityConfig,
-    TaskConfig,
-    TaskToolPolicyConfig,
-)
+import importlib
+from typing import TYPE_CHECKING, Any, Dict, List
 
-# Types/enums
-from freemad.types import (  # noqa: E402
-    Decision,
-    RoundType,
-    ScoreAction,
-    TieBreak,
-    GenMarker,
-    CritMarker,
-    ValidatorName,
-    LogEvent,
-    RuntimeMode,
-    TaskType,
-    TaskRole,
-    TaskStage,
-    TaskOutcome,
-    ActionKind,
-    ReviewDecision,
-    TaskStatus,
-    ArtifactKind,
-    WorkItemStatus,
-    TaskEventKind,
-)
+__version__ = "0.2.0"
 
-# Prompts
-from freemad.prompts import build_generation_prompt, build_critique_prompt, build_task_prompt  # noqa: E402
+if TYPE_CHECKING:
+    from freemad.config import (
+        Config,
+        ConfigError,
+        load_config,
+        clear_config_cache,
+        AgentConfig,
+        AgentRuntimeConfig,
+        SecurityConfig,
+        TaskConfig,
+        TaskToolPolicyConfig,
+        TaskWorkerConfig,
+        StoppingConfig,
+        ClusteringConfig,
+        HealthConfig,
+    )
+    from freemad.types import (
+        Decision,
+        RoundType,
+        ScoreAction,
+        TieBreak,
+        GenMarker,
+        CritMarker,
+        ValidatorName,
+        LogEvent,
+        RuntimeMode,
+        TaskType,
+        TaskRole,
+        TaskStage,
+        TaskOutcome,
+        ActionKind,
+        ReviewDecision,
+        TaskStatus,
+        ArtifactKind,
+        WorkItemStatus,
+        TaskEventKind,
+        EarlyStopPolicy,
+        TokenCounterKind,
+        CanonicalizationMode,
+    )
+    from freemad.prompts import build_generation_prompt, build_critique_prompt, build_task_prompt
+    from freemad.utils import (
+        parse_generation,
+        parse_critique,
+        canonicalize_solution,
+        compute_answer_id,
+    )
+    from freemad.utils.budget import (
+        AgentBudgetLedger,
+        BudgetGuard,
+        BudgetExceeded,
+        TokenBudget,
+        enforce_size,
+        truncate_to_tokens,
+        approx_tokens,
+    )
+    from freemad.utils.tokens import TokenCounter, get_token_counter
+    from freemad.utils.logger import get_logger, log_event
+    from freemad.utils.cache import DiskCache
+    from freemad.utils.retention import TranscriptJanitor, gc_transcripts, read_transcript
+    from freemad.security import Redactor
+    from freemad.security.secrets import get_secret, SecretSpec
+    from freemad.agents.base import (
+        Agent,
+        AgentResponse,
+        CritiqueResponse,
+        Metadata,
+    )
+    from freemad.agents.factory import AgentFactory
+    from freemad.agents.registry import register_agent
+    from freemad.agents import bootstrap
+    from freemad.agents.cli_adapter import CLIAdapter
+    from freemad.agents.health import HealthMonitor
+    from freemad.topology import build_topology
+    from freemad.scoring import AnswerClusterer, ScoreTracker
+    from freemad.orchestrator import Orchestrator
+    from freemad.run_events import RunEvent, RunObserver, NullObserver, FanOutObserver
+    from freemad.event_log import JsonlEventSink, read_event_log, rebuild_transcript
+    from freemad.checkpoint import RunCheckpoint, load_checkpoint
+    from freemad.types import RunEventKind
+    from freemad.task_events import TaskEvent, TaskObserver, NullTaskObserver, FanOutTaskObserver
+    from freemad.tasks import (
+        ArtifactRef,
+        FileWrite,
+        ReviewRecord,
+        SourceRecord,
+        StageAttempt,
+        TaskRequest,
+        TaskResponse,
+        TaskSnapshot,
+        TaskStore,
+        WorkItem,
+    )
+    from freemad.tasks.orchestrator import TaskOrchestrator
+    from freemad.tasks.worker import TaskWorker
+    from freemad.validation import ValidationManager
+    from freemad.validation.sandbox import SandboxValidator
+    from freemad.cli import main
+    from freemad.dashboard.app import create_app, DashboardConfig
 
-# Utils
-from freemad.utils import (  # noqa: E402
-    parse_generation,
-    parse_critique,
-    canonicalize_solution,
-    compute_answer_id,
-)
-from freemad.utils.budget import (  # noqa: E402
-    BudgetGuard,
-    BudgetExceeded,
-    TokenBudget,
-    enforce_size,
-    truncate_to_tokens,
-    approx_tokens,
-)
-from freemad.utils.logger import get_logger, log_event  # noqa: E402
-from freemad.utils.cache import DiskCache  # noqa: E402
+# Public name -> defining module.
+_LAZY_EXPORTS: Dict[str, str] = {
+    # Config
+    "Config": "freemad.config",
+    "ConfigError": "freemad.config",
+    "load_config": "freemad.config",
+    "clear_config_cache": "freemad.config",
+    "AgentConfig": "freemad.config",
+    "AgentRuntimeConfig": "freemad.config",
+    "SecurityConfig": "freemad.config",
+    "TaskConfig": "freemad.config",
+    "TaskToolPolicyConfig": "freemad.config",
+    "TaskWorkerConfig": "freemad.config",
+    "StoppingConfig": "freemad.config",
+    "ClusteringConfig": "freemad.config",
+    "HealthConfig": "freemad.config",
+    # Types/enums
+    "Decision": "freemad.types",
+    "RoundType": "freemad.types",
+    "ScoreAction": "freemad.types",
+    "TieBreak": "freemad.types",
+    "GenMarker": "freemad.types",
+    "CritMarker": "freemad.types",
+    "ValidatorName": "freemad.types",
+    "LogEvent": "freemad.types",
+    "RuntimeMode": "freemad.types",
+    "TaskType": "freemad.types",
+    "TaskRole": "freemad.types",
+    "TaskStage": "freemad.types",
+    "TaskOutcome": "freemad.types",
+    "ActionKind": "freemad.types",
+    "ReviewDecision": "freemad.types",
+    "TaskStatus": "freemad.types",
+    "ArtifactKind": "freemad.types",
+    "WorkItemStatus": "freemad.types",
+    "TaskEventKind": "freemad.types",
+    "EarlyStopPolicy": "freemad.types",
+    "TokenCounterKind": "freemad.types",
+    "CanonicalizationMode": "freemad.types",
+    # Prompts
+    "build_generation_prompt": "freemad.prompts",
+    "build_critique_prompt": "freemad.prompts",
+    "build_task_prompt": "freemad.prompts",
+    # Utils
+    "parse_generation": "freemad.utils",
+    "parse_critique": "freemad.utils",
+    "canonicalize_solution": "freemad.utils",
+    "compute_answer_id": "freemad.utils",
+    "AgentBudgetLedger": "freemad.utils.budget",
+    "BudgetGuard": "freemad.utils.budget",
+    "BudgetExceeded": "freemad.utils.budget",
+    "TokenBudget": "freemad.utils.budget",
+    "enforce_size": "freemad.utils.budget",
+    "truncate_to_tokens": "freemad.utils.budget",
+    "approx_tokens": "freemad.utils.budget",
+    "TokenCounter": "freemad.utils.tokens",
+    "get_token_counter": "freemad.utils.tokens",
+    "get_logger": "freemad.utils.logger",
+    "log_event": "freemad.utils.logger",
+    "DiskCache": "freemad.utils.cache",
+    "TranscriptJanitor": "freemad.utils.retention",
+    "gc_transcripts": "freemad.utils.retention",
+    "read_transcript": "freemad.utils.retention",
+    # Security helpers
+    "Redactor": "freemad.security",
+    "get_secret": "freemad.security.secrets",
+    "SecretSpec": "freemad.security.secrets",
+    # Agents
+    "Agent": "freemad.agents.base",
+    "AgentResponse": "freemad.agents.base",
+    "CritiqueResponse": "freemad.agents.base",
+    "Metadata": "freemad.agents.base",
+    "AgentFactory": "freemad.agents.factory",
+    "register_agent": "freemad.agents.registry",
+    "bootstrap": "freemad.agents",
+    "CLIAdapter": "freemad.agents.cli_adapter",
+    "HealthMonitor": "freemad.agents.health",
+    # Topology / Scoring / Orchestrator
+    "build_topology": "freemad.topology",
+    "AnswerClusterer": "freemad.scoring",
+    "ScoreTracker": "freemad.scoring",
+    "Orchestrator": "freemad.orchestrator",
+    "RunEvent": "freemad.run_events",
+    "RunObserver": "freemad.run_events",
+    "NullObserver": "freemad.run_events",
+    "FanOutObserver": "freemad.run_events",
+    "JsonlEventSink": "freemad.event_log",
+    "read_event_log": "freemad.event_log",
+    "rebuild_transcript": "freemad.event_log",
+    "RunCheckpoint": "freemad.checkpoint",
+    "load_checkpoint": "freemad.checkpoint",
+    "RunEventKind": "freemad.types",
+    "TaskEvent": "freemad.task_events",
+    "TaskObserver": "freemad.task_events",
+    "NullTaskObserver": "freemad.task_events",
+    "FanOutTaskObserver": "freemad.task_events",
+    "ArtifactRef": "freemad.tasks",
+    "FileWrite": "freemad.tasks",
+    "ReviewRecord": "freemad.tasks",
+    "SourceRecord": "freemad.tasks",
+    "StageAttempt": "freemad.tasks",
+    "TaskRequest": "freemad.tasks",
+    "TaskResponse": "freemad.tasks",
+    "TaskSnapshot": "freemad.tasks",
+    "TaskStore": "freemad.tasks",
+    "WorkItem": "freemad.tasks",
+    "TaskOrchestrator": "freemad.tasks.orchestrator",
+    "TaskWorker": "freemad.tasks.worker",
+    # Validation
+    "ValidationManager": "freemad.validation",
+    "SandboxValidator": "freemad.validation.sandbox",
+    # CLI / Dashboard public entrypoints
+    "main": "freemad.cli",
+    "create_app": "freemad.dashboard.app",
+    "DashboardConfig": "freemad.dashboard.app",
+}
 
-# Security helpers
-from freemad.security import Redactor  # noqa: E402
-from freemad.security.secrets import get_secret, SecretSpec  # noqa: E402
 
-# Agents
-from freemad.agents.base import (  # noqa: E402
-    Agent,
-    AgentResponse,
-    CritiqueResponse,
-    Metadata,
-)
-from freemad.agents.factory import AgentFactory  # noqa: E402
-from freemad.agents.registry import register_agent  # noqa: E402
-from freemad.agents import bootstrap  # noqa: E402
-from freemad.agents.cli_adapter import CLIAdapter  # noqa: E402
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module = importlib.import_module(module_name)
+    try:
+        value = getattr(module, name)
+    except AttributeError:
+        # Submodule exports, e.g. `bootstrap` from `freemad.agents`.
+        value = importlib.import_module(f"{module_name}.{name}")
+    globals()[name] = value
+    return value
 
-# Topology / Scoring / Orchestrator
-from freemad.topology import build_topology  # noqa: E402
-from freemad.scoring import ScoreTracker  # noqa: E402
-from freemad.orchestrator import Orchestrator  # noqa: E402
-from freemad.run_events import RunEvent, RunObserver, NullObserver, FanOutObserver  # noqa: E402
-from freemad.types import RunEventKind  # noqa: E402
-from freemad.task_events import TaskEvent, TaskObserver, NullTaskObserver, FanOutTaskObserver  # noqa: E402
-from freemad.tasks import (  # noqa: E402
-    ArtifactRef,
-    FileWrite,
-    ReviewRecord,
-    SourceRecord,
-    StageAttempt,
-    TaskRequest,
-    TaskResponse,
-    TaskSnapshot,
-    TaskStore,
-    WorkItem,
-)
-from freemad.tasks.orchestrator import TaskOrchestrator  # noqa: E402
 
-# Validation
-from freemad.validation import ValidationManager  # noqa: E402
-from freemad.validation.sandbox import SandboxValidator  # noqa: E402
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(__all__))
 
-# CLI / Dashboard public entrypoints
-from freemad.cli import main  # noqa: E402
-from freemad.dashboard.app import create_app, DashboardConfig  # noqa: E402
 
 __all__ = [
     "__version__",
@@ -115,11 +257,16 @@ __all__ = [
     "Config",
     "ConfigError",
     "load_config",
+    "clear_config_cache",
     "AgentConfig",
     "AgentRuntimeConfig",
     "SecurityConfig",
     "TaskConfig",
     "TaskToolPolicyConfig",
+    "TaskWorkerConfig",
+    "StoppingConfig",
+    "ClusteringConfig",
+    "HealthConfig",
     # enums
     "Decision",
     "RoundType",
@@ -141,6 +288,9 @@ __all__ = [
     "ArtifactKind",
     "WorkItemStatus",
     "TaskEventKind",
+    "EarlyStopPolicy",
+    "TokenCounterKind",
+    "CanonicalizationMode",
     # prompts
     "build_generation_prompt",
     "build_critique_prompt",
@@ -150,15 +300,21 @@ __all__ = [
     "parse_critique",
     "canonicalize_solution",
     "compute_answer_id",
+    "AgentBudgetLedger",
     "BudgetGuard",
     "BudgetExceeded",
     "TokenBudget",
     "enforce_size",
     "truncate_to_tokens",
     "approx_tokens",
+    "TokenCounter",
+    "get_token_counter",
     "get_logger",
     "log_event",
     "DiskCache",
+    "TranscriptJanitor",
+    "gc_transcripts",
+    "read_transcript",
     # security
     "Redactor",
     "get_secret",
@@ -172,8 +328,10 @@ __all__ = [
     "register_agent",
     "bootstrap",
     "CLIAdapter",
+    "HealthMonitor",
     # topology/scoring/orchestrator
     "build_topology",
+    "AnswerClusterer",
     "ScoreTracker",
     "Orchestrator",
     "RunEvent",
@@ -181,6 +339,11 @@ __all__ = [
     "RunObserver",
     "NullObserver",
     "FanOutObserver",
+    "JsonlEventSink",
+    "read_event_log",
+    "rebuild_transcript",
+    "RunCheckpoint",
+    "load_checkpoint",
     "TaskEvent",
     "TaskObserver",
     "NullTaskObserver",
@@ -195,6 +358,7 @@ __all__ = [
     "TaskSnapshot",
     "TaskStore",
     "TaskOrchestrator",
+    "TaskWorker",
     "WorkItem",
     # validation
     "ValidationManager",
@@ -1,12 +1,15 @@
 from __future__ import annotations
 
 import abc
+import contextvars
 import shlex
 import shutil
 import subprocess
+import threading
 import time
+from contextlib import contextmanager
 from dataclasses import dataclass, field
-from typing import TYPE_CHECKING, Dict, List, Optional
+from typing import TYPE_CHECKING, Dict, Iterator, List, Optional
 
 from freemad.config import AgentConfig, Config
 from freemad.types import Decision
@@ -15,13 +18,13 @@ if TYPE_CHECKING:
     from freemad.tasks.models import TaskRequest, TaskResponse
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Metadata:
     timings: Dict[str, float] = field(default_factory=dict)  # ms
     tokens: Dict[str, int] = field(default_factory=dict)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class AgentResponse:
     agent_id: str
     solution: str
@@ -30,7 +33,7 @@ class AgentResponse:
     metadata: Metadata = field(default_factory=Metadata)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CritiqueResponse:
     agent_id: str
     decision: Decision
@@ -51,6 +54,33 @@ class HealthStatus:
     latency_ms: Optional[float] = None
 
 
+class AgentCancelled(Exception):
+    """An agent call was stopped because its result is no longer needed."""
+
+
+_CANCEL_EVENT: contextvars.ContextVar[Optional[threading.Event]] = contextvars.ContextVar(
+    "freemad_agent_cancel", default=None
+)
+
+
+@contextmanager
+def cancel_scope(event: threading.Event) -> Iterator[None]:
+    """Agent calls made in this scope should stop once `event` is set.
+
+    `CLIAdapter` kills its subprocess and raises `AgentCancelled`; adapters that
+    cannot be interrupted run to completion.
+    """
+    token = _CANCEL_EVENT.set(event)
+    try:
+        yield
+    finally:
+        _CANCEL_EVENT.reset(token)
+
+
+def current_cancel_event() -> Optional[threading.Event]:
+    return _CANCEL_EVENT.get()
+
+
 class Agent(abc.ABC):
     """Abstract agent interface. Adapters must implement the two calls.
 
@@ -3,6 +3,7 @@ from __future__ import annotations
 import logging
 import shlex
 import subprocess
+import threading
 import time
 from typing import Any, List, Optional, Tuple
 import json
@@ -12,11 +13,41 @@ from freemad.prompts import build_critique_prompt, build_generation_prompt, buil
 from freemad.tasks.models import TaskRequest, TaskResponse
 from freemad.types import Decision, LogEvent
 from freemad.utils import parse_generation, parse_critique, compute_answer_id
-from freemad.utils.budget import enforce_size, truncate_to_tokens, approx_tokens
+from freemad.utils.budget import enforce_size, truncate_to_tokens
+from freemad.utils.tokens import get_token_counter
 from freemad.utils.logger import log_event
 from freemad.utils.cache import DiskCache
 
-from .base import Agent, AgentResponse, CritiqueResponse, Metadata
+from .base import Agent, AgentCancelled, AgentResponse, CritiqueResponse, Metadata, current_cancel_event
+
+# How often a cancellable CLI call checks whether it was cancelled.
+_CANCEL_POLL_SEC = 0.1
+
+
+def _run_cancellable(
+    cmd: List[str], input_text: str, timeout_s: float, cancel: threading.Event
+) -> "subprocess.CompletedProcess[str]":
+    """`subprocess.run` that also kills the process once `cancel` is set."""
+    if cancel.is_set():
+        raise AgentCancelled(f"{cmd[0]} cancelled before it started")
+    proc = subprocess.Popen(cmd, stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
+    deadline = time.monotonic() + timeout_s
+    pending: Optional[str] = input_text
+    while True:
+        try:
+            stdout, stderr = proc.communicate(
+                pending, timeout=max(0.0, min(_CANCEL_POLL_SEC, deadline - time.monotonic()))
+            )
+            return subprocess.CompletedProcess(cmd, proc.returncode, stdout, stderr)
+        except subprocess.TimeoutExpired:
+            pending = None  # already being written; communicate() must not get it twice
+            if not cancel.is_set() and time.monotonic() < deadline:
+                continue
+            proc.kill()
+            proc.communicate()
+            if cancel.is_set():
+                raise AgentCancelled(f"{cmd[0]} cancelled") from None
+            raise subprocess.TimeoutExpired(cmd, timeout_s) from None
 
 
 class CLIAdapter(Agent):
@@ -37,6 +68,7 @@ class CLIAdapter(Agent):
         except Exception:  # pragma: no cover
             pass
         self._cache = DiskCache(cfg.cache.dir, cfg.cache.max_entries) if cfg.cache.enabled else None
+        self._tokens = get_token_counter(cfg.budget)
 
     def _ensure_allowed(self, exe: str) -> None:
         if exe not in (self.cfg.security.cli_allowed_commands or []):
@@ -93,14 +125,18 @@ class CLIAdapter(Agent):
                 agent=self.agent_cfg.id,
                 mode=mode,
             )
-        proc = subprocess.run(
-            cmd,
-            input=input_text,
-            text=True,
-            capture_output=True,
-            timeout=timeout_s,
-            check=False
-        )
+        cancel = current_cancel_event()
+        if cancel is None:
+            proc = subprocess.run(
+                cmd,
+                input=input_text,
+                text=True,
+                capture_output=True,
+                timeout=timeout_s,
+                check=False
+            )
+        else:
+            proc = _run_cancellable(cmd, input_text, timeout_s, cancel)
         elapsed_ms = (time.perf_counter() - t0) * 1000
         stdout = (proc.stdout or "").strip()
         stderr = (proc.stderr or "").strip()
@@ -137,12 +173,15 @@ class CLIAdapter(Agent):
                 pass
         return out, elapsed_ms, False
 
+    def _prompt_token_cap(self) -> Optional[int]:
+        if not self.cfg.budget.enable_token_truncation:
+            return None
+        return self.cfg.budget.max_tokens_per_agent_per_round
+
     # Step 3 parsing behavior: one retry if malformed, then default KEEP
     def generate(self, requirement: str) -> AgentResponse:
-        prompt = build_generation_prompt(requirement)
-        # token budget enforcement for prompt
-        if self.cfg.budget.enable_token_truncation and self.cfg.budget.max_tokens_per_agent_per_round is not None:
-            prompt, _ = truncate_to_tokens(prompt, self.cfg.budget.max_tokens_per_agent_per_round, label="prompt")
+        # token budget enforcement for prompt: only the requirement is trimmed
+        prompt = build_generation_prompt(requirement, max_tokens=self._prompt_token_cap(), token_counter=self._tokens)
         raw, elapsed_ms, cached = self._run_cli(prompt, mode="generating")
         parsed = parse_generation(raw)
         if parsed.needs_retry:
@@ -158,9 +197,9 @@ class CLIAdapter(Agent):
         solution, truncated = enforce_size(solution, self.cfg.security.max_solution_size, label="solution")
         if truncated and self.logger:
             log_event(self.logger, LogEvent.TRUNCATE, label="solution", agent=self.agent_cfg.id)
-        ans_id = compute_answer_id(solution)
-        tokens_out = approx_tokens(solution + "\n\n" + parsed.reasoning)
-        tokens_in = approx_tokens(prompt)
+        ans_id = compute_answer_id(solution, self.cfg.scoring.canonicalization)
+        tokens_out = self._tokens.count(solution + "\n\n" + parsed.reasoning)
+        tokens_in = self._tokens.count(prompt)
         return AgentResponse(
             agent_id=self.agent_cfg.id,
             solution=solution,
@@ -170,9 +209,15 @@ class CLIAdapter(Agent):
         )
 
     def critique_and_refine(self, requirement: str, own_response: str, peer_responses: List[str]) -> CritiqueResponse:
-        prompt = build_critique_prompt(requirement, own_response, peer_responses)
-        if self.cfg.budget.enable_token_truncation and self.cfg.budget.max_tokens_per_agent_per_round is not None:
-            prompt, _ = truncate_to_tokens(prompt, self.cfg.budget.max_tokens_per_agent_per_round, label="prompt")
+        prompt = build_critique_prompt(
+            requirement,
+            own_response,
+            peer_responses,
+            max_peer_tokens=self.cfg.budget.max_peer_tokens,
+            max_tokens=self._prompt_token_cap(),
+            token_counter=self._tokens,
+            canonicalization=self.cfg.scoring.canonicalization,
+        )
         raw, elapsed_ms, cached = self._run_cli(prompt, mode="critique")
         parsed = parse_critique(raw)
         if parsed.needs_retry:
@@ -189,9 +234,9 @@ class CLIAdapter(Agent):
         new_solution, truncated = enforce_size(new_solution, self.cfg.security.max_solution_size, label="solution")
         if truncated and self.logger:
             log_event(self.logger, LogEvent.TRUNCATE, label="solution", agent=self.agent_cfg.id)
-        ans_id = compute_answer_id(new_solution)
-        tokens_out = approx_tokens((parsed.solution or own_response) + "\n\n" + parsed.reasoning)
-        tokens_in = approx_tokens(prompt)
+        ans_id = compute_answer_id(new_solution, self.cfg.scoring.canonicalization)
+        tokens_out = self._tokens.count((parsed.solution or own_response) + "\n\n" + parsed.reasoning)
+        tokens_in = self._tokens.count(prompt)
         return CritiqueResponse(
             agent_id=self.agent_cfg.id,
             decision=decision,
@@ -205,7 +250,9 @@ class CLIAdapter(Agent):
     def act(self, request: TaskRequest) -> TaskResponse:
         prompt = build_task_prompt(request)
         if self.cfg.budget.enable_token_truncation and self.cfg.budget.max_tokens_per_agent_per_round is not None:
-            prompt, _ = truncate_to_tokens(prompt, self.cfg.budget.max_tokens_per_agent_per_round, label="task_prompt")
+            prompt, _ = truncate_to_tokens(
+                prompt, self.cfg.budget.max_tokens_per_agent_per_round, label="task_prompt", counter=self._tokens
+            )
         raw, _elapsed_ms, _cached = self._run_cli(prompt, mode=f"task-{request.stage.value}")
         return self._parse_task_response(raw, request=request)
 
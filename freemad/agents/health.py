@@ -0,0 +1,154 @@
+"""Concurrent, TTL-cached agent health checks.
+
+`Agent.health()` spawns `<exe> --version`, so probing agents one after another
+costs the sum of their latencies. `HealthMonitor.check` probes every agent whose
+cached result is stale in parallel and reuses each `HealthStatus` for `ttl_sec`.
+Entries are keyed by agent id, type and cli command, so a config change re-probes.
+`HealthProber` keeps a monitor warm from a daemon thread (used by the dashboard).
+"""
+
+from __future__ import annotations
+
+import concurrent.futures
+import threading
+import time
+from typing import Callable, Dict, Mapping, Optional, Tuple
+
+from freemad.config import HealthConfig
+
+from .base import Agent, HealthStatus
+
+
+_Key = Tuple[str, str, Optional[str]]
+
+
+def _key(agent: Agent) -> _Key:
+    return (agent.agent_cfg.id, agent.agent_cfg.type, agent.agent_cfg.cli_command)
+
+
+def _probe(agent: Agent) -> HealthStatus:
+    try:
+        return agent.health()
+    except Exception as e:  # adapters may override health(); never let one break the sweep
+        return HealthStatus(agent_id=agent.agent_cfg.id, available=False, message=f"health error: {e}")
+
+
+class HealthMonitor:
+    """Caches health results per agent for `ttl_sec`; safe to share across threads."""
+
+    def __init__(
+        self,
+        ttl_sec: float = 30.0,
+        max_workers: int = 8,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.ttl_sec = ttl_sec
+        self.max_workers = max(1, max_workers)
+        self._clock = clock
+        self._entries: Dict[_Key, Tuple[HealthStatus, float]] = {}
+        self._lock = threading.Lock()
+
+    def check(self, agents: Mapping[str, Agent], *, force: bool = False) -> Dict[str, HealthStatus]:
+        """Agent id -> status, probing stale (or all, with `force`) agents concurrently."""
+        now = self._clock()
+        out: Dict[str, HealthStatus] = {}
+        stale: Dict[str, Agent] = {}
+        with self._lock:
+            for aid, agent in agents.items():
+                hit = None if force else self._entries.get(_key(agent))
+                if hit is not None and now - hit[1] < self.ttl_sec:
+                    out[aid] = hit[0]
+                else:
+                    stale[aid] = agent
+        if stale:
+            workers = min(len(stale), self.max_workers)
+            with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as ex:
+                futs = {aid: ex.submit(_probe, agent) for aid, agent in stale.items()}
+                probed = {aid: fut.result() for aid, fut in futs.items()}
+            checked_at = self._clock()
+            with self._lock:
+                for aid, status in probed.items():
+                    self._entries[_key(stale[aid])] = (status, checked_at)
+            out.update(probed)
+        return {aid: out[aid] for aid in agents}
+
+    def snapshot(self) -> Dict[str, Dict[str, object]]:
+        """Cached results as JSON-friendly dicts, with their age in seconds."""
+        now = self._clock()
+        with self._lock:
+            entries = list(self._entries.values())
+        return {
+            status.agent_id: {
+                "available": status.available,
+                "message": status.message,
+                "version": status.version,
+                "command": status.command,
+                "latency_ms": status.latency_ms,
+                "age_sec": round(now - checked_at, 3),
+                "stale": now - checked_at >= self.ttl_sec,
+            }
+            for status, checked_at in entries
+        }
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+class HealthProber:
+    """Re-checks the agents returned by `load_agents` every `interval_sec` on a daemon thread."""
+
+    def __init__(
+        self,
+        monitor: HealthMonitor,
+        load_agents: Callable[[], Mapping[str, Agent]],
+        interval_sec: float,
+    ) -> None:
+        self.monitor = monitor
+        self._load_agents = load_agents
+        self.interval_sec = interval_sec
+        self.last_error: Optional[str] = None
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        if self._thread is not None or self.interval_sec <= 0:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._loop, name="freemad-health-prober", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def probe_once(self) -> Dict[str, HealthStatus]:
+        try:
+            result = self.monitor.check(self._load_agents(), force=True)
+        except Exception as e:  # a broken config must not kill the prober
+            self.last_error = str(e)
+            return {}
+        self.last_error = None
+        return result
+
+    def _loop(self) -> None:
+        while not self._stop.is_set():
+            self.probe_once()
+            self._stop.wait(self.interval_sec)
+
+
+_MONITORS: Dict[Tuple[float, int], HealthMonitor] = {}
+_MONITORS_LOCK = threading.Lock()
+
+
+def get_health_monitor(health: HealthConfig) -> HealthMonitor:
+    """Process-wide monitor for `health`, so the CLI, dashboard and runs share results."""
+    key = (health.ttl_sec, health.max_workers)
+    with _MONITORS_LOCK:
+        monitor = _MONITORS.get(key)
+        if monitor is None:
+            monitor = HealthMonitor(ttl_sec=health.ttl_sec, max_workers=health.max_workers)
+            _MONITORS[key] = monitor
+        return monitor
@@ -0,0 +1,131 @@
+"""Round checkpoints for resumable debates.
+
+After every completed round the orchestrator saves the state needed to carry
+on: current answers, answer texts, the score tracker, budget spend and the
+transcript so far. `Orchestrator.resume(run_id)` loads it and continues with
+the next round, so agent calls already paid for are not repeated and scoring
+matches an uninterrupted run exactly.
+
+Checkpoints are gzip-compressed JSON, replaced atomically. Transcript solutions
+equal to the stored text of their answer id are written once, in `answer_text`.
+"""
+
+from __future__ import annotations
+
+import gzip
+import os
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List
+
+from freemad.config import Config, ConfigError
+from freemad.types import Decision
+from freemad.utils import jsonio
+
+CHECKPOINT_VERSION = 1
+
+
+@dataclass(frozen=True)
+class RunCheckpoint:
+    run_id: str
+    requirement: str  # as sent to agents (size-enforced)
+    max_rounds: int
+    round_index: int  # last completed round; 0 = generation
+    agent_ids: List[str]
+    current_solution: Dict[str, str]
+    current_answer_id: Dict[str, str]
+    answer_text: Dict[str, str]
+    scores: Dict[str, Any]  # ScoreTracker.to_state()
+    transcript: List[Dict[str, Any]]  # rounds in the result's "transcript" format
+    # Decisions of the last critique round, for stop policies checked before the next one.
+    last_decisions: Dict[str, Decision] = field(default_factory=dict)
+    skipped_agents: Dict[str, str] = field(default_factory=dict)
+    tokens_used: int = 0
+    agent_spend: Dict[str, Dict[str, float]] = field(default_factory=dict)
+
+    def to_dict(self) -> Dict[str, Any]:
+        rounds = []
+        for rnd in self.transcript:
+            agents = {}
+            for aid, rec in rnd["agents"].items():
+                resp = rec["response"]
+                if resp.get("solution") == self.answer_text.get(resp.get("answer_id", "")):
+                    resp = {k: v for k, v in resp.items() if k != "solution"}
+                agents[aid] = {**rec, "response": resp}
+            rounds.append({**rnd, "agents": agents})
+        return {
+            "version": CHECKPOINT_VERSION,
+            "run_id": self.run_id,
+            "requirement": self.requirement,
+            "max_rounds": self.max_rounds,
+            "round_index": self.round_index,
+            "agent_ids": list(self.agent_ids),
+            "current_solution": dict(self.current_solution),
+            "current_answer_id": dict(self.current_answer_id),
+            "answer_text": dict(self.answer_text),
+            "scores": self.scores,
+            "transcript": rounds,
+            "last_decisions": {aid: d.value for aid, d in self.last_decisions.items()},
+            "skipped_agents": dict(self.skipped_agents),
+            "tokens_used": self.tokens_used,
+            "agent_spend": self.agent_spend,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> RunCheckpoint:
+        if data.get("version") != CHECKPOINT_VERSION:
+            raise ConfigError(f"unsupported checkpoint version: {data.get('version')!r}")
+        answer_text = {str(k): str(v) for k, v in dict(data["answer_text"]).items()}
+        transcript = []
+        for rnd in data["transcript"]:
+            agents = {}
+            for aid, rec in rnd["agents"].items():
+                resp = dict(rec["response"])
+                if "solution" not in resp:
+                    resp["solution"] = answer_text[resp["answer_id"]]
+                agents[aid] = {**rec, "response": resp}
+            transcript.append({**rnd, "agents": agents})
+        return cls(
+            run_id=str(data["run_id"]),
+            requirement=str(data["requirement"]),
+            max_rounds=int(data["max_rounds"]),
+            round_index=int(data["round_index"]),
+            agent_ids=[str(a) for a in data["agent_ids"]],
+            current_solution={str(k): str(v) for k, v in dict(data["current_solution"]).items()},
+            current_answer_id={str(k): str(v) for k, v in dict(data["current_answer_id"]).items()},
+            answer_text=answer_text,
+            scores=dict(data["scores"]),
+            transcript=transcript,
+            last_decisions={str(k): Decision(str(v)) for k, v in dict(data.get("last_decisions", {})).items()},
+            skipped_agents={str(k): str(v) for k, v in dict(data.get("skipped_agents", {})).items()},
+            tokens_used=int(data.get("tokens_used", 0)),
+            agent_spend={str(k): dict(v) for k, v in dict(data.get("agent_spend", {})).items()},
+        )
+
+
+def checkpoint_path(cfg: Config, run_id: str) -> Path:
+    return Path(cfg.checkpoint.dir) / f"{run_id}.ckpt.json.gz"
+
+
+def save_checkpoint(path: str | Path, checkpoint: RunCheckpoint) -> Path:
+    """Write atomically: a crash mid-write leaves the previous round's checkpoint intact."""
+    p = Path(path)
+    p.parent.mkdir(parents=True, exist_ok=True)
+    tmp = p.with_name(p.name + ".tmp")
+    tmp.write_bytes(gzip.compress(jsonio.dumps_bytes(checkpoint.to_dict()), compresslevel=6))
+    os.replace(tmp, p)
+    return p
+
+
+def load_checkpoint(path: str | Path) -> RunCheckpoint:
+    p = Path(path)
+    try:
+        raw = gzip.decompress(p.read_bytes())
+    except FileNotFoundError:
+        raise ConfigError(f"no checkpoint at {p}") from None
+    except (OSError, EOFError) as e:
+        raise ConfigError(f"unreadable checkpoint {p}: {e}") from e
+    try:
+        return RunCheckpoint.from_dict(jsonio.loads(raw))
+    except (ValueError, KeyError, TypeError) as e:
+        raise ConfigError(f"invalid checkpoint {p}: {e}") from e
@@ -10,8 +10,12 @@ from freemad.agents import bootstrap as agent_bootstrap
 from freemad.config import ConfigError, load_config
 from freemad.orchestrator import Orchestrator
 from freemad.task_events import TaskEvent
+from freemad.tasks.compaction import compact_task_events, load_task_snapshot
 from freemad.tasks.orchestrator import TaskOrchestrator
+from freemad.tasks.verification import prune_verification_cache
+from freemad.tasks.worker import TaskWorker
 from freemad.types import TaskEventKind, TaskStatus, TaskType
+from freemad.utils.retention import gc_cache, gc_transcripts, refresh_index
 from freemad.utils.transcript import save_transcript
 
 
@@ -22,11 +26,13 @@ def _task_payload(orch: TaskOrchestrator, task_id: str) -> dict[str, Any]:
     task = orch.get_task(task_id)
     if task is None:
         raise ConfigError(f"unknown task id: {task_id}")
+    snapshot, _ = load_task_snapshot(orch.store, task_id, snapshot_every=orch.cfg.task.snapshot_every_events)
     return {
         **task.to_dict(),
         "artifacts": [artifact.to_dict() for artifact in orch.store.list_artifacts(task_id)],
         "work_items": [item.to_dict() for item in orch.store.list_work_items(task_id)],
-        "events": [event.to_dict() for event in orch.store.list_events(task_id)],
+        "events": [event.to_dict() for event in orch.store.list_recent_events(task_id, orch.cfg.task.payload_event_limit)],
+        "snapshot": snapshot.to_dict(),
     }
 
 
@@ -39,6 +45,7 @@ def _task_main(argv: list[str]) -> int:
     start.add_argument("--config", help="Path to config file (yaml/json)")
     start.add_argument("--task-type", choices=[TaskType.PLAN.value, TaskType.CODE.value], default=TaskType.PLAN.value)
     start.add_argument("--workspace-root", default=".", help="Workspace root for autonomous task execution")
+    start.add_argument("--enqueue", action="store_true", help="Create the task and leave it for `freemad task worker`")
 
     resume = sub.add_parser("resume", help="Resume an existing autonomous task")
     resume.add_argument("task_id", help="Task id")
@@ -66,6 +73,17 @@ def _task_main(argv: list[str]) -> int:
     pause.add_argument("task_id", help="Task id")
     pause.add_argument("--config", help="Path to config file (yaml/json)")
 
+    worker = sub.add_parser("worker", help="Claim and run pending tasks from the task store")
+    worker.add_argument("--config", help="Path to config file (yaml/json)")
+    worker.add_argument("--concurrency", type=int, help="Tasks run at once (default: task.worker.concurrency)")
+    worker.add_argument("--worker-id", help="Lease owner id (default: host-pid-random)")
+    worker.add_argument("--once", action="store_true", help="Exit once no claimable tasks remain")
+
+    compact = sub.add_parser("compact", help="Snapshot task state and archive old events")
+    compact.add_argument("task_id", nargs="?", help="Task id (default: every task)")
+    compact.add_argument("--config", help="Path to config file (yaml/json)")
+    compact.add_argument("--keep", type=int, help="Recent events kept in the store (default: task.payload_event_limit)")
+
     args = parser.parse_args(argv)
 
     try:
@@ -82,7 +100,8 @@ def _task_main(argv: list[str]) -> int:
                 task_type=TaskType(args.task_type),
                 workspace_root=args.workspace_root,
             )
-            orch.run(task.task_id)
+            if not args.enqueue:
+                TaskWorker(orch).run_task(task.task_id)
             print(json.dumps(_task_payload(orch, task.task_id)))
             return 0
 
@@ -90,12 +109,47 @@ def _task_main(argv: list[str]) -> int:
             existing_task = orch.get_task(args.task_id)
             if existing_task is None:
                 raise ConfigError(f"unknown task id: {args.task_id}")
-            if existing_task.status in {TaskStatus.PAUSED, TaskStatus.WAITING_FOR_HUMAN}:
+            if existing_task.status in {TaskStatus.PAUSED, TaskStatus.WAITING_FOR_HUMAN, TaskStatus.FAILED}:
                 orch.store.update_task(replace(existing_task, status=TaskStatus.RUNNING))
-            orch.run(args.task_id)
+            TaskWorker(orch).run_task(args.task_id)
             print(json.dumps(_task_payload(orch, args.task_id)))
             return 0
 
+        if args.task_command == "worker":
+            if args.concurrency is not None and args.concurrency < 1:
+                raise ConfigError("--concurrency must be >= 1")
+            task_worker = TaskWorker(orch, worker_id=args.worker_id, concurrency=args.concurrency)
+            driven = task_worker.serve(exit_when_idle=args.once)
+            print(
+                json.dumps(
+                    {
+                        "worker_id": task_worker.worker_id,
+                        "tasks": [
+                            {"task_id": task_id, "status": snapshot.status.value}
+                            for task_id in driven
+                            if (snapshot := orch.get_task(task_id)) is not None
+                        ],
+                        "errors": task_worker.errors,
+                    }
+                )
+            )
+            return 0
+
+        if args.task_command == "compact":
+            keep = args.keep if args.keep is not None else cfg.task.payload_event_limit
+            if keep < 0:
+                raise ConfigError("--keep must be >= 0")
+            if args.task_id is not None and orch.get_task(args.task_id) is None:
+                raise ConfigError(f"unknown task id: {args.task_id}")
+            task_ids = [args.task_id] if args.task_id else [task.task_id for task in orch.store.list_tasks()]
+            results = [
+                compact_task_events(orch.store, task_id, archive_dir=cfg.task.archive_dir, keep_recent=keep)
+                for task_id in task_ids
+            ]
+            pruned = prune_verification_cache(orch.store, cfg.task.tool_policy)
+            print(json.dumps({"tasks": results, "verification_cache_pruned": pruned}))
+            return 0
+
         if args.task_command in {"inspect", "status"}:
             print(json.dumps(_task_payload(orch, args.task_id)))
             return 0
@@ -156,19 +210,60 @@ def _task_main(argv: list[str]) -> int:
     return 2
 
 
+def _transcripts_main(argv: list[str]) -> int:
+    parser = argparse.ArgumentParser(prog="freemad transcripts", description="FREE-MAD transcript maintenance")
+    sub = parser.add_subparsers(dest="transcripts_command", required=True)
+
+    gc = sub.add_parser("gc", help="Apply retention: archive or delete old runs, refresh the run index, prune the cache")
+    gc.add_argument("--config", help="Path to config file (yaml/json)")
+    gc.add_argument("--dir", help="Transcripts directory (default: output.transcript_dir)")
+    gc.add_argument("--dry-run", action="store_true", help="Report what would be removed without changing anything")
+    gc.add_argument("--rebuild-index", action="store_true", help="Re-read every transcript and archive into the index")
+
+    args = parser.parse_args(argv)
+
+    try:
+        cfg = load_config(path=args.config if args.config else None)
+    except ConfigError as e:
+        print(f"config error: {e}", file=sys.stderr)
+        return 2
+
+    transcripts_dir = args.dir or cfg.output.transcript_dir
+    try:
+        if args.rebuild_index:
+            refresh_index(transcripts_dir, rebuild=True)
+        report = gc_transcripts(
+            transcripts_dir,
+            cfg.retention,
+            events_dir=cfg.output.event_log_dir or None,
+            dry_run=args.dry_run,
+        )
+        cache = gc_cache(cfg.cache.dir, cfg.retention, dry_run=args.dry_run)
+    except OSError as e:
+        print(f"transcripts error: {e}", file=sys.stderr)
+        return 1
+    print(json.dumps({"transcripts": report.to_dict(), "cache": cache.to_dict()}))
+    return 0
+
+
 def main(argv: list[str] | None = None) -> int:
     argv_list = list(argv) if argv is not None else sys.argv[1:]
     if argv_list and argv_list[0] == "task":
         agent_bootstrap.register_builtin_agents()
         return _task_main(argv_list[1:])
+    if argv_list and argv_list[0] == "transcripts":
+        return _transcripts_main(argv_list[1:])
 
     parser = argparse.ArgumentParser(prog="freemad", description="FREE-MAD Orchestrator CLI")
     parser.add_argument("requirement", nargs="?", help="Problem statement to solve")
     parser.add_argument("--config", help="Path to config file (yaml/json)")
-    parser.add_argument("--rounds", type=int, default=1, help="Number of critique rounds")
+    parser.add_argument("--rounds", type=int, help="Number of critique rounds (default 1; with --resume: the run's own)")
     parser.add_argument("--save-transcript", action="store_true", help="Force saving transcript")
     parser.add_argument("--format", choices=["json", "markdown"], help="Transcript format override")
     parser.add_argument("--transcript-dir", help="Transcript directory override")
+    parser.add_argument("--event-log", action="store_true", help="Append run events to <transcript_dir>/events/<run_id>.jsonl")
+    parser.add_argument("--checkpoint", action="store_true", help="Checkpoint the debate after every round")
+    parser.add_argument("--resume", metavar="RUN_ID", help="Continue a checkpointed run after its last completed round")
     parser.add_argument("--verbose", action="store_true")
     parser.add_argument("--version", action="store_true", help="Print version and exit")
     parser.add_argument("--health", action="store_true", help="Print agent health and exit")
@@ -187,6 +282,10 @@ def main(argv: list[str] | None = None) -> int:
         overrides.setdefault("output", {})["transcript_dir"] = args.transcript_dir
     if args.format:
         overrides.setdefault("output", {})["format"] = args.format
+    if args.event_log:
+        overrides.setdefault("output", {})["event_log"] = True
+    if args.checkpoint or args.resume:
+        overrides.setdefault("checkpoint", {})["enabled"] = True
     try:
         cfg = load_config(path=args.config if args.config else None, overrides=overrides or None)
     except ConfigError as e:
@@ -195,23 +294,27 @@ def main(argv: list[str] | None = None) -> int:
 
     if args.health:
         from freemad.agents.factory import AgentFactory
+        from freemad.agents.health import get_health_monitor
 
         factory = AgentFactory(cfg)
         agents = factory.build_all()
-        for aid, a in agents.items():
-            h = a.health()
+        # Probe all agents concurrently; output keeps config order.
+        for aid, h in get_health_monitor(cfg.health).check(agents, force=True).items():
             status = "ok" if h.available else "unavailable"
             print(f"{aid}: {status} - {h.message or ''} {h.version or ''}")
 
         return 0
 
-    if not args.requirement:
-        print("requirement is required unless --health/--version", file=sys.stderr)
+    if not args.requirement and not args.resume:
+        print("requirement is required unless --health/--version/--resume", file=sys.stderr)
         return 2
 
     orch = Orchestrator(cfg)
     try:
-        result = orch.run(args.requirement, max_rounds=args.rounds)
+        if args.resume:
+            result = orch.resume(args.resume, max_rounds=args.rounds)
+        else:
+            result = orch.run(args.requirement, max_rounds=args.rounds if args.rounds is not None else 1)
     except ConfigError as e:
         print(
             "config error during run: "
@@ -226,6 +329,8 @@ def main(argv: list[str] | None = None) -> int:
     final_id = result['final_answer_id']
     final_score = result['scores'].get(final_id, 0.0)
     rounds = max(0, len(result['transcript']) - 1)
+    if cfg.checkpoint.enabled:
+        print(f"- Run id: {result['run_id']}")
     print(f"- Final answer id: {final_id}")
     print(f"- Final score: {final_score:.2f}")
     print(f"- Rounds: {rounds}")
@@ -239,6 +344,8 @@ def main(argv: list[str] | None = None) -> int:
         path = save_transcript(result, fmt, args.transcript_dir or cfg.output.transcript_dir)
         if args.verbose:
             print(f"Transcript saved to: {path}")
+    if args.verbose and result.get("event_log"):
+        print(f"Event log: {result['event_log']}")
     return 0
 
 
@@ -1,13 +1,16 @@
 from __future__ import annotations
 
+from collections import OrderedDict
 import dataclasses
+import hashlib
 import json
 import os
 import re
+import threading
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Dict, List, Literal, Optional
-from freemad.types import ActionKind, TaskRole, TieBreak
+from typing import Any, Dict, List, Literal, Optional, Sequence, Tuple
+from freemad.types import ActionKind, CanonicalizationMode, EarlyStopPolicy, TaskRole, TieBreak, TokenCounterKind
 
 
 class ConfigError(ValueError):
@@ -39,14 +42,19 @@ class AgentConfig:
     # Each entry (k: v) becomes either ['--k', 'v'] or [k, 'v'] if k already starts with '-'.
     cli_args: Dict[str, str] = field(default_factory=dict)
     # Extra single flags appended verbatim (order preserved), e.g., ['--enable', '-v']
-    cli_flags: List[str] = field(default_factory=list)
+    cli_flags: Tuple[str, ...] = ()
     # Extra positional args appended at the very end (order preserved), e.g., ['-']
-    cli_positional: List[str] = field(default_factory=list)
-    roles: List[TaskRole] = field(default_factory=list)
-    capabilities: List[ActionKind] = field(default_factory=list)
+    cli_positional: Tuple[str, ...] = ()
+    roles: Tuple[TaskRole, ...] = ()
+    capabilities: Tuple[ActionKind, ...] = ()
 
 
-TopologyType = Literal["all_to_all", "k_reviewers", "ring", "star"]
+TopologyType = Literal[
+    "all_to_all", "k_reviewers", "ring", "star", "expander", "small_world", "hierarchical", "rotating", "adaptive"
+]
+_TOPOLOGY_TYPES = (
+    "all_to_all", "k_reviewers", "ring", "star", "expander", "small_world", "hierarchical", "rotating", "adaptive"
+)
 
 
 @dataclass(frozen=True)
@@ -55,6 +63,10 @@ class TopologyConfig:
     k: Optional[int] = None
     seed: int = 12345
     hub_agent: Optional[str] = None
+    rewire_p: float = 0.1  # small_world: probability of rewiring each lattice link
+    cluster_size: Optional[int] = None  # hierarchical: agents per cluster
+    rotate: bool = True  # random/hierarchical topologies draw a fresh assignment every round
+    explore: int = 1  # adaptive: random lower-ranked answers shown in addition to the top k
 
 
 @dataclass(frozen=True)
@@ -62,33 +74,63 @@ class DeadlinesConfig:
     soft_timeout_ms: int = 15000
     hard_timeout_ms: int = 30000
     min_agents: int = 2
+    # Start round r+1 for fast agents once min_agents round-r results are in, instead of
+    # waiting for every agent (stragglers join when they finish).
+    pipelined: bool = False
 
 
 @dataclass(frozen=True)
 class ScoringConfig:
-    weights: List[float] = field(default_factory=lambda: [20.0, 25.0, 30.0, 20.0])
+    weights: Tuple[float, ...] = (20.0, 25.0, 30.0, 20.0)
     normalize: bool = True
     tie_break: TieBreak = TieBreak.DETERMINISTIC
     random_seed: int = 987654321
+    # How solutions are normalized before hashing into answer ids; looser modes let
+    # formatting-only differences share one answer (and its score).
+    canonicalization: CanonicalizationMode = CanonicalizationMode.EXACT
+
+
+@dataclass(frozen=True)
+class ClusteringConfig:
+    # Group near-duplicate answers (MinHash/LSH over canonical text) and select the
+    # final answer on pooled cluster scores instead of per-answer scores.
+    enabled: bool = False
+    threshold: float = 0.8  # estimated Jaccard similarity of shingle sets to merge
+    num_perm: int = 64  # MinHash signature length
+    bands: int = 16  # LSH bands; num_perm must be divisible by bands
+    shingle_size: int = 5  # tokens per shingle
+
+
+@dataclass(frozen=True)
+class HealthConfig:
+    # Agent health probes (`<cli> --version`) run in parallel and are cached for ttl_sec.
+    skip_unavailable: bool = False  # drop agents failing their probe before round 0
+    ttl_sec: float = 30.0
+    probe_interval_sec: float = 15.0  # dashboard background prober period; 0 disables
+    max_workers: int = 8
+
+
+@dataclass(frozen=True)
+class StoppingConfig:
+    # Convergence policies checked before each critique round; empty = always run max_rounds.
+    policies: Tuple[EarlyStopPolicy, ...] = ()
+    # Critique rounds that always run before any policy may stop the debate.
+    min_rounds: int = 1
 
 
 @dataclass(frozen=True)
 class SecurityConfig:
     api_key_source: Optional[str] = None
     api_key_name: Optional[str] = None
-    redact_patterns: List[str] = field(
-        default_factory=lambda: [r"sk-[A-Za-z0-9_\-]+", r"(?i)api[_-]?key\s*[:=]\s*\S+"]
-    )
+    redact_patterns: Tuple[str, ...] = (r"sk-[A-Za-z0-9_\-]+", r"(?i)api[_-]?key\s*[:=]\s*\S+")
     max_requirement_size: int = 20000  # bytes/characters
     max_solution_size: int = 40000
     max_critique_size: int = 20000
     cli_use_shell: bool = False
     cli_timeout_ms: int = 60000
-    cli_allowed_commands: List[str] = field(
-        default_factory=lambda: [
-            # Keep intentionally strict; adapters can override via config
-            "zen", "zen-mcp", "claude", "codex",
-        ]
+    cli_allowed_commands: Tuple[str, ...] = (
+        # Keep intentionally strict; adapters can override via config
+        "zen", "zen-mcp", "claude", "codex",
     )
 
 
@@ -98,10 +140,21 @@ class BudgetConfig:
     max_round_time_sec: Optional[float] = 30.0
     max_agent_time_sec: Optional[float] = 20.0
     max_tokens_per_agent_per_round: Optional[int] = None
+    max_peer_tokens: Optional[int] = None  # cap on peer text per critique prompt (approx tokens)
     max_total_tokens: Optional[int] = None
     enforce_total_tokens: bool = False  # when True, exceeding raises; default = log only
     enable_token_truncation: bool = True  # control prompt token truncation only
     max_concurrent_agents: Optional[int] = None
+    # Per-agent ledger across the whole debate; an agent whose next call would not fit is
+    # not called and its answer is carried forward, like a timeout.
+    max_tokens_per_agent: Optional[int] = None
+    max_time_per_agent_sec: Optional[float] = None
+    # With max_total_tokens set, admit agents cheapest-first (mean tokens per call) while
+    # the estimated spend of the round fits in what is left.
+    prefer_cheaper_agents: bool = False
+    # Token counting used for truncation, budgets and transcript metadata.
+    token_counter: TokenCounterKind = TokenCounterKind.APPROX
+    token_vocab_path: Optional[str] = None  # tiktoken-format rank file; required for bpe
 
 
 @dataclass(frozen=True)
@@ -111,6 +164,14 @@ class OutputConfig:
     format: Literal["json", "markdown"] = "json"
     verbose: bool = False
     include_topology_info: bool = True
+    # Append every RunEvent to <event_log_dir>/<run_id>.jsonl from a background writer thread.
+    event_log: bool = False
+    # Directory of per-run event logs; empty = <transcript_dir>/events.
+    event_log_dir: str = ""
+    # fsync each group commit, so a crash loses at most the batch being written.
+    event_log_fsync: bool = True
+    # Most events written per group commit.
+    event_log_batch_size: int = 256
 
 
 @dataclass(frozen=True)
@@ -119,6 +180,14 @@ class LoggingConfig:
     file: Optional[str] = None
     console: bool = True
     structured: bool = False
+    # Longest string field `log_event` writes (e.g. agent stdout); longer values are cut. 0 = unbounded.
+    max_field_chars: int = 4000
+    # Hand records to a background writer thread (flushes once per batch) instead of writing inline.
+    queue: bool = True
+    batch_size: int = 256
+    # Size-based rotation of `file`: rotate at max_bytes (0 = never), keeping backup_count old files.
+    max_bytes: int = 0
+    backup_count: int = 3
 
 
 @dataclass(frozen=True)
@@ -134,16 +203,63 @@ class CacheConfig:
     max_entries: Optional[int] = None
 
 
+@dataclass(frozen=True)
+class CheckpointConfig:
+    # Save the debate state after every completed round, so `Orchestrator.resume` can continue it.
+    enabled: bool = False
+    # One <run_id>.ckpt.json.gz per run.
+    dir: str = ".freemad/checkpoints"
+    # Keep the checkpoint of a run that finished (default: delete it).
+    keep_completed: bool = False
+
+
+@dataclass(frozen=True)
+class RetentionConfig:
+    # Applied by `freemad transcripts gc` and the dashboard's background janitor; None disables a rule.
+    # Loose transcripts older than this are packed into monthly archives (still readable).
+    archive_after_days: Optional[float] = 7.0
+    # Loose transcripts kept unpacked; the oldest beyond this are archived.
+    max_loose: Optional[int] = 200
+    # Runs (loose or archived) older than this are deleted, with their event logs.
+    delete_after_days: Optional[float] = None
+    # Runs kept in total; the oldest beyond this are deleted.
+    max_runs: Optional[int] = None
+    # Total transcript bytes on disk; the oldest runs are deleted until under the cap.
+    max_bytes: Optional[int] = None
+    # Response cache entries not read for this long are deleted.
+    cache_max_age_days: Optional[float] = 30.0
+    # Total cache bytes; least recently used entries are deleted first.
+    cache_max_bytes: Optional[int] = None
+    # Dashboard janitor period; 0 disables.
+    gc_interval_sec: float = 0.0
+
+
 @dataclass(frozen=True)
 class TaskToolPolicyConfig:
     allow_web_research: bool = True
     allow_workspace_write: bool = True
     allow_local_commands: bool = True
-    allowed_write_roots: List[str] = field(default_factory=lambda: ["."])
-    allowed_local_commands: List[str] = field(
-        default_factory=lambda: ["python", "python3", "pytest", "poetry", "ruff", "mypy"]
-    )
-    verification_commands: List[str] = field(default_factory=list)
+    allowed_write_roots: Tuple[str, ...] = (".",)
+    allowed_local_commands: Tuple[str, ...] = ("python", "python3", "pytest", "poetry", "ruff", "mypy")
+    verification_commands: Tuple[str, ...] = ()
+    # Upper bound on verification commands run at once; None => all of them.
+    verification_max_parallel: Optional[int] = None
+    # Reuse passing verification results while the workspace contents are unchanged.
+    verification_cache: bool = True
+    # Cached results older than this are dropped (installed dependencies may have changed); None keeps them.
+    verification_cache_ttl_sec: Optional[float] = 7 * 24 * 3600.0
+    # Newest cached results kept; None => unbounded.
+    verification_cache_max_entries: Optional[int] = 1000
+
+
+@dataclass(frozen=True)
+class TaskWorkerConfig:
+    # Tasks a single `freemad task worker` process drives at once.
+    concurrency: int = 2
+    # A claimed task is reclaimable by other workers once its lease expires.
+    lease_ms: int = 60000
+    heartbeat_ms: int = 15000
+    poll_interval_ms: int = 1000
 
 
 @dataclass(frozen=True)
@@ -152,21 +268,37 @@ class TaskConfig:
     artifacts_dir: str = ".freemad/tasks/artifacts"
     max_stage_retries: int = 2
     max_total_iterations: int = 20
+    # Number of independent reviewers consulted concurrently in plan/code review.
+    review_quorum: int = 1
+    # Approvals needed to accept a review; None => simple majority of the quorum.
+    review_approvals_required: Optional[int] = None
+    # Materialize a task state snapshot after this many events have been folded past the last one.
+    snapshot_every_events: int = 100
+    # Number of most recent events included in task payloads (inspect/status/dashboard).
+    payload_event_limit: int = 200
+    # Cold storage for events moved out by `freemad task compact`.
+    archive_dir: str = ".freemad/tasks/archive"
     tool_policy: TaskToolPolicyConfig = field(default_factory=TaskToolPolicyConfig)
+    worker: TaskWorkerConfig = field(default_factory=TaskWorkerConfig)
 
 
 @dataclass(frozen=True)
 class Config:
-    agents: List[AgentConfig]
+    agents: Tuple[AgentConfig, ...]
     topology: TopologyConfig = field(default_factory=TopologyConfig)
     deadlines: DeadlinesConfig = field(default_factory=DeadlinesConfig)
     scoring: ScoringConfig = field(default_factory=ScoringConfig)
+    stopping: StoppingConfig = field(default_factory=StoppingConfig)
+    clustering: ClusteringConfig = field(default_factory=ClusteringConfig)
+    health: HealthConfig = field(default_factory=HealthConfig)
     security: SecurityConfig = field(default_factory=SecurityConfig)
     budget: BudgetConfig = field(default_factory=BudgetConfig)
     output: OutputConfig = field(default_factory=OutputConfig)
     logging: LoggingConfig = field(default_factory=LoggingConfig)
     validation: ValidationConfig = field(default_factory=ValidationConfig)
     cache: CacheConfig = field(default_factory=CacheConfig)
+    checkpoint: CheckpointConfig = field(default_factory=CheckpointConfig)
+    retention: RetentionConfig = field(default_factory=RetentionConfig)
     task: TaskConfig = field(default_factory=TaskConfig)
 
 
@@ -197,7 +329,7 @@ def default_agents() -> List[AgentConfig]:
 
 
 def default_config() -> Config:
-    return Config(agents=default_agents())
+    return Config(agents=tuple(default_agents()))
 
 
 # ----------------------
@@ -208,7 +340,7 @@ def default_config() -> Config:
 def _asdict_cfg(cfg: Any) -> Dict[str, Any]:
     if dataclasses.is_dataclass(cfg):
         return {k: _asdict_cfg(v) for k, v in dataclasses.asdict(cfg).items()}  # type: ignore[arg-type]
-    if isinstance(cfg, list):
+    if isinstance(cfg, (list, tuple)):
         return [_asdict_cfg(x) for x in cfg]  # type: ignore[return-value]
     return cfg  # type: ignore[return-value]
 
@@ -222,7 +354,7 @@ def to_dict(cfg: Config) -> Dict[str, Any]:
 # ----------------------
 
 
-def _validate_agents(agents: List[AgentConfig]) -> None:
+def _validate_agents(agents: Sequence[AgentConfig]) -> None:
     if len(agents) < 2:
         raise ConfigError("config.agents must contain at least 2 agents")
 
@@ -241,16 +373,25 @@ def _validate_agents(agents: List[AgentConfig]) -> None:
             raise ConfigError(f"agent {a.id} capabilities must be valid action kinds")
 
 
-def _validate_topology(top: TopologyConfig, agents: List[AgentConfig]) -> None:
-    if top.type not in ("all_to_all", "k_reviewers", "ring", "star"):
+def _validate_topology(top: TopologyConfig, agents: Sequence[AgentConfig]) -> None:
+    if top.type not in _TOPOLOGY_TYPES:
         raise ConfigError(f"invalid topology.type: {top.type}")
 
     n = len(agents)
-    if top.type == "k_reviewers":
+    if top.type in ("k_reviewers", "expander", "small_world", "rotating", "adaptive"):
         if top.k is None:
-            raise ConfigError("topology.k required for k_reviewers")
+            raise ConfigError(f"topology.k required for {top.type}")
         if not (1 <= top.k <= max(1, n - 1)):
             raise ConfigError("topology.k must be in [1, N-1]")
+    if top.explore < 0:
+        raise ConfigError("topology.explore must be >= 0")
+    if not (0.0 <= top.rewire_p <= 1.0):
+        raise ConfigError("topology.rewire_p must be in [0, 1]")
+    if top.type == "hierarchical":
+        if top.cluster_size is None:
+            raise ConfigError("topology.cluster_size required for hierarchical")
+        if top.cluster_size < 2:
+            raise ConfigError("topology.cluster_size must be >= 2")
     if top.type == "star":
         if not top.hub_agent:
             raise ConfigError("topology.hub_agent required for star topology")
@@ -258,7 +399,7 @@ def _validate_topology(top: TopologyConfig, agents: List[AgentConfig]) -> None:
             raise ConfigError("topology.hub_agent must match an agent id")
 
 
-def _validate_deadlines(d: DeadlinesConfig, agents: List[AgentConfig]) -> None:
+def _validate_deadlines(d: DeadlinesConfig, agents: Sequence[AgentConfig]) -> None:
     if not (d.soft_timeout_ms > 0 and d.hard_timeout_ms > 0):
         raise ConfigError("deadlines timeouts must be positive")
     if d.soft_timeout_ms >= d.hard_timeout_ms:
@@ -275,6 +416,48 @@ def _validate_scoring(s: ScoringConfig) -> None:
     # tie_break is an enum by construction
 
 
+def _validate_clustering(c: ClusteringConfig) -> None:
+    if not 0.0 < c.threshold <= 1.0:
+        raise ConfigError("clustering.threshold must be in (0, 1]")
+    if c.num_perm < 1 or c.bands < 1 or c.num_perm % c.bands:
+        raise ConfigError("clustering.num_perm must be a positive multiple of clustering.bands")
+    if c.shingle_size < 1:
+        raise ConfigError("clustering.shingle_size must be >= 1")
+
+
+def _validate_health(h: HealthConfig) -> None:
+    if h.ttl_sec < 0:
+        raise ConfigError("health.ttl_sec must be >= 0")
+    if h.probe_interval_sec < 0:
+        raise ConfigError("health.probe_interval_sec must be >= 0")
+    if h.max_workers < 1:
+        raise ConfigError("health.max_workers must be >= 1")
+
+
+def _validate_retention(r: RetentionConfig) -> None:
+    for name in (
+        "archive_after_days",
+        "max_loose",
+        "delete_after_days",
+        "max_runs",
+        "max_bytes",
+        "cache_max_age_days",
+        "cache_max_bytes",
+    ):
+        value = getattr(r, name)
+        if value is not None and value < 0:
+            raise ConfigError(f"retention.{name} must be >= 0")
+    if r.gc_interval_sec < 0:
+        raise ConfigError("retention.gc_interval_sec must be >= 0")
+
+
+def _validate_stopping(s: StoppingConfig) -> None:
+    if s.min_rounds < 0:
+        raise ConfigError("stopping.min_rounds must be >= 0")
+    if len(set(s.policies)) != len(s.policies):
+        raise ConfigError("stopping.policies must not contain duplicates")
+
+
 def _validate_security(sec: SecurityConfig) -> None:
     if sec.cli_use_shell:
         # Disallowed by spec unless explicitly overridden later
@@ -296,17 +479,22 @@ def _validate_budget(b: BudgetConfig) -> None:
         "max_total_time_sec": b.max_total_time_sec,
         "max_round_time_sec": b.max_round_time_sec,
         "max_agent_time_sec": b.max_agent_time_sec,
+        "max_time_per_agent_sec": b.max_time_per_agent_sec,
     }
     for name, val in nums.items():
         if val is not None and val <= 0:
             raise ConfigError(f"budget.{name} must be > 0 if set")
     for name, val in (
         ("max_tokens_per_agent_per_round", b.max_tokens_per_agent_per_round),
+        ("max_peer_tokens", b.max_peer_tokens),
         ("max_total_tokens", b.max_total_tokens),
         ("max_concurrent_agents", b.max_concurrent_agents),
+        ("max_tokens_per_agent", b.max_tokens_per_agent),
     ):
         if val is not None and val <= 0:
             raise ConfigError(f"budget.{name} must be > 0 if set")
+    if b.token_counter == TokenCounterKind.BPE and not b.token_vocab_path:
+        raise ConfigError("budget.token_vocab_path required when budget.token_counter is bpe")
 
 
 def _validate_output(out: OutputConfig) -> None:
@@ -314,11 +502,19 @@ def _validate_output(out: OutputConfig) -> None:
         raise ConfigError("output.format must be json|markdown")
     if not out.transcript_dir:
         raise ConfigError("output.transcript_dir must be non-empty")
+    if out.event_log_batch_size < 1:
+        raise ConfigError("output.event_log_batch_size must be >= 1")
 
 
 def _validate_logging(log: LoggingConfig) -> None:
     if log.level not in ("DEBUG", "INFO", "WARNING", "ERROR"):
         raise ConfigError("logging.level must be DEBUG|INFO|WARNING|ERROR")
+    if log.max_field_chars < 0:
+        raise ConfigError("logging.max_field_chars must be >= 0")
+    if log.batch_size < 1:
+        raise ConfigError("logging.batch_size must be >= 1")
+    if log.max_bytes < 0 or log.backup_count < 0:
+        raise ConfigError("logging.max_bytes and logging.backup_count must be >= 0")
 
 
 def _validate_task(task: TaskConfig) -> None:
@@ -330,12 +526,34 @@ def _validate_task(task: TaskConfig) -> None:
         raise ConfigError("task.max_stage_retries must be >= 0")
     if task.max_total_iterations <= 0:
         raise ConfigError("task.max_total_iterations must be > 0")
+    if task.snapshot_every_events < 1:
+        raise ConfigError("task.snapshot_every_events must be >= 1")
+    if task.payload_event_limit < 1:
+        raise ConfigError("task.payload_event_limit must be >= 1")
+    if not task.archive_dir:
+        raise ConfigError("task.archive_dir must be non-empty")
+    if task.review_quorum < 1:
+        raise ConfigError("task.review_quorum must be >= 1")
+    if task.review_approvals_required is not None and not (1 <= task.review_approvals_required <= task.review_quorum):
+        raise ConfigError("task.review_approvals_required must be in [1, task.review_quorum]")
     if not all(isinstance(root, str) and root.strip() for root in task.tool_policy.allowed_write_roots):
         raise ConfigError("task.tool_policy.allowed_write_roots must be non-empty strings")
     if not all(isinstance(cmd, str) and cmd.strip() for cmd in task.tool_policy.allowed_local_commands):
         raise ConfigError("task.tool_policy.allowed_local_commands must be non-empty strings")
     if not all(isinstance(cmd, str) and cmd.strip() for cmd in task.tool_policy.verification_commands):
         raise ConfigError("task.tool_policy.verification_commands must be non-empty strings")
+    if task.tool_policy.verification_max_parallel is not None and task.tool_policy.verification_max_parallel < 1:
+        raise ConfigError("task.tool_policy.verification_max_parallel must be >= 1")
+    if task.tool_policy.verification_cache_ttl_sec is not None and task.tool_policy.verification_cache_ttl_sec < 0:
+        raise ConfigError("task.tool_policy.verification_cache_ttl_sec must be >= 0")
+    if task.tool_policy.verification_cache_max_entries is not None and task.tool_policy.verification_cache_max_entries < 0:
+        raise ConfigError("task.tool_policy.verification_cache_max_entries must be >= 0")
+    if task.worker.concurrency < 1:
+        raise ConfigError("task.worker.concurrency must be >= 1")
+    if task.worker.lease_ms <= 0 or task.worker.poll_interval_ms <= 0:
+        raise ConfigError("task.worker.lease_ms and task.worker.poll_interval_ms must be > 0")
+    if not (0 < task.worker.heartbeat_ms < task.worker.lease_ms):
+        raise ConfigError("task.worker.heartbeat_ms must be > 0 and < task.worker.lease_ms")
 
 
 def validate_config(cfg: Config) -> None:
@@ -343,6 +561,9 @@ def validate_config(cfg: Config) -> None:
     _validate_topology(cfg.topology, cfg.agents)
     _validate_deadlines(cfg.deadlines, cfg.agents)
     _validate_scoring(cfg.scoring)
+    _validate_stopping(cfg.stopping)
+    _validate_clustering(cfg.clustering)
+    _validate_health(cfg.health)
     _validate_security(cfg.security)
     _validate_budget(cfg.budget)
     _validate_output(cfg.output)
@@ -353,6 +574,9 @@ def validate_config(cfg: Config) -> None:
     # cache config
     if not cfg.cache.dir:
         raise ConfigError("cache.dir must be non-empty")
+    if not cfg.checkpoint.dir:
+        raise ConfigError("checkpoint.dir must be non-empty")
+    _validate_retention(cfg.retention)
     _validate_task(cfg.task)
 
 
@@ -375,7 +599,9 @@ def _maybe_parse_yaml(text: str) -> Dict[str, Any]:
     try:
         import yaml  # type: ignore
 
-        data = yaml.safe_load(text) or {}
+        # libyaml's C loader parses several times faster when PyYAML was built with it.
+        loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+        data = yaml.load(text, Loader=loader) or {}  # nosec B506 - safe loader
         if not isinstance(data, dict):
             raise ConfigError("YAML root must be a mapping")
         return data
@@ -428,10 +654,10 @@ def _coerce_agent(obj: Dict[str, Any]) -> AgentConfig:
         ),
         cli_mode_arg=bool(obj.get("cli_mode_arg", False)),
         cli_args={str(k): str(v) for k, v in dict(obj.get("cli_args", {}) or {}).items()},
-        cli_flags=[str(x) for x in list(obj.get("cli_flags", []) or [])],
-        cli_positional=[str(x) for x in list(obj.get("cli_positional", []) or [])],
-        roles=[_coerce_task_role(x) for x in list(obj.get("roles", []) or [])],
-        capabilities=[_coerce_action_kind(x) for x in list(obj.get("capabilities", []) or [])],
+        cli_flags=tuple(str(x) for x in list(obj.get("cli_flags", []) or [])),
+        cli_positional=tuple(str(x) for x in list(obj.get("cli_positional", []) or [])),
+        roles=tuple(_coerce_task_role(x) for x in list(obj.get("roles", []) or [])),
+        capabilities=tuple(_coerce_action_kind(x) for x in list(obj.get("capabilities", []) or [])),
     )
 
 
@@ -470,6 +696,36 @@ def _coerce_tiebreak(v: Any) -> TieBreak:
     raise ConfigError("scoring.tie_break must be deterministic|random")
 
 
+def _coerce_canonicalization(v: Any) -> CanonicalizationMode:
+    if isinstance(v, CanonicalizationMode):
+        return v
+    try:
+        return CanonicalizationMode(str(v).strip().lower())
+    except ValueError as exc:
+        allowed = "|".join(m.value for m in CanonicalizationMode)
+        raise ConfigError(f"scoring.canonicalization must be {allowed}") from exc
+
+
+def _coerce_token_counter(v: Any) -> TokenCounterKind:
+    if isinstance(v, TokenCounterKind):
+        return v
+    try:
+        return TokenCounterKind(str(v).strip().lower())
+    except ValueError as exc:
+        allowed = "|".join(k.value for k in TokenCounterKind)
+        raise ConfigError(f"budget.token_counter must be {allowed}") from exc
+
+
+def _coerce_early_stop_policy(v: Any) -> EarlyStopPolicy:
+    if isinstance(v, EarlyStopPolicy):
+        return v
+    try:
+        return EarlyStopPolicy(str(v).strip().lower())
+    except ValueError as exc:
+        allowed = "|".join(p.value for p in EarlyStopPolicy)
+        raise ConfigError(f"stopping.policies entries must be {allowed}") from exc
+
+
 def _coerce_task_role(v: Any) -> TaskRole:
     if isinstance(v, TaskRole):
         return v
@@ -493,23 +749,29 @@ def _coerce_action_kind(v: Any) -> ActionKind:
 def _coerce(cfg_dict: Dict[str, Any]) -> Config:
     agents_list = cfg_dict.get("agents")
     if not agents_list:
-        agents = default_agents()
+        agents = tuple(default_agents())
     else:
-        if not isinstance(agents_list, list):
+        if not isinstance(agents_list, (list, tuple)):
             raise ConfigError("config.agents must be a list")
-        agents = [_coerce_agent(a) for a in agents_list]
+        agents = tuple(_coerce_agent(a) for a in agents_list)
 
     topology = cfg_dict.get("topology", {})
     deadlines = cfg_dict.get("deadlines", {})
     scoring = cfg_dict.get("scoring", {})
+    stopping = cfg_dict.get("stopping", {})
+    clustering = cfg_dict.get("clustering", {})
+    health = cfg_dict.get("health", {})
     security = cfg_dict.get("security", {})
     budget = cfg_dict.get("budget", {})
     output = cfg_dict.get("output", {})
     logging = cfg_dict.get("logging", {})
     validation = cfg_dict.get("validation", {})
     cache = cfg_dict.get("cache", {})
+    checkpoint = cfg_dict.get("checkpoint", {})
+    retention = cfg_dict.get("retention", {})
     task = cfg_dict.get("task", {})
     task_tool_policy = dict(task.get("tool_policy", {}) or {})
+    task_worker = dict(task.get("worker", {}) or {})
 
     cfg = Config(
         agents=agents,
@@ -518,38 +780,67 @@ def _coerce(cfg_dict: Dict[str, Any]) -> Config:
             k=topology.get("k"),
             seed=int(topology.get("seed", 12345)),
             hub_agent=topology.get("hub_agent"),
+            rewire_p=float(topology.get("rewire_p", 0.1)),
+            cluster_size=_opt_int(topology.get("cluster_size")),
+            rotate=bool(topology.get("rotate", True)),
+            explore=int(topology.get("explore", 1)),
         ),
         deadlines=DeadlinesConfig(
             soft_timeout_ms=int(deadlines.get("soft_timeout_ms", 15000)),
             hard_timeout_ms=int(deadlines.get("hard_timeout_ms", 30000)),
             min_agents=int(deadlines.get("min_agents", 2)),
+            pipelined=bool(deadlines.get("pipelined", False)),
         ),
         scoring=ScoringConfig(
-            weights=[float(x) for x in scoring.get("weights", [20, 25, 30, 20])],
+            weights=tuple(float(x) for x in scoring.get("weights", [20, 25, 30, 20])),
             normalize=bool(scoring.get("normalize", True)),
             tie_break=_coerce_tiebreak(scoring.get("tie_break", TieBreak.DETERMINISTIC)),
             random_seed=int(scoring.get("random_seed", 987654321)),
+            canonicalization=_coerce_canonicalization(scoring.get("canonicalization", CanonicalizationMode.EXACT)),
+        ),
+        stopping=StoppingConfig(
+            policies=tuple(_coerce_early_stop_policy(p) for p in list(stopping.get("policies", []) or [])),
+            min_rounds=int(stopping.get("min_rounds", StoppingConfig().min_rounds)),
+        ),
+        clustering=ClusteringConfig(
+            enabled=bool(clustering.get("enabled", False)),
+            threshold=float(clustering.get("threshold", 0.8)),
+            num_perm=int(clustering.get("num_perm", 64)),
+            bands=int(clustering.get("bands", 16)),
+            shingle_size=int(clustering.get("shingle_size", 5)),
+        ),
+        health=HealthConfig(
+            skip_unavailable=bool(health.get("skip_unavailable", False)),
+            ttl_sec=float(health.get("ttl_sec", 30.0)),
+            probe_interval_sec=float(health.get("probe_interval_sec", 15.0)),
+            max_workers=int(health.get("max_workers", 8)),
         ),
         security=SecurityConfig(
             api_key_source=security.get("api_key_source"),
             api_key_name=security.get("api_key_name"),
-            redact_patterns=list(security.get("redact_patterns", SecurityConfig().redact_patterns)),
+            redact_patterns=tuple(security.get("redact_patterns", SecurityConfig().redact_patterns)),
             max_requirement_size=int(security.get("max_requirement_size", 20000)),
             max_solution_size=int(security.get("max_solution_size", 40000)),
             max_critique_size=int(security.get("max_critique_size", 20000)),
             cli_use_shell=bool(security.get("cli_use_shell", False)),
             cli_timeout_ms=int(security.get("cli_timeout_ms", 60000)),
-            cli_allowed_commands=list(security.get("cli_allowed_commands", SecurityConfig().cli_allowed_commands)),
+            cli_allowed_commands=tuple(security.get("cli_allowed_commands", SecurityConfig().cli_allowed_commands)),
         ),
         budget=BudgetConfig(
             max_total_time_sec=_opt_float(budget.get("max_total_time_sec", 120.0)),
             max_round_time_sec=_opt_float(budget.get("max_round_time_sec", 30.0)),
             max_agent_time_sec=_opt_float(budget.get("max_agent_time_sec", 20.0)),
             max_tokens_per_agent_per_round=_opt_int(budget.get("max_tokens_per_agent_per_round")),
+            max_peer_tokens=_opt_int(budget.get("max_peer_tokens")),
             max_total_tokens=_opt_int(budget.get("max_total_tokens")),
             enforce_total_tokens=bool(budget.get("enforce_total_tokens", False)),
             enable_token_truncation=bool(budget.get("enable_token_truncation", True)),
             max_concurrent_agents=_opt_int(budget.get("max_concurrent_agents")),
+            max_tokens_per_agent=_opt_int(budget.get("max_tokens_per_agent")),
+            max_time_per_agent_sec=_opt_float(budget.get("max_time_per_agent_sec")),
+            prefer_cheaper_agents=bool(budget.get("prefer_cheaper_agents", False)),
+            token_counter=_coerce_token_counter(budget.get("token_counter", TokenCounterKind.APPROX)),
+            token_vocab_path=budget.get("token_vocab_path"),
         ),
         output=OutputConfig(
             save_transcript=bool(output.get("save_transcript", True)),
@@ -557,12 +848,21 @@ def _coerce(cfg_dict: Dict[str, Any]) -> Config:
             format=output.get("format", "json"),
             verbose=bool(output.get("verbose", False)),
             include_topology_info=bool(output.get("include_topology_info", True)),
+            event_log=bool(output.get("event_log", False)),
+            event_log_dir=str(output.get("event_log_dir") or ""),
+            event_log_fsync=bool(output.get("event_log_fsync", True)),
+            event_log_batch_size=int(output.get("event_log_batch_size", 256)),
         ),
         logging=LoggingConfig(
             level=output_or(logging, "level", "INFO"),
             file=_opt_str(logging.get("file")),
             console=bool(logging.get("console", True)),
             structured=bool(logging.get("structured", False)),
+            max_field_chars=int(logging.get("max_field_chars", 4000)),
+            queue=bool(logging.get("queue", True)),
+            batch_size=int(logging.get("batch_size", 256)),
+            max_bytes=int(logging.get("max_bytes", 0)),
+            backup_count=int(logging.get("backup_count", 3)),
         ),
         validation=ValidationConfig(
             enable_sandbox=bool(validation.get("enable_sandbox", False)),
@@ -573,32 +873,105 @@ def _coerce(cfg_dict: Dict[str, Any]) -> Config:
             dir=str(cache.get("dir", ".mad_cache")),
             max_entries=_opt_int(cache.get("max_entries")),
         ),
+        checkpoint=CheckpointConfig(
+            enabled=bool(checkpoint.get("enabled", False)),
+            dir=str(checkpoint.get("dir", CheckpointConfig().dir)),
+            keep_completed=bool(checkpoint.get("keep_completed", False)),
+        ),
+        retention=RetentionConfig(
+            archive_after_days=_opt_float(retention.get("archive_after_days", RetentionConfig().archive_after_days)),
+            max_loose=_opt_int(retention.get("max_loose", RetentionConfig().max_loose)),
+            delete_after_days=_opt_float(retention.get("delete_after_days")),
+            max_runs=_opt_int(retention.get("max_runs")),
+            max_bytes=_opt_int(retention.get("max_bytes")),
+            cache_max_age_days=_opt_float(retention.get("cache_max_age_days", RetentionConfig().cache_max_age_days)),
+            cache_max_bytes=_opt_int(retention.get("cache_max_bytes")),
+            gc_interval_sec=float(retention.get("gc_interval_sec", RetentionConfig().gc_interval_sec)),
+        ),
         task=TaskConfig(
             store_path=str(task.get("store_path", TaskConfig().store_path)),
             artifacts_dir=str(task.get("artifacts_dir", TaskConfig().artifacts_dir)),
             max_stage_retries=int(task.get("max_stage_retries", TaskConfig().max_stage_retries)),
             max_total_iterations=int(task.get("max_total_iterations", TaskConfig().max_total_iterations)),
+            review_quorum=int(task.get("review_quorum", TaskConfig().review_quorum)),
+            review_approvals_required=_opt_int(task.get("review_approvals_required")),
+            snapshot_every_events=int(task.get("snapshot_every_events", TaskConfig().snapshot_every_events)),
+            payload_event_limit=int(task.get("payload_event_limit", TaskConfig().payload_event_limit)),
+            archive_dir=str(task.get("archive_dir", TaskConfig().archive_dir)),
             tool_policy=TaskToolPolicyConfig(
                 allow_web_research=bool(task_tool_policy.get("allow_web_research", True)),
                 allow_workspace_write=bool(task_tool_policy.get("allow_workspace_write", True)),
                 allow_local_commands=bool(task_tool_policy.get("allow_local_commands", True)),
-                allowed_write_roots=list(task_tool_policy.get("allowed_write_roots", ["."])),
-                allowed_local_commands=list(
+                allowed_write_roots=tuple(task_tool_policy.get("allowed_write_roots", ["."])),
+                allowed_local_commands=tuple(
                     task_tool_policy.get(
                         "allowed_local_commands",
                         TaskToolPolicyConfig().allowed_local_commands,
                     )
                 ),
-                verification_commands=list(task_tool_policy.get("verification_commands", [])),
+                verification_commands=tuple(task_tool_policy.get("verification_commands", [])),
+                verification_max_parallel=_opt_int(task_tool_policy.get("verification_max_parallel")),
+                verification_cache=bool(task_tool_policy.get("verification_cache", True)),
+                verification_cache_ttl_sec=_opt_float(
+                    task_tool_policy.get("verification_cache_ttl_sec", TaskToolPolicyConfig().verification_cache_ttl_sec)
+                ),
+                verification_cache_max_entries=_opt_int(
+                    task_tool_policy.get("verification_cache_max_entries", TaskToolPolicyConfig().verification_cache_max_entries)
+                ),
+            ),
+            worker=TaskWorkerConfig(
+                concurrency=int(task_worker.get("concurrency", TaskWorkerConfig().concurrency)),
+                lease_ms=int(task_worker.get("lease_ms", TaskWorkerConfig().lease_ms)),
+                heartbeat_ms=int(task_worker.get("heartbeat_ms", TaskWorkerConfig().heartbeat_ms)),
+                poll_interval_ms=int(task_worker.get("poll_interval_ms", TaskWorkerConfig().poll_interval_ms)),
             ),
         ),
     )
     return cfg
 
 
+# Compiled configs keyed by (working dir, config file, file content hash, overrides hash).
+# File content hashes are keyed by (mtime_ns, size), so an unchanged file is not re-read.
+_CONFIG_CACHE_SIZE = 128
+_CONFIG_CACHE: "OrderedDict[Tuple[str, str, str, str], Config]" = OrderedDict()
+_FILE_HASHES: Dict[str, Tuple[int, int, str]] = {}
+_CONFIG_CACHE_LOCK = threading.Lock()
+
+
+def clear_config_cache() -> None:
+    with _CONFIG_CACHE_LOCK:
+        _CONFIG_CACHE.clear()
+        _FILE_HASHES.clear()
+
+
+def _file_content_hash(cfg_file: Path) -> str:
+    st = cfg_file.stat()
+    key = str(cfg_file)
+    with _CONFIG_CACHE_LOCK:
+        known = _FILE_HASHES.get(key)
+    if known is not None and known[:2] == (st.st_mtime_ns, st.st_size):
+        return known[2]
+    digest = hashlib.sha256(cfg_file.read_bytes()).hexdigest()
+    with _CONFIG_CACHE_LOCK:
+        _FILE_HASHES[key] = (st.st_mtime_ns, st.st_size, digest)
+    return digest
+
+
+def _overrides_hash(overrides: Optional[Dict[str, Any]]) -> Optional[str]:
+    if not overrides:
+        return ""
+    try:
+        blob = json.dumps(overrides, sort_keys=True, separators=(",", ":"))
+    except (TypeError, ValueError):
+        return None  # not JSON-serializable: compile without caching
+    return hashlib.sha256(blob.encode("utf-8")).hexdigest()
+
+
 def load_config(
     path: Optional[str | os.PathLike[str]] = None,
     overrides: Optional[Dict[str, Any]] = None,
+    *,
+    cache: bool = True,
 ) -> Config:
     """Load, merge, validate, and finalize a Config.
 
@@ -607,12 +980,41 @@ def load_config(
     - Optional overrides dict (deep-merged)
     - Validates and ensures transcript directory if needed
     - Returns an immutable Config
+
+    Compiled configs are cached by file content and overrides, so repeated calls
+    (e.g. per dashboard request) return the same pre-validated object; its
+    collections are tuples, so sharing it is safe. Configured directories are
+    re-created on every call, cached or not. An edited file is picked up through
+    its mtime/size.
     """
+    cfg_file = _resolve_existing_config_file(path) if path else None
+    config_root = cfg_file.parent if cfg_file is not None else Path.cwd().resolve()
+    key: Optional[Tuple[str, str, str, str]] = None
+    if cache:
+        ov_hash = _overrides_hash(overrides)
+        if ov_hash is not None:
+            content = _file_content_hash(cfg_file) if cfg_file is not None else ""
+            key = (os.getcwd(), str(cfg_file or ""), content, ov_hash)
+            with _CONFIG_CACHE_LOCK:
+                hit = _CONFIG_CACHE.get(key)
+                if hit is not None:
+                    _CONFIG_CACHE.move_to_end(key)
+            if hit is not None:
+                _ensure_config_dirs(hit, config_root)
+                return hit
+    cfg = _compile_config(cfg_file, overrides)
+    _ensure_config_dirs(cfg, config_root)
+    if key is not None:
+        with _CONFIG_CACHE_LOCK:
+            _CONFIG_CACHE[key] = cfg
+            while len(_CONFIG_CACHE) > _CONFIG_CACHE_SIZE:
+                _CONFIG_CACHE.popitem(last=False)
+    return cfg
+
+
+def _compile_config(cfg_file: Optional[Path], overrides: Optional[Dict[str, Any]]) -> Config:
     base_dict: Dict[str, Any] = to_dict(default_config())
-    config_root = Path.cwd().resolve()
-    if path:
-        cfg_file = _resolve_existing_config_file(path)
-        config_root = cfg_file.parent
+    if cfg_file is not None:
         file_dict = _load_config_file(cfg_file)
         base_dict = _deep_update(base_dict, file_dict)
 
@@ -621,15 +1023,20 @@ def load_config(
 
     cfg = _coerce(base_dict)
     validate_config(cfg)
+    return cfg
+
 
+def _ensure_config_dirs(cfg: Config, config_root: Path) -> None:
     # Ensure transcript dir exists if requested
     if cfg.output.save_transcript:
         _ensure_dir(cfg.output.transcript_dir, config_root)
+    if cfg.output.event_log:
+        _ensure_dir(cfg.output.event_log_dir or str(Path(cfg.output.transcript_dir) / "events"), config_root)
     # Ensure cache dir if enabled
     if cfg.cache.enabled and cfg.cache.dir:
         _ensure_dir(cfg.cache.dir, config_root)
-
-    return cfg
+    if cfg.checkpoint.enabled:
+        _ensure_dir(cfg.checkpoint.dir, config_root)
 
 
 def _ensure_dir(path_str: str, root: Path) -> None:
@@ -1,13 +1,12 @@
 from __future__ import annotations
 
 import argparse
-import json
 import os
 import re
 import secrets
 import threading
 import time
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
 from typing import Any, Dict, List, Optional
@@ -22,14 +21,18 @@ import difflib
 import anyio
 import yaml  # type: ignore[import-untyped]
 
-from freemad.config import load_config, ConfigError
+from freemad.config import HealthConfig, RetentionConfig, TaskConfig, load_config, ConfigError
+from freemad.agents.factory import AgentFactory
+from freemad.agents.health import HealthProber, get_health_monitor
 from freemad.dashboard.live_manager import LiveRunManager
 from freemad.dashboard.task_live_manager import TaskLiveManager
-from freemad.dashboard.task_state import apply_task_event, initial_task_snapshot
+from freemad.tasks.compaction import load_task_snapshot
 from freemad.tasks.orchestrator import TaskOrchestrator
 from freemad.tasks.store import TaskStore
 from freemad.types import RunEventKind, TaskEventKind, TaskStatus, TaskType
 from freemad.agents import bootstrap as agent_bootstrap
+from freemad.utils import jsonio
+from freemad.utils.retention import TranscriptJanitor, delete_run, read_transcript, refresh_index
 
 
 @dataclass(frozen=True)
@@ -37,6 +40,8 @@ class DashboardConfig:
     transcripts_dir: str = "transcripts"
     task_store_path: Path = Path(".freemad/tasks/tasks.db")
     task_artifacts_dir: Path = Path(".freemad/tasks/artifacts")
+    task_snapshot_every_events: int = TaskConfig().snapshot_every_events
+    task_payload_event_limit: int = TaskConfig().payload_event_limit
     override_path: Path | None = None
     override_base: Path | None = None
     enable_csrf: bool = False
@@ -45,6 +50,11 @@ class DashboardConfig:
     rate_limit_per_minute: int = 30
     enable_cors: bool = False
     cors_origins: List[str] | None = None
+    # Background health probes of the override config's agents; 0 disables.
+    health_probe_interval_sec: float = HealthConfig().probe_interval_sec
+    # Background transcript retention (archive/delete per `retention`); 0 disables.
+    gc_interval_sec: float = RetentionConfig().gc_interval_sec
+    retention: RetentionConfig = field(default_factory=RetentionConfig)
 
 
 DEFAULT_OVERRIDE_PATH = Path("config_examples/user_override.yaml")
@@ -75,11 +85,15 @@ def _ensure_user_override_config(path: Path, base: Path | None) -> Path:
     return path
 
 
-def _load_json(p: Path) -> Dict[str, Any]:
+def _load_run(transcripts_root: Path, file: str) -> Dict[str, Any]:
+    # Loose transcripts and those packed into archive/ by retention.
+    raw = read_transcript(transcripts_root, file)
+    if raw is None:
+        raise HTTPException(status_code=404, detail="run not found")
     try:
-        return json.loads(p.read_text(encoding="utf-8"))
+        return jsonio.loads(raw)
     except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Failed to read {p.name}: {e}")
+        raise HTTPException(status_code=500, detail=f"Failed to read {file}: {e}")
 
 
 def _validate_transcript_filename(file: str, transcripts_root: Path) -> Path:
@@ -104,22 +118,22 @@ def _validate_config_path(config_path: str | None, allowed_root: Path) -> str |
 
 
 def _list_runs(dirpath: Path) -> List[Dict[str, Any]]:
-    files = sorted(dirpath.glob("transcript-*.json"))
+    # Summaries come from the run index; only new or changed transcripts are parsed.
     runs: List[Dict[str, Any]] = []
-    for f in files:
-        obj = _load_json(f)
-        ts = _parse_ts(f.name)
-        ts_display = ts.strftime("%b %d, %Y %H:%M:%S") if ts else None
+    for name, entry in refresh_index(dirpath).items():
+        if not TRANSCRIPT_FILE_PATTERN.match(name):
+            continue
         runs.append(
             {
-                "file": f.name,
-                "timestamp": ts.isoformat() if ts else None,
-                "display_time": ts_display,
-                "final_answer_id": obj.get("final_answer_id"),
-                "winning_agents": obj.get("winning_agents", []),
-                "rounds": max(0, len(obj.get("transcript", [])) - 1),
-                "scores": obj.get("scores", {}),
-                "metrics": obj.get("metrics", {}),
+                "file": name,
+                "timestamp": entry["timestamp"],
+                "display_time": entry["display_time"],
+                "final_answer_id": entry["final_answer_id"],
+                "winning_agents": entry["winning_agents"],
+                "rounds": entry["rounds"],
+                "scores": entry["scores"],
+                "metrics": entry["metrics"],
+                "archived": entry["archive"] is not None,
             }
         )
     runs.sort(key=lambda x: x.get("timestamp") or "", reverse=True)
@@ -195,6 +209,21 @@ def create_app(cfg: DashboardConfig) -> FastAPI:
     task_artifacts_dir = Path(cfg.task_artifacts_dir)
     task_store = TaskStore(task_store_path, task_artifacts_dir)
 
+    def _override_agents() -> Dict[str, Any]:
+        cfg_obj = load_config(path=str(_ensure_user_override_config(override_path, override_base)))
+        return dict(AgentFactory(cfg_obj).build_all())
+
+    # Shares the default-config monitor with live runs, so their pre-round-0
+    # health checks hit results the prober already cached.
+    health_prober = HealthProber(get_health_monitor(HealthConfig()), _override_agents, cfg.health_probe_interval_sec)
+    app.state.health_prober = health_prober
+    app.router.on_startup.append(health_prober.start)
+    app.router.on_shutdown.append(health_prober.stop)
+    janitor = TranscriptJanitor(transcripts_root, cfg.retention, cfg.gc_interval_sec)
+    app.state.transcript_janitor = janitor
+    app.router.on_startup.append(janitor.start)
+    app.router.on_shutdown.append(janitor.stop)
+
     class _RateLimiter:
         def __init__(self, limit: int) -> None:
             self.limit = max(1, limit)
@@ -257,6 +286,17 @@ def create_app(cfg: DashboardConfig) -> FastAPI:
     def health() -> Dict[str, Any]:
         return {"status": "ok", "transcripts_dir": str(transcripts_root.resolve())}
 
+    @app.get("/api/agents/health", response_class=JSONResponse)
+    def api_agents_health(refresh: bool = False) -> Dict[str, Any]:
+        if refresh:
+            health_prober.probe_once()
+        return {
+            "agents": health_prober.monitor.snapshot(),
+            "ttl_sec": health_prober.monitor.ttl_sec,
+            "probe_interval_sec": health_prober.interval_sec,
+            "error": health_prober.last_error,
+        }
+
     @app.get("/api/runs", response_class=JSONResponse)
     def api_runs(page: int | None = None, limit: int | None = None) -> Any:
         runs = _list_runs(transcripts_root)
@@ -270,10 +310,8 @@ def create_app(cfg: DashboardConfig) -> FastAPI:
 
     @app.get("/api/runs/{file}", response_class=JSONResponse)
     def api_run_detail(file: str) -> Dict[str, Any]:
-        p = _validate_transcript_filename(file, transcripts_root)
-        if not p.exists():
-            raise HTTPException(status_code=404, detail="run not found")
-        obj = _load_json(p)
+        _validate_transcript_filename(file, transcripts_root)
+        obj = _load_run(transcripts_root, file)
         # Backfill winning_agents if missing (older transcripts)
         if not obj.get("winning_agents"):
             fid = obj.get("final_answer_id")
@@ -290,10 +328,9 @@ def create_app(cfg: DashboardConfig) -> FastAPI:
 
     @app.delete("/api/runs/{file}", response_class=JSONResponse)
     def api_run_delete(file: str) -> Dict[str, str]:
-        p = _validate_transcript_filename(file, transcripts_root)
-        if not p.exists():
+        _validate_transcript_filename(file, transcripts_root)
+        if not delete_run(transcripts_root, file):
             raise HTTPException(status_code=404, detail="run not found")
-        p.unlink()
         return {"message": "deleted", "file": file}
 
     @app.post("/api/live-runs", response_class=JSONResponse)
@@ -340,7 +377,7 @@ def create_app(cfg: DashboardConfig) -> FastAPI:
             while True:
                 try:
                     event = await anyio.to_thread.run_sync(lambda: q.get(timeout=1.0))
-                    await ws.send_json({"event": event.to_dict()})
+                    await ws.send_text(jsonio.encode(event, wrap="event"))
                     if event.kind in (
                         RunEventKind.RUN_COMPLETED,
                         RunEventKind.RUN_FAILED,
@@ -358,23 +395,14 @@ def create_app(cfg: DashboardConfig) -> FastAPI:
         task = task_store.get_task(task_id)
         if task is None:
             raise HTTPException(status_code=404, detail="task not found")
-        events = task_store.list_events(task_id)
-        snapshot = initial_task_snapshot(task_id)
-        for event in events:
-            snapshot = apply_task_event(snapshot, event)
+        snapshot, _ = load_task_snapshot(task_store, task_id, snapshot_every=cfg.task_snapshot_every_events)
+        events = task_store.list_recent_events(task_id, cfg.task_payload_event_limit)
         return {
             **task.to_dict(),
             "artifacts": [artifact.to_dict() for artifact in task_store.list_artifacts(task_id)],
             "work_items": [item.to_dict() for item in task_store.list_work_items(task_id)],
             "events": [event.to_dict() for event in events],
-            "snapshot": {
-                "task_id": snapshot.task_id,
-                "status": snapshot.status.value,
-                "current_stage": snapshot.current_stage.value if snapshot.current_stage is not None else None,
-                "artifact_counts": dict(snapshot.artifact_counts),
-                "completed": snapshot.completed,
-                "error": snapshot.error,
-            },
+            "snapshot": snapshot.to_dict(),
         }
 
     @app.get("/api/tasks", response_class=JSONResponse)
@@ -423,7 +451,7 @@ def create_app(cfg: DashboardConfig) -> FastAPI:
     async def ws_task(ws: WebSocket, task_id: str) -> None:
         await ws.accept()
         try:
-            sent = 0
+            last_seq = 0
             terminal_deadline: float | None = None
             terminal_statuses = {
                 TaskStatus.COMPLETED,
@@ -432,15 +460,13 @@ def create_app(cfg: DashboardConfig) -> FastAPI:
                 TaskStatus.WAITING_FOR_HUMAN,
             }
             while True:
-                events = task_store.list_events(task_id)
+                events = task_store.list_events_since(task_id, last_seq)
                 task = task_store.get_task(task_id)
-                if not events and task is None and not task_live_manager.has_task(task_id):
+                if not events and last_seq == 0 and task is None and not task_live_manager.has_task(task_id):
                     await ws.close(code=1008)
                     return
-                while sent < len(events):
-                    event = events[sent]
-                    sent += 1
-                    await ws.send_json({"event": event.to_dict()})
+                for last_seq, event in events:
+                    await ws.send_text(jsonio.encode(event, wrap="event"))
                     await anyio.sleep(0)
                     if event.kind in (
                         TaskEventKind.TASK_COMPLETED,
@@ -502,10 +528,8 @@ def create_app(cfg: DashboardConfig) -> FastAPI:
 
     @app.get("/runs/{file}", response_class=HTMLResponse)
     def run_detail(request: Request, file: str) -> HTMLResponse:
-        p = _validate_transcript_filename(file, transcripts_root)
-        if not p.exists():
-            raise HTTPException(status_code=404, detail="run not found")
-        obj = _load_json(p)
+        _validate_transcript_filename(file, transcripts_root)
+        obj = _load_run(transcripts_root, file)
         # augment for UI
         obj["_file"] = file
         ts = _parse_ts(file)
@@ -583,9 +607,25 @@ def main(argv: Optional[List[str]] = None) -> int:
     ap.add_argument("--dir", default="transcripts", help="Transcripts directory")
     ap.add_argument("--host", default="127.0.0.1")
     ap.add_argument("--port", default=8000, type=int)
+    ap.add_argument(
+        "--health-interval",
+        default=HealthConfig().probe_interval_sec,
+        type=float,
+        help="Seconds between background agent health probes (0 disables)",
+    )
+    ap.add_argument(
+        "--gc-interval",
+        default=RetentionConfig().gc_interval_sec,
+        type=float,
+        help="Seconds between background transcript retention sweeps (0 disables)",
+    )
     args = ap.parse_args(argv)
 
-    cfg = DashboardConfig(transcripts_dir=args.dir)
+    cfg = DashboardConfig(
+        transcripts_dir=args.dir,
+        health_probe_interval_sec=args.health_interval,
+        gc_interval_sec=args.gc_interval,
+    )
     app = create_app(cfg)
 
     # Run uvicorn programmatically
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
 from typing import Dict, List, Optional
 
 from freemad.run_events import RunEvent
@@ -16,7 +16,7 @@ class AgentStatus(StrEnum):
     ERROR = "error"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class AgentSnapshot:
     agent_id: str
     status: AgentStatus = AgentStatus.WAITING
@@ -25,7 +25,7 @@ class AgentSnapshot:
     last_decision: Optional[Decision] = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class RunSnapshot:
     run_id: str
     round_index: Optional[int] = None
@@ -59,52 +59,37 @@ def _update_agent(
     changes_count = prev.changes_count
     if changed:
         changes_count += 1
-    new_agents = dict(agents)
-    new_agents[agent_id] = AgentSnapshot(
+    updated = AgentSnapshot(
         agent_id=agent_id,
         status=new_status,
         current_answer_id=new_answer,
         changes_count=changes_count,
         last_decision=new_decision,
     )
+    if updated == prev and agent_id in agents:
+        return agents  # nothing changed; keep sharing the existing mapping
+    new_agents = dict(agents)
+    new_agents[agent_id] = updated
     return new_agents
 
 
 def apply_event(snapshot: RunSnapshot, event: RunEvent) -> RunSnapshot:
+    """Fold one event into `snapshot`.
+
+    Snapshots are immutable, so unchanged fields (including the agents, scores and
+    holders containers) are shared with the previous snapshot rather than copied.
+    """
     if event.run_id != snapshot.run_id:
         return snapshot
 
     # Round-level changes
     if event.kind == RunEventKind.ROUND_STARTED:
-        return RunSnapshot(
-            run_id=snapshot.run_id,
-            round_index=event.round_index,
-            round_type=event.round_type,
-            agents=snapshot.agents,
-            scores=snapshot.scores,
-            holders=snapshot.holders,
-            final_answer_id=snapshot.final_answer_id,
-            winning_agents=snapshot.winning_agents,
-            completed=snapshot.completed,
-            error=snapshot.error,
-        )
+        return replace(snapshot, round_index=event.round_index, round_type=event.round_type)
 
     if event.kind == RunEventKind.AGENT_GENERATE_STARTED:
         if event.agent_id is None:
             return snapshot
-        agents = _update_agent(snapshot.agents, event.agent_id, status=AgentStatus.GENERATING)
-        return RunSnapshot(
-            run_id=snapshot.run_id,
-            round_index=snapshot.round_index,
-            round_type=snapshot.round_type,
-            agents=agents,
-            scores=snapshot.scores,
-            holders=snapshot.holders,
-            final_answer_id=snapshot.final_answer_id,
-            winning_agents=snapshot.winning_agents,
-            completed=snapshot.completed,
-            error=snapshot.error,
-        )
+        return replace(snapshot, agents=_update_agent(snapshot.agents, event.agent_id, status=AgentStatus.GENERATING))
 
     if event.kind == RunEventKind.AGENT_GENERATE_FINISHED:
         if event.agent_id is None:
@@ -116,35 +101,12 @@ def apply_event(snapshot: RunSnapshot, event: RunEvent) -> RunSnapshot:
             answer_id=event.answer_id,
             decision=event.decision,
         )
-        return RunSnapshot(
-            run_id=snapshot.run_id,
-            round_index=snapshot.round_index,
-            round_type=snapshot.round_type,
-            agents=agents,
-            scores=snapshot.scores,
-            holders=snapshot.holders,
-            final_answer_id=snapshot.final_answer_id,
-            winning_agents=snapshot.winning_agents,
-            completed=snapshot.completed,
-            error=snapshot.error,
-        )
+        return replace(snapshot, agents=agents)
 
     if event.kind == RunEventKind.AGENT_CRITIQUE_STARTED:
         if event.agent_id is None:
             return snapshot
-        agents = _update_agent(snapshot.agents, event.agent_id, status=AgentStatus.CRITIQUING)
-        return RunSnapshot(
-            run_id=snapshot.run_id,
-            round_index=snapshot.round_index,
-            round_type=snapshot.round_type,
-            agents=agents,
-            scores=snapshot.scores,
-            holders=snapshot.holders,
-            final_answer_id=snapshot.final_answer_id,
-            winning_agents=snapshot.winning_agents,
-            completed=snapshot.completed,
-            error=snapshot.error,
-        )
+        return replace(snapshot, agents=_update_agent(snapshot.agents, event.agent_id, status=AgentStatus.CRITIQUING))
 
     if event.kind == RunEventKind.AGENT_CRITIQUE_FINISHED:
         if event.agent_id is None:
@@ -157,59 +119,15 @@ def apply_event(snapshot: RunSnapshot, event: RunEvent) -> RunSnapshot:
             decision=event.decision,
             changed=event.changed,
         )
-        return RunSnapshot(
-            run_id=snapshot.run_id,
-            round_index=snapshot.round_index,
-            round_type=snapshot.round_type,
-            agents=agents,
-            scores=snapshot.scores,
-            holders=snapshot.holders,
-            final_answer_id=snapshot.final_answer_id,
-            winning_agents=snapshot.winning_agents,
-            completed=snapshot.completed,
-            error=snapshot.error,
-        )
+        return replace(snapshot, agents=agents)
 
     if event.kind == RunEventKind.SCORES_UPDATED:
-        return RunSnapshot(
-            run_id=snapshot.run_id,
-            round_index=snapshot.round_index,
-            round_type=snapshot.round_type,
-            agents=snapshot.agents,
-            scores=dict(event.scores),
-            holders={k: list(v) for k, v in event.holders.items()},
-            final_answer_id=snapshot.final_answer_id,
-            winning_agents=snapshot.winning_agents,
-            completed=snapshot.completed,
-            error=snapshot.error,
-        )
+        return replace(snapshot, scores=dict(event.scores), holders={k: list(v) for k, v in event.holders.items()})
 
     if event.kind == RunEventKind.FINAL_ANSWER_SELECTED:
-        return RunSnapshot(
-            run_id=snapshot.run_id,
-            round_index=snapshot.round_index,
-            round_type=snapshot.round_type,
-            agents=snapshot.agents,
-            scores=snapshot.scores,
-            holders=snapshot.holders,
-            final_answer_id=event.final_answer_id,
-            winning_agents=list(event.winning_agents),
-            completed=snapshot.completed,
-            error=snapshot.error,
-        )
+        return replace(snapshot, final_answer_id=event.final_answer_id, winning_agents=list(event.winning_agents))
 
     if event.kind in (RunEventKind.RUN_COMPLETED, RunEventKind.RUN_FAILED, RunEventKind.RUN_BUDGET_EXCEEDED):
-        return RunSnapshot(
-            run_id=snapshot.run_id,
-            round_index=snapshot.round_index,
-            round_type=snapshot.round_type,
-            agents=snapshot.agents,
-            scores=snapshot.scores,
-            holders=snapshot.holders,
-            final_answer_id=snapshot.final_answer_id,
-            winning_agents=snapshot.winning_agents,
-            completed=True,
-            error=event.error if event.error is not None else snapshot.error,
-        )
+        return replace(snapshot, completed=True, error=event.error if event.error is not None else snapshot.error)
 
     return snapshot
@@ -6,6 +6,7 @@ from typing import Dict
 
 from freemad.config import Config
 from freemad.tasks.orchestrator import TaskOrchestrator
+from freemad.tasks.worker import TaskWorker
 from freemad.types import TaskType
 
 
@@ -26,7 +27,7 @@ class TaskLiveManager:
 
         def _worker() -> None:
             try:
-                orch.run(task.task_id)
+                TaskWorker(orch).run_task(task.task_id)
             finally:
                 self._mark_completed(task.task_id)
 
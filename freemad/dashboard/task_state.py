@@ -1,13 +1,13 @@
 from __future__ import annotations
 
-from dataclasses import dataclass, field
-from typing import Dict, Optional
+from dataclasses import dataclass, field, replace
+from typing import Any, Dict, Optional
 
 from freemad.task_events import TaskEvent
 from freemad.types import TaskEventKind, TaskStage, TaskStatus
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TaskSnapshot:
     task_id: str
     status: TaskStatus = TaskStatus.PENDING
@@ -16,43 +16,50 @@ class TaskSnapshot:
     completed: bool = False
     error: Optional[str] = None
 
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "task_id": self.task_id,
+            "status": self.status.value,
+            "current_stage": self.current_stage.value if self.current_stage is not None else None,
+            "artifact_counts": dict(self.artifact_counts),
+            "completed": self.completed,
+            "error": self.error,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> TaskSnapshot:
+        return cls(
+            task_id=str(data.get("task_id", "")),
+            status=TaskStatus(str(data.get("status", TaskStatus.PENDING.value))),
+            current_stage=TaskStage(str(data["current_stage"])) if data.get("current_stage") is not None else None,
+            artifact_counts={str(k): int(v) for k, v in dict(data.get("artifact_counts", {}) or {}).items()},
+            completed=bool(data.get("completed", False)),
+            error=str(data["error"]) if data.get("error") is not None else None,
+        )
+
 
 def initial_task_snapshot(task_id: str) -> TaskSnapshot:
     return TaskSnapshot(task_id=task_id)
 
 
 def apply_task_event(snapshot: TaskSnapshot, event: TaskEvent) -> TaskSnapshot:
+    # Snapshots are immutable: only ARTIFACT_CREATED copies the counts, every other
+    # event shares them with the previous snapshot.
     if snapshot.task_id != event.task_id:
         return snapshot
     if event.kind == TaskEventKind.STAGE_STARTED and event.stage is not None:
-        return TaskSnapshot(
-            task_id=snapshot.task_id,
-            status=snapshot.status,
-            current_stage=event.stage,
-            artifact_counts=dict(snapshot.artifact_counts),
-            completed=snapshot.completed,
-            error=snapshot.error,
-        )
+        return replace(snapshot, current_stage=event.stage)
     if event.kind == TaskEventKind.ARTIFACT_CREATED and event.artifact_kind is not None:
         counts = dict(snapshot.artifact_counts)
         key = event.artifact_kind.value
         counts[key] = counts.get(key, 0) + 1
-        return TaskSnapshot(
-            task_id=snapshot.task_id,
-            status=snapshot.status,
-            current_stage=snapshot.current_stage,
-            artifact_counts=counts,
-            completed=snapshot.completed,
-            error=snapshot.error,
-        )
+        return replace(snapshot, artifact_counts=counts)
     if event.kind in (TaskEventKind.TASK_STARTED, TaskEventKind.TASK_COMPLETED, TaskEventKind.TASK_PAUSED, TaskEventKind.TASK_FAILED):
         status = event.status or snapshot.status
         completed = event.kind in (TaskEventKind.TASK_COMPLETED, TaskEventKind.TASK_PAUSED, TaskEventKind.TASK_FAILED)
-        return TaskSnapshot(
-            task_id=snapshot.task_id,
+        return replace(
+            snapshot,
             status=status,
-            current_stage=snapshot.current_stage,
-            artifact_counts=dict(snapshot.artifact_counts),
             completed=completed,
             error=event.error if event.error is not None else snapshot.error,
         )
@@ -0,0 +1,176 @@
+"""Durable per-run event logs.
+
+`JsonlEventSink` appends `RunEvent.to_dict()` lines to `<dir>/<run_id>.jsonl`.
+`on_event` only enqueues; a writer thread drains the queue and commits each
+batch with one write, flush and (optionally) fsync, so the orchestrator never
+waits on disk. If the process dies mid-run, `read_event_log` and
+`rebuild_transcript` recover what happened up to the last committed batch.
+"""
+
+from __future__ import annotations
+
+import os
+import queue
+import threading
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+
+from freemad.config import Config
+from freemad.run_events import RunEvent, RunObserver
+from freemad.types import RunEventKind
+from freemad.utils import jsonio
+
+
+def event_log_dir(cfg: Config) -> Path:
+    return Path(cfg.output.event_log_dir or Path(cfg.output.transcript_dir) / "events")
+
+
+def event_log_path(cfg: Config, run_id: str) -> Path:
+    return event_log_dir(cfg) / f"{run_id}.jsonl"
+
+
+class _Flush:
+    __slots__ = ("done",)
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+
+
+class JsonlEventSink(RunObserver):
+    """Appends events to a JSONL file from a background thread, committing in groups."""
+
+    _STOP = object()
+
+    def __init__(self, path: str | Path, *, fsync: bool = True, batch_size: int = 256) -> None:
+        self.path = Path(path)
+        self.fsync = fsync
+        self.batch_size = max(1, batch_size)
+        self.last_error: Optional[str] = None
+        self._q: "queue.SimpleQueue[Any]" = queue.SimpleQueue()
+        self._closed = False
+        self._thread = threading.Thread(target=self._loop, name="freemad-event-log", daemon=True)
+        self._thread.start()
+
+    def on_event(self, event: RunEvent) -> None:
+        if not self._closed:
+            self._q.put(event)
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Block until every event enqueued so far is committed; False on timeout."""
+        if self._closed:
+            return True
+        marker = _Flush()
+        self._q.put(marker)
+        return marker.done.wait(timeout)
+
+    def close(self, timeout: Optional[float] = None) -> None:
+        if self._closed:
+            return
+        self._closed = True
+        self._q.put(self._STOP)
+        self._thread.join(timeout)
+
+    def _loop(self) -> None:
+        fh = None
+        try:
+            while True:
+                batch: List[Any] = [self._q.get()]
+                while len(batch) < self.batch_size:
+                    try:
+                        batch.append(self._q.get_nowait())
+                    except queue.Empty:
+                        break
+                lines = [jsonio.dumps(item.to_dict()) + "\n" for item in batch if isinstance(item, RunEvent)]
+                if lines:
+                    try:
+                        if fh is None:
+                            self.path.parent.mkdir(parents=True, exist_ok=True)
+                            fh = open(self.path, "a", encoding="utf-8")
+                        fh.write("".join(lines))
+                        fh.flush()
+                        if self.fsync:
+                            os.fsync(fh.fileno())
+                    except OSError as e:
+                        self.last_error = str(e)  # best-effort like every observer; keep draining
+                for item in batch:
+                    if isinstance(item, _Flush):
+                        item.done.set()
+                if any(item is self._STOP for item in batch):
+                    return
+        finally:
+            if fh is not None:
+                fh.close()
+
+
+def read_event_log(path: str | Path) -> List[RunEvent]:
+    """Events in a log, skipping lines that cannot be parsed (e.g. a torn final write)."""
+    events: List[RunEvent] = []
+    with open(path, "rb") as fh:
+        for line in fh:
+            if not line.strip():
+                continue
+            try:
+                events.append(RunEvent.from_dict(jsonio.loads(line)))
+            except (ValueError, KeyError, TypeError):
+                continue
+    return events
+
+
+def rebuild_transcript(events: Iterable[RunEvent]) -> Dict[str, Any]:
+    """Partial run result folded from events.
+
+    Events carry answer ids, decisions and scores but not solution text, so the
+    rounds list who held which answer rather than the full agent responses.
+    `completed` is False when the log stops before the run finished.
+    """
+    out: Dict[str, Any] = {
+        "run_id": None,
+        "completed": False,
+        "error": None,
+        "final_answer_id": None,
+        "winning_agents": [],
+        "scores": {},
+        "holders": {},
+        "transcript": [],
+    }
+    rounds: Dict[int, Dict[str, Any]] = {}
+
+    def _round(e: RunEvent) -> Dict[str, Any]:
+        idx = e.round_index if e.round_index is not None else -1
+        if idx not in rounds:
+            rounds[idx] = {
+                "round": idx,
+                "type": e.round_type.value if e.round_type is not None else None,
+                "agents": {},
+                "scores": {},
+                "completed": False,
+            }
+        return rounds[idx]
+
+    for e in events:
+        if out["run_id"] is None:
+            out["run_id"] = e.run_id
+        if e.kind == RunEventKind.ROUND_STARTED:
+            _round(e)
+        elif e.kind in (RunEventKind.AGENT_GENERATE_FINISHED, RunEventKind.AGENT_CRITIQUE_FINISHED):
+            if e.agent_id is not None:
+                _round(e)["agents"][e.agent_id] = {
+                    "answer_id": e.answer_id,
+                    "decision": e.decision.value if e.decision is not None else None,
+                    "changed": e.changed,
+                }
+        elif e.kind == RunEventKind.SCORES_UPDATED:
+            out["scores"] = dict(e.scores)
+            out["holders"] = {k: list(v) for k, v in e.holders.items()}
+        elif e.kind == RunEventKind.ROUND_COMPLETED:
+            rnd = _round(e)
+            rnd["scores"], rnd["completed"] = dict(e.scores), True
+        elif e.kind == RunEventKind.FINAL_ANSWER_SELECTED:
+            out["final_answer_id"] = e.final_answer_id
+            out["winning_agents"] = list(e.winning_agents)
+        elif e.kind in (RunEventKind.RUN_COMPLETED, RunEventKind.RUN_FAILED, RunEventKind.RUN_BUDGET_EXCEEDED):
+            out["completed"] = e.kind == RunEventKind.RUN_COMPLETED
+            if e.error is not None:
+                out["error"] = e.error
+    out["transcript"] = [rounds[i] for i in sorted(rounds)]
+    return out
@@ -3,22 +3,27 @@ from __future__ import annotations
 import concurrent.futures
 import logging
 import time
-from dataclasses import dataclass, field, asdict
-from typing import Any, Dict, List, Optional
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional
 import random
 import uuid
 
-from freemad.agents import AgentFactory
-from freemad.config import Config
-from freemad.scoring import ScoreTracker
+from freemad.agents import Agent, AgentFactory
+from freemad.agents.base import Metadata
+from freemad.agents.health import get_health_monitor
+from freemad.config import Config, ConfigError
+from freemad.scoring import AnswerClusterer, ScoreTracker
+from freemad.stopping import RoundOutcome, build_stop_policies
 from freemad.topology import build_topology
 from freemad.utils import compute_answer_id
-from freemad.utils.budget import BudgetGuard, BudgetExceeded, TokenBudget, enforce_size
+from freemad.utils.budget import AgentBudgetLedger, BudgetGuard, BudgetExceeded, TokenBudget, enforce_size
 from freemad.validation import ValidationManager
 from freemad.validation.base import ValidationResult
 from freemad.utils.logger import get_logger, log_event
 from freemad.types import Decision, RoundType, TieBreak, LogEvent, RunEventKind
 from freemad.run_events import RunEvent, RunObserver, NullObserver
+from freemad.event_log import JsonlEventSink, event_log_path
+from freemad.checkpoint import RunCheckpoint, checkpoint_path, load_checkpoint, save_checkpoint
 
 
 class AnswerSelector:
@@ -96,7 +101,21 @@ class DeadlineManager:
         return completed, deadline_hit_soft, deadline_hit_hard, remaining
 
 
-@dataclass(frozen=True)
+def _metadata_dict(md: Any) -> Dict[str, Any]:
+    if isinstance(md, Metadata):
+        return {"timings": dict(md.timings), "tokens": dict(md.tokens)}
+    return dict(md) if isinstance(md, dict) else {}
+
+
+def _response_tokens(md: Any) -> int:
+    if isinstance(md, Metadata):
+        tokens = md.tokens
+    else:
+        tokens = md.get("tokens", {}) if isinstance(md, dict) else {}
+    return int(tokens.get("prompt", 0)) + int(tokens.get("output", 0))
+
+
+@dataclass(frozen=True, slots=True)
 class TranscriptResponse:
     agent_id: str
     solution: str
@@ -104,17 +123,64 @@ class TranscriptResponse:
     decision: Decision
     changed: bool
     answer_id: str
-    metadata: dict
+    # The agent's own Metadata (referenced, not copied); None for carried-forward responses.
+    metadata: Any = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "agent_id": self.agent_id,
+            "solution": self.solution,
+            "reasoning": self.reasoning,
+            "decision": self.decision.value,
+            "changed": self.changed,
+            "answer_id": self.answer_id,
+            "metadata": _metadata_dict(self.metadata),
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> TranscriptResponse:
+        return cls(
+            agent_id=str(data["agent_id"]),
+            solution=str(data["solution"]),
+            reasoning=str(data.get("reasoning", "")),
+            decision=Decision(str(data["decision"])),
+            changed=bool(data.get("changed", False)),
+            answer_id=str(data["answer_id"]),
+            metadata=dict(data.get("metadata") or {}),
+        )
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class AgentRoundRecord:
     response: TranscriptResponse
     peers_assigned: List[str] = field(default_factory=list)
     peers_seen: List[str] = field(default_factory=list)
+    # Pipelined rounds only: peer -> round of the (stale) solution that was shown.
+    peers_seen_rounds: Dict[str, int] = field(default_factory=dict)
+
+    def to_dict(self) -> Dict[str, Any]:
+        data: Dict[str, Any] = {
+            "response": self.response.to_dict(),
+            "peers_assigned": self.peers_assigned,
+            "peers_assigned_count": len(self.peers_assigned),
+            "peers_seen": self.peers_seen,
+            "peers_seen_count": len(self.peers_seen),
+        }
+        if self.peers_seen_rounds:
+            data["peers_seen_rounds"] = self.peers_seen_rounds
+        return data
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> AgentRoundRecord:
+        return cls(
+            response=TranscriptResponse.from_dict(data["response"]),
+            peers_assigned=list(data.get("peers_assigned", [])),
+            peers_seen=list(data.get("peers_seen", [])),
+            peers_seen_rounds={str(k): int(v) for k, v in dict(data.get("peers_seen_rounds", {})).items()},
+        )
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class RoundTranscript:
     round_index: int
     type: RoundType  # generation | critique
@@ -124,22 +190,83 @@ class RoundTranscript:
     deadline_hit_soft: bool = False
     deadline_hit_hard: bool = False
 
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "round": self.round_index,
+            "type": self.type.value,
+            "agents": {aid: rec.to_dict() for aid, rec in self.agents.items()},
+            "scores": self.scores,
+            "topology_info": self.topology_info,
+            "deadline_hit_soft": self.deadline_hit_soft,
+            "deadline_hit_hard": self.deadline_hit_hard,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> RoundTranscript:
+        return cls(
+            round_index=int(data["round"]),
+            type=RoundType(str(data["type"])),
+            agents={str(aid): AgentRoundRecord.from_dict(rec) for aid, rec in dict(data["agents"]).items()},
+            scores={str(k): float(v) for k, v in dict(data.get("scores", {})).items()},
+            topology_info=dict(data.get("topology_info", {})),
+            deadline_hit_soft=bool(data.get("deadline_hit_soft", False)),
+            deadline_hit_hard=bool(data.get("deadline_hit_hard", False)),
+        )
+
 
 class Orchestrator:
     def __init__(self, cfg: Config, observer: Optional[RunObserver] = None):
         self.cfg = cfg
         self.factory = AgentFactory(cfg)
-        self.agents = self.factory.build_all()
+        self._configured_agents = self.factory.build_all()
         self.topology = build_topology(cfg)
         self.score = ScoreTracker(cfg)
         self.answer_text: Dict[str, str] = {}
         self.logger = get_logger(cfg)
         self._token_budget = TokenBudget(cfg.budget.max_total_tokens, cfg.budget.enforce_total_tokens)
         self._observer: RunObserver = observer or NullObserver()
+        self._event_sink: Optional[JsonlEventSink] = None
+        # (requirement, max_rounds, skipped_agents) of the run being checkpointed, if any.
+        self._checkpoint_ctx: Optional[tuple[str, int, Dict[str, str]]] = None
         self._selector = AnswerSelector(cfg.scoring.tie_break, cfg.scoring.random_seed)
         self._deadline_manager = DeadlineManager()
+        self._clusterer = AnswerClusterer(cfg.clustering, cfg.scoring.canonicalization)
+        self._bind_agents(self._configured_agents)
+
+    def _bind_agents(self, agents: Dict[str, Agent]) -> None:
+        """Set the debating agents and the per-agent state sized by them."""
+        self.agents = dict(agents)
+        self._ledger = AgentBudgetLedger(
+            list(self.agents.keys()),
+            max_tokens=self.cfg.budget.max_tokens_per_agent,
+            max_time_sec=self.cfg.budget.max_time_per_agent_sec,
+            total=self._token_budget,
+            prefer_cheaper=self.cfg.budget.prefer_cheaper_agents,
+        )
+        self._stop_policies = build_stop_policies(
+            self.cfg, agent_ids=list(self.agents.keys()), score=self.score, token_budget=self._token_budget
+        )
+
+    def _skip_unavailable_agents(self) -> Dict[str, str]:
+        """Drop agents failing their (cached, parallel) health probe; agent id -> reason."""
+        if not self.cfg.health.skip_unavailable:
+            return {}
+        statuses = get_health_monitor(self.cfg.health).check(self._configured_agents)
+        skipped = {aid: st.message for aid, st in statuses.items() if not st.available}
+        for aid, reason in skipped.items():
+            log_event(
+                self.logger, LogEvent.HEALTH_STATUS, level=logging.WARNING, agent_id=aid, available=False, message=reason
+            )
+        available = {aid: a for aid, a in self._configured_agents.items() if aid not in skipped}
+        if not available:
+            raise ConfigError("no available agents: " + "; ".join(f"{aid}: {why}" for aid, why in skipped.items()))
+        if available.keys() != self.agents.keys():
+            self._bind_agents(available)
+        return skipped
 
     def _emit(self, event: RunEvent) -> None:
+        if self._event_sink is not None:
+            self._event_sink.on_event(event)  # enqueue only; written by the sink's thread
         try:
             self._observer.on_event(event)
         except Exception as exc:
@@ -147,23 +274,87 @@ class Orchestrator:
             log_event(self.logger, LogEvent.HEALTH_STATUS, level=logging.DEBUG, error=f"observer error: {exc}")
             return
 
+    def _timed_call(self, aid: str, fn: Any, *args: Any) -> Any:
+        started = time.perf_counter()
+        try:
+            return fn(*args)
+        finally:
+            self._ledger.record_time(aid, time.perf_counter() - started)
+
+    def _budget_remaining(self, aid: Optional[str] = None) -> Dict[str, Dict[str, float]]:
+        if not self._ledger.enabled:
+            return {}
+        return {aid: self._ledger.remaining(aid)} if aid is not None else self._ledger.remaining_all()
+
     def _record_answer(self, text: str) -> str:
-        ans_id = compute_answer_id(text)
+        ans_id = compute_answer_id(text, self.cfg.scoring.canonicalization)
         self.answer_text[ans_id] = text
         return ans_id
 
     def run(self, requirement: str, max_rounds: int = 1, run_id: Optional[str] = None) -> dict:
         run_id = run_id or str(uuid.uuid4())
-        current_solution: Dict[str, str] = {}
-        current_answer_id: Dict[str, str] = {}
-        transcript: List[RoundTranscript] = []
+        return self._run_logged(run_id, lambda: self._run(requirement, max_rounds, run_id))
 
-        guard = BudgetGuard(self.cfg.budget.max_total_time_sec, self.cfg.budget.max_round_time_sec)
-        guard.check_total()
+    def resume(self, run_id: str, max_rounds: Optional[int] = None) -> dict:
+        """Continue run `run_id` after its last checkpointed round (see `checkpoint.dir`).
+
+        Completed rounds are not repeated and their scores are restored exactly.
+        `max_rounds` defaults to the run's original value. Time budgets restart.
+        """
+        ckpt = load_checkpoint(checkpoint_path(self.cfg, run_id))
+        rounds = ckpt.max_rounds if max_rounds is None else max_rounds
+        return self._run_logged(run_id, lambda: self._run(ckpt.requirement, rounds, run_id, resume_from=ckpt))
 
-        requirement_trunc, _ = enforce_size(
-            requirement, self.cfg.security.max_requirement_size, label="requirement"
+    def _run_logged(self, run_id: str, body: Callable[[], dict]) -> dict:
+        if not self.cfg.output.event_log:
+            return body()
+        path = event_log_path(self.cfg, run_id)
+        self._event_sink = JsonlEventSink(
+            path, fsync=self.cfg.output.event_log_fsync, batch_size=self.cfg.output.event_log_batch_size
         )
+        try:
+            result = body()
+        except BaseException as e:
+            # The log is the record of a crashed run: end it with the reason.
+            kind = RunEventKind.RUN_BUDGET_EXCEEDED if isinstance(e, BudgetExceeded) else RunEventKind.RUN_FAILED
+            self._event_sink.on_event(
+                RunEvent(kind=kind, run_id=run_id, ts_ms=int(time.time() * 1000), error=str(e) or type(e).__name__)
+            )
+            raise
+        finally:
+            sink, self._event_sink = self._event_sink, None
+            sink.close()
+        result["event_log"] = str(path)
+        return result
+
+    def _run(
+        self, requirement: str, max_rounds: int, run_id: str, resume_from: Optional[RunCheckpoint] = None
+    ) -> dict:
+        guard = BudgetGuard(self.cfg.budget.max_total_time_sec, self.cfg.budget.max_round_time_sec)
+        guard.check_total()
+        if resume_from is None:
+            current_solution: Dict[str, str] = {}
+            current_answer_id: Dict[str, str] = {}
+            transcript: List[RoundTranscript] = []
+            skipped_agents = self._skip_unavailable_agents()
+            requirement_trunc, _ = enforce_size(
+                requirement, self.cfg.security.max_requirement_size, label="requirement"
+            )
+            start_round = 1
+            last_outcome = RoundOutcome(round_index=0, round_type=RoundType.GENERATION)
+        else:
+            skipped_agents = self._restore_checkpoint(resume_from)
+            requirement_trunc = resume_from.requirement
+            current_solution = dict(resume_from.current_solution)
+            current_answer_id = dict(resume_from.current_answer_id)
+            transcript = [RoundTranscript.from_dict(t) for t in resume_from.transcript]
+            start_round = resume_from.round_index + 1
+            last_outcome = RoundOutcome(
+                round_index=resume_from.round_index,
+                round_type=RoundType.CRITIQUE if resume_from.round_index else RoundType.GENERATION,
+                decisions=dict(resume_from.last_decisions),
+            )
+        self._checkpoint_ctx = (requirement_trunc, max_rounds, skipped_agents) if self.cfg.checkpoint.enabled else None
 
         # Log the requirement we are about to send to all agents (truncated and redacted).
         log_event(
@@ -172,6 +363,7 @@ class Orchestrator:
             level=logging.INFO,
             run_id=run_id,
             requirement=requirement_trunc,
+            **({"resumed_after_round": resume_from.round_index} if resume_from is not None else {}),
         )
 
         self._emit(
@@ -182,28 +374,47 @@ class Orchestrator:
             )
         )
 
-        # Round 0: generation
-        self._run_generation_round(run_id, requirement_trunc, current_solution, current_answer_id, transcript, guard)
+        if resume_from is None:
+            # Round 0: generation
+            self._run_generation_round(run_id, requirement_trunc, current_solution, current_answer_id, transcript, guard)
+            self._save_checkpoint(run_id, 0, current_solution, current_answer_id, transcript, {})
         # Critique rounds
         early_stop_reason, transcript = self._run_critique_rounds(
-            run_id, requirement_trunc, max_rounds, guard, current_solution, current_answer_id, transcript
+            run_id,
+            requirement_trunc,
+            max_rounds,
+            guard,
+            current_solution,
+            current_answer_id,
+            transcript,
+            start_round=start_round,
+            last_outcome=last_outcome,
         )
 
         all_scores = self.score.get_all_scores()
+        clusters: Dict[str, List[str]] = {}
+        if self.cfg.clustering.enabled:
+            self._clusterer.add_many(self.answer_text)
+            clusters = self._clusterer.clusters(all_scores)
+            all_scores = self.score.get_pooled_scores(clusters)
         vm = ValidationManager(self.cfg)
         vresults, vconf = vm.validate_many(self.answer_text)
         log_event(self.logger, LogEvent.VALIDATION_DONE)
         best_ans = self._selector.select(all_scores, vconf, self.answer_text)
         final_solution = self.answer_text.get(best_ans, "")
 
-        winning_agents = [aid for aid, ans in current_answer_id.items() if ans == best_ans]
+        best_members = set(clusters.get(best_ans, [best_ans]))
+        winning_agents = [aid for aid, ans in current_answer_id.items() if ans in best_members]
         origin_agents: List[str] = []
         for t in transcript:
-            holders = [aid for aid, rec in t.agents.items() if rec.response.answer_id == best_ans]
+            holders = [aid for aid, rec in t.agents.items() if rec.response.answer_id in best_members]
             if holders:
                 origin_agents = holders
                 break
-        holders_history = {t.round_index: [aid for aid, rec in t.agents.items() if rec.response.answer_id == best_ans] for t in transcript}
+        holders_history = {
+            t.round_index: [aid for aid, rec in t.agents.items() if rec.response.answer_id in best_members]
+            for t in transcript
+        }
 
         self._emit(
             RunEvent(
@@ -217,39 +428,23 @@ class Orchestrator:
         )
 
         result = {
+            "run_id": run_id,
             "final_answer_id": best_ans,
             "final_solution": final_solution,
             "scores": all_scores,
             "raw_scores": self.score.get_raw_scores(),
+            "answer_clusters": clusters,
             "winning_agents": winning_agents,
             "origin_agents": origin_agents,
             "holders_history": holders_history,
             "early_stop_reason": early_stop_reason,
-            "transcript": [
-                {
-                    "round": t.round_index,
-                    "type": t.type.value,
-                    "agents": {
-                        aid: {
-                            "response": (asdict(rec.response) | {"decision": rec.response.decision.value}),
-                            "peers_assigned": rec.peers_assigned,
-                            "peers_assigned_count": len(rec.peers_assigned),
-                            "peers_seen": rec.peers_seen,
-                            "peers_seen_count": len(rec.peers_seen),
-                        }
-                        for aid, rec in t.agents.items()
-                    },
-                    "scores": t.scores,
-                    "topology_info": t.topology_info,
-                    "deadline_hit_soft": t.deadline_hit_soft,
-                    "deadline_hit_hard": t.deadline_hit_hard,
-                }
-                for t in transcript
-            ],
+            "agent_spend": self._ledger.snapshot(),
+            "skipped_agents": skipped_agents,
+            "transcript": [t.to_dict() for t in transcript],
             "validation": {ans: {name: vars(res) for name, res in vresults[ans].items()} for ans in self.answer_text.keys()},
             "validator_confidence": vconf,
             "score_explainers": {ans: [{**e.__dict__, "action": e.action.value} for e in self.score.explain_score(ans)] for ans in self.answer_text.keys()},
-            "metrics": self._compute_metrics(transcript, best_ans, vresults),
+            "metrics": self._compute_metrics(transcript, best_ans, vresults, best_members),
         }
         self._emit(
             RunEvent(
@@ -259,8 +454,59 @@ class Orchestrator:
                 final_answer_id=best_ans,
             )
         )
+        if (self.cfg.checkpoint.enabled or resume_from is not None) and not self.cfg.checkpoint.keep_completed:
+            checkpoint_path(self.cfg, run_id).unlink(missing_ok=True)
         return result
 
+    def _restore_checkpoint(self, ckpt: RunCheckpoint) -> Dict[str, str]:
+        """Bind the checkpoint's agents and restore scores, answers and spend; returns skipped agents."""
+        missing = [aid for aid in ckpt.agent_ids if aid not in self._configured_agents]
+        if missing:
+            raise ConfigError(f"checkpoint {ckpt.run_id} uses agents missing from the config: {', '.join(missing)}")
+        self._bind_agents({aid: self._configured_agents[aid] for aid in ckpt.agent_ids})
+        self.answer_text = dict(ckpt.answer_text)
+        self.score.load_state(ckpt.scores)
+        self._token_budget.used = ckpt.tokens_used
+        self._ledger.load_state(ckpt.agent_spend)
+        return dict(ckpt.skipped_agents)
+
+    def _save_checkpoint(
+        self,
+        run_id: str,
+        r: int,
+        current_solution: Dict[str, str],
+        current_answer_id: Dict[str, str],
+        transcript: List[RoundTranscript],
+        decisions: Dict[str, Decision],
+    ) -> None:
+        if self._checkpoint_ctx is None:
+            return
+        requirement_trunc, max_rounds, skipped_agents = self._checkpoint_ctx
+        ckpt = RunCheckpoint(
+            run_id=run_id,
+            requirement=requirement_trunc,
+            max_rounds=max_rounds,
+            round_index=r,
+            agent_ids=list(self.agents.keys()),
+            current_solution=dict(current_solution),
+            current_answer_id=dict(current_answer_id),
+            answer_text=dict(self.answer_text),
+            scores=self.score.to_state(),
+            transcript=[t.to_dict() for t in transcript],
+            last_decisions=dict(decisions),
+            skipped_agents=dict(skipped_agents),
+            tokens_used=self._token_budget.used,
+            agent_spend=self._ledger.to_state(),
+        )
+        path = checkpoint_path(self.cfg, run_id)
+        try:
+            save_checkpoint(path, ckpt)
+        except OSError as e:
+            # A failed checkpoint only costs resumability; the debate goes on.
+            log_event(
+                self.logger, LogEvent.CHECKPOINT_FAILED, level=logging.WARNING, run_id=run_id, path=str(path), error=str(e)
+            )
+
     def _run_generation_round(
         self,
         run_id: str,
@@ -295,7 +541,7 @@ class Orchestrator:
                         agent_id=aid,
                     )
                 )
-                gen_futs[ex.submit(a.generate, requirement_trunc)] = aid
+                gen_futs[ex.submit(self._timed_call, aid, a.generate, requirement_trunc)] = aid
             for fut in concurrent.futures.as_completed(gen_futs):
                 aid = gen_futs[fut]
                 resp = fut.result()
@@ -307,6 +553,7 @@ class Orchestrator:
                 t_in = int(resp.metadata.tokens.get("prompt", 0))
                 t_out = int(resp.metadata.tokens.get("output", 0))
                 self._token_budget.add(t_in + t_out)
+                self._ledger.record_tokens(aid, t_in + t_out)
                 self._emit(
                     RunEvent(
                         kind=RunEventKind.AGENT_GENERATE_FINISHED,
@@ -318,6 +565,7 @@ class Orchestrator:
                         answer_id=ans_id,
                         decision=Decision.KEEP,
                         changed=False,
+                        budget_remaining=self._budget_remaining(aid),
                     )
                 )
                 gen_agents[aid] = AgentRoundRecord(
@@ -328,7 +576,7 @@ class Orchestrator:
                         decision=Decision.KEEP,
                         changed=False,
                         answer_id=ans_id,
-                        metadata=asdict(resp.metadata),
+                        metadata=resp.metadata,
                     ),
                     peers_assigned=[],
                     peers_seen=[],
@@ -380,221 +628,499 @@ class Orchestrator:
         current_solution: Dict[str, str],
         current_answer_id: Dict[str, str],
         transcript: List[RoundTranscript],
+        *,
+        start_round: int = 1,
+        last_outcome: Optional[RoundOutcome] = None,
     ) -> tuple[Optional[str], List[RoundTranscript]]:
+        last_outcome = last_outcome or RoundOutcome(round_index=0, round_type=RoundType.GENERATION)
+        if self.cfg.deadlines.pipelined:
+            return self._run_pipelined_rounds(
+                run_id,
+                requirement_trunc,
+                max_rounds,
+                guard,
+                current_solution,
+                current_answer_id,
+                transcript,
+                start_round=start_round,
+                last_outcome=last_outcome,
+            )
         early_stop_reason: Optional[str] = None
-        for r in range(1, max_rounds + 1):
+        for r in range(start_round, max_rounds + 1):
             try:
                 guard.check_total()
             except BudgetExceeded:
                 early_stop_reason = "total_time_budget_exceeded"
                 log_event(self.logger, LogEvent.BUDGET_EXCEEDED, scope="total", round=r)
                 break
+            if r > self.cfg.stopping.min_rounds:
+                early_stop_reason = self._check_stop_policies(last_outcome, next_round=r, max_rounds=max_rounds)
+                if early_stop_reason is not None:
+                    log_event(self.logger, LogEvent.EARLY_STOP, round=r, reason=early_stop_reason)
+                    break
             rs = guard.round_start()
-            log_event(self.logger, LogEvent.ROUND_START, round=r, type=RoundType.CRITIQUE.value)
-            self._emit(
-                RunEvent(
-                    kind=RunEventKind.ROUND_STARTED,
-                    run_id=run_id,
-                    ts_ms=int(time.time() * 1000),
-                    round_index=r,
-                    round_type=RoundType.CRITIQUE,
-                )
-            )
-            peers_map = self.topology.assign_peers(list(self.agents.keys()))
-            round_agents: Dict[str, AgentRoundRecord] = {}
-            start = time.perf_counter()
+            peers_map = self._open_critique_round(run_id, r, current_answer_id)
             soft_s = self.cfg.deadlines.soft_timeout_ms / 1000.0
             hard_s = self.cfg.deadlines.hard_timeout_ms / 1000.0
             min_agents = self.cfg.deadlines.min_agents
 
-            peer_bundles: Dict[str, List[str]] = {}
-            for aid in self.agents.keys():
-                assigned = peers_map.get(aid, [])
-                peer_bundles[aid] = []
-                for p in assigned:
-                    if p in current_solution:
-                        s, _ = enforce_size(current_solution[p], self.cfg.security.max_solution_size, label="peer_solution")
-                        peer_bundles[aid].append(s)
+            # Size-enforce each solution once; bundles share the same strings and the
+            # prompt builder collapses peers that hold the same answer.
+            peer_views = {
+                p: enforce_size(sol, self.cfg.security.max_solution_size, label="peer_solution")[0]
+                for p, sol in current_solution.items()
+            }
 
             max_workers = min(len(self.agents), self.cfg.budget.max_concurrent_agents or len(self.agents))
             with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as ex:
                 crit_futs: Dict[concurrent.futures.Future[Any], str] = {}
+                skipped = self._skip_over_budget(r, list(self.agents.keys()))
                 for aid in self.agents.keys():
-                    self._emit(
-                        RunEvent(
-                            kind=RunEventKind.AGENT_CRITIQUE_STARTED,
-                            run_id=run_id,
-                            ts_ms=int(time.time() * 1000),
-                            round_index=r,
-                            round_type=RoundType.CRITIQUE,
-                            agent_id=aid,
-                        )
-                    )
-                    fut = ex.submit(
-                        self.agents[aid].critique_and_refine,
-                        requirement_trunc,
-                        enforce_size(current_solution.get(aid, ""), self.cfg.security.max_solution_size, label="own_solution")[0],
-                        peer_bundles.get(aid, []),
-                    )
+                    if aid in skipped:
+                        continue
+                    peers = [peer_views[p] for p in peers_map.get(aid, []) if p in peer_views]
+                    fut = self._submit_critique(ex, run_id, r, aid, requirement_trunc, current_solution.get(aid, ""), peers)
                     crit_futs[fut] = aid
-                completed_raw, deadline_hit_soft, deadline_hit_hard, _remaining = self._deadline_manager.collect(
-                    crit_futs, soft_s=soft_s, hard_s=hard_s, min_agents=min_agents
-                )
+                if crit_futs:
+                    completed_raw, deadline_hit_soft, deadline_hit_hard, _remaining = self._deadline_manager.collect(
+                        crit_futs, soft_s=soft_s, hard_s=hard_s, min_agents=min(min_agents, len(crit_futs))
+                    )
+                else:
+                    completed_raw, deadline_hit_soft, deadline_hit_hard = {}, False, False
                 if deadline_hit_soft:
                     log_event(self.logger, LogEvent.DEADLINE_SOFT, round=r, completed=len(completed_raw), min_agents=min_agents)
                 if deadline_hit_hard:
                     log_event(self.logger, LogEvent.DEADLINE_HARD, round=r)
+                round_agents, round_decisions = self._apply_critique_results(
+                    run_id, r, peers_map, completed_raw, current_solution, current_answer_id, skipped=skipped
+                )
+
+            self._close_critique_round(
+                run_id, r, round_agents, current_answer_id, transcript, deadline_hit_soft, deadline_hit_hard
+            )
+            last_outcome = RoundOutcome(round_index=r, round_type=RoundType.CRITIQUE, decisions=round_decisions)
+            self._save_checkpoint(run_id, r, current_solution, current_answer_id, transcript, round_decisions)
 
-                completed: Dict[str, dict] = {}
-                for aid, res in completed_raw.items():
-                    if isinstance(res, Exception):
-                        completed[aid] = {
-                            "agent_id": aid,
-                            "decision": Decision.KEEP,
-                            "changed": False,
-                            "solution": current_solution.get(aid, ""),
-                            "reasoning": str(res),
-                            "answer_id": current_answer_id.get(aid),
-                        }
-                    else:
+            try:
+                guard.check_round(rs)
+            except BudgetExceeded:
+                early_stop_reason = "round_time_budget_exceeded"
+                log_event(self.logger, LogEvent.BUDGET_EXCEEDED, scope="round", round=r)
+                break
+        return early_stop_reason, transcript
+
+    def _run_pipelined_rounds(
+        self,
+        run_id: str,
+        requirement_trunc: str,
+        max_rounds: int,
+        guard: BudgetGuard,
+        current_solution: Dict[str, str],
+        current_answer_id: Dict[str, str],
+        transcript: List[RoundTranscript],
+        *,
+        start_round: int,
+        last_outcome: RoundOutcome,
+    ) -> tuple[Optional[str], List[RoundTranscript]]:
+        """Critique rounds without a hard barrier between them.
+
+        Round r+1 opens once `min_agents` results for round r are in (or its soft
+        deadline passes); an agent then starts round r+1 as soon as its own round r
+        call returns, reading the newest peer solutions available (possibly from
+        round r-1; recorded in `peers_seen_rounds`). Agents run at most one round
+        ahead of the last finalized round. Results are applied to scores, the
+        transcript and stop policies strictly in round order, and within a round in
+        agent order, exactly as in barrier mode.
+        """
+        agent_ids = list(self.agents.keys())
+        soft_s = self.cfg.deadlines.soft_timeout_ms / 1000.0
+        hard_s = self.cfg.deadlines.hard_timeout_ms / 1000.0
+        min_agents = self.cfg.deadlines.min_agents
+
+        # Lane state: each agent's newest solution (possibly not finalized yet) and its round.
+        latest_solution = dict(current_solution)
+        solution_round: Dict[str, int] = dict.fromkeys(agent_ids, start_round - 1)
+        next_round: Dict[str, int] = dict.fromkeys(agent_ids, start_round)
+        busy: Dict[str, concurrent.futures.Future[Any]] = {}
+        running: Dict[concurrent.futures.Future[Any], tuple[str, int, float]] = {}
+
+        peers_maps: Dict[int, Dict[str, List[str]]] = {}
+        seen_rounds: Dict[int, Dict[str, Dict[str, int]]] = {}
+        results: Dict[int, Dict[str, Any]] = {}
+        timed_out: Dict[int, set[str]] = {}
+        skipped: Dict[int, set[str]] = {}
+        opened_at: Dict[int, float] = {}
+        round_started: Dict[int, float] = {}
+        gate_open: set[int] = {start_round}
+        soft_hit: set[int] = set()
+        hard_hit: set[int] = set()
+        finalized = start_round - 1
+        early_stop_reason: Optional[str] = None
+        if start_round > self.cfg.stopping.min_rounds:
+            early_stop_reason = self._check_stop_policies(last_outcome, next_round=start_round, max_rounds=max_rounds)
+
+        max_workers = min(len(self.agents), self.cfg.budget.max_concurrent_agents or len(self.agents))
+        ex = concurrent.futures.ThreadPoolExecutor(max_workers=max_workers)
+        try:
+            while early_stop_reason is None and finalized < max_rounds:
+                # 1) start every idle agent whose next round is open
+                progress_mark = (finalized, len(running), len(gate_open))
+                for aid in agent_ids:
+                    r = next_round[aid]
+                    if aid in busy or r > max_rounds or r > finalized + 2 or r not in gate_open:
+                        continue
+                    if r not in opened_at:
                         try:
-                            completed[aid] = asdict(res)
-                        except Exception:
-                            completed[aid] = {
-                                "agent_id": aid,
-                                "decision": Decision.KEEP,
-                                "changed": False,
-                                "solution": current_solution.get(aid, ""),
-                                "reasoning": str(res),
-                                "answer_id": current_answer_id.get(aid),
-                            }
+                            guard.check_total()
+                        except BudgetExceeded:
+                            early_stop_reason = "total_time_budget_exceeded"
+                            log_event(self.logger, LogEvent.BUDGET_EXCEEDED, scope="total", round=r)
+                            break
+                        opened_at[r] = time.perf_counter()
+                        round_started[r] = guard.round_start()
+                        peers_maps[r] = self._open_critique_round(run_id, r, current_answer_id)
+                        results[r], timed_out[r], skipped[r], seen_rounds[r] = {}, set(), set(), {}
+                    if self._skip_over_budget(r, [aid]):
+                        skipped[r].add(aid)
+                        next_round[aid] = r + 1
+                        continue
+                    assigned = [p for p in peers_maps[r].get(aid, []) if p in latest_solution]
+                    seen_rounds[r][aid] = {p: solution_round[p] for p in assigned}
+                    peers = [
+                        enforce_size(latest_solution[p], self.cfg.security.max_solution_size, label="peer_solution")[0]
+                        for p in assigned
+                    ]
+                    fut = self._submit_critique(ex, run_id, r, aid, requirement_trunc, latest_solution.get(aid, ""), peers)
+                    busy[aid] = fut
+                    running[fut] = (aid, r, time.perf_counter())
+                if early_stop_reason is not None:
+                    break
 
-                for aid in self.agents.keys():
-                    peers_assigned = peers_map.get(aid, [])
-                    peers_seen = list(peers_assigned)
-                    if aid not in completed:
-                        self.score.record_keep(agent_id=aid, answer_id=current_answer_id[aid], round_idx=r)
-                        round_agents[aid] = AgentRoundRecord(
-                            response=TranscriptResponse(
-                                agent_id=aid,
-                                solution=current_solution[aid],
-                                reasoning="timeout carry-forward",
-                                decision=Decision.KEEP,
-                                changed=False,
-                                answer_id=current_answer_id[aid],
-                                metadata={},
-                            ),
-                            peers_assigned=peers_assigned,
-                            peers_seen=peers_seen,
-                        )
-                        self._emit(
-                            RunEvent(
-                                kind=RunEventKind.AGENT_CRITIQUE_FINISHED,
-                                run_id=run_id,
-                                ts_ms=int(time.time() * 1000),
-                                round_index=r,
-                                round_type=RoundType.CRITIQUE,
-                                agent_id=aid,
-                                answer_id=current_answer_id[aid],
-                                decision=Decision.KEEP,
-                                changed=False,
-                            )
-                        )
+                # 2) wait for the next completion or timer (soft gate / hard deadline)
+                now = time.perf_counter()
+                timers = [started + hard_s - now for (_a, r, started) in running.values() if _a not in timed_out[r]]
+                timers += [opened_at[r] + soft_s - now for r in opened_at if r + 1 not in gate_open]
+                timeout = max(0.0, min(timers)) if timers else None
+                if running:
+                    done, _ = concurrent.futures.wait(
+                        list(running), timeout=timeout, return_when=concurrent.futures.FIRST_COMPLETED
+                    )
+                else:
+                    done = set()
+                    if timeout:
+                        time.sleep(timeout)
+                now = time.perf_counter()
+
+                for fut in done:
+                    aid, r, _started = running.pop(fut)
+                    busy.pop(aid, None)
+                    next_round[aid] = r + 1
+                    if aid in timed_out[r]:
+                        continue  # late straggler: already carried forward
+                    try:
+                        res = fut.result()
+                    except Exception as e:
+                        res = e
+                    results[r][aid] = res
+                    if not isinstance(res, Exception) and res.decision == Decision.REVISE and res.solution:
+                        latest_solution[aid] = res.solution
+                    solution_round[aid] = r
+
+                # 3) hard deadlines carry the agent forward; its lane frees up when the call returns
+                for aid, r, started in running.values():
+                    if aid not in timed_out[r] and now - started >= hard_s:
+                        timed_out[r].add(aid)
+                        if r not in hard_hit:
+                            hard_hit.add(r)
+                            log_event(self.logger, LogEvent.DEADLINE_HARD, round=r)
+
+                # 4) open round r+1 after min_agents results (or the soft deadline) for round r
+                for r in list(opened_at):
+                    if r + 1 in gate_open:
                         continue
+                    quorum = min(min_agents, len(agent_ids) - len(skipped[r]))
+                    carried = len(timed_out[r]) + len(skipped[r])
+                    if len(results[r]) >= quorum or len(results[r]) + carried == len(agent_ids):
+                        gate_open.add(r + 1)
+                    elif now - opened_at[r] >= soft_s:
+                        gate_open.add(r + 1)
+                        soft_hit.add(r)
+                        log_event(self.logger, LogEvent.DEADLINE_SOFT, round=r, completed=len(results[r]), min_agents=min_agents)
 
-                    res = completed[aid]
-                    if res.get("decision") == Decision.REVISE and res.get("solution"):
-                        old = current_answer_id[aid]
-                        current_solution[aid] = res["solution"]
-                        current_answer_id[aid] = res["answer_id"]
-                        self._record_answer(res["solution"])
-                        self.score.record_change(agent_id=aid, old_answer_id=old, new_answer_id=current_answer_id[aid], round_idx=r)
-                    else:
-                        self.score.record_keep(agent_id=aid, answer_id=current_answer_id[aid], round_idx=r)
-                        res["decision"] = Decision.KEEP
-                        res["changed"] = False
-                        res["answer_id"] = current_answer_id[aid]
-
-                    md_dict: Dict[str, Any] = {}
-                    md = res.get("metadata", {}) or {}
-                    md_dict = md if isinstance(md, dict) else {}
-                    t_in = int(md_dict.get("tokens", {}).get("prompt", 0))
-                    t_out = int(md_dict.get("tokens", {}).get("output", 0))
-                    self._token_budget.add(t_in + t_out)
-
-                    round_agents[aid] = AgentRoundRecord(
-                        response=TranscriptResponse(
-                            agent_id=res["agent_id"],
-                            solution=res["solution"],
-                            reasoning=res.get("reasoning", ""),
-                            decision=res["decision"],
-                            changed=res.get("changed", False),
-                            answer_id=res["answer_id"],
-                            metadata=md_dict,
-                        ),
-                        peers_assigned=peers_assigned,
-                        peers_seen=peers_seen,
+                # 5) finalize complete rounds in order
+                while finalized < max_rounds and (finalized + 1) in results:
+                    r = finalized + 1
+                    if len(results[r]) + len(timed_out[r]) + len(skipped[r]) < len(agent_ids):
+                        break
+                    round_agents, round_decisions = self._apply_critique_results(
+                        run_id,
+                        r,
+                        peers_maps[r],
+                        results[r],
+                        current_solution,
+                        current_answer_id,
+                        seen_rounds[r],
+                        skipped=skipped[r],
                     )
-                    self._emit(
-                        RunEvent(
-                            kind=RunEventKind.AGENT_CRITIQUE_FINISHED,
-                            run_id=run_id,
-                            ts_ms=int(time.time() * 1000),
-                            round_index=r,
-                            round_type=RoundType.CRITIQUE,
-                            agent_id=res["agent_id"],
-                            answer_id=res["answer_id"],
-                            decision=res["decision"],
-                            changed=res.get("changed", False),
-                        )
+                    self._close_critique_round(
+                        run_id, r, round_agents, current_answer_id, transcript, r in soft_hit, r in hard_hit
                     )
+                    self._save_checkpoint(run_id, r, current_solution, current_answer_id, transcript, round_decisions)
+                    finalized = r
+                    try:
+                        guard.check_round(round_started[r])
+                    except BudgetExceeded:
+                        early_stop_reason = "round_time_budget_exceeded"
+                        log_event(self.logger, LogEvent.BUDGET_EXCEEDED, scope="round", round=r)
+                        break
+                    if r < max_rounds and r + 1 > self.cfg.stopping.min_rounds:
+                        early_stop_reason = self._check_stop_policies(
+                            RoundOutcome(round_index=r, round_type=RoundType.CRITIQUE, decisions=round_decisions),
+                            next_round=r + 1,
+                            max_rounds=max_rounds,
+                        )
+                        if early_stop_reason is not None:
+                            log_event(self.logger, LogEvent.EARLY_STOP, round=r + 1, reason=early_stop_reason)
+                            break
+                if not running and not timers and progress_mark == (finalized, 0, len(gate_open)):
+                    break  # nothing runnable and nothing to wait for
+        finally:
+            # Work for rounds past a stop is discarded; do not block on it.
+            ex.shutdown(wait=early_stop_reason is None, cancel_futures=True)
+        return early_stop_reason, transcript
 
-            scores_round = self.score.get_all_scores()
-            holders_round: Dict[str, List[str]] = {
-                ans: [aid for aid, curr in current_answer_id.items() if curr == ans] for ans in scores_round.keys()
-            }
-            transcript.append(
-                RoundTranscript(
-                    round_index=r,
-                    type=RoundType.CRITIQUE,
-                    agents=round_agents,
-                    scores=scores_round,
-                    topology_info=self.topology.info() if self.cfg.output.include_topology_info else {},
-                    deadline_hit_soft=deadline_hit_soft,
-                    deadline_hit_hard=deadline_hit_hard,
-                )
+    def _open_critique_round(self, run_id: str, r: int, current_answer_id: Dict[str, str]) -> Dict[str, List[str]]:
+        log_event(self.logger, LogEvent.ROUND_START, round=r, type=RoundType.CRITIQUE.value)
+        self._emit(
+            RunEvent(
+                kind=RunEventKind.ROUND_STARTED,
+                run_id=run_id,
+                ts_ms=int(time.time() * 1000),
+                round_index=r,
+                round_type=RoundType.CRITIQUE,
             )
-            log_event(self.logger, LogEvent.ROUND_END, round=r, type=RoundType.CRITIQUE.value)
-            self._emit(
-                RunEvent(
-                    kind=RunEventKind.SCORES_UPDATED,
-                    run_id=run_id,
-                    ts_ms=int(time.time() * 1000),
-                    round_index=r,
-                    round_type=RoundType.CRITIQUE,
-                    scores=scores_round,
-                    holders=holders_round,
+        )
+        holders: Dict[str, List[str]] = {}
+        for aid, ans in current_answer_id.items():
+            holders.setdefault(ans, []).append(aid)
+        self.topology.observe_debate(self.score.get_all_scores(), holders)
+        peers = self.topology.assign_peers(list(self.agents.keys()), round_idx=r)
+        if len(self.agents) < len(self._configured_agents):
+            # Fixed peers (e.g. a star hub) may have been skipped as unavailable.
+            peers = {aid: [p for p in ps if p in self.agents] for aid, ps in peers.items()}
+        return peers
+
+    def _submit_critique(
+        self,
+        ex: concurrent.futures.ThreadPoolExecutor,
+        run_id: str,
+        r: int,
+        aid: str,
+        requirement_trunc: str,
+        own_solution: str,
+        peers: List[str],
+    ) -> concurrent.futures.Future[Any]:
+        self._emit(
+            RunEvent(
+                kind=RunEventKind.AGENT_CRITIQUE_STARTED,
+                run_id=run_id,
+                ts_ms=int(time.time() * 1000),
+                round_index=r,
+                round_type=RoundType.CRITIQUE,
+                agent_id=aid,
+            )
+        )
+        return ex.submit(
+            self._timed_call,
+            aid,
+            self.agents[aid].critique_and_refine,
+            requirement_trunc,
+            enforce_size(own_solution, self.cfg.security.max_solution_size, label="own_solution")[0],
+            peers,
+        )
+
+    def _apply_critique_results(
+        self,
+        run_id: str,
+        r: int,
+        peers_map: Dict[str, List[str]],
+        completed_raw: Dict[str, Any],
+        current_solution: Dict[str, str],
+        current_answer_id: Dict[str, str],
+        seen_rounds: Optional[Dict[str, Dict[str, int]]] = None,
+        skipped: Optional[set[str]] = None,
+    ) -> tuple[Dict[str, AgentRoundRecord], Dict[str, Decision]]:
+        """Apply one round's results to scores and current answers, in agent order.
+
+        Responses are read field by field (no `asdict` copies); transcript records
+        reference the agent's strings and Metadata instead of duplicating them.
+        """
+        round_agents: Dict[str, AgentRoundRecord] = {}
+        round_decisions: Dict[str, Decision] = {}
+        for aid in self.agents.keys():
+            peers_assigned = peers_map.get(aid, [])
+            agent_seen = (seen_rounds or {}).get(aid)
+            peers_seen = list(agent_seen) if agent_seen is not None else list(peers_assigned)
+            # Only peers shown an older solution than round r-1 are recorded.
+            stale = {p: sr for p, sr in (agent_seen or {}).items() if sr < r - 1}
+            if aid not in completed_raw:
+                self.score.record_keep(agent_id=aid, answer_id=current_answer_id[aid], round_idx=r)
+                round_agents[aid] = AgentRoundRecord(
+                    response=TranscriptResponse(
+                        agent_id=aid,
+                        solution=current_solution[aid],
+                        reasoning="budget carry-forward" if aid in (skipped or ()) else "timeout carry-forward",
+                        decision=Decision.KEEP,
+                        changed=False,
+                        answer_id=current_answer_id[aid],
+                    ),
+                    peers_assigned=peers_assigned,
+                    peers_seen=peers_seen,
+                    peers_seen_rounds=stale,
+                )
+                self._emit(
+                    RunEvent(
+                        kind=RunEventKind.AGENT_CRITIQUE_FINISHED,
+                        run_id=run_id,
+                        ts_ms=int(time.time() * 1000),
+                        round_index=r,
+                        round_type=RoundType.CRITIQUE,
+                        agent_id=aid,
+                        answer_id=current_answer_id[aid],
+                        decision=Decision.KEEP,
+                        changed=False,
+                        budget_remaining=self._budget_remaining(aid),
+                    )
                 )
+                continue
+
+            res = completed_raw[aid]
+            if isinstance(res, Exception) or not hasattr(res, "decision"):
+                # Failed call (or an unusable result): keep the current answer.
+                agent_id, decision, solution = aid, Decision.KEEP, current_solution.get(aid, "")
+                reasoning, changed, md = str(res), False, None
+            else:
+                agent_id, decision, solution = res.agent_id, res.decision, res.solution
+                reasoning, changed, md = res.reasoning or "", res.changed, res.metadata
+            if decision == Decision.REVISE and solution:
+                old = current_answer_id[aid]
+                current_solution[aid] = solution
+                # The orchestrator's id is authoritative: agents may canonicalize differently.
+                current_answer_id[aid] = self._record_answer(solution)
+                self.score.record_change(agent_id=aid, old_answer_id=old, new_answer_id=current_answer_id[aid], round_idx=r)
+            else:
+                self.score.record_keep(agent_id=aid, answer_id=current_answer_id[aid], round_idx=r)
+                decision, changed = Decision.KEEP, False
+            answer_id = current_answer_id[aid]
+            round_decisions[aid] = decision
+
+            spent = _response_tokens(md)
+            self._token_budget.add(spent)
+            self._ledger.record_tokens(aid, spent)
+
+            round_agents[aid] = AgentRoundRecord(
+                response=TranscriptResponse(
+                    agent_id=agent_id,
+                    solution=solution,
+                    reasoning=reasoning,
+                    decision=decision,
+                    changed=changed,
+                    answer_id=answer_id,
+                    metadata=md,
+                ),
+                peers_assigned=peers_assigned,
+                peers_seen=peers_seen,
+                peers_seen_rounds=stale,
             )
             self._emit(
                 RunEvent(
-                    kind=RunEventKind.ROUND_COMPLETED,
+                    kind=RunEventKind.AGENT_CRITIQUE_FINISHED,
                     run_id=run_id,
                     ts_ms=int(time.time() * 1000),
                     round_index=r,
                     round_type=RoundType.CRITIQUE,
+                    agent_id=agent_id,
+                    answer_id=answer_id,
+                    decision=decision,
+                    changed=changed,
+                    budget_remaining=self._budget_remaining(aid),
                 )
             )
+        return round_agents, round_decisions
 
-            try:
-                guard.check_round(rs)
-            except BudgetExceeded:
-                early_stop_reason = "round_time_budget_exceeded"
-                log_event(self.logger, LogEvent.BUDGET_EXCEEDED, scope="round", round=r)
-                break
-        return early_stop_reason, transcript
+    def _skip_over_budget(self, r: int, candidates: List[str]) -> set[str]:
+        """Candidates left out of round `r` by the budget ledger; they are carried forward."""
+        admitted = set(self._ledger.admit(candidates))
+        skipped = {aid for aid in candidates if aid not in admitted}
+        for aid in candidates:
+            if aid in skipped:
+                self._ledger.record_skip(aid)
+                log_event(self.logger, LogEvent.BUDGET_EXCEEDED, scope="agent", round=r, agent_id=aid)
+        return skipped
+
+    def _close_critique_round(
+        self,
+        run_id: str,
+        r: int,
+        round_agents: Dict[str, AgentRoundRecord],
+        current_answer_id: Dict[str, str],
+        transcript: List[RoundTranscript],
+        deadline_hit_soft: bool,
+        deadline_hit_hard: bool,
+    ) -> None:
+        scores_round = self.score.get_all_scores()
+        holders_round: Dict[str, List[str]] = {
+            ans: [aid for aid, curr in current_answer_id.items() if curr == ans] for ans in scores_round.keys()
+        }
+        transcript.append(
+            RoundTranscript(
+                round_index=r,
+                type=RoundType.CRITIQUE,
+                agents=round_agents,
+                scores=scores_round,
+                topology_info=self.topology.info() if self.cfg.output.include_topology_info else {},
+                deadline_hit_soft=deadline_hit_soft,
+                deadline_hit_hard=deadline_hit_hard,
+            )
+        )
+        log_event(self.logger, LogEvent.ROUND_END, round=r, type=RoundType.CRITIQUE.value)
+        self._emit(
+            RunEvent(
+                kind=RunEventKind.SCORES_UPDATED,
+                run_id=run_id,
+                ts_ms=int(time.time() * 1000),
+                round_index=r,
+                round_type=RoundType.CRITIQUE,
+                scores=scores_round,
+                holders=holders_round,
+            )
+        )
+        self._emit(
+            RunEvent(
+                kind=RunEventKind.ROUND_COMPLETED,
+                run_id=run_id,
+                ts_ms=int(time.time() * 1000),
+                round_index=r,
+                round_type=RoundType.CRITIQUE,
+                budget_remaining=self._budget_remaining(),
+            )
+        )
+
+    def _check_stop_policies(self, last: RoundOutcome, *, next_round: int, max_rounds: int) -> Optional[str]:
+        for policy in self._stop_policies:
+            reason = policy.check(last, next_round=next_round, max_rounds=max_rounds)
+            if reason is not None:
+                return reason
+        return None
 
-    def _compute_metrics(self, rounds: List[RoundTranscript], final_id: str, vresults: Dict[str, Dict[str, ValidationResult]]) -> Dict[str, float]:
+    def _compute_metrics(
+        self,
+        rounds: List[RoundTranscript],
+        final_id: str,
+        vresults: Dict[str, Dict[str, ValidationResult]],
+        final_members: Optional[set[str]] = None,
+    ) -> Dict[str, float]:
+        final_members = final_members or {final_id}
         num_rounds = max(0, len(rounds) - 1)
         num_agents = len(self.agents)
         deadline_soft_hits = sum(1 for r in rounds if r.deadline_hit_soft)
@@ -608,7 +1134,7 @@ class Orchestrator:
         final_agreement = 0.0
         if rounds:
             last = rounds[-1]
-            final_agreement = sum(1 for rec in last.agents.values() if rec.response.answer_id == final_id) / float(num_agents or 1)
+            final_agreement = sum(1 for rec in last.agents.values() if rec.response.answer_id in final_members) / float(num_agents or 1)
         scores = self.score.get_all_scores().values()
         if scores:
             smin, smax = min(scores), max(scores)
@@ -1,12 +1,11 @@
 from __future__ import annotations
 
-import json
-
 from freemad.tasks.models import TaskRequest
+from freemad.utils import jsonio
 
 
 def build_task_prompt(request: TaskRequest) -> str:
-    payload = json.dumps(request.to_prompt_dict(), indent=2, sort_keys=True)
+    payload = jsonio.dumps(request.to_prompt_dict(), indent=True, sort_keys=True)
     return (
         "You are an autonomous FREE-MAD task agent.\n"
         "Return exactly one JSON object and no surrounding prose.\n"
@@ -1,7 +1,11 @@
 from __future__ import annotations
 
-from typing import Iterable
-from freemad import GenMarker, CritMarker
+import difflib
+from typing import Dict, Iterable, List, Optional, Tuple
+from freemad import CanonicalizationMode, GenMarker, CritMarker
+from freemad.utils.budget import truncate_to_tokens
+from freemad.utils.canon import compute_answer_id
+from freemad.utils.tokens import ApproxTokenCounter, TokenCounter
 
 
 GEN_SOLUTION = f"{GenMarker.SOLUTION.value}:"
@@ -12,7 +16,9 @@ CRT_REVISED_SOLUTION = f"{CritMarker.REVISED_SOLUTION.value}:"
 CRT_REASONING = f"{CritMarker.REASONING.value}:"
 
 
-def build_generation_prompt(requirement: str) -> str:
+def build_generation_prompt(
+    requirement: str, *, max_tokens: Optional[int] = None, token_counter: Optional[TokenCounter] = None
+) -> str:
     """Self-descriptive prompt for Round 0 (independent generation).
 
     Scope: general problem-solving (not just coding). Produce the best
@@ -29,17 +35,32 @@ def build_generation_prompt(requirement: str) -> str:
       use fenced code blocks with a language tag (e.g., ```python).
     - REASONING: brief rationale (<= 8 lines). State key assumptions if any
       information was missing; prefer decisive choices with short justifications.
+
+    With `max_tokens`, only the requirement is trimmed; the contract is always kept.
     """
-    return (
+    header = (
         "You are an expert problem-solving agent. Provide your best final answer.\n"
         "STRICT OUTPUT FORMAT — follow exactly.\n\n"
         f"{GEN_SOLUTION} <final deliverable: text and/or fenced code>\n\n"
         f"{GEN_REASONING} <succinct rationale and assumptions if needed>\n\n"
-        "Requirement:\n" + requirement
+        "Requirement:\n"
     )
+    if max_tokens is not None:
+        counter = token_counter or ApproxTokenCounter()
+        requirement = _fit(requirement, max_tokens - counter.count(header), token_counter, "requirement")
+    return header + requirement
 
 
-def build_critique_prompt(requirement: str, own_solution: str, peer_solutions: Iterable[str]) -> str:
+def build_critique_prompt(
+    requirement: str,
+    own_solution: str,
+    peer_solutions: Iterable[str],
+    *,
+    max_peer_tokens: Optional[int] = None,
+    max_tokens: Optional[int] = None,
+    token_counter: Optional[TokenCounter] = None,
+    canonicalization: CanonicalizationMode = CanonicalizationMode.EXACT,
+) -> str:
     """Self-descriptive prompt for critique (anti-conformity, general tasks).
 
     Agent task:
@@ -54,9 +75,57 @@ def build_critique_prompt(requirement: str, own_solution: str, peer_solutions: I
       (text and/or code; use fenced code blocks with language tags when code exists).
     - Always include REASONING: briefly justify the decision; cite peers as “Peer #k”.
     - No extra sections beyond DECISION, (optional) REVISED_SOLUTION, and REASONING.
+
+    Peers holding the same answer are shown once (see `format_peer_solutions`).
+    With `max_tokens`, sections are budgeted rather than cut from the end: peers
+    shrink first, then the prior solution, then the requirement; trimming happens
+    at line/code-fence boundaries and the output contract is never dropped.
     """
+    if max_tokens is None:
+        peer_blob = format_peer_solutions(
+            own_solution,
+            peer_solutions,
+            max_tokens=max_peer_tokens,
+            token_counter=token_counter,
+            canonicalization=canonicalization,
+        )
+        return _critique_prompt(requirement, own_solution, peer_blob)
+
+    counter = token_counter or ApproxTokenCounter()
     peers = list(peer_solutions)
-    peer_blob = "\n\n".join(f"Peer #{i+1}:\n{p}" for i, p in enumerate(peers)) if peers else "(no peers)"
+    budget = max(0, max_tokens - counter.count(_critique_prompt("", "", "")))
+    req_tokens = counter.count(requirement)
+    own_tokens = counter.count(own_solution)
+    peer_cap = budget - req_tokens - own_tokens
+    if max_peer_tokens is not None:
+        peer_cap = min(peer_cap, max_peer_tokens)
+    if peer_cap >= _MIN_PEER_TOKENS or not peers:
+        peer_blob = format_peer_solutions(
+            own_solution, peers, max_tokens=peer_cap, token_counter=token_counter, canonicalization=canonicalization
+        )
+        return _critique_prompt(requirement, own_solution, peer_blob)
+
+    # No room for peers: the prior solution (what is being critiqued) keeps at least
+    # `_MIN_OWN_TOKENS`, the requirement up to half the budget, the prior solution the rest.
+    peer_blob = f"({len(peers)} peer solution(s) omitted to fit the prompt token budget)"
+    budget -= counter.count(peer_blob)
+    own_floor = min(own_tokens, _MIN_OWN_TOKENS)
+    req_cap = min(req_tokens, max(budget - own_tokens, budget // 2), budget - own_floor - _MARKER_TOKENS)
+    shown_req = _fit(requirement, req_cap, token_counter, "requirement")
+    own_cap = max(own_floor, budget - counter.count(shown_req) - _MARKER_TOKENS)
+    shown_own = _fit(own_solution, own_cap, token_counter, "own_solution")
+    return _critique_prompt(shown_req, shown_own, peer_blob)
+
+
+# Below this many tokens a peer section is mostly labels and markers; omit it instead.
+_MIN_PEER_TOKENS = 32
+# The prior solution is never cut below this many tokens, even if the prompt overshoots.
+_MIN_OWN_TOKENS = 32
+# Room left for a truncation marker and a closing code fence.
+_MARKER_TOKENS = 16
+
+
+def _critique_prompt(requirement: str, own_solution: str, peer_blob: str) -> str:
     return (
         "Anti-conformity critique. Analyze peers for flaws and improvements.\n"
         "STRICT OUTPUT FORMAT — follow exactly.\n\n"
@@ -67,3 +136,76 @@ def build_critique_prompt(requirement: str, own_solution: str, peer_solutions: I
         "Your prior solution:\n" + own_solution + "\n\n"
         "Peer solutions (anonymized):\n" + peer_blob
     )
+
+
+def _fit(text: str, max_tokens: int, counter: Optional[TokenCounter], label: str) -> str:
+    return truncate_to_tokens(text, max(0, max_tokens), label=label, counter=counter)[0]
+
+
+def _peer_label(numbers: List[int]) -> str:
+    refs = ", ".join(f"#{n}" for n in numbers)
+    if len(numbers) == 1:
+        return f"Peer {refs}"
+    return f"Peers {refs} ({len(numbers)} agents)"
+
+
+def _solution_diff(own_solution: str, peer_solution: str) -> str:
+    return "\n".join(
+        difflib.unified_diff(
+            own_solution.splitlines(),
+            peer_solution.splitlines(),
+            fromfile="your_solution",
+            tofile="peer_solution",
+            lineterm="",
+            n=2,
+        )
+    )
+
+
+def format_peer_solutions(
+    own_solution: str,
+    peer_solutions: Iterable[str],
+    *,
+    max_tokens: Optional[int] = None,
+    token_counter: Optional[TokenCounter] = None,
+    canonicalization: CanonicalizationMode = CanonicalizationMode.EXACT,
+) -> str:
+    """Render peer solutions grouped by answer id, e.g. `Peers #2, #5 (2 agents):`.
+
+    Each distinct answer appears once; peers that hold the agent's own answer are
+    only listed. With `max_tokens`, the remaining budget is split evenly over the
+    remaining groups; a solution over its share is replaced by a unified diff
+    against the agent's own solution when that is shorter, then truncated.
+    """
+    groups: Dict[str, Tuple[List[int], str]] = {}
+    for i, solution in enumerate(peer_solutions):
+        answer_id = compute_answer_id(solution, canonicalization)
+        if answer_id in groups:
+            groups[answer_id][0].append(i + 1)
+        else:
+            groups[answer_id] = ([i + 1], solution)
+    if not groups:
+        return "(no peers)"
+
+    own_id = compute_answer_id(own_solution, canonicalization)
+    same_as_own = groups.pop(own_id, None)
+    blocks: List[str] = []
+    if same_as_own is not None:
+        blocks.append(f"{_peer_label(same_as_own[0])}: same answer as your prior solution.")
+
+    counter = token_counter or ApproxTokenCounter()
+    remaining = max_tokens
+    for left, (numbers, solution) in zip(range(len(groups), 0, -1), groups.values()):
+        label = _peer_label(numbers)
+        body = solution
+        if remaining is not None:
+            share = max(0, remaining // left)
+            if counter.count(body) > share:
+                diff = _solution_diff(own_solution, solution)
+                if diff and counter.count(diff) < counter.count(body):
+                    label += " (diff against your prior solution)"
+                    body = diff
+                body, _ = truncate_to_tokens(body, share, label="peer_solution", counter=token_counter)
+            remaining -= counter.count(body)
+        blocks.append(f"{label}:\n{body}")
+    return "\n\n".join(blocks)
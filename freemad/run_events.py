@@ -1,12 +1,15 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional
+import queue
+import threading
+import time
+from typing import Any, Dict, List, Optional
 
 from freemad.types import Decision, RoundType, RunEventKind
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class RunEvent:
     kind: RunEventKind
     run_id: str
@@ -23,6 +26,8 @@ class RunEvent:
     final_answer_id: Optional[str] = None
     selection_chain: Optional[list[dict[str, object]]] = None
     error: Optional[str] = None
+    # agent_id -> remaining per-agent budget ({"tokens", "time_sec"}; only capped dimensions)
+    budget_remaining: dict[str, dict[str, float]] = field(default_factory=dict)
 
     def to_dict(self) -> Dict[str, object]:
         data: Dict[str, object] = {
@@ -54,30 +59,157 @@ class RunEvent:
             data["selection_chain"] = list(self.selection_chain)
         if self.error is not None:
             data["error"] = self.error
+        if self.budget_remaining:
+            data["budget_remaining"] = {k: dict(v) for k, v in self.budget_remaining.items()}
         return data
 
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> RunEvent:
+        def _opt(key: str) -> Optional[str]:
+            value = data.get(key)
+            return str(value) if value is not None else None
+
+        round_type, decision = _opt("round_type"), _opt("decision")
+        chain = data.get("selection_chain")
+        return cls(
+            kind=RunEventKind(str(data["kind"])),
+            run_id=str(data.get("run_id", "")),
+            ts_ms=int(data.get("ts_ms", 0)),
+            round_index=int(data["round_index"]) if data.get("round_index") is not None else None,
+            round_type=RoundType(round_type) if round_type is not None else None,
+            agent_id=_opt("agent_id"),
+            answer_id=_opt("answer_id"),
+            decision=Decision(decision) if decision is not None else None,
+            changed=bool(data["changed"]) if data.get("changed") is not None else None,
+            scores={str(k): float(v) for k, v in dict(data.get("scores") or {}).items()},
+            holders={str(k): [str(a) for a in v] for k, v in dict(data.get("holders") or {}).items()},
+            winning_agents=[str(a) for a in data.get("winning_agents") or []],
+            final_answer_id=_opt("final_answer_id"),
+            selection_chain=list(chain) if chain is not None else None,
+            error=_opt("error"),
+            budget_remaining={
+                str(k): {str(d): float(x) for d, x in dict(v).items()} for k, v in dict(data.get("budget_remaining") or {}).items()
+            },
+        )
+
 
 class RunObserver:
     def on_event(self, event: RunEvent) -> None:
         raise NotImplementedError
 
+    def close(self) -> None:
+        """Release resources (threads, files); events delivered before the call are not lost."""
+        return
+
 
 class NullObserver(RunObserver):
     def on_event(self, event: RunEvent) -> None:  # pragma: no cover - trivial
         return
 
 
+class _AsyncDispatcher:
+    """Feeds one observer from a bounded queue on its own daemon thread."""
+
+    _STOP = object()
+
+    def __init__(self, observer: RunObserver, queue_size: int) -> None:
+        self.observer = observer
+        self.dropped = 0
+        self._q: "queue.Queue[Any]" = queue.Queue(maxsize=max(1, queue_size))
+        self._thread = threading.Thread(target=self._loop, name="freemad-observer", daemon=True)
+        self._thread.start()
+
+    def submit(self, event: RunEvent) -> None:
+        try:
+            self._q.put_nowait(event)
+        except queue.Full:
+            self.dropped += 1  # the observer is behind; never stall the debate for it
+
+    def close(self, timeout: Optional[float]) -> None:
+        deadline = None if timeout is None else time.monotonic() + timeout
+        try:
+            self._q.put(self._STOP, timeout=timeout)
+        except queue.Full:
+            pass
+        else:
+            self._thread.join(None if deadline is None else max(0.0, deadline - time.monotonic()))
+            if not self._thread.is_alive():
+                return
+        # The observer is stuck: drop what it has not seen yet, so the thread stops
+        # as soon as its current event returns.
+        while True:
+            try:
+                item = self._q.get_nowait()
+            except queue.Empty:
+                break
+            if item is not self._STOP:
+                self.dropped += 1
+        self._q.put_nowait(self._STOP)
+
+    def _loop(self) -> None:
+        while True:
+            item = self._q.get()
+            if item is self._STOP:
+                return
+            try:
+                self.observer.on_event(item)
+            except Exception:
+                continue
+
+
 class FanOutObserver(RunObserver):
-    def __init__(self, observers: Optional[List[RunObserver]] = None) -> None:
-        self._observers: List[RunObserver] = list(observers or [])
+    """Delivers each event to several observers, ignoring their errors.
+
+    With `async_dispatch`, every observer gets its own bounded queue and thread:
+    `on_event` only enqueues, so a slow observer delays nobody but itself. When
+    its queue (`queue_size` events) is full, further events for that observer
+    are dropped and counted in `dropped`. `close()` drains the queues; events
+still queued when its `timeout` runs out are dropped as well.
+    """
+
+    def __init__(
+        self,
+        observers: Optional[List[RunObserver]] = None,
+        *,
+        async_dispatch: bool = False,
+        queue_size: int = 1024,
+    ) -> None:
+        self._observers: List[RunObserver] = []
+        self._async = async_dispatch
+        self._queue_size = queue_size
+        self._dispatchers: List[_AsyncDispatcher] = []
+        self._closed_dropped = 0
+        for obs in observers or []:
+            self.add(obs)
 
     def add(self, observer: RunObserver) -> None:
         self._observers.append(observer)
+        if self._async:
+            self._dispatchers.append(_AsyncDispatcher(observer, self._queue_size))
+
+    @property
+    def dropped(self) -> int:
+        return self._closed_dropped + sum(d.dropped for d in self._dispatchers)
 
     def on_event(self, event: RunEvent) -> None:
+        if self._async:
+            for dispatcher in list(self._dispatchers):
+                dispatcher.submit(event)
+            return
         for obs in list(self._observers):
             try:
                 obs.on_event(event)
             except Exception:
                 # Observers must be best-effort; errors are ignored.
                 continue
+
+    def close(self, timeout: Optional[float] = None) -> None:
+        dispatchers, self._dispatchers = self._dispatchers, []
+        for dispatcher in dispatchers:
+            dispatcher.close(timeout)
+            self._closed_dropped += dispatcher.dropped
+        for obs in list(self._observers):
+            try:
+                obs.close()
+            except Exception:
+                continue
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from .clustering import AnswerClusterer
 from .scorer import ScoreTracker
 
-__all__ = ["ScoreTracker"]
+__all__ = ["AnswerClusterer", "ScoreTracker"]
@@ -0,0 +1,118 @@
+"""Near-duplicate answer clustering with MinHash signatures and LSH banding.
+
+Each answer is reduced once to a MinHash signature over token shingles of its
+canonical text. LSH buckets signatures by band, so only answers sharing a band
+are compared; pairs whose estimated Jaccard similarity reaches the threshold are
+merged (union-find). Cost is O(answers * num_perm) plus the candidate pairs,
+instead of comparing every pair of solutions.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import random
+import re
+from typing import Dict, List, Mapping, Optional, Set, Tuple
+
+from freemad.config import ClusteringConfig
+from freemad.types import CanonicalizationMode
+from freemad.utils.canon import canonicalize_solution
+
+
+_TOKEN_RE = re.compile(r"\w+|[^\w\s]")
+_MERSENNE_61 = (1 << 61) - 1
+_MAX_HASH = (1 << 32) - 1
+
+
+def _shingle_hashes(text: str, size: int) -> Set[int]:
+    tokens = _TOKEN_RE.findall(text)
+    if len(tokens) <= size:
+        grams = [" ".join(tokens)] if tokens else []
+    else:
+        grams = [" ".join(tokens[i : i + size]) for i in range(len(tokens) - size + 1)]
+    return {int.from_bytes(hashlib.blake2b(g.encode("utf-8"), digest_size=4).digest(), "big") for g in grams}
+
+
+class AnswerClusterer:
+    """Incremental MinHash/LSH clusterer; signatures are computed once per answer id."""
+
+    def __init__(
+        self,
+        cfg: ClusteringConfig,
+        canonicalization: CanonicalizationMode = CanonicalizationMode.EXACT,
+        seed: int = 1,
+    ) -> None:
+        self.cfg = cfg
+        self._canonicalization = canonicalization
+        self._rows = cfg.num_perm // cfg.bands
+        rnd = random.Random(seed)
+        self._perms: List[Tuple[int, int]] = [
+            (rnd.randrange(1, _MERSENNE_61), rnd.randrange(0, _MERSENNE_61)) for _ in range(cfg.num_perm)
+        ]
+        self._signatures: Dict[str, Tuple[int, ...]] = {}
+        self._buckets: Dict[Tuple[int, Tuple[int, ...]], List[str]] = {}
+        self._parent: Dict[str, str] = {}
+
+    def signature(self, text: str) -> Tuple[int, ...]:
+        shingles = _shingle_hashes(canonicalize_solution(text, self._canonicalization), self.cfg.shingle_size)
+        if not shingles:
+            return tuple([_MAX_HASH] * self.cfg.num_perm)
+        return tuple(min(((a * x + b) % _MERSENNE_61) & _MAX_HASH for x in shingles) for a, b in self._perms)
+
+    @staticmethod
+    def similarity(sig_a: Tuple[int, ...], sig_b: Tuple[int, ...]) -> float:
+        """Estimated Jaccard similarity: fraction of agreeing signature slots."""
+        return sum(1 for x, y in zip(sig_a, sig_b) if x == y) / float(len(sig_a) or 1)
+
+    def add(self, answer_id: str, text: str) -> None:
+        if answer_id in self._signatures:
+            return
+        sig = self.signature(text)
+        self._signatures[answer_id] = sig
+        self._parent[answer_id] = answer_id
+        checked: Set[str] = set()
+        for band in range(self.cfg.bands):
+            key = (band, sig[band * self._rows : (band + 1) * self._rows])
+            bucket = self._buckets.setdefault(key, [])
+            for other in bucket:
+                if other in checked:
+                    continue
+                checked.add(other)
+                if self.similarity(sig, self._signatures[other]) >= self.cfg.threshold:
+                    self._union(answer_id, other)
+            bucket.append(answer_id)
+
+    def add_many(self, answers: Mapping[str, str]) -> None:
+        for answer_id in sorted(answers):
+            self.add(answer_id, answers[answer_id])
+
+    def _find(self, answer_id: str) -> str:
+        root = answer_id
+        while self._parent[root] != root:
+            root = self._parent[root]
+        while self._parent[answer_id] != root:
+            self._parent[answer_id], answer_id = root, self._parent[answer_id]
+        return root
+
+    def _union(self, a: str, b: str) -> None:
+        ra, rb = self._find(a), self._find(b)
+        if ra != rb:
+            # The smaller id becomes the root so cluster keys do not depend on insertion order.
+            lo, hi = sorted((ra, rb))
+            self._parent[hi] = lo
+
+    def clusters(self, representative_scores: Optional[Mapping[str, float]] = None) -> Dict[str, List[str]]:
+        """Representative answer id -> sorted member ids.
+
+        The representative is the member with the highest `representative_scores`
+        value (ties and missing scores fall back to the smallest id).
+        """
+        groups: Dict[str, List[str]] = {}
+        for answer_id in sorted(self._signatures):
+            groups.setdefault(self._find(answer_id), []).append(answer_id)
+        scores = representative_scores or {}
+        out: Dict[str, List[str]] = {}
+        for members in groups.values():
+            rep = min(members, key=lambda a: (-scores.get(a, 0.0), a))
+            out[rep] = members
+        return out
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Dict, List, Optional, Set
+from typing import Any, Dict, List, Mapping, Optional, Set
 
 from freemad import Config
 from freemad import ScoreAction
@@ -70,5 +70,82 @@ class ScoreTracker:
             out[ans] = raw / c
         return out
 
+    def get_pooled_scores(self, clusters: Mapping[str, List[str]]) -> Dict[str, float]:
+        """Scores keyed by cluster representative: member raw scores summed, normalized
+        by the distinct contributors of the whole cluster."""
+        out: Dict[str, float] = {}
+        for rep, members in clusters.items():
+            raw = sum(self._raw.get(ans, 0.0) for ans in members)
+            contributors: Set[str] = set()
+            for ans in members:
+                contributors |= self._contributors.get(ans, set())
+            c = max(1, len(contributors)) if self.cfg.scoring.normalize else 1
+            out[rep] = raw / c
+        return out
+
+    def unassailable_leader(self, *, next_round: int, max_rounds: int, num_agents: int) -> Optional[str]:
+        """Return the leading answer if rounds `next_round..max_rounds` cannot change the winner.
+
+        Each remaining round r can move at most `num_agents` agents, so a challenger gains
+        at most `num_agents * max(w3, w4) / (r + 1)` raw score and the leader loses at most
+        `num_agents * w2 / (r + 1)`. The leader must beat every challenger bound strictly,
+        including an answer nobody has proposed yet.
+        """
+        if not self._raw:
+            return None
+        _, w2, w3, w4 = self.cfg.scoring.weights
+        decay_sum = sum(self._decay(r) for r in range(next_round, max_rounds + 1))
+        max_gain = num_agents * max(w3, w4) * decay_sum
+        max_loss = num_agents * w2 * decay_sum
+        scores = self.get_all_scores()
+        leader = max(scores, key=lambda ans: scores[ans])
+        # Normalized bounds: contributor counts range over 1..num_agents in later rounds, so the
+        # leader is divided by the largest possible count and challengers by the smallest.
+        lowest = self._raw[leader] - max_loss
+        if self.cfg.scoring.normalize and lowest > 0:
+            lowest = lowest / max(num_agents, len(self._contributors.get(leader, set())), 1)
+        best_challenger = max_gain  # a brand-new answer starts from zero
+        for ans, raw in self._raw.items():
+            if ans != leader:
+                best_challenger = max(best_challenger, raw + max_gain)
+        return leader if lowest > best_challenger else None
+
     def explain_score(self, answer_id: str) -> List[ScoreEvent]:
         return list(self._history.get(answer_id, []))
+
+    def to_state(self) -> Dict[str, Any]:
+        """JSON-friendly copy of the tracker; `load_state` restores it exactly (floats round-trip)."""
+        return {
+            "raw": dict(self._raw),
+            "contributors": {ans: sorted(agents) for ans, agents in self._contributors.items()},
+            "history": {
+                ans: [
+                    {
+                        "round": ev.round,
+                        "agent_id": ev.agent_id,
+                        "action": ev.action.value,
+                        "deltas": dict(ev.deltas),
+                        "contributors": dict(ev.contributors),
+                    }
+                    for ev in events
+                ]
+                for ans, events in self._history.items()
+            },
+        }
+
+    def load_state(self, state: Mapping[str, Any]) -> None:
+        self._raw = {str(ans): float(v) for ans, v in dict(state.get("raw", {})).items()}
+        self._contributors = {str(ans): set(agents) for ans, agents in dict(state.get("contributors", {})).items()}
+        self._history = {
+            str(ans): [
+                ScoreEvent(
+                    round=int(ev["round"]),
+                    agent_id=str(ev["agent_id"]),
+                    action=ScoreAction(str(ev["action"])),
+                    deltas={str(k): float(v) for k, v in dict(ev["deltas"]).items()},
+                    contributors={str(k): int(v) for k, v in dict(ev["contributors"]).items()},
+                )
+                for ev in events
+            ]
+            for ans, events in dict(state.get("history", {})).items()
+        }
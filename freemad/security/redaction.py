@@ -1,10 +1,77 @@
 from __future__ import annotations
 
 import re
-from typing import Iterable, List
+from typing import Iterable, List, Optional, Tuple
+
+_REPLACEMENT = "[REDACTED]"
+_LEADING_FLAGS = re.compile(r"^\(\?[aiLmsux]+\)")
+_META = set(".^$*+?{}[]|()")
+_QUANTIFIERS = set("*?{")
+
+
+def _has_top_level_alternation(pattern: str) -> bool:
+    depth = 0
+    in_class = False
+    i = 0
+    while i < len(pattern):
+        c = pattern[i]
+        if c == "\\":
+            i += 2
+            continue
+        if in_class:
+            in_class = c != "]"
+        elif c == "[":
+            in_class = True
+            if pattern[i + 1 : i + 2] == "]":
+                i += 1  # a leading "]" is a literal member of the class
+        elif c == "(":
+            depth += 1
+        elif c == ")":
+            depth -= 1
+        elif c == "|" and depth == 0:
+            return True
+        i += 1
+    return False
+
+
+def _literal_prefix(rx: re.Pattern) -> Optional[str]:
+    """Literal text every match of `rx` starts with, or None if it cannot be determined."""
+    if rx.flags & re.VERBOSE or _has_top_level_alternation(rx.pattern):
+        return None
+    pattern = _LEADING_FLAGS.sub("", rx.pattern, count=1)
+    chars: List[str] = []
+    i = 0
+    while i < len(pattern):
+        c = pattern[i]
+        if c == "\\":
+            nxt = pattern[i + 1 : i + 2]
+            if not nxt or nxt.isalnum():
+                break  # \d, \s, \1, ... are classes or backreferences, not literals
+            c, step = nxt, 2
+        elif c in _META:
+            break
+        else:
+            step = 1
+        if pattern[i + step : i + step + 1] in _QUANTIFIERS:
+            break  # the character is optional or repeated
+        chars.append(c)
+        i += step
+    prefix = "".join(chars)
+    if not prefix:
+        return None
+    return prefix.casefold() if rx.flags & re.IGNORECASE else prefix
 
 
 class Redactor:
+    """Replaces every match of the configured patterns with `[REDACTED]`.
+
+    Each pattern's literal prefix (e.g. `sk-`, or `api` for `(?i)api[_-]?key...`)
+    is extracted once; `redact` checks it with a fast substring search and only
+    runs the regex when the prefix occurs. Most log lines contain no secret, so
+    they cost a few `str.__contains__` scans instead of one regex pass per
+    pattern. Patterns without a usable prefix always run.
+    """
+
     def __init__(self, patterns: Iterable[str]):
         self._regexes: List[re.Pattern] = []
         for p in patterns:
@@ -12,10 +79,25 @@ class Redactor:
                 self._regexes.append(re.compile(p))
             except re.error:
                 continue
+        self._prefilters: List[Tuple[re.Pattern, Optional[str], bool]] = [
+            (rx, _literal_prefix(rx), bool(rx.flags & re.IGNORECASE)) for rx in self._regexes
+        ]
 
     def redact(self, text: str) -> str:
+        if not self._regexes or not text:
+            return text
         s = text
-        for rx in self._regexes:
-            s = rx.sub("[REDACTED]", s)
+        folded: Optional[str] = None
+        for rx, prefix, ignore_case in self._prefilters:
+            if prefix is not None:
+                if ignore_case:
+                    if folded is None:
+                        folded = s.casefold()
+                    if prefix not in folded:
+                        continue
+                elif prefix not in s:
+                    continue
+            s, n = rx.subn(_REPLACEMENT, s)
+            if n:
+                folded = None
         return s
-
@@ -0,0 +1,93 @@
+"""Convergence-based early stopping for critique rounds.
+
+Policies are checked before each critique round with the outcome of the round
+that just finished; the first policy that fires ends the debate and its reason
+is reported as `early_stop_reason`.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
+
+from freemad.config import Config
+from freemad.scoring import ScoreTracker
+from freemad.types import Decision, EarlyStopPolicy, RoundType
+from freemad.utils.budget import TokenBudget
+
+
+@dataclass(frozen=True)
+class RoundOutcome:
+    round_index: int
+    round_type: RoundType
+    # Decisions of agents that actually answered; timeout carry-forwards are omitted.
+    decisions: Dict[str, Decision] = field(default_factory=dict)
+
+
+class StopPolicy:
+    name: EarlyStopPolicy
+
+    def check(self, last: RoundOutcome, *, next_round: int, max_rounds: int) -> Optional[str]:
+        raise NotImplementedError
+
+
+class AllKeepPolicy(StopPolicy):
+    """Stop once every agent that answered a critique round chose KEEP: nothing changed to react to.
+
+    Agents that timed out or were skipped for budget have no decision and are
+    not waited for; at least one agent must have answered.
+    """
+
+    name = EarlyStopPolicy.ALL_KEEP
+
+    def check(self, last: RoundOutcome, *, next_round: int, max_rounds: int) -> Optional[str]:
+        if last.round_type != RoundType.CRITIQUE or not last.decisions:
+            return None
+        if all(decision == Decision.KEEP for decision in last.decisions.values()):
+            return "all_agents_kept"
+        return None
+
+
+class UnassailableLeaderPolicy(StopPolicy):
+    """Stop once the remaining decayed score cannot change which answer leads."""
+
+    name = EarlyStopPolicy.UNASSAILABLE_LEADER
+
+    def __init__(self, score: ScoreTracker, num_agents: int) -> None:
+        self._score = score
+        self._num_agents = num_agents
+
+    def check(self, last: RoundOutcome, *, next_round: int, max_rounds: int) -> Optional[str]:
+        leader = self._score.unassailable_leader(
+            next_round=next_round, max_rounds=max_rounds, num_agents=self._num_agents
+        )
+        return "leader_unassailable" if leader is not None else None
+
+
+class TokenBudgetPolicy(StopPolicy):
+    """Stop once `budget.max_total_tokens` has been used up, even when not enforced."""
+
+    name = EarlyStopPolicy.TOKEN_BUDGET
+
+    def __init__(self, budget: TokenBudget) -> None:
+        self._budget = budget
+
+    def check(self, last: RoundOutcome, *, next_round: int, max_rounds: int) -> Optional[str]:
+        limit = self._budget.max_total_tokens
+        if limit is not None and self._budget.used >= limit:
+            return "token_budget_exhausted"
+        return None
+
+
+def build_stop_policies(
+    cfg: Config, *, agent_ids: List[str], score: ScoreTracker, token_budget: TokenBudget
+) -> List[StopPolicy]:
+    policies: List[StopPolicy] = []
+    for name in cfg.stopping.policies:
+        if name == EarlyStopPolicy.ALL_KEEP:
+            policies.append(AllKeepPolicy())
+        elif name == EarlyStopPolicy.UNASSAILABLE_LEADER:
+            policies.append(UnassailableLeaderPolicy(score, len(agent_ids)))
+        elif name == EarlyStopPolicy.TOKEN_BUDGET:
+            policies.append(TokenBudgetPolicy(token_budget))
+    return policies
@@ -1,12 +1,12 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Dict, List, Optional
+from typing import Any, Dict, List, Optional
 
 from freemad.types import ArtifactKind, ReviewDecision, TaskEventKind, TaskRole, TaskStage, TaskStatus
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TaskEvent:
     kind: TaskEventKind
     task_id: str
@@ -47,6 +47,29 @@ class TaskEvent:
             data["error"] = self.error
         return data
 
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> TaskEvent:
+        def _opt(key: str) -> Optional[str]:
+            value = data.get(key)
+            return str(value) if value is not None else None
+
+        stage, role, status = _opt("stage"), _opt("role"), _opt("status")
+        artifact_kind, review_decision = _opt("artifact_kind"), _opt("review_decision")
+        return cls(
+            kind=TaskEventKind(str(data["kind"])),
+            task_id=str(data.get("task_id", "")),
+            ts_ms=int(data.get("ts_ms", 0)),
+            stage=TaskStage(stage) if stage is not None else None,
+            role=TaskRole(role) if role is not None else None,
+            status=TaskStatus(status) if status is not None else None,
+            artifact_id=_opt("artifact_id"),
+            artifact_kind=ArtifactKind(artifact_kind) if artifact_kind is not None else None,
+            work_item_id=_opt("work_item_id"),
+            review_decision=ReviewDecision(review_decision) if review_decision is not None else None,
+            message=_opt("message"),
+            error=_opt("error"),
+        )
+
 
 class TaskObserver:
     def on_event(self, event: TaskEvent) -> None:
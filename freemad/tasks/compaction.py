@@ -0,0 +1,47 @@
+"""Materialized task snapshots and event compaction on top of the task store."""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+from freemad.dashboard.task_state import TaskSnapshot, apply_task_event, initial_task_snapshot
+from freemad.tasks.store import TaskStore
+
+
+def load_task_snapshot(store: TaskStore, task_id: str, *, snapshot_every: int) -> Tuple[TaskSnapshot, int]:
+    """Fold only the events after the last materialized snapshot.
+
+    A new snapshot is stored once `snapshot_every` events have been folded on top of the
+    previous one, so the replay cost stays bounded regardless of task age. Returns the
+    snapshot and the sequence number it covers.
+    """
+    stored = store.get_state_snapshot(task_id)
+    if stored is None:
+        seq, snapshot = 0, initial_task_snapshot(task_id)
+    else:
+        seq, snapshot = stored[0], TaskSnapshot.from_dict(stored[1])
+    pending = store.list_events_since(task_id, seq)
+    for event_seq, event in pending:
+        snapshot = apply_task_event(snapshot, event)
+        seq = event_seq
+    if len(pending) >= snapshot_every:
+        store.save_state_snapshot(task_id, seq, snapshot.to_dict())
+    return snapshot, seq
+
+
+def compact_task_events(store: TaskStore, task_id: str, *, archive_dir: str | Path, keep_recent: int) -> Dict[str, Any]:
+    """Snapshot a task at its latest event and move all but `keep_recent` events to cold storage."""
+    snapshot, seq = load_task_snapshot(store, task_id, snapshot_every=1)
+    archive_path: Optional[Path] = None
+    archived = 0
+    cutoff = store.event_seq_before_recent(task_id, keep_recent)
+    if cutoff is not None:
+        archive_path, archived = store.archive_events(task_id, min(cutoff, seq), archive_dir)
+    return {
+        "task_id": task_id,
+        "snapshot_seq": seq,
+        "snapshot": snapshot.to_dict(),
+        "archived_events": archived,
+        "archive_path": str(archive_path) if archive_path is not None else None,
+    }
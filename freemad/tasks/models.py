@@ -67,6 +67,21 @@ class ArtifactRef:
             data["role"] = self.role.value
         return data
 
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> ArtifactRef:
+        return cls(
+            artifact_id=str(data.get("artifact_id", "")),
+            task_id=str(data.get("task_id", "")),
+            stage=TaskStage(str(data.get("stage", TaskStage.INTAKE.value))),
+            kind=ArtifactKind(str(data["kind"])),
+            path=str(data.get("path", "")),
+            created_by_agent_id=str(data.get("created_by_agent_id", "")),
+            created_ts_ms=int(data.get("created_ts_ms", 0)),
+            summary=str(data.get("summary", "")),
+            parent_artifact_ids=tuple(str(item) for item in list(data.get("parent_artifact_ids", []) or [])),
+            role=TaskRole(str(data["role"])) if data.get("role") is not None else None,
+        )
+
 
 @dataclass(frozen=True)
 class FileWrite:
@@ -166,6 +181,8 @@ class StageAttempt:
     output_artifact_ids: Tuple[str, ...] = ()
     outcome: Optional[TaskOutcome] = None
     decision_reason: str = ""
+    reviewer_agent_ids: Tuple[str, ...] = ()
+    reviewer_latency_ms: Dict[str, float] = field(default_factory=dict)
 
     def to_dict(self) -> Dict[str, Any]:
         data: Dict[str, Any] = {
@@ -177,6 +194,10 @@ class StageAttempt:
             "output_artifact_ids": list(self.output_artifact_ids),
             "decision_reason": self.decision_reason,
         }
+        if self.reviewer_agent_ids:
+            data["reviewer_agent_ids"] = list(self.reviewer_agent_ids)
+        if self.reviewer_latency_ms:
+            data["reviewer_latency_ms"] = dict(self.reviewer_latency_ms)
         if self.arbiter_agent_id is not None:
             data["arbiter_agent_id"] = self.arbiter_agent_id
         if self.outcome is not None:
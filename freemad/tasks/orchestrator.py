@@ -1,19 +1,20 @@
 from __future__ import annotations
 
 import concurrent.futures
-from dataclasses import replace
-import json
+from dataclasses import dataclass, field, replace
 from pathlib import Path
-import shlex
 import subprocess
+import threading
 import time
-from typing import Iterable, List, Optional, Sequence, Tuple
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
 
+from freemad.agents.base import Agent, cancel_scope
 from freemad.agents.factory import AgentFactory
 from freemad.config import Config, ConfigError
 from freemad.task_events import NullTaskObserver, TaskEvent, TaskObserver
 from freemad.tasks.models import ArtifactRef, FileWrite, StageAttempt, TaskRequest, TaskResponse, TaskSnapshot, WorkItem
 from freemad.tasks.store import TaskStore
+from freemad.tasks.verification import VerificationResult, VerificationRunner, parse_local_command
 from freemad.types import (
     ActionKind,
     ArtifactKind,
@@ -26,16 +27,29 @@ from freemad.types import (
     TaskType,
     WorkItemStatus,
 )
+from freemad.utils import jsonio
 from freemad.utils.budget import enforce_size
 
 
+@dataclass(frozen=True)
+class QuorumReview:
+    decision: ReviewDecision
+    responses: Tuple[Tuple[str, TaskResponse], ...]  # (reviewer_agent_id, response) in arrival order
+    latency_ms: Dict[str, float] = field(default_factory=dict)
+    cancelled_agent_ids: Tuple[str, ...] = ()
+    failed: Dict[str, str] = field(default_factory=dict)  # reviewer_agent_id -> error; counted as non-approvals
+
+
 class TaskOrchestrator:
     def __init__(self, cfg: Config, observer: Optional[TaskObserver] = None):
         self.cfg = cfg
         self.store = TaskStore(cfg.task.store_path, cfg.task.artifacts_dir)
         self.factory = AgentFactory(cfg)
         self.agents = self.factory.build_all()
+        # Orders checkpoint saves against a review quorum being resolved (see `_run_review_quorum`).
+        self._checkpoint_lock = threading.Lock()
         self._observer = observer or NullTaskObserver()
+        self._verifier = VerificationRunner(cfg, self.store)
 
     def create_task(self, goal: str, task_type: TaskType, workspace_root: str) -> TaskSnapshot:
         task = self.store.create_task(goal=goal, task_type=task_type, workspace_root=workspace_root)
@@ -57,6 +71,10 @@ class TaskOrchestrator:
             task = self.step(task.task_id)
         return task
 
+    def fail_task(self, task_id: str, error: str) -> TaskSnapshot:
+        """Mark a task FAILED from outside `step`, e.g. when a worker's step raised."""
+        return self._fail(self._require_task(task_id), error)
+
     def step(self, task_id: str) -> TaskSnapshot:
         task = self._require_task(task_id)
         if task.status in {
@@ -73,28 +91,34 @@ class TaskOrchestrator:
         try:
             if task.current_stage == TaskStage.INTAKE:
                 task = self._persist(replace(task, current_stage=TaskStage.RESEARCH))
-
-            if task.current_stage == TaskStage.RESEARCH:
-                return self._run_research(task)
-            if task.current_stage == TaskStage.DRAFT_PLAN:
-                return self._run_draft_plan(task)
-            if task.current_stage == TaskStage.PLAN_REVIEW:
-                return self._run_plan_review(task)
-            if task.current_stage == TaskStage.EXECUTE:
-                return self._run_execute(task)
-            if task.current_stage == TaskStage.CODE_REVIEW:
-                return self._run_code_review(task)
-            if task.current_stage == TaskStage.VERIFY:
-                return self._run_verify(task)
-            if task.current_stage == TaskStage.FINALIZE:
-                return self._run_finalize(task)
-            return self._fail(task, f"unknown task stage: {task.current_stage.value}")
+            task = self._run_stage(task)
         except ConfigError as exc:
             return self._fail(self._require_task(task_id), str(exc))
         except subprocess.TimeoutExpired as exc:
             return self._fail(self._require_task(task_id), f"command timed out: {exc.cmd}")
         except Exception as exc:  # pragma: no cover - defensive boundary
             return self._fail(self._require_task(task_id), f"autonomous task crashed: {exc}")
+        # The stage ran to an outcome, so its unit checkpoints are no longer needed. A stage
+        # interrupted by an error or a crash keeps them, and resuming it reuses finished units.
+        self.store.clear_checkpoints(task_id)
+        return task
+
+    def _run_stage(self, task: TaskSnapshot) -> TaskSnapshot:
+        if task.current_stage == TaskStage.RESEARCH:
+            return self._run_research(task)
+        if task.current_stage == TaskStage.DRAFT_PLAN:
+            return self._run_draft_plan(task)
+        if task.current_stage == TaskStage.PLAN_REVIEW:
+            return self._run_plan_review(task)
+        if task.current_stage == TaskStage.EXECUTE:
+            return self._run_execute(task)
+        if task.current_stage == TaskStage.CODE_REVIEW:
+            return self._run_code_review(task)
+        if task.current_stage == TaskStage.VERIFY:
+            return self._run_verify(task)
+        if task.current_stage == TaskStage.FINALIZE:
+            return self._run_finalize(task)
+        return self._fail(task, f"unknown task stage: {task.current_stage.value}")
 
     def _run_research(self, task: TaskSnapshot) -> TaskSnapshot:
         self._emit_stage_started(task, TaskStage.RESEARCH, TaskRole.RESEARCHER)
@@ -116,7 +140,7 @@ class TaskOrchestrator:
                 kind=ArtifactKind.SOURCE_BUNDLE,
                 stage=TaskStage.RESEARCH,
                 role=TaskRole.RESEARCHER,
-                content=json.dumps([source.to_dict() for source in response.sources], indent=2, sort_keys=True),
+                content=jsonio.dumps([source.to_dict() for source in response.sources], indent=True, sort_keys=True),
                 created_by_agent_id=proposer.agent_cfg.id,
                 summary=f"{len(response.sources)} sources",
                 parent_artifact_ids=(artifact.artifact_id,),
@@ -190,41 +214,25 @@ class TaskOrchestrator:
     def _run_plan_review(self, task: TaskSnapshot) -> TaskSnapshot:
         self._emit_stage_started(task, TaskStage.PLAN_REVIEW, TaskRole.REVIEWER)
         proposer = self._select_agent_for_role(TaskRole.PLANNER)
-        reviewer = self._select_agent_for_role(TaskRole.REVIEWER, exclude={proposer.agent_cfg.id} if proposer else set())
-        if reviewer is None:
-            return self._pause(task, "missing_plan_reviewer")
-        response = self._invoke_agent(reviewer, task, TaskRole.REVIEWER, TaskStage.PLAN_REVIEW)
-        decision = response.review_decision or ReviewDecision.REJECT
-        review_artifact = self._record_artifact(
-            task,
-            kind=ArtifactKind.REVIEW,
-            stage=TaskStage.PLAN_REVIEW,
-            role=TaskRole.REVIEWER,
-            content=response.content,
-            created_by_agent_id=reviewer.agent_cfg.id,
-            summary=response.content[:200],
-        )
-        updated = self._append_attempt(
-            task,
-            StageAttempt(
-                stage=TaskStage.PLAN_REVIEW,
-                attempt_index=self._next_attempt_index(task, TaskStage.PLAN_REVIEW),
-                proposer_agent_id=proposer.agent_cfg.id if proposer is not None else "",
-                reviewer_agent_id=reviewer.agent_cfg.id,
-                output_artifact_ids=(review_artifact.artifact_id,),
-                outcome=self._decision_to_outcome(decision),
-                decision_reason=response.content,
-            ),
+        reviewers = self._select_agents_for_role(
+            TaskRole.REVIEWER,
+            exclude={proposer.agent_cfg.id} if proposer else set(),
+            limit=self.cfg.task.review_quorum,
         )
-        self._emit_review_event(updated, TaskStage.PLAN_REVIEW, reviewer.agent_cfg.id, decision, response.findings)
-        if decision == ReviewDecision.APPROVE:
+        if not reviewers:
+            return self._pause(task, "missing_plan_reviewer")
+        review = self._run_review_quorum(task, TaskStage.PLAN_REVIEW, reviewers)
+        proposer_agent_id = proposer.agent_cfg.id if proposer is not None else ""
+        updated = self._record_quorum_review(task, TaskStage.PLAN_REVIEW, proposer_agent_id, review)
+        if review.decision == ReviewDecision.APPROVE:
             next_stage = TaskStage.FINALIZE if updated.task_type == TaskType.PLAN else TaskStage.EXECUTE
             return self._persist(replace(updated, current_stage=next_stage, iteration=updated.iteration + 1))
         return self._resolve_review_dispute(
             updated,
             stage=TaskStage.PLAN_REVIEW,
-            proposer_agent_id=proposer.agent_cfg.id if proposer is not None else "",
-            reviewer_agent_id=reviewer.agent_cfg.id,
+            proposer_agent_id=proposer_agent_id,
+            reviewer_agent_id=review.responses[0][0],
+            reviewer_agent_ids=[agent.agent_cfg.id for agent in reviewers],
             retry_stage=TaskStage.DRAFT_PLAN,
         )
 
@@ -249,40 +257,24 @@ class TaskOrchestrator:
     def _run_code_review(self, task: TaskSnapshot) -> TaskSnapshot:
         self._emit_stage_started(task, TaskStage.CODE_REVIEW, TaskRole.REVIEWER)
         implementer = self._select_agent_for_role(TaskRole.IMPLEMENTER)
-        reviewer = self._select_agent_for_role(TaskRole.REVIEWER, exclude={implementer.agent_cfg.id} if implementer else set())
-        if reviewer is None:
-            return self._pause(task, "missing_code_reviewer")
-        response = self._invoke_agent(reviewer, task, TaskRole.REVIEWER, TaskStage.CODE_REVIEW)
-        decision = response.review_decision or ReviewDecision.REJECT
-        review_artifact = self._record_artifact(
-            task,
-            kind=ArtifactKind.REVIEW,
-            stage=TaskStage.CODE_REVIEW,
-            role=TaskRole.REVIEWER,
-            content=response.content,
-            created_by_agent_id=reviewer.agent_cfg.id,
-            summary=response.content[:200],
-        )
-        updated = self._append_attempt(
-            task,
-            StageAttempt(
-                stage=TaskStage.CODE_REVIEW,
-                attempt_index=self._next_attempt_index(task, TaskStage.CODE_REVIEW),
-                proposer_agent_id=implementer.agent_cfg.id if implementer is not None else "",
-                reviewer_agent_id=reviewer.agent_cfg.id,
-                output_artifact_ids=(review_artifact.artifact_id,),
-                outcome=self._decision_to_outcome(decision),
-                decision_reason=response.content,
-            ),
+        reviewers = self._select_agents_for_role(
+            TaskRole.REVIEWER,
+            exclude={implementer.agent_cfg.id} if implementer else set(),
+            limit=self.cfg.task.review_quorum,
         )
-        self._emit_review_event(updated, TaskStage.CODE_REVIEW, reviewer.agent_cfg.id, decision, response.findings)
-        if decision == ReviewDecision.APPROVE:
+        if not reviewers:
+            return self._pause(task, "missing_code_reviewer")
+        review = self._run_review_quorum(task, TaskStage.CODE_REVIEW, reviewers)
+        implementer_agent_id = implementer.agent_cfg.id if implementer is not None else ""
+        updated = self._record_quorum_review(task, TaskStage.CODE_REVIEW, implementer_agent_id, review)
+        if review.decision == ReviewDecision.APPROVE:
             return self._persist(replace(updated, current_stage=TaskStage.VERIFY, iteration=updated.iteration + 1))
         return self._resolve_review_dispute(
             updated,
             stage=TaskStage.CODE_REVIEW,
-            proposer_agent_id=implementer.agent_cfg.id if implementer is not None else "",
-            reviewer_agent_id=reviewer.agent_cfg.id,
+            proposer_agent_id=implementer_agent_id,
+            reviewer_agent_id=review.responses[0][0],
+            reviewer_agent_ids=[agent.agent_cfg.id for agent in reviewers],
             retry_stage=TaskStage.EXECUTE,
         )
 
@@ -297,9 +289,36 @@ class TaskOrchestrator:
                 role=TaskRole.VERIFIER,
             )
         )
-        for command in self.cfg.task.tool_policy.verification_commands:
-            result = self._run_command(task, command, stage=TaskStage.VERIFY)
-            if result.returncode != 0:
+        commands = list(self.cfg.task.tool_policy.verification_commands)
+        scope = self._checkpoint_scope(task, TaskStage.VERIFY)
+        results: List[Optional[VerificationResult]] = []
+        for index, command in enumerate(commands):
+            checkpoint = self.store.get_checkpoint(task.task_id, scope, f"verify:{index}:{command}")
+            results.append(VerificationResult.from_dict(checkpoint) if checkpoint is not None else None)
+        pending = [index for index, result in enumerate(results) if result is None]
+
+        def _checkpoint(position: int, result: VerificationResult) -> None:
+            index = pending[position]
+            self.store.save_checkpoint(task.task_id, scope, f"verify:{index}:{commands[index]}", result.to_dict())
+
+        fresh = self._verifier.run(task, [commands[index] for index in pending], on_result=_checkpoint)
+        for index, fresh_result in zip(pending, fresh):
+            results[index] = fresh_result
+            if fresh_result.artifact is not None:
+                self._emit(
+                    TaskEvent(
+                        kind=TaskEventKind.ARTIFACT_CREATED,
+                        task_id=task.task_id,
+                        ts_ms=self._now(),
+                        stage=TaskStage.VERIFY,
+                        role=TaskRole.VERIFIER,
+                        artifact_id=fresh_result.artifact.artifact_id,
+                        artifact_kind=fresh_result.artifact.kind,
+                        message="cached" if fresh_result.cached else None,
+                    )
+                )
+        for result in results:
+            if result is not None and not result.passed:
                 return self._resolve_review_dispute(
                     task,
                     stage=TaskStage.VERIFY,
@@ -395,6 +414,10 @@ class TaskOrchestrator:
         return completed
 
     def _execute_work_item(self, task: TaskSnapshot, work_item: WorkItem) -> None:
+        scope = self._checkpoint_scope(task, TaskStage.EXECUTE)
+        unit_key = f"work_item:{work_item.work_item_id}"
+        if self.store.get_checkpoint(task.task_id, scope, unit_key) is not None:
+            return
         self._emit(
             TaskEvent(
                 kind=TaskEventKind.WORK_ITEM_STARTED,
@@ -412,8 +435,12 @@ class TaskOrchestrator:
         writes = tuple(response.writes)
         if writes:
             self._apply_writes(task, writes, running)
-        for command in response.commands:
-            self._run_command(task, command, stage=TaskStage.EXECUTE)
+        for index, command in enumerate(response.commands):
+            command_key = f"{unit_key}:command:{index}"
+            if self.store.get_checkpoint(task.task_id, scope, command_key) is not None:
+                continue
+            completed_command = self._run_command(task, command, stage=TaskStage.EXECUTE)
+            self.store.save_checkpoint(task.task_id, scope, command_key, {"returncode": completed_command.returncode})
         self._record_artifact(
             task,
             kind=ArtifactKind.PATCH,
@@ -425,6 +452,7 @@ class TaskOrchestrator:
         )
         completed = replace(running, status=WorkItemStatus.APPROVED)
         self.store.update_work_item(task.task_id, completed)
+        self.store.save_checkpoint(task.task_id, scope, unit_key, {"status": completed.status.value})
         self._emit(
             TaskEvent(
                 kind=TaskEventKind.WORK_ITEM_COMPLETED,
@@ -444,6 +472,7 @@ class TaskOrchestrator:
         stage: TaskStage,
         *,
         work_item: Optional[WorkItem] = None,
+        abandoned: Optional[threading.Event] = None,
     ) -> TaskResponse:
         request = TaskRequest(
             task_id=task.task_id,
@@ -457,11 +486,24 @@ class TaskOrchestrator:
             feedback=self._feedback_for_task(task.task_id),
             work_item=work_item,
         )
+        scope = self._checkpoint_scope(task, stage)
+        unit_key = f"agent:{role.value}:{agent.agent_cfg.id}:{work_item.work_item_id if work_item is not None else ''}"
+        checkpoint = self.store.get_checkpoint(task.task_id, scope, unit_key)
+        if checkpoint is not None:
+            return TaskResponse.from_dict(checkpoint)
         response = agent.act(request)
         if not isinstance(response, TaskResponse):
             raise ConfigError(f"agent {agent.agent_cfg.id} returned unsupported autonomous response type")
+        with self._checkpoint_lock:
+            # A call outliving its quorum's decision must not checkpoint into a stage that has moved on.
+            if abandoned is None or not abandoned.is_set():
+                self.store.save_checkpoint(task.task_id, scope, unit_key, response.to_dict())
         return response
 
+    def _checkpoint_scope(self, task: TaskSnapshot, stage: TaskStage) -> str:
+        # Scoped to one pass through a stage: a retry or a new review attempt starts clean.
+        return f"{task.iteration}:{stage.value}:{self._attempt_count(task, stage)}"
+
     def _allowed_actions_for_stage(self, stage: TaskStage) -> Tuple[ActionKind, ...]:
         if stage == TaskStage.RESEARCH:
             return (ActionKind.RESEARCH,)
@@ -476,13 +518,153 @@ class TaskOrchestrator:
         return ()
 
     def _select_agent_for_role(self, role: TaskRole, *, exclude: Iterable[str] = ()):
+        selected = self._select_agents_for_role(role, exclude=exclude, limit=1)
+        return selected[0] if selected else None
+
+    def _select_agents_for_role(
+        self,
+        role: TaskRole,
+        *,
+        exclude: Iterable[str] = (),
+        limit: Optional[int] = None,
+    ) -> List[Agent]:
         excluded = set(exclude)
+        selected: List[Agent] = []
         for agent_cfg in self.cfg.agents:
             if not agent_cfg.enabled or agent_cfg.id in excluded or agent_cfg.id not in self.agents:
                 continue
             if role in agent_cfg.roles:
-                return self.agents[agent_cfg.id]
-        return None
+                selected.append(self.agents[agent_cfg.id])
+                if limit is not None and len(selected) >= limit:
+                    break
+        return selected
+
+    def _run_review_quorum(self, task: TaskSnapshot, stage: TaskStage, reviewers: Sequence[Agent]) -> QuorumReview:
+        """Run reviewers concurrently and stop as soon as the outcome is decided.
+
+        The review is approved once `required` approvals arrive and rejected as
+        soon as approval becomes impossible; calls still outstanding at that
+        point are cancelled. Running calls are cancelled through `cancel_scope`
+        (CLI agents kill their subprocess); their responses are never checkpointed. A reviewer that raises casts a failed vote; the
+        error propagates only if every reviewer failed.
+        """
+        quorum = len(reviewers)
+        required = min(self.cfg.task.review_approvals_required or quorum // 2 + 1, quorum)
+        max_workers = quorum
+        if self.cfg.budget.max_concurrent_agents is not None:
+            max_workers = max(1, min(max_workers, self.cfg.budget.max_concurrent_agents))
+        responses: List[Tuple[str, TaskResponse]] = []
+        latency_ms: Dict[str, float] = {}
+        failed: Dict[str, str] = {}
+        first_error: Optional[BaseException] = None
+        approvals = 0
+        abandoned = threading.Event()
+        executor = concurrent.futures.ThreadPoolExecutor(max_workers=max_workers)
+        try:
+            futures = {
+                executor.submit(
+                    self._timed_invoke, reviewer, task, TaskRole.REVIEWER, stage, abandoned=abandoned
+                ): reviewer.agent_cfg.id
+                for reviewer in reviewers
+            }
+            for future in concurrent.futures.as_completed(futures):
+                agent_id = futures[future]
+                try:
+                    response, elapsed_ms = future.result()
+                except Exception as exc:
+                    failed[agent_id] = str(exc) or type(exc).__name__
+                    first_error = first_error or exc
+                else:
+                    responses.append((agent_id, response))
+                    latency_ms[agent_id] = elapsed_ms
+                    if response.review_decision == ReviewDecision.APPROVE:
+                        approvals += 1
+                if approvals >= required or len(responses) + len(failed) - approvals > quorum - required:
+                    break
+        finally:
+            with self._checkpoint_lock:
+                abandoned.set()
+            executor.shutdown(wait=False, cancel_futures=True)
+        if not responses and first_error is not None:
+            raise first_error
+        objections = [response.review_decision for _, response in responses if response.review_decision != ReviewDecision.APPROVE]
+        if approvals >= required:
+            decision = ReviewDecision.APPROVE
+        elif objections and all(objection == ReviewDecision.REVISE for objection in objections):
+            decision = ReviewDecision.REVISE
+        else:
+            decision = ReviewDecision.REJECT
+        return QuorumReview(
+            decision=decision,
+            responses=tuple(responses),
+            latency_ms=latency_ms,
+            cancelled_agent_ids=tuple(
+                r.agent_cfg.id for r in reviewers if r.agent_cfg.id not in latency_ms and r.agent_cfg.id not in failed
+            ),
+            failed=failed,
+        )
+
+    def _timed_invoke(
+        self,
+        agent: Agent,
+        task: TaskSnapshot,
+        role: TaskRole,
+        stage: TaskStage,
+        *,
+        abandoned: Optional[threading.Event] = None,
+    ) -> Tuple[TaskResponse, float]:
+        t0 = time.perf_counter()
+        if abandoned is None:
+            response = self._invoke_agent(agent, task, role, stage)
+        else:
+            with cancel_scope(abandoned):  # e.g. CLI agents kill their subprocess once the quorum is decided
+                response = self._invoke_agent(agent, task, role, stage, abandoned=abandoned)
+        return response, (time.perf_counter() - t0) * 1000
+
+    def _record_quorum_review(
+        self,
+        task: TaskSnapshot,
+        stage: TaskStage,
+        proposer_agent_id: str,
+        review: QuorumReview,
+    ) -> TaskSnapshot:
+        review_artifact_ids: List[str] = []
+        for agent_id, response in review.responses:
+            review_artifact = self._record_artifact(
+                task,
+                kind=ArtifactKind.REVIEW,
+                stage=stage,
+                role=TaskRole.REVIEWER,
+                content=response.content,
+                created_by_agent_id=agent_id,
+                summary=response.content[:200],
+            )
+            review_artifact_ids.append(review_artifact.artifact_id)
+        if len(review.responses) == 1 and not review.failed:
+            decision_reason = review.responses[0][1].content
+        else:
+            decision_reason = "\n\n".join(
+                [f"{agent_id}: {response.content}" for agent_id, response in review.responses]
+                + [f"{agent_id}: review failed: {error}" for agent_id, error in review.failed.items()]
+            )
+        updated = self._append_attempt(
+            task,
+            StageAttempt(
+                stage=stage,
+                attempt_index=self._next_attempt_index(task, stage),
+                proposer_agent_id=proposer_agent_id,
+                reviewer_agent_id=review.responses[0][0],
+                output_artifact_ids=tuple(review_artifact_ids),
+                outcome=self._decision_to_outcome(review.decision),
+                decision_reason=decision_reason,
+                reviewer_agent_ids=tuple(agent_id for agent_id, _ in review.responses),
+                reviewer_latency_ms=dict(review.latency_ms),
+            ),
+        )
+        for agent_id, response in review.responses:
+            decision = response.review_decision or ReviewDecision.REJECT
+            self._emit_review_event(updated, stage, agent_id, decision, response.findings)
+        return updated
 
     def _resolve_review_dispute(
         self,
@@ -492,12 +674,16 @@ class TaskOrchestrator:
         proposer_agent_id: str,
         reviewer_agent_id: str,
         retry_stage: TaskStage,
+        reviewer_agent_ids: Sequence[str] = (),
     ) -> TaskSnapshot:
         attempts = self._attempt_count(task, stage)
         if attempts <= self.cfg.task.max_stage_retries:
             return self._persist(replace(task, current_stage=retry_stage, iteration=task.iteration + 1))
 
-        arbiter = self._select_agent_for_role(TaskRole.ARBITER, exclude=(proposer_agent_id, reviewer_agent_id))
+        arbiter = self._select_agent_for_role(
+            TaskRole.ARBITER,
+            exclude=(proposer_agent_id, reviewer_agent_id, *reviewer_agent_ids),
+        )
         if arbiter is None:
             return self._pause(task, f"{stage.value}_retries_exhausted")
 
@@ -636,13 +822,7 @@ class TaskOrchestrator:
             target.write_text(write.content, encoding="utf-8")
 
     def _run_command(self, task: TaskSnapshot, command: str, *, stage: TaskStage) -> subprocess.CompletedProcess[str]:
-        if not self.cfg.task.tool_policy.allow_local_commands:
-            raise ConfigError("task tool policy forbids local commands")
-        cmd = shlex.split(command)
-        if not cmd:
-            raise ConfigError("empty autonomous command")
-        if cmd[0] not in self.cfg.task.tool_policy.allowed_local_commands:
-            raise ConfigError(f"command '{cmd[0]}' not allowed for autonomous tasks")
+        cmd = parse_local_command(self.cfg.task.tool_policy, command)
         completed = subprocess.run(
             cmd,
             cwd=task.workspace_root,
@@ -1,14 +1,15 @@
 from __future__ import annotations
 
-import json
+import gzip
 import sqlite3
 import threading
 import time
 import uuid
 from pathlib import Path
-from typing import Any, Iterable, List, Optional, Sequence
+from typing import Any, Iterable, List, Optional, Sequence, Tuple
 
 from freemad.task_events import TaskEvent
+from freemad.utils import jsonio
 from freemad.tasks.models import ArtifactRef, StageAttempt, TaskSnapshot, WorkItem
 from freemad.types import (
     ArtifactKind,
@@ -22,6 +23,10 @@ from freemad.types import (
     WorkItemStatus,
 )
 
+# Never moved to cold storage by `archive_events`: agents receive human input as
+# feedback on every later request, which reads it from the live table.
+RETAINED_EVENT_KINDS = (TaskEventKind.HUMAN_INPUT_RECEIVED, TaskEventKind.DECISION_RECORDED)
+
 
 class TaskStore:
     def __init__(self, store_path: str | Path, artifacts_dir: str | Path):
@@ -32,6 +37,8 @@ class TaskStore:
         self._store_path.parent.mkdir(parents=True, exist_ok=True)
         self._conn = sqlite3.connect(str(self._store_path), check_same_thread=False)
         self._conn.row_factory = sqlite3.Row
+        # WAL lets several worker processes read while one of them commits.
+        self._conn.execute("PRAGMA journal_mode=WAL")
         self._init_db()
 
     def _init_db(self) -> None:
@@ -66,6 +73,13 @@ class TaskStore:
                     message TEXT,
                     error TEXT
                 );
+                CREATE INDEX IF NOT EXISTS task_events_task_seq ON task_events (task_id, seq);
+                CREATE TABLE IF NOT EXISTS task_state_snapshots (
+                    task_id TEXT PRIMARY KEY,
+                    seq INTEGER NOT NULL,
+                    snapshot_json TEXT NOT NULL,
+                    created_ts_ms INTEGER NOT NULL
+                );
                 CREATE TABLE IF NOT EXISTS task_artifacts (
                     artifact_id TEXT PRIMARY KEY,
                     task_id TEXT NOT NULL,
@@ -92,6 +106,28 @@ class TaskStore:
                     arbiter_agent_id TEXT,
                     PRIMARY KEY (task_id, work_item_id)
                 );
+                CREATE TABLE IF NOT EXISTS task_leases (
+                    task_id TEXT PRIMARY KEY,
+                    worker_id TEXT NOT NULL,
+                    acquired_at_ms INTEGER NOT NULL,
+                    expires_at_ms INTEGER NOT NULL
+                );
+                CREATE TABLE IF NOT EXISTS task_checkpoints (
+                    task_id TEXT NOT NULL,
+                    scope TEXT NOT NULL,
+                    unit_key TEXT NOT NULL,
+                    payload_json TEXT NOT NULL,
+                    created_ts_ms INTEGER NOT NULL,
+                    PRIMARY KEY (task_id, scope, unit_key)
+                );
+                CREATE TABLE IF NOT EXISTS verification_cache (
+                    cache_key TEXT PRIMARY KEY,
+                    command TEXT NOT NULL,
+                    returncode INTEGER NOT NULL,
+                    output TEXT NOT NULL,
+                    created_ts_ms INTEGER NOT NULL
+                );
+                CREATE INDEX IF NOT EXISTS idx_verification_cache_created ON verification_cache(created_ts_ms);
                 """
             )
             self._conn.commit()
@@ -100,6 +136,14 @@ class TaskStore:
         with self._lock:
             self._conn.close()
 
+    def __del__(self) -> None:
+        # sqlite3 connections sit in a reference cycle with their statement cache, so an
+        # unclosed one is only finalized by a later GC pass, whose WAL checkpoint then
+        # stalls whichever thread triggered it. Close as soon as the store is dropped.
+        conn = getattr(self, "_conn", None)
+        if conn is not None:
+            conn.close()
+
     def create_task(self, goal: str, task_type: TaskType, workspace_root: str) -> TaskSnapshot:
         task = TaskSnapshot(
             task_id=str(uuid.uuid4()),
@@ -145,7 +189,7 @@ class TaskStore:
                     task.current_stage.value,
                     task.workspace_root,
                     task.iteration,
-                    json.dumps([attempt.to_dict() for attempt in task.stage_attempts]),
+                    jsonio.dumps([attempt.to_dict() for attempt in task.stage_attempts]),
                     task.error,
                     created_at_ms,
                     now_ms,
@@ -204,6 +248,104 @@ class TaskStore:
             ).fetchall()
         return [self._row_to_event(row) for row in rows]
 
+    def list_events_since(
+        self,
+        task_id: str,
+        after_seq: int = 0,
+        limit: Optional[int] = None,
+    ) -> List[Tuple[int, TaskEvent]]:
+        """Events with `seq > after_seq`, oldest first, paired with their sequence numbers."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT * FROM task_events WHERE task_id = ? AND seq > ? ORDER BY seq ASC LIMIT ?",
+                (task_id, after_seq, -1 if limit is None else limit),
+            ).fetchall()
+        return [(int(row["seq"]), self._row_to_event(row)) for row in rows]
+
+    def list_recent_events(self, task_id: str, limit: int) -> List[TaskEvent]:
+        """The newest `limit` events, oldest first."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT * FROM task_events WHERE task_id = ? ORDER BY seq DESC LIMIT ?",
+                (task_id, limit),
+            ).fetchall()
+        return [self._row_to_event(row) for row in reversed(rows)]
+
+    def save_state_snapshot(self, task_id: str, seq: int, snapshot: dict[str, Any]) -> None:
+        with self._lock:
+            self._conn.execute(
+                """
+                INSERT INTO task_state_snapshots (task_id, seq, snapshot_json, created_ts_ms)
+                VALUES (?, ?, ?, ?)
+                ON CONFLICT(task_id) DO UPDATE SET
+                    seq = excluded.seq,
+                    snapshot_json = excluded.snapshot_json,
+                    created_ts_ms = excluded.created_ts_ms
+                WHERE excluded.seq >= task_state_snapshots.seq
+                """,
+                (task_id, seq, jsonio.dumps(snapshot, sort_keys=True), int(time.time() * 1000)),
+            )
+            self._conn.commit()
+
+    def get_state_snapshot(self, task_id: str) -> Optional[Tuple[int, dict[str, Any]]]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT seq, snapshot_json FROM task_state_snapshots WHERE task_id = ?",
+                (task_id,),
+            ).fetchone()
+        if row is None:
+            return None
+        return int(row["seq"]), dict(jsonio.loads(str(row["snapshot_json"])))
+
+    def event_seq_before_recent(self, task_id: str, keep_recent: int) -> Optional[int]:
+        """Sequence number of the newest event older than the `keep_recent` most recent ones."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT seq FROM task_events WHERE task_id = ? ORDER BY seq DESC LIMIT 1 OFFSET ?",
+                (task_id, keep_recent),
+            ).fetchone()
+        return int(row["seq"]) if row is not None else None
+
+    def archive_events(self, task_id: str, up_to_seq: int, archive_dir: str | Path) -> Tuple[Optional[Path], int]:
+        """Move events with `seq <= up_to_seq` into a gzip JSONL file and drop them from the table.
+
+        Callers must hold a state snapshot covering `up_to_seq`, since archived events are
+        no longer replayed. Events in `RETAINED_EVENT_KINDS` stay in the table. Returns the
+        archive path (None when nothing was archived) and the number of events moved.
+        """
+        retained = [kind.value for kind in RETAINED_EVENT_KINDS]
+        archivable = f"task_id = ? AND seq <= ? AND kind NOT IN ({', '.join('?' for _ in retained)})"
+        with self._lock:
+            rows = self._conn.execute(
+                f"SELECT * FROM task_events WHERE {archivable} ORDER BY seq ASC",
+                (task_id, up_to_seq, *retained),
+            ).fetchall()
+            if not rows:
+                return None, 0
+            first_seq, last_seq = int(rows[0]["seq"]), int(rows[-1]["seq"])
+            task_archive_dir = Path(archive_dir) / task_id
+            task_archive_dir.mkdir(parents=True, exist_ok=True)
+            path = task_archive_dir / f"events-{first_seq:012d}-{last_seq:012d}.jsonl.gz"
+            with gzip.open(path, "wt", encoding="utf-8") as fh:
+                for row in rows:
+                    fh.write(jsonio.dumps({"seq": int(row["seq"]), **self._row_to_event(row).to_dict()}, sort_keys=True))
+                    fh.write("\n")
+            self._conn.execute(
+                f"DELETE FROM task_events WHERE {archivable}",
+                (task_id, last_seq, *retained),
+            )
+            self._conn.commit()
+        return path, len(rows)
+
+    def list_archived_events(self, task_id: str, archive_dir: str | Path) -> List[TaskEvent]:
+        events: List[TaskEvent] = []
+        for path in sorted((Path(archive_dir) / task_id).glob("events-*.jsonl.gz")):
+            with gzip.open(path, "rt", encoding="utf-8") as fh:
+                for line in fh:
+                    if line.strip():
+                        events.append(TaskEvent.from_dict(jsonio.loads(line)))
+        return events
+
     def save_artifact(
         self,
         task_id: str,
@@ -216,12 +358,41 @@ class TaskStore:
         parent_artifact_ids: Sequence[str] = (),
         role: Optional[TaskRole] = None,
     ) -> ArtifactRef:
+        artifact_id, path = self.allocate_artifact_path(task_id, kind)
+        path.write_text(content, encoding="utf-8")
+        return self.register_artifact(
+            task_id,
+            artifact_id=artifact_id,
+            path=path,
+            kind=kind,
+            stage=stage,
+            created_by_agent_id=created_by_agent_id,
+            summary=summary,
+            parent_artifact_ids=parent_artifact_ids,
+            role=role,
+        )
+
+    def allocate_artifact_path(self, task_id: str, kind: ArtifactKind) -> tuple[str, Path]:
+        """Reserve an artifact id and file path so callers can stream content into it."""
         artifact_id = str(uuid.uuid4())
-        created_ts_ms = int(time.time() * 1000)
         task_dir = self._artifacts_dir / task_id
         task_dir.mkdir(parents=True, exist_ok=True)
-        path = task_dir / f"{artifact_id}-{kind.value}.txt"
-        path.write_text(content, encoding="utf-8")
+        return artifact_id, task_dir / f"{artifact_id}-{kind.value}.txt"
+
+    def register_artifact(
+        self,
+        task_id: str,
+        *,
+        artifact_id: str,
+        path: Path,
+        kind: ArtifactKind,
+        stage: TaskStage,
+        created_by_agent_id: str,
+        summary: str = "",
+        parent_artifact_ids: Sequence[str] = (),
+        role: Optional[TaskRole] = None,
+    ) -> ArtifactRef:
+        created_ts_ms = int(time.time() * 1000)
         with self._lock:
             self._conn.execute(
                 """
@@ -239,7 +410,7 @@ class TaskStore:
                     created_by_agent_id,
                     created_ts_ms,
                     summary,
-                    json.dumps(list(parent_artifact_ids)),
+                    jsonio.dumps(list(parent_artifact_ids)),
                     role.value if role is not None else None,
                 ),
             )
@@ -282,9 +453,9 @@ class TaskStore:
                         work_item.work_item_id,
                         work_item.title,
                         work_item.description,
-                        json.dumps(list(work_item.depends_on)),
-                        json.dumps(list(work_item.write_scope)),
-                        json.dumps(list(work_item.verification_scope)),
+                        jsonio.dumps(list(work_item.depends_on)),
+                        jsonio.dumps(list(work_item.write_scope)),
+                        jsonio.dumps(list(work_item.verification_scope)),
                         work_item.status.value,
                         work_item.author_agent_id,
                         work_item.reviewer_agent_id,
@@ -318,9 +489,9 @@ class TaskStore:
                     work_item.work_item_id,
                     work_item.title,
                     work_item.description,
-                    json.dumps(list(work_item.depends_on)),
-                    json.dumps(list(work_item.write_scope)),
-                    json.dumps(list(work_item.verification_scope)),
+                    jsonio.dumps(list(work_item.depends_on)),
+                    jsonio.dumps(list(work_item.write_scope)),
+                    jsonio.dumps(list(work_item.verification_scope)),
                     work_item.status.value,
                     work_item.author_agent_id,
                     work_item.reviewer_agent_id,
@@ -337,6 +508,174 @@ class TaskStore:
             ).fetchall()
         return [self._row_to_work_item(row) for row in rows]
 
+    def save_checkpoint(self, task_id: str, scope: str, unit_key: str, payload: dict[str, Any]) -> None:
+        with self._lock:
+            self._conn.execute(
+                """
+                INSERT INTO task_checkpoints (task_id, scope, unit_key, payload_json, created_ts_ms)
+                VALUES (?, ?, ?, ?, ?)
+                ON CONFLICT(task_id, scope, unit_key) DO UPDATE SET
+                    payload_json = excluded.payload_json,
+                    created_ts_ms = excluded.created_ts_ms
+                """,
+                (task_id, scope, unit_key, jsonio.dumps(payload, sort_keys=True), int(time.time() * 1000)),
+            )
+            self._conn.commit()
+
+    def get_checkpoint(self, task_id: str, scope: str, unit_key: str) -> Optional[dict[str, Any]]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT payload_json FROM task_checkpoints WHERE task_id = ? AND scope = ? AND unit_key = ?",
+                (task_id, scope, unit_key),
+            ).fetchone()
+        if row is None:
+            return None
+        return dict(jsonio.loads(str(row["payload_json"])))
+
+    def clear_checkpoints(self, task_id: str) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM task_checkpoints WHERE task_id = ?", (task_id,))
+            self._conn.commit()
+
+    def claim_task(self, worker_id: str, lease_ms: int, task_id: Optional[str] = None) -> Optional[TaskSnapshot]:
+        """Lease a task to `worker_id`.
+
+        Without `task_id`, the oldest PENDING or RUNNING task that has no live lease is
+        claimed. With `task_id`, that task is claimed (or its lease extended) unless
+        another worker holds an unexpired lease on it. Returns None when nothing was claimed.
+        """
+        now_ms = int(time.time() * 1000)
+        with self._lock:
+            self._conn.commit()
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                if task_id is None:
+                    row = self._conn.execute(
+                        """
+                        SELECT t.* FROM tasks t
+                        LEFT JOIN task_leases l ON l.task_id = t.task_id
+                        WHERE t.status IN (?, ?) AND (l.task_id IS NULL OR l.expires_at_ms <= ?)
+                        ORDER BY t.created_at_ms ASC
+                        LIMIT 1
+                        """,
+                        (TaskStatus.PENDING.value, TaskStatus.RUNNING.value, now_ms),
+                    ).fetchone()
+                else:
+                    row = self._conn.execute(
+                        """
+                        SELECT t.* FROM tasks t
+                        LEFT JOIN task_leases l ON l.task_id = t.task_id
+                        WHERE t.task_id = ? AND (l.task_id IS NULL OR l.expires_at_ms <= ? OR l.worker_id = ?)
+                        """,
+                        (task_id, now_ms, worker_id),
+                    ).fetchone()
+                if row is None:
+                    self._conn.rollback()
+                    return None
+                self._conn.execute(
+                    """
+                    INSERT INTO task_leases (task_id, worker_id, acquired_at_ms, expires_at_ms)
+                    VALUES (?, ?, ?, ?)
+                    ON CONFLICT(task_id) DO UPDATE SET
+                        worker_id = excluded.worker_id,
+                        acquired_at_ms = excluded.acquired_at_ms,
+                        expires_at_ms = excluded.expires_at_ms
+                    """,
+                    (row["task_id"], worker_id, now_ms, now_ms + lease_ms),
+                )
+                self._conn.commit()
+            except BaseException:
+                self._conn.rollback()
+                raise
+        return self._row_to_task(row)
+
+    def renew_lease(self, task_id: str, worker_id: str, lease_ms: int) -> bool:
+        """Extend a lease still held by `worker_id`; False means it was lost."""
+        now_ms = int(time.time() * 1000)
+        with self._lock:
+            cursor = self._conn.execute(
+                "UPDATE task_leases SET expires_at_ms = ? WHERE task_id = ? AND worker_id = ?",
+                (now_ms + lease_ms, task_id, worker_id),
+            )
+            self._conn.commit()
+        return cursor.rowcount == 1
+
+    def release_lease(self, task_id: str, worker_id: str) -> None:
+        with self._lock:
+            self._conn.execute(
+                "DELETE FROM task_leases WHERE task_id = ? AND worker_id = ?",
+                (task_id, worker_id),
+            )
+            self._conn.commit()
+
+    def get_lease(self, task_id: str) -> Optional[dict[str, Any]]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT * FROM task_leases WHERE task_id = ?",
+                (task_id,),
+            ).fetchone()
+        return dict(row) if row is not None else None
+
+    def reclaim_expired_leases(self) -> List[str]:
+        """Drop expired leases so their tasks become claimable; returns the affected task ids."""
+        now_ms = int(time.time() * 1000)
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT task_id FROM task_leases WHERE expires_at_ms <= ?",
+                (now_ms,),
+            ).fetchall()
+            self._conn.execute("DELETE FROM task_leases WHERE expires_at_ms <= ?", (now_ms,))
+            self._conn.commit()
+        return [str(row["task_id"]) for row in rows]
+
+    def get_verification_result(self, cache_key: str) -> Optional[tuple[int, str]]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT returncode, output FROM verification_cache WHERE cache_key = ?",
+                (cache_key,),
+            ).fetchone()
+        if row is None:
+            return None
+        return int(row["returncode"]), str(row["output"])
+
+    def save_verification_result(self, cache_key: str, *, command: str, returncode: int, output: str) -> None:
+        with self._lock:
+            self._conn.execute(
+                """
+                INSERT INTO verification_cache (cache_key, command, returncode, output, created_ts_ms)
+                VALUES (?, ?, ?, ?, ?)
+                ON CONFLICT(cache_key) DO UPDATE SET
+                    returncode = excluded.returncode,
+                    output = excluded.output,
+                    created_ts_ms = excluded.created_ts_ms
+                """,
+                (cache_key, command, returncode, output, int(time.time() * 1000)),
+            )
+            self._conn.commit()
+
+    def prune_verification_cache(self, *, max_age_ms: Optional[int] = None, max_entries: Optional[int] = None) -> int:
+        """Delete cached results older than `max_age_ms`, then all but the newest `max_entries`."""
+        removed = 0
+        with self._lock:
+            if max_age_ms is not None:
+                cursor = self._conn.execute(
+                    "DELETE FROM verification_cache WHERE created_ts_ms < ?",
+                    (int(time.time() * 1000) - max_age_ms,),
+                )
+                removed += cursor.rowcount
+            if max_entries is not None:
+                cursor = self._conn.execute(
+                    """
+                    DELETE FROM verification_cache WHERE cache_key NOT IN (
+                        SELECT cache_key FROM verification_cache ORDER BY created_ts_ms DESC, cache_key LIMIT ?
+                    )
+                    """,
+                    (max_entries,),
+                )
+                removed += cursor.rowcount
+            self._conn.commit()
+        return removed
+
     def _row_to_task(self, row: sqlite3.Row) -> TaskSnapshot:
         return TaskSnapshot(
             task_id=str(row["task_id"]),
@@ -348,7 +687,7 @@ class TaskStore:
             iteration=int(row["iteration"]),
             stage_attempts=tuple(
                 self._stage_attempt_from_dict(item)
-                for item in list(json.loads(str(row["stage_attempts_json"]) or "[]") or [])
+                for item in list(jsonio.loads(str(row["stage_attempts_json"]) or "[]") or [])
             ),
             artifacts=tuple(self.list_artifacts(str(row["task_id"]))),
             work_items=tuple(self.list_work_items(str(row["task_id"]))),
@@ -388,7 +727,7 @@ class TaskStore:
             created_ts_ms=int(row["created_ts_ms"]),
             summary=str(row["summary"]),
             parent_artifact_ids=tuple(
-                str(item) for item in list(json.loads(str(row["parent_artifact_ids_json"]) or "[]") or [])
+                str(item) for item in list(jsonio.loads(str(row["parent_artifact_ids_json"]) or "[]") or [])
             ),
             role=(TaskRole(str(row["role"])) if row["role"] is not None else None),
         )
@@ -399,10 +738,10 @@ class TaskStore:
             task_id=str(row["task_id"]),
             title=str(row["title"]),
             description=str(row["description"]),
-            depends_on=tuple(str(item) for item in list(json.loads(str(row["depends_on_json"]) or "[]") or [])),
-            write_scope=tuple(str(item) for item in list(json.loads(str(row["write_scope_json"]) or "[]") or [])),
+            depends_on=tuple(str(item) for item in list(jsonio.loads(str(row["depends_on_json"]) or "[]") or [])),
+            write_scope=tuple(str(item) for item in list(jsonio.loads(str(row["write_scope_json"]) or "[]") or [])),
             verification_scope=tuple(
-                str(item) for item in list(json.loads(str(row["verification_scope_json"]) or "[]") or [])
+                str(item) for item in list(jsonio.loads(str(row["verification_scope_json"]) or "[]") or [])
             ),
             status=WorkItemStatus(str(row["status"])),
             author_agent_id=(str(row["author_agent_id"]) if row["author_agent_id"] is not None else None),
@@ -421,4 +760,8 @@ class TaskStore:
             output_artifact_ids=tuple(str(item) for item in list(data.get("output_artifact_ids", []) or [])),
             outcome=(TaskOutcome(str(data["outcome"])) if data.get("outcome") is not None else None),
             decision_reason=str(data.get("decision_reason", "")),
+            reviewer_agent_ids=tuple(str(item) for item in list(data.get("reviewer_agent_ids", []) or [])),
+            reviewer_latency_ms={
+                str(k): float(v) for k, v in dict(data.get("reviewer_latency_ms", {}) or {}).items()
+            },
         )
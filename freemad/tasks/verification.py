@@ -0,0 +1,351 @@
+"""Concurrent runner for task verification commands.
+
+Commands run in parallel, stream their combined stdout/stderr into the
+report artifact as it is produced (keeping only a bounded head/tail window),
+and passing results are cached against a fingerprint of the workspace and the
+command environment so an unchanged tree does not re-run the same checks on
+resume or retry.
+"""
+
+from __future__ import annotations
+
+import collections
+import concurrent.futures
+from dataclasses import dataclass
+import hashlib
+import os
+from pathlib import Path
+import shlex
+import shutil
+import subprocess
+import threading
+import time
+from typing import Any, Callable, Deque, Dict, Iterable, List, Optional, Sequence, TextIO
+
+from freemad.config import Config, ConfigError, TaskToolPolicyConfig
+from freemad.tasks.models import ArtifactRef, TaskSnapshot
+from freemad.tasks.store import TaskStore
+from freemad.types import ArtifactKind, TaskRole, TaskStage
+
+
+# Directories not hashed file by file: caches and VCS data never influence a verification
+# outcome, and installed dependency trees are covered by `environment_fingerprint`.
+_FINGERPRINT_SKIP_DIRS = frozenset(
+    {
+        ".git",
+        ".freemad",
+        "__pycache__",
+        ".pytest_cache",
+        ".mypy_cache",
+        ".ruff_cache",
+        "node_modules",
+        ".venv",
+    }
+)
+
+
+@dataclass(frozen=True)
+class VerificationResult:
+    command: str
+    returncode: int
+    output: str  # bounded head/tail window of the combined stdout/stderr
+    truncated: bool
+    cached: bool
+    elapsed_ms: float
+    artifact: Optional[ArtifactRef] = None
+
+    @property
+    def passed(self) -> bool:
+        return self.returncode == 0
+
+    def to_dict(self) -> Dict[str, Any]:
+        data: Dict[str, Any] = {
+            "command": self.command,
+            "returncode": self.returncode,
+            "output": self.output,
+            "truncated": self.truncated,
+            "cached": self.cached,
+            "elapsed_ms": self.elapsed_ms,
+        }
+        if self.artifact is not None:
+            data["artifact"] = self.artifact.to_dict()
+        return data
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> VerificationResult:
+        return cls(
+            command=str(data.get("command", "")),
+            returncode=int(data.get("returncode", 0)),
+            output=str(data.get("output", "")),
+            truncated=bool(data.get("truncated", False)),
+            cached=bool(data.get("cached", False)),
+            elapsed_ms=float(data.get("elapsed_ms", 0.0)),
+            artifact=ArtifactRef.from_dict(data["artifact"]) if data.get("artifact") else None,
+        )
+
+
+def parse_local_command(policy: TaskToolPolicyConfig, command: str) -> List[str]:
+    """Split a command string and check it against the task tool policy."""
+    if not policy.allow_local_commands:
+        raise ConfigError("task tool policy forbids local commands")
+    cmd = shlex.split(command)
+    if not cmd:
+        raise ConfigError("empty autonomous command")
+    if cmd[0] not in policy.allowed_local_commands:
+        raise ConfigError(f"command '{cmd[0]}' not allowed for autonomous tasks")
+    return cmd
+
+
+class OutputWindow:
+    """Writes the first half of a stream through and keeps only the last half in memory."""
+
+    def __init__(self, sink: TextIO, limit: int):
+        self._sink = sink
+        self._head_limit = max(0, limit // 2)
+        self._tail_limit = max(0, limit - self._head_limit)
+        self._head: List[str] = []
+        self._head_size = 0
+        self._tail: Deque[str] = collections.deque()
+        self._tail_size = 0
+        self._dropped = 0
+
+    def write(self, chunk: str) -> None:
+        if self._head_size < self._head_limit:
+            take = chunk[: self._head_limit - self._head_size]
+            self._head.append(take)
+            self._head_size += len(take)
+            self._sink.write(take)
+            self._sink.flush()
+            chunk = chunk[len(take):]
+        if not chunk:
+            return
+        self._tail.append(chunk)
+        self._tail_size += len(chunk)
+        while self._tail_size > self._tail_limit and self._tail:
+            overflow = self._tail_size - self._tail_limit
+            first = self._tail[0]
+            if len(first) <= overflow:
+                self._tail.popleft()
+                self._tail_size -= len(first)
+                self._dropped += len(first)
+            else:
+                self._tail[0] = first[overflow:]
+                self._tail_size -= overflow
+                self._dropped += overflow
+
+    def close(self) -> None:
+        if self._dropped:
+            self._sink.write(f"\n...[truncated {self._dropped} chars]...\n")
+        self._sink.write("".join(self._tail))
+        self._sink.flush()
+
+    @property
+    def truncated(self) -> bool:
+        return self._dropped > 0
+
+    def text(self) -> str:
+        marker = f"\n...[truncated {self._dropped} chars]...\n" if self._dropped else ""
+        return "".join(self._head) + marker + "".join(self._tail)
+
+
+def prune_verification_cache(store: TaskStore, policy: TaskToolPolicyConfig) -> int:
+    ttl = policy.verification_cache_ttl_sec
+    return store.prune_verification_cache(
+        max_age_ms=int(ttl * 1000) if ttl is not None else None,
+        max_entries=policy.verification_cache_max_entries,
+    )
+
+
+def workspace_fingerprint(root: str | Path, skip_paths: Iterable[str | Path] = ()) -> str:
+    """Hash relative paths and contents of every file under `root`."""
+    root_path = Path(root).resolve()
+    skipped = {Path(p).resolve() for p in skip_paths}
+    digest = hashlib.sha256()
+    for dirpath, dirnames, filenames in os.walk(root_path):
+        current = Path(dirpath)
+        dirnames[:] = sorted(
+            d for d in dirnames if d not in _FINGERPRINT_SKIP_DIRS and (current / d).resolve() not in skipped
+        )
+        for name in sorted(filenames):
+            path = current / name
+            if not path.is_file():
+                continue
+            digest.update(path.relative_to(root_path).as_posix().encode("utf-8"))
+            digest.update(b"\0")
+            try:
+                with path.open("rb") as fh:
+                    for block in iter(lambda: fh.read(1 << 16), b""):
+                        digest.update(block)
+            except OSError:
+                continue
+            digest.update(b"\0")
+    return digest.hexdigest()
+
+
+# Environment variables that change which interpreter or packages a command picks up.
+_FINGERPRINT_ENV_VARS = ("PATH", "VIRTUAL_ENV", "PYTHONPATH", "NODE_PATH")
+
+
+def _dependency_dirs(root: Path) -> List[Path]:
+    # Installing, removing or upgrading a package changes these directories' mtimes.
+    venvs = [root / ".venv"]
+    if os.environ.get("VIRTUAL_ENV"):
+        venvs.append(Path(os.environ["VIRTUAL_ENV"]))
+    dirs = [root / "node_modules"]
+    for venv in venvs:
+        dirs.extend(sorted(venv.glob("lib/python*/site-packages")))
+        dirs.append(venv / "Lib" / "site-packages")
+    return dirs
+
+
+def environment_fingerprint(root: str | Path, argvs: Iterable[Sequence[str]]) -> str:
+    """Hash what commands run against but `workspace_fingerprint` skips.
+
+    Covers the resolved executables, interpreter-related environment variables,
+    lockfile-like markers and installed-package directories of the workspace
+    `.venv`, `node_modules` and the active virtualenv.
+    """
+    root_path = Path(root).resolve()
+    digest = hashlib.sha256()
+    for name in _FINGERPRINT_ENV_VARS:
+        digest.update(f"{name}={os.environ.get(name, '')}\0".encode("utf-8"))
+    for exe in sorted({argv[0] for argv in argvs if argv}):
+        resolved = shutil.which(exe)
+        digest.update(f"{exe}={resolved}\0".encode("utf-8"))
+        if resolved is not None:
+            real = os.path.realpath(resolved)
+            st = os.stat(real)
+            digest.update(f"{real}:{st.st_size}:{st.st_mtime_ns}\0".encode("utf-8"))
+    markers = [root_path / ".venv" / "pyvenv.cfg", root_path / "node_modules" / ".package-lock.json"]
+    for path in [*markers, *_dependency_dirs(root_path)]:
+        try:
+            st = path.stat()
+        except OSError:
+            continue
+        digest.update(f"{path}:{st.st_size}:{st.st_mtime_ns}\0".encode("utf-8"))
+    return digest.hexdigest()
+
+
+class VerificationRunner:
+    def __init__(self, cfg: Config, store: TaskStore):
+        self.cfg = cfg
+        self.store = store
+
+    def run(
+        self,
+        task: TaskSnapshot,
+        commands: Sequence[str],
+        on_result: Optional[Callable[[int, VerificationResult], None]] = None,
+    ) -> List[VerificationResult]:
+        """Run all commands concurrently; results are returned in command order.
+
+        `on_result(index, result)` is called from the worker thread as each command finishes.
+        """
+        if not commands:
+            return []
+        policy = self.cfg.task.tool_policy
+        argvs = [parse_local_command(policy, command) for command in commands]
+        fingerprint = ""
+        if policy.verification_cache:
+            workspace = workspace_fingerprint(
+                task.workspace_root,
+                skip_paths=[self.cfg.task.artifacts_dir, Path(self.cfg.task.store_path).parent],
+            )
+            fingerprint = f"{workspace}:{environment_fingerprint(task.workspace_root, argvs)}"
+        workers = min(len(commands), policy.verification_max_parallel or len(commands))
+
+        def _run(index: int, command: str, argv: List[str]) -> VerificationResult:
+            result = self._run_one(task, command, argv, fingerprint)
+            if on_result is not None:
+                on_result(index, result)
+            return result
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = [
+                executor.submit(_run, index, command, argv)
+                for index, (command, argv) in enumerate(zip(commands, argvs))
+            ]
+            results = [future.result() for future in futures]
+        if policy.verification_cache:
+            prune_verification_cache(self.store, policy)
+        return results
+
+    def _cache_key(self, fingerprint: str, command: str) -> str:
+        return hashlib.sha256(f"{fingerprint}\0{command}".encode("utf-8")).hexdigest()
+
+    def _run_one(self, task: TaskSnapshot, command: str, argv: List[str], fingerprint: str) -> VerificationResult:
+        started = time.perf_counter()
+        cache_key = self._cache_key(fingerprint, command) if fingerprint else ""
+        cached = self.store.get_verification_result(cache_key) if cache_key else None
+        artifact_id, path = self.store.allocate_artifact_path(task.task_id, ArtifactKind.VERIFICATION_REPORT)
+        with path.open("w", encoding="utf-8") as sink:
+            sink.write(f"Command: {command}\n")
+            if cached is not None:
+                sink.write("Cached: workspace unchanged since last passing run\n")
+            sink.write("Output:\n")
+            window = OutputWindow(sink, self.cfg.security.max_solution_size)
+            if cached is not None:
+                returncode, cached_output = cached
+                window.write(cached_output)
+            else:
+                returncode = self._stream(argv, task.workspace_root, window)
+            window.close()
+            sink.write(f"\nReturn code: {returncode}\n")
+        summary = command if len(command) <= 200 else command[:200]
+        artifact = self.store.register_artifact(
+            task.task_id,
+            artifact_id=artifact_id,
+            path=path,
+            kind=ArtifactKind.VERIFICATION_REPORT,
+            stage=TaskStage.VERIFY,
+            created_by_agent_id=TaskRole.VERIFIER.value,
+            summary=summary,
+            role=TaskRole.VERIFIER,
+        )
+        output = window.text()
+        if cache_key and cached is None and returncode == 0:
+            self.store.save_verification_result(cache_key, command=command, returncode=returncode, output=output)
+        return VerificationResult(
+            command=command,
+            returncode=returncode,
+            output=output,
+            truncated=window.truncated,
+            cached=cached is not None,
+            elapsed_ms=(time.perf_counter() - started) * 1000.0,
+            artifact=artifact,
+        )
+
+    def _stream(self, argv: List[str], cwd: str, window: OutputWindow) -> int:
+        timeout_s = self.cfg.security.cli_timeout_ms / 1000.0
+        proc = subprocess.Popen(
+            argv,
+            cwd=cwd,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            text=True,
+            errors="replace",
+        )
+        stdout = proc.stdout
+        if stdout is None:
+            proc.kill()
+            proc.wait()
+            raise OSError(f"no output pipe for verification command: {argv[0]}")
+        timed_out = threading.Event()
+
+        def _kill() -> None:
+            timed_out.set()
+            proc.kill()
+
+        timer = threading.Timer(timeout_s, _kill)
+        timer.daemon = True
+        timer.start()
+        try:
+            for chunk in iter(lambda: stdout.readline(1 << 16), ""):
+                window.write(chunk)
+            returncode = proc.wait()
+        finally:
+            timer.cancel()
+            stdout.close()
+        if timed_out.is_set():
+            raise subprocess.TimeoutExpired(argv, timeout_s)
+        return returncode
@@ -0,0 +1,178 @@
+"""Lease-based task worker.
+
+A worker claims PENDING/RUNNING tasks from the shared TaskStore, drives each
+one step by step on a thread pool, and keeps its leases alive from a single
+heartbeat thread. Several worker processes can point at the same database:
+a task is only driven by the worker holding its lease, and a crashed worker's
+tasks become claimable again once their leases expire.
+"""
+
+from __future__ import annotations
+
+import concurrent.futures
+import logging
+import os
+import socket
+import threading
+import time
+from typing import Dict, List, Optional
+import uuid
+
+from freemad.config import ConfigError
+from freemad.tasks.models import TaskSnapshot
+from freemad.tasks.orchestrator import TaskOrchestrator
+from freemad.types import LogEvent, TaskStatus
+from freemad.utils.logger import get_logger, log_event
+
+
+_TERMINAL = frozenset(
+    {
+        TaskStatus.COMPLETED,
+        TaskStatus.PAUSED,
+        TaskStatus.FAILED,
+        TaskStatus.WAITING_FOR_HUMAN,
+    }
+)
+
+
+def default_worker_id() -> str:
+    return f"{socket.gethostname()}-{os.getpid()}-{uuid.uuid4().hex[:8]}"
+
+
+class TaskWorker:
+    def __init__(
+        self,
+        orchestrator: TaskOrchestrator,
+        *,
+        worker_id: Optional[str] = None,
+        concurrency: Optional[int] = None,
+    ):
+        self.orchestrator = orchestrator
+        self.store = orchestrator.store
+        self.worker_id = worker_id or default_worker_id()
+        worker_cfg = orchestrator.cfg.task.worker
+        self.concurrency = concurrency or worker_cfg.concurrency
+        self._lease_ms = worker_cfg.lease_ms
+        self._heartbeat_s = worker_cfg.heartbeat_ms / 1000.0
+        self._poll_s = worker_cfg.poll_interval_ms / 1000.0
+        # task_id -> lost flag; a lost lease stops the task after its current step.
+        # The heartbeat thread runs only while at least one lease is held.
+        self._held: Dict[str, bool] = {}
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._heartbeat: Optional[threading.Thread] = None
+        # task_id -> error of a drive that raised; the worker logs it and keeps serving.
+        self.errors: Dict[str, str] = {}
+        self._logger = get_logger(orchestrator.cfg)
+
+    def stop(self) -> None:
+        self._stop.set()
+
+    def run_task(self, task_id: str) -> TaskSnapshot:
+        """Claim one specific task and drive it in the calling thread."""
+        if self.store.claim_task(self.worker_id, self._lease_ms, task_id=task_id) is None:
+            if self.store.get_task(task_id) is None:
+                raise ConfigError(f"unknown task id: {task_id}")
+            raise ConfigError(f"task {task_id} is leased by another worker")
+        self._hold(task_id)
+        return self._drive(task_id)
+
+    def drain(self) -> List[str]:
+        """Run claimable tasks until none are left; returns the task ids that were driven."""
+        return self.serve(exit_when_idle=True)
+
+    def serve(self, *, exit_when_idle: bool = False) -> List[str]:
+        """Claim and drive tasks until `stop()` is called (or the queue is empty)."""
+        driven: List[str] = []
+        running: Dict[concurrent.futures.Future[TaskSnapshot], str] = {}
+        with concurrent.futures.ThreadPoolExecutor(
+            max_workers=self.concurrency, thread_name_prefix=f"freemad-worker-{self.worker_id}"
+        ) as pool:
+            try:
+                while not self._stop.is_set():
+                    self._reap(running, [future for future in running if future.done()])
+                    self.store.reclaim_expired_leases()
+                    while len(running) < self.concurrency:
+                        task = self.store.claim_task(self.worker_id, self._lease_ms)
+                        if task is None:
+                            break
+                        self._hold(task.task_id)
+                        driven.append(task.task_id)
+                        running[pool.submit(self._drive, task.task_id)] = task.task_id
+                    if not running:
+                        if exit_when_idle:
+                            break
+                        self._stop.wait(self._poll_s)
+                        continue
+                    concurrent.futures.wait(running, timeout=self._poll_s, return_when=concurrent.futures.FIRST_COMPLETED)
+            except KeyboardInterrupt:
+                # Let in-flight tasks finish their current step and release their leases.
+                self.stop()
+        self._reap(running, list(running))
+        return driven
+
+    def _reap(
+        self,
+        running: Dict[concurrent.futures.Future[TaskSnapshot], str],
+        finished: List[concurrent.futures.Future[TaskSnapshot]],
+    ) -> None:
+        for future in finished:
+            task_id = running.pop(future)
+            exc = future.exception()
+            if exc is not None:
+                self.errors[task_id] = f"{type(exc).__name__}: {exc}"
+                log_event(
+                    self._logger,
+                    LogEvent.WORKER_TASK_ERROR,
+                    level=logging.ERROR,
+                    worker_id=self.worker_id,
+                    task_id=task_id,
+                    error=self.errors[task_id],
+                )
+
+    def _drive(self, task_id: str) -> TaskSnapshot:
+        try:
+            task = self.store.get_task(task_id)
+            if task is None:
+                raise ConfigError(f"unknown task id: {task_id}")
+            while task.status not in _TERMINAL and not self._stop.is_set():
+                with self._lock:
+                    if self._held.get(task_id, True):
+                        break
+                try:
+                    task = self.orchestrator.step(task_id)
+                except Exception as exc:
+                    # Otherwise the task stays claimable and every poll would retry it.
+                    try:
+                        self.orchestrator.fail_task(task_id, f"worker {self.worker_id} error: {exc}")
+                    except Exception:
+                        pass  # the store itself is failing; the lease expires and another poll retries
+                    raise
+            return task
+        finally:
+            with self._lock:
+                self._held.pop(task_id, None)
+            self.store.release_lease(task_id, self.worker_id)
+
+    def _hold(self, task_id: str) -> None:
+        with self._lock:
+            self._held[task_id] = False
+            if self._heartbeat is None or not self._heartbeat.is_alive():
+                self._heartbeat = threading.Thread(
+                    target=self._heartbeat_loop, name=f"freemad-heartbeat-{self.worker_id}", daemon=True
+                )
+                self._heartbeat.start()
+
+    def _heartbeat_loop(self) -> None:
+        while True:
+            with self._lock:
+                held = [task_id for task_id, lost in self._held.items() if not lost]
+                if not held:
+                    self._heartbeat = None
+                    return
+            for task_id in held:
+                if not self.store.renew_lease(task_id, self.worker_id, self._lease_ms):
+                    with self._lock:
+                        if task_id in self._held:
+                            self._held[task_id] = True
+            time.sleep(self._heartbeat_s)
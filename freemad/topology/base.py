@@ -1,13 +1,18 @@
 from __future__ import annotations
 
 import abc
-from typing import Dict, List
+from typing import Dict, List, Optional, Set, Tuple
+
+from .info import TopologyStats
 
 
 class Topology(abc.ABC):
+    _stats: Optional[TopologyStats] = None
+    _seen_pairs: Optional[Set[Tuple[str, str]]] = None
+
     @abc.abstractmethod
-    def assign_peers(self, agent_ids: List[str]) -> Dict[str, List[str]]:
-        """Return mapping agent_id -> list of peer agent_ids."""
+    def assign_peers(self, agent_ids: List[str], round_idx: int = 0) -> Dict[str, List[str]]:
+        """Return mapping agent_id -> list of peer agent_ids for critique round `round_idx`."""
         ...
 
     @abc.abstractmethod
@@ -15,3 +20,47 @@ class Topology(abc.ABC):
         """Return topology metadata for transcripts/logging."""
         ...
 
+    def observe_debate(self, scores: Dict[str, float], holders: Dict[str, List[str]]) -> None:
+        """Receive current answer scores and answer_id -> holder agent ids before a round.
+
+        Static topologies ignore the debate state; adaptive ones use it to pick peers.
+        """
+        return None
+
+    def stats(self) -> Optional[TopologyStats]:
+        """Degree/coverage statistics of the last `assign_peers` call, if any."""
+        return self._stats
+
+    def _observe(self, peers: Dict[str, List[str]]) -> Dict[str, List[str]]:
+        """Update degree/coverage statistics from an assignment and return it unchanged."""
+        if self._seen_pairs is None:
+            self._seen_pairs = set()
+        n = len(peers)
+        in_degree: Dict[str, int] = dict.fromkeys(peers, 0)
+        out_degrees: List[int] = []
+        for reviewer, assigned in peers.items():
+            out_degrees.append(len(assigned))
+            for reviewee in assigned:
+                in_degree[reviewee] = in_degree.get(reviewee, 0) + 1
+                self._seen_pairs.add((reviewer, reviewee))
+        edges = sum(out_degrees)
+        possible_pairs = n * (n - 1)
+        rounds = self._stats.rounds + 1 if self._stats is not None else 1
+        self._stats = TopologyStats(
+            rounds=rounds,
+            agents=n,
+            edges=edges,
+            min_out_degree=min(out_degrees, default=0),
+            max_out_degree=max(out_degrees, default=0),
+            mean_out_degree=edges / n if n else 0.0,
+            min_in_degree=min(in_degree.values(), default=0),
+            max_in_degree=max(in_degree.values(), default=0),
+            coverage=sum(1 for d in in_degree.values() if d > 0) / n if n else 0.0,
+            pair_coverage=len(self._seen_pairs) / possible_pairs if possible_pairs else 0.0,
+        )
+        return peers
+
+    def _with_stats(self, info: dict) -> dict:
+        if self._stats is not None:
+            info["stats"] = self._stats.to_dict()
+        return info
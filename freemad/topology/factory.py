@@ -3,7 +3,13 @@ from __future__ import annotations
 from freemad import Config, ConfigError
 
 from .base import Topology
-from .impl import AllToAll, KReviewers, Ring, Star
+from .impl import Adaptive, AllToAll, Expander, Hierarchical, KReviewers, Ring, Rotating, SmallWorld, Star
+
+
+def _require_k(cfg: Config) -> int:
+    if cfg.topology.k is None:
+        raise ConfigError(f"topology.k required for {cfg.topology.type}")
+    return cfg.topology.k
 
 
 def build_topology(cfg: Config) -> Topology:
@@ -11,14 +17,25 @@ def build_topology(cfg: Config) -> Topology:
     if t == "all_to_all":
         return AllToAll()
     if t == "k_reviewers":
-        if cfg.topology.k is None:
-            raise ConfigError("topology.k required for k_reviewers")
-        return KReviewers(k=cfg.topology.k, seed=cfg.topology.seed)
+        return KReviewers(k=_require_k(cfg), seed=cfg.topology.seed, rotate=cfg.topology.rotate)
     if t == "ring":
         return Ring()
     if t == "star":
         if not cfg.topology.hub_agent:
             raise ConfigError("topology.hub_agent required for star")
         return Star(hub=cfg.topology.hub_agent)
+    if t == "expander":
+        return Expander(k=_require_k(cfg), seed=cfg.topology.seed, rotate=cfg.topology.rotate)
+    if t == "small_world":
+        return SmallWorld(
+            k=_require_k(cfg), rewire_p=cfg.topology.rewire_p, seed=cfg.topology.seed, rotate=cfg.topology.rotate
+        )
+    if t == "hierarchical":
+        if cfg.topology.cluster_size is None:
+            raise ConfigError("topology.cluster_size required for hierarchical")
+        return Hierarchical(cluster_size=cfg.topology.cluster_size, rotate=cfg.topology.rotate)
+    if t == "rotating":
+        return Rotating(k=_require_k(cfg))
+    if t == "adaptive":
+        return Adaptive(k=_require_k(cfg), explore=cfg.topology.explore, seed=cfg.topology.seed)
     raise ConfigError(f"unknown topology: {t}")
-
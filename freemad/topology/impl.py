@@ -1,74 +1,94 @@
 from __future__ import annotations
 
 import hashlib
+import heapq
 import random
-from typing import Dict, List
+from typing import Dict, List, Set
 
 from .base import Topology
-from .info import AllToAllInfo, KReviewersInfo, RingInfo, StarInfo
+from .info import (
+    AdaptiveInfo,
+    AllToAllInfo,
+    ExpanderInfo,
+    HierarchicalInfo,
+    KReviewersInfo,
+    RingInfo,
+    RotatingInfo,
+    SmallWorldInfo,
+    StarInfo,
+)
+
+
+def _rng(seed: int, *parts: object) -> random.Random:
+    """Deterministic RNG for (seed, parts), stable across processes (unlike hash())."""
+    h = hashlib.sha256("\0".join(str(p) for p in parts).encode("utf-8")).digest()
+    salt = int.from_bytes(h[:8], "big")
+    return random.Random((seed ^ salt) & ((1 << 64) - 1))
+
+
+def _sample_others(r: random.Random, agent_ids: List[str], index: int, k: int) -> List[str]:
+    """Pick k distinct agents other than agent_ids[index] in O(k)."""
+    n = len(agent_ids)
+    if k >= n - 1:
+        return agent_ids[:index] + agent_ids[index + 1 :]
+    # Sample positions from the n-1 other slots and shift past the agent itself.
+    return [agent_ids[j + 1 if j >= index else j] for j in r.sample(range(n - 1), k)]
+
+
+def _all_to_all(agent_ids: List[str]) -> Dict[str, List[str]]:
+    return {a: agent_ids[:i] + agent_ids[i + 1 :] for i, a in enumerate(agent_ids)}
 
 
 class AllToAll(Topology):
-    def assign_peers(self, agent_ids: List[str]) -> Dict[str, List[str]]:
-        peers: Dict[str, List[str]] = {}
-        for a in agent_ids:
-            peers[a] = [x for x in agent_ids if x != a]
-        return peers
+    def assign_peers(self, agent_ids: List[str], round_idx: int = 0) -> Dict[str, List[str]]:
+        return self._observe(_all_to_all(agent_ids))
 
     def info(self) -> dict:
-        return AllToAllInfo().to_dict()
+        return self._with_stats(AllToAllInfo().to_dict())
 
 
 class KReviewers(Topology):
-    def __init__(self, k: int, seed: int):
+    def __init__(self, k: int, seed: int, rotate: bool = True):
         self.k = k
         self.seed = seed
+        self.rotate = rotate
 
-    def _seed_for(self, agent_id: str) -> int:
-        h = hashlib.sha256(agent_id.encode("utf-8")).digest()
-        salt = int.from_bytes(h[:8], "big")
-        return (self.seed ^ salt) & ((1 << 64) - 1)
-
-    def assign_peers(self, agent_ids: List[str]) -> Dict[str, List[str]]:
+    def assign_peers(self, agent_ids: List[str], round_idx: int = 0) -> Dict[str, List[str]]:
         peers: Dict[str, List[str]] = {}
-        for a in agent_ids:
-            pool = [x for x in agent_ids if x != a]
-            r = random.Random(self._seed_for(a))
-            if self.k >= len(pool):
-                peers[a] = pool
-            else:
-                peers[a] = r.sample(pool, self.k)
-        return peers
+        round_key = round_idx if self.rotate else 0
+        for i, a in enumerate(agent_ids):
+            peers[a] = _sample_others(_rng(self.seed, a, round_key), agent_ids, i, self.k)
+        return self._observe(peers)
 
     def info(self) -> dict:
-        return KReviewersInfo(k=self.k, seed=self.seed).to_dict()
+        return self._with_stats(KReviewersInfo(k=self.k, seed=self.seed, rotate=self.rotate).to_dict())
 
 
 class Ring(Topology):
-    def assign_peers(self, agent_ids: List[str]) -> Dict[str, List[str]]:
+    def assign_peers(self, agent_ids: List[str], round_idx: int = 0) -> Dict[str, List[str]]:
         n = len(agent_ids)
         peers: Dict[str, List[str]] = {}
         if n == 1:
             peers[agent_ids[0]] = []
-            return peers
+            return self._observe(peers)
         if n == 2:
             # degenerates to all_to_all
-            return AllToAll().assign_peers(agent_ids)
+            return self._observe(_all_to_all(agent_ids))
         # Each agent reviews the next agent in the ring (single neighbor)
         for i, a in enumerate(agent_ids):
             nxt = agent_ids[(i + 1) % n]
             peers[a] = [nxt]
-        return peers
+        return self._observe(peers)
 
     def info(self) -> dict:
-        return RingInfo(neighbors=1).to_dict()
+        return self._with_stats(RingInfo(neighbors=1).to_dict())
 
 
 class Star(Topology):
     def __init__(self, hub: str):
         self.hub = hub
 
-    def assign_peers(self, agent_ids: List[str]) -> Dict[str, List[str]]:
+    def assign_peers(self, agent_ids: List[str], round_idx: int = 0) -> Dict[str, List[str]]:
         peers: Dict[str, List[str]] = {}
         others = [x for x in agent_ids if x != self.hub]
         for a in agent_ids:
@@ -76,7 +96,180 @@ class Star(Topology):
                 peers[a] = others
             else:
                 peers[a] = [self.hub]
-        return peers
+        return self._observe(peers)
+
+    def info(self) -> dict:
+        return self._with_stats(StarInfo(hub=self.hub).to_dict())
+
+
+class Expander(Topology):
+    """Union of k random Hamiltonian cycles: out/in-degree <= k, good mixing w.h.p."""
+
+    def __init__(self, k: int, seed: int, rotate: bool = True):
+        self.k = k
+        self.seed = seed
+        self.rotate = rotate
+
+    def assign_peers(self, agent_ids: List[str], round_idx: int = 0) -> Dict[str, List[str]]:
+        n = len(agent_ids)
+        if self.k >= n - 1:
+            return self._observe(_all_to_all(agent_ids))
+        r = _rng(self.seed, "expander", round_idx if self.rotate else 0)
+        peers: Dict[str, List[str]] = {a: [] for a in agent_ids}
+        order = list(agent_ids)
+        for _ in range(self.k):
+            r.shuffle(order)
+            for pos, a in enumerate(order):
+                b = order[(pos + 1) % n]
+                if b not in peers[a]:
+                    peers[a].append(b)
+        return self._observe(peers)
+
+    def info(self) -> dict:
+        return self._with_stats(ExpanderInfo(k=self.k, seed=self.seed, rotate=self.rotate).to_dict())
+
+
+class SmallWorld(Topology):
+    """Watts-Strogatz: ring lattice of k nearest neighbours, each link rewired with probability p."""
+
+    def __init__(self, k: int, rewire_p: float, seed: int, rotate: bool = True):
+        self.k = k
+        self.rewire_p = rewire_p
+        self.seed = seed
+        self.rotate = rotate
+
+    def assign_peers(self, agent_ids: List[str], round_idx: int = 0) -> Dict[str, List[str]]:
+        n = len(agent_ids)
+        if self.k >= n - 1:
+            return self._observe(_all_to_all(agent_ids))
+        r = _rng(self.seed, "small_world", round_idx if self.rotate else 0)
+        forward = (self.k + 1) // 2
+        offsets = [o for j in range(1, forward + 1) for o in (j, -j)][: self.k]
+        peers: Dict[str, List[str]] = {}
+        for i, a in enumerate(agent_ids):
+            chosen: List[str] = []
+            for off in offsets:
+                b = agent_ids[(i + off) % n]
+                if r.random() < self.rewire_p:
+                    b = _sample_others(r, agent_ids, i, 1)[0]
+                if b not in chosen:
+                    chosen.append(b)
+            peers[a] = chosen
+        return self._observe(peers)
+
+    def info(self) -> dict:
+        return self._with_stats(
+            SmallWorldInfo(k=self.k, rewire_p=self.rewire_p, seed=self.seed, rotate=self.rotate).to_dict()
+        )
+
+
+class Hierarchical(Topology):
+    """Agents debate within fixed-size clusters; cluster leaders also review each other.
+
+    With `rotate`, leadership moves to the next cluster member every round.
+    """
+
+    def __init__(self, cluster_size: int, rotate: bool = True):
+        self.cluster_size = cluster_size
+        self.rotate = rotate
+
+    def assign_peers(self, agent_ids: List[str], round_idx: int = 0) -> Dict[str, List[str]]:
+        clusters = [agent_ids[i : i + self.cluster_size] for i in range(0, len(agent_ids), self.cluster_size)]
+        turn = round_idx if self.rotate else 0
+        leaders = [cluster[turn % len(cluster)] for cluster in clusters]
+        peers: Dict[str, List[str]] = {}
+        for cluster, leader in zip(clusters, leaders):
+            for i, a in enumerate(cluster):
+                peers[a] = cluster[:i] + cluster[i + 1 :]
+            peers[leader] = peers[leader] + [x for x in leaders if x != leader]
+        return self._observe(peers)
+
+    def info(self) -> dict:
+        return self._with_stats(HierarchicalInfo(cluster_size=self.cluster_size, rotate=self.rotate).to_dict())
+
+
+class Rotating(Topology):
+    """Round r reviews the next block of k ring offsets, so every pair meets within ceil((N-1)/k) rounds."""
+
+    def __init__(self, k: int):
+        self.k = k
+
+    def assign_peers(self, agent_ids: List[str], round_idx: int = 0) -> Dict[str, List[str]]:
+        n = len(agent_ids)
+        if n < 2:
+            return self._observe({a: [] for a in agent_ids})
+        blocks = -(-(n - 1) // self.k)
+        block = max(0, round_idx - 1) % blocks
+        offsets = [off for off in range(block * self.k + 1, block * self.k + self.k + 1) if off <= n - 1]
+        peers: Dict[str, List[str]] = {}
+        for i, a in enumerate(agent_ids):
+            peers[a] = [agent_ids[(i + off) % n] for off in offsets]
+        return self._observe(peers)
+
+    def info(self) -> dict:
+        return self._with_stats(RotatingInfo(k=self.k).to_dict())
+
+
+class Adaptive(Topology):
+    """Score-aware assignment: each agent sees the top-k competing answers plus `explore` random ones.
+
+    One holder per selected answer is assigned as the peer, since the critique prompt
+    shows each distinct answer once anyway. Before any scores are observed this
+    behaves like k_reviewers with k + explore peers.
+    """
+
+    def __init__(self, k: int, explore: int, seed: int):
+        self.k = k
+        self.explore = explore
+        self.seed = seed
+        self._scores: Dict[str, float] = {}
+        self._holders: Dict[str, List[str]] = {}
+        self._ranked: List[Dict[str, object]] = []
+        self._explored: List[str] = []
+
+    def observe_debate(self, scores: Dict[str, float], holders: Dict[str, List[str]]) -> None:
+        self._scores = dict(scores)
+        self._holders = {ans: list(agents) for ans, agents in holders.items() if agents}
+
+    def assign_peers(self, agent_ids: List[str], round_idx: int = 0) -> Dict[str, List[str]]:
+        if not self._holders:
+            sampled = {
+                a: _sample_others(_rng(self.seed, a, round_idx), agent_ids, i, self.k + self.explore)
+                for i, a in enumerate(agent_ids)
+            }
+            return self._observe(sampled)
+
+        own_answer = {agent: ans for ans, agents in self._holders.items() for agent in agents}
+        # k + 1 best answers cover every agent: at most one of them is the agent's own.
+        top = heapq.nlargest(
+            self.k + 1, self._holders, key=lambda ans: (self._scores.get(ans, 0.0), ans)
+        )
+        top_set = set(top)
+        rest = sorted(ans for ans in self._holders if ans not in top_set)
+        self._ranked = [
+            {"answer_id": ans, "score": self._scores.get(ans, 0.0), "holders": len(self._holders[ans])} for ans in top
+        ]
+        explored: Set[str] = set()
+        peers: Dict[str, List[str]] = {}
+        for a in agent_ids:
+            r = _rng(self.seed, a, round_idx)
+            mine = own_answer.get(a)
+            chosen = [ans for ans in top if ans != mine][: self.k]
+            pool = [ans for ans in rest if ans != mine]
+            sample = r.sample(pool, min(self.explore, len(pool)))
+            explored.update(sample)
+            selected: List[str] = []
+            for ans in chosen + sample:
+                candidates = [h for h in self._holders[ans] if h != a]
+                if candidates:
+                    selected.append(r.choice(candidates))
+            peers[a] = selected
+        self._explored = sorted(explored)
+        return self._observe(peers)
 
     def info(self) -> dict:
-        return StarInfo(hub=self.hub).to_dict()
+        return self._with_stats(
+            AdaptiveInfo(
+                k=self.k, explore=self.explore, seed=self.seed, ranked=list(self._ranked), explored=list(self._explored)
+            ).to_dict()
+        )
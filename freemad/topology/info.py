@@ -1,7 +1,7 @@
 from __future__ import annotations
 
-from dataclasses import dataclass, asdict
-from typing import Dict
+from dataclasses import dataclass, asdict, field
+from typing import Dict, List
 
 
 @dataclass(frozen=True)
@@ -11,6 +11,29 @@ class TopologyInfo:
         return asdict(self)
 
 
+@dataclass(frozen=True)
+class TopologyStats:
+    """Degree and coverage of the most recent assignment.
+
+    `coverage` is the share of agents reviewed by at least one peer this round;
+    `pair_coverage` is the share of ordered (reviewer, reviewee) pairs seen so far.
+    """
+
+    rounds: int = 0
+    agents: int = 0
+    edges: int = 0
+    min_out_degree: int = 0
+    max_out_degree: int = 0
+    mean_out_degree: float = 0.0
+    min_in_degree: int = 0
+    max_in_degree: int = 0
+    coverage: float = 0.0
+    pair_coverage: float = 0.0
+
+    def to_dict(self) -> Dict[str, object]:
+        return asdict(self)
+
+
 @dataclass(frozen=True)
 class AllToAllInfo(TopologyInfo):
     type: str = "all_to_all"
@@ -20,6 +43,7 @@ class AllToAllInfo(TopologyInfo):
 class KReviewersInfo(TopologyInfo):
     k: int = 1
     seed: int = 0
+    rotate: bool = True
     type: str = "k_reviewers"
 
 
@@ -34,3 +58,44 @@ class StarInfo(TopologyInfo):
     hub: str = ""
     type: str = "star"
 
+
+@dataclass(frozen=True)
+class ExpanderInfo(TopologyInfo):
+    k: int = 1
+    seed: int = 0
+    rotate: bool = True
+    type: str = "expander"
+
+
+@dataclass(frozen=True)
+class SmallWorldInfo(TopologyInfo):
+    k: int = 2
+    rewire_p: float = 0.1
+    seed: int = 0
+    rotate: bool = True
+    type: str = "small_world"
+
+
+@dataclass(frozen=True)
+class HierarchicalInfo(TopologyInfo):
+    cluster_size: int = 2
+    rotate: bool = True
+    type: str = "hierarchical"
+
+
+@dataclass(frozen=True)
+class RotatingInfo(TopologyInfo):
+    k: int = 1
+    type: str = "rotating"
+
+
+@dataclass(frozen=True)
+class AdaptiveInfo(TopologyInfo):
+    k: int = 1
+    explore: int = 1
+    seed: int = 0
+    # Rationale for the last assignment: answers ranked by score (best first) and
+    # the answers that were only shown as exploration samples.
+    ranked: List[Dict[str, object]] = field(default_factory=list)
+    explored: List[str] = field(default_factory=list)
+    type: str = "adaptive"
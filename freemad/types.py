@@ -34,6 +34,24 @@ class TieBreak(StrEnum):
     RANDOM = "random"
 
 
+class TokenCounterKind(StrEnum):
+    APPROX = "approx"
+    REGEX = "regex"
+    BPE = "bpe"
+
+
+class CanonicalizationMode(StrEnum):
+    EXACT = "exact"
+    WHITESPACE = "whitespace"
+    PYTHON_AST = "python_ast"
+
+
+class EarlyStopPolicy(StrEnum):
+    ALL_KEEP = "all_keep"
+    UNASSAILABLE_LEADER = "unassailable_leader"
+    TOKEN_BUDGET = "token_budget"
+
+
 class GenMarker(StrEnum):
     SOLUTION = "SOLUTION"
     REASONING = "REASONING"
@@ -64,6 +82,9 @@ class LogEvent(StrEnum):
     VALIDATION_DONE = "validation_done"
     HEALTH_STATUS = "health_status"
     COMMAND = "command"
+    EARLY_STOP = "early_stop"
+    WORKER_TASK_ERROR = "worker_task_error"
+    CHECKPOINT_FAILED = "checkpoint_failed"
 
 
 class RunEventKind(StrEnum):
@@ -1,6 +1,12 @@
 from __future__ import annotations
 
+from dataclasses import asdict, dataclass
+import threading
 import time
+from typing import TYPE_CHECKING, Dict, List, Mapping, Optional, Sequence
+
+if TYPE_CHECKING:
+    from freemad.utils.tokens import TokenCounter
 
 
 class BudgetExceeded(RuntimeError):
@@ -29,12 +35,29 @@ class BudgetGuard:
             raise BudgetExceeded("max_round_time_sec exceeded")
 
 
+def trim_at_boundary(text: str, cut: int) -> str:
+    """Return `text[:cut]` backed off to a line boundary, closing an unterminated code fence.
+
+    Backs off only when a newline exists in the second half of the kept prefix, so a
+    single very long line is still cut mid-line rather than dropped.
+    """
+    kept = text[:cut]
+    if cut < len(text):
+        nl = kept.rfind("\n")
+        if nl >= len(kept) // 2:
+            kept = kept[:nl]
+    fences = sum(1 for line in kept.splitlines() if line.lstrip().startswith("```"))
+    if fences % 2:
+        kept += "\n```"
+    return kept
+
+
 def enforce_size(text: str, max_size: int, label: str) -> tuple[str, bool]:
     s = text or ""
     if len(s) <= max_size:
         return s, False
     marker = f"\n\n[TRUNCATED at {max_size} chars: {label}]"
-    return s[:max_size] + marker, True
+    return trim_at_boundary(s, max_size) + marker, True
 
 
 def approx_tokens(text: str) -> int:
@@ -43,16 +66,25 @@ def approx_tokens(text: str) -> int:
     return max(0, (len(s) + 3) // 4)
 
 
-def truncate_to_tokens(text: str, max_tokens: int, label: str) -> tuple[str, bool]:
+def truncate_to_tokens(
+    text: str, max_tokens: int, label: str, counter: Optional["TokenCounter"] = None
+) -> tuple[str, bool]:
+    """Cut `text` to `max_tokens` (by `counter`, or the 4-chars heuristic) and append a marker."""
     if max_tokens is None:
         return text, False
-    if approx_tokens(text) <= max_tokens:
+    if counter is None:
+        if approx_tokens(text) <= max_tokens:
+            return text, False
+        approx_chars = max_tokens * 4
+        marker = f"\n\n[TRUNCATED at ~{max_tokens} tokens: {label}]"
+        if approx_chars <= 0:
+            return marker, True
+        return trim_at_boundary(text, approx_chars) + marker, True
+    if counter.count(text) <= max_tokens:
         return text, False
-    approx_chars = max_tokens * 4
-    marker = f"\n\n[TRUNCATED at ~{max_tokens} tokens: {label}]"
-    if approx_chars <= 0:
-        return marker, True
-    return text[:approx_chars] + marker, True
+    marker = f"\n\n[TRUNCATED at {max_tokens} tokens: {label}]"
+    prefix = counter.truncate(text, max(0, max_tokens))
+    return trim_at_boundary(text, len(prefix)) + marker, True
 
 
 class TokenBudget:
@@ -67,3 +99,127 @@ class TokenBudget:
         self.used += n
         if self.enforce and self.max_total_tokens is not None and self.used > self.max_total_tokens:
             raise BudgetExceeded("max_total_tokens exceeded")
+
+
+@dataclass
+class AgentSpend:
+    tokens: int = 0
+    time_sec: float = 0.0
+    calls: int = 0
+    skipped_rounds: int = 0
+
+    def to_dict(self) -> Dict[str, float]:
+        return {
+            "tokens": self.tokens,
+            "time_sec": round(self.time_sec, 3),
+            "calls": self.calls,
+            "skipped_rounds": self.skipped_rounds,
+        }
+
+
+class AgentBudgetLedger:
+    """Per-agent token and wall-time spend across the rounds of one debate.
+
+    The next call of an agent is estimated from its mean spend per call so far;
+    `admit` drops agents whose estimate would overrun their own cap and, when
+    `prefer_cheaper` is set, fills the remaining debate token budget cheapest-first.
+    Time is recorded from agent worker threads, so updates are locked.
+    """
+
+    def __init__(
+        self,
+        agent_ids: Sequence[str],
+        *,
+        max_tokens: Optional[int] = None,
+        max_time_sec: Optional[float] = None,
+        total: Optional[TokenBudget] = None,
+        prefer_cheaper: bool = False,
+    ) -> None:
+        self.max_tokens = max_tokens
+        self.max_time_sec = max_time_sec
+        self._total = total
+        self._prefer_cheaper = prefer_cheaper
+        self._spend: Dict[str, AgentSpend] = {aid: AgentSpend() for aid in agent_ids}
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        limited_total = self._total is not None and self._total.max_total_tokens is not None
+        return self.max_tokens is not None or self.max_time_sec is not None or (self._prefer_cheaper and limited_total)
+
+    def record_tokens(self, agent_id: str, n: int) -> None:
+        with self._lock:
+            spend = self._spend.setdefault(agent_id, AgentSpend())
+            spend.tokens += max(0, n)
+            spend.calls += 1
+
+    def record_time(self, agent_id: str, elapsed_sec: float) -> None:
+        with self._lock:
+            self._spend.setdefault(agent_id, AgentSpend()).time_sec += max(0.0, elapsed_sec)
+
+    def record_skip(self, agent_id: str) -> None:
+        with self._lock:
+            self._spend.setdefault(agent_id, AgentSpend()).skipped_rounds += 1
+
+    def _estimated_time(self, spend: AgentSpend) -> float:
+        return spend.time_sec / spend.calls if spend.calls else 0.0
+
+    def remaining(self, agent_id: str) -> Dict[str, float]:
+        """Remaining per-agent budget; only capped dimensions are reported."""
+        with self._lock:
+            spend = self._spend.get(agent_id) or AgentSpend()
+            out: Dict[str, float] = {}
+            if self.max_tokens is not None:
+                out["tokens"] = max(0, self.max_tokens - spend.tokens)
+            if self.max_time_sec is not None:
+                out["time_sec"] = round(max(0.0, self.max_time_sec - spend.time_sec), 3)
+            return out
+
+    def remaining_all(self) -> Dict[str, Dict[str, float]]:
+        return {aid: self.remaining(aid) for aid in list(self._spend)}
+
+    def admit(self, agent_ids: Sequence[str]) -> List[str]:
+        """Agents that may be called next, in the given order."""
+        if not self.enabled:
+            return list(agent_ids)
+        with self._lock:
+            estimates: Dict[str, float] = {}
+            for aid in agent_ids:
+                spend = self._spend.get(aid) or AgentSpend()
+                est = spend.tokens / spend.calls if spend.calls else 0.0
+                if self.max_tokens is not None and spend.tokens + est > self.max_tokens:
+                    continue
+                if self.max_time_sec is not None and spend.time_sec + self._estimated_time(spend) > self.max_time_sec:
+                    continue
+                estimates[aid] = est
+        total = self._total
+        if self._prefer_cheaper and total is not None and total.max_total_tokens is not None:
+            left: float = total.max_total_tokens - total.used
+            order = {aid: i for i, aid in enumerate(agent_ids)}
+            chosen = set()
+            for aid in sorted(estimates, key=lambda a: (estimates[a], order[a])):
+                if estimates[aid] > left:
+                    break
+                left -= estimates[aid]
+                chosen.add(aid)
+            return [aid for aid in agent_ids if aid in chosen]
+        return [aid for aid in agent_ids if aid in estimates]
+
+    def snapshot(self) -> Dict[str, Dict[str, float]]:
+        with self._lock:
+            return {aid: spend.to_dict() for aid, spend in self._spend.items()}
+
+    def to_state(self) -> Dict[str, Dict[str, float]]:
+        """Unrounded spend per agent, for checkpoints; see `load_state`."""
+        with self._lock:
+            return {aid: asdict(spend) for aid, spend in self._spend.items()}
+
+    def load_state(self, state: Mapping[str, Mapping[str, float]]) -> None:
+        with self._lock:
+            for aid, spend in state.items():
+                self._spend[aid] = AgentSpend(
+                    tokens=int(spend.get("tokens", 0)),
+                    time_sec=float(spend.get("time_sec", 0.0)),
+                    calls=int(spend.get("calls", 0)),
+                    skipped_rounds=int(spend.get("skipped_rounds", 0)),
+                )
@@ -1,11 +1,12 @@
 from __future__ import annotations
 
 import hashlib
-import json
 import os
 from pathlib import Path
 from typing import Optional
 
+from freemad.utils import jsonio
+
 
 def _sha256(s: str) -> str:
     return hashlib.sha256(s.encode("utf-8")).hexdigest()
@@ -26,7 +27,7 @@ class DiskCache:
         if not p.exists():
             return None
         try:
-            obj = json.loads(p.read_text(encoding="utf-8"))
+            obj = jsonio.loads(p.read_text(encoding="utf-8"))
             if not isinstance(obj, dict) or "raw" not in obj:
                 return None
             # touch mtime
@@ -39,7 +40,7 @@ class DiskCache:
         p = self._path_for(key)
         p.parent.mkdir(parents=True, exist_ok=True)
         payload = {"raw": raw}
-        p.write_text(json.dumps(payload), encoding="utf-8")
+        p.write_text(jsonio.dumps(payload), encoding="utf-8")
         self._evict_if_needed()
 
     def _evict_if_needed(self) -> None:
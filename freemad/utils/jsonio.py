@@ -0,0 +1,142 @@
+"""JSON encoding/decoding with an optional fast backend.
+
+Uses `orjson` or `msgspec` when installed (several times faster than the stdlib
+on transcripts and events) and falls back to `json` otherwise. Override the
+choice with `FREEMAD_JSON_BACKEND=orjson|msgspec|stdlib`.
+
+Output is equivalent JSON, not byte-identical: fast backends write compact
+separators and raw UTF-8 instead of `\\uXXXX` escapes. Values a fast backend
+rejects (e.g. integers beyond 64 bits) are retried with the stdlib, and decode
+errors always surface as `json.JSONDecodeError`. NaN and Infinity, which fast
+backends write as `null`, are also left to the stdlib, and with orjson
+dataclasses and datetimes raise `TypeError` (or go through `default`) as they
+do with `json`. Remaining differences: fast backends encode `uuid.UUID` and
+plain `Enum` members where the stdlib raises, and msgspec also encodes
+dataclasses and datetimes. Keep hashing and cache keys on the stdlib so they do
+not depend on the installed backend.
+"""
+
+from __future__ import annotations
+
+import importlib
+import json
+import math
+import os
+from typing import Any, Callable, Optional, Protocol
+
+
+class _ToDict(Protocol):
+    def to_dict(self) -> Any: ...
+
+
+def _stdlib_dumps(obj: Any, indent: bool, sort_keys: bool, default: Optional[Callable[[Any], Any]]) -> str:
+    return json.dumps(obj, indent=2 if indent else None, sort_keys=sort_keys, default=default)
+
+
+def _reject(obj: Any) -> Any:
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _has_non_finite(obj: Any) -> bool:
+    if isinstance(obj, float):
+        return not math.isfinite(obj)
+    if isinstance(obj, dict):
+        return any(_has_non_finite(v) for v in obj.values())
+    if isinstance(obj, (list, tuple)):
+        return any(_has_non_finite(v) for v in obj)
+    return False
+
+
+def _load_backend(requested: str) -> str:
+    candidates = ("orjson", "msgspec") if requested == "auto" else (requested,)
+    for name in candidates:
+        if name == "stdlib":
+            return name
+        try:
+            importlib.import_module(name if name == "orjson" else "msgspec.json")
+            return name
+        except ImportError:
+            continue
+    return "stdlib"
+
+
+BACKEND = _load_backend(os.environ.get("FREEMAD_JSON_BACKEND", "auto").strip().lower() or "auto")
+
+if BACKEND == "orjson":
+    import orjson
+
+    def _fast_dumps(obj: Any, indent: bool, sort_keys: bool, default: Optional[Callable[[Any], Any]]) -> bytes:
+        # Hand dataclasses and datetimes to `default` like the stdlib instead of encoding them.
+        option = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATACLASS | orjson.OPT_PASSTHROUGH_DATETIME
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        if sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        return orjson.dumps(obj, default=default or _reject, option=option)
+
+    _fast_loads: Callable[[Any], Any] = orjson.loads
+
+elif BACKEND == "msgspec":
+    import msgspec
+
+    _ENCODERS = {order: msgspec.json.Encoder(order=order) for order in (None, "sorted")}
+
+    def _fast_dumps(obj: Any, indent: bool, sort_keys: bool, default: Optional[Callable[[Any], Any]]) -> bytes:
+        if default is not None:
+            out = msgspec.json.encode(obj, enc_hook=default, order="sorted" if sort_keys else None)
+        else:
+            out = _ENCODERS["sorted" if sort_keys else None].encode(obj)
+        return msgspec.json.format(out, indent=2) if indent else out
+
+    _fast_loads = msgspec.json.decode
+
+
+def _try_fast_dumps(
+    obj: Any, indent: bool, sort_keys: bool, default: Optional[Callable[[Any], Any]]
+) -> Optional[bytes]:
+    if BACKEND == "stdlib":
+        return None
+    try:
+        out = _fast_dumps(obj, indent, sort_keys, default)
+    except Exception:
+        return None  # unsupported by the fast backend (e.g. huge ints); the stdlib decides
+    if b"null" in out and _has_non_finite(obj):
+        return None  # NaN/Infinity came out as null; the stdlib keeps them
+    return out
+
+
+def dumps_bytes(
+    obj: Any, *, indent: bool = False, sort_keys: bool = False, default: Optional[Callable[[Any], Any]] = None
+) -> bytes:
+    """UTF-8 encoded JSON; `indent` pretty-prints with two spaces."""
+    out = _try_fast_dumps(obj, indent, sort_keys, default)
+    if out is not None:
+        return out
+    return _stdlib_dumps(obj, indent, sort_keys, default).encode("utf-8")
+
+
+def dumps(
+    obj: Any, *, indent: bool = False, sort_keys: bool = False, default: Optional[Callable[[Any], Any]] = None
+) -> str:
+    out = _try_fast_dumps(obj, indent, sort_keys, default)
+    if out is not None:
+        return out.decode("utf-8")
+    return _stdlib_dumps(obj, indent, sort_keys, default)
+
+
+def loads(data: str | bytes) -> Any:
+    if BACKEND != "stdlib":
+        try:
+            return _fast_loads(data)
+        except Exception:
+            pass  # NaN/Infinity literals etc.; let the stdlib accept or raise JSONDecodeError
+    return json.loads(data)
+
+
+def encode(model: _ToDict, wrap: Optional[str] = None) -> str:
+    """Encode a model with `to_dict()` (RunEvent, TaskEvent, task models).
+
+    `wrap` nests it under one key, e.g. `encode(event, wrap="event")` -> `{"event": {...}}`.
+    """
+    data = model.to_dict()
+    return dumps({wrap: data} if wrap else data)
@@ -1,8 +1,22 @@
+"""Logging setup for the `freemad` logger.
+
+With `logging.queue` (default) callers only enqueue records: a `QueueHandler`
+on the logger feeds a background `QueueListener` that redacts, formats and
+writes them, flushing once per batch instead of once per record. Orchestrator
+and worker threads therefore never wait on disk or a slow terminal. The output
+style (JSON or key=value) and field limit are resolved once in `get_logger`.
+"""
+
 from __future__ import annotations
 
+import atexit
+from dataclasses import dataclass
 import json
 import logging
-from typing import Any, Dict
+import logging.handlers
+import queue
+import threading
+from typing import Any, Dict, List
 
 from freemad.security import Redactor
 from freemad.config import Config
@@ -10,40 +24,150 @@ from freemad.types import LogEvent
 
 
 class RedactionFilter(logging.Filter):
-    def __init__(self, redactor: Redactor):
+    """Redacts each record once, even when it reaches several handlers.
+
+    `max_field_chars` is read by `log_event` to bound the size of logged fields.
+    """
+
+    def __init__(self, redactor: Redactor, max_field_chars: int = 0):
         super().__init__()
         self.redactor = redactor
+        self.max_field_chars = max_field_chars
 
-    def filter(self, record: logging.LogRecord) -> bool:  # pragma: no cover trivial
+    def filter(self, record: logging.LogRecord) -> bool:
+        if getattr(record, "_freemad_redacted", False):
+            return True
+        if record.args:
+            # Redact the formatted message; args would otherwise be merged in unredacted.
+            record.msg, record.args = record.getMessage(), None
         if isinstance(record.msg, str):
             record.msg = self.redactor.redact(record.msg)
+        record._freemad_redacted = True
         return True
 
 
+class _BatchFlushMixin:
+    """Skips the per-record flush of stream handlers; the listener calls `flush_batch`."""
+
+    def flush(self) -> None:
+        return None
+
+    def flush_batch(self) -> None:
+        try:
+            super().flush()  # type: ignore[misc]
+        except (OSError, ValueError):
+            pass  # stream closed underneath us (e.g. at interpreter exit); never kill the listener
+
+    def close(self) -> None:
+        self.flush_batch()
+        super().close()  # type: ignore[misc]
+
+
+class _BatchStreamHandler(_BatchFlushMixin, logging.StreamHandler):
+    pass
+
+
+class _BatchRotatingFileHandler(_BatchFlushMixin, logging.handlers.RotatingFileHandler):
+    pass
+
+
+class _BatchingQueueListener(logging.handlers.QueueListener):
+    """Flushes its handlers when the queue runs dry or every `batch_size` records."""
+
+    def __init__(self, q: "queue.SimpleQueue[Any]", *handlers: logging.Handler, batch_size: int = 256):
+        super().__init__(q, *handlers, respect_handler_level=True)
+        self._queue = q  # `self.queue` is typed as the minimal `_QueueLike`, which lacks `empty()`
+        self.batch_size = max(1, batch_size)
+        self._pending = 0
+
+    def handle(self, record: logging.LogRecord) -> None:
+        super().handle(record)
+        self._pending += 1
+        if self._pending >= self.batch_size or self._queue.empty():
+            self.flush_batch()
+
+    def flush_batch(self) -> None:
+        self._pending = 0
+        for h in self.handlers:
+            getattr(h, "flush_batch", h.flush)()
+
+
+@dataclass(frozen=True)
+class _LogSettings:
+    structured: bool
+    max_field_chars: int
+
+
+_SETTINGS: Dict[str, _LogSettings] = {}
+_LISTENERS: Dict[str, _BatchingQueueListener] = {}
+_LISTENERS_LOCK = threading.Lock()
+_ATEXIT_REGISTERED = False
+
+
+def _stop_listener(name: str) -> None:
+    with _LISTENERS_LOCK:
+        listener = _LISTENERS.pop(name, None)
+    if listener is not None:
+        listener.stop()
+        listener.flush_batch()
+
+
+def _stop_all_listeners() -> None:
+    for name in list(_LISTENERS):
+        _stop_listener(name)
+
+
+def flush_logs() -> None:
+    """Block until every queued record has been written (e.g. before reading a log file)."""
+    with _LISTENERS_LOCK:
+        listeners = list(_LISTENERS.values())
+    for listener in listeners:
+        listener.stop()  # drains the queue up to the sentinel
+        listener.flush_batch()
+        listener.start()
+
+
 def get_logger(cfg: Config) -> logging.Logger:
+    global _ATEXIT_REGISTERED
     logger = logging.getLogger("freemad")
     if logger.handlers:
         return logger
     level = getattr(logging, cfg.logging.level, logging.INFO)
     logger.setLevel(level)
     redactor = Redactor(cfg.security.redact_patterns)
-    flt = RedactionFilter(redactor)
+    flt = RedactionFilter(redactor, cfg.logging.max_field_chars)
+    _SETTINGS[logger.name] = _LogSettings(cfg.logging.structured, cfg.logging.max_field_chars)
 
+    sinks: List[logging.Handler] = []
     if cfg.logging.console:
-        ch = logging.StreamHandler()
-        ch.setLevel(level)
-        ch.addFilter(flt)
-        if cfg.logging.structured:
-            ch.setFormatter(_JsonFormatter())
-        else:
-            ch.setFormatter(logging.Formatter("%(asctime)s %(levelname)s %(message)s"))
-        logger.addHandler(ch)
+        ch: logging.Handler = _BatchStreamHandler() if cfg.logging.queue else logging.StreamHandler()
+        sinks.append(ch)
     if cfg.logging.file:
-        fh = logging.FileHandler(cfg.logging.file)
-        fh.setLevel(level)
-        fh.addFilter(flt)
-        fh.setFormatter(_JsonFormatter() if cfg.logging.structured else logging.Formatter("%(asctime)s %(levelname)s %(message)s"))
-        logger.addHandler(fh)
+        cls = _BatchRotatingFileHandler if cfg.logging.queue else logging.handlers.RotatingFileHandler
+        sinks.append(cls(cfg.logging.file, maxBytes=cfg.logging.max_bytes, backupCount=cfg.logging.backup_count))
+    for h in sinks:
+        h.setLevel(level)
+        h.addFilter(flt)
+        h.setFormatter(_JsonFormatter() if cfg.logging.structured else logging.Formatter("%(asctime)s %(levelname)s %(message)s"))
+
+    if not cfg.logging.queue:
+        for h in sinks:
+            logger.addHandler(h)
+        return logger
+
+    # A previous pipeline whose handlers were removed (reconfiguration) is drained first.
+    _stop_listener(logger.name)
+    q: "queue.SimpleQueue[Any]" = queue.SimpleQueue()
+    qh = logging.handlers.QueueHandler(q)
+    qh.setLevel(level)
+    listener = _BatchingQueueListener(q, *sinks, batch_size=cfg.logging.batch_size)
+    with _LISTENERS_LOCK:
+        _LISTENERS[logger.name] = listener
+        if not _ATEXIT_REGISTERED:
+            atexit.register(_stop_all_listeners)
+            _ATEXIT_REGISTERED = True
+    listener.start()
+    logger.addHandler(qh)
     return logger
 
 
@@ -54,12 +178,42 @@ class _JsonFormatter(logging.Formatter):  # pragma: no cover minimal
             "level": record.levelname,
             "message": record.getMessage(),
         }
-        return json.dumps(obj)
+        return _dumps(obj)
+
+
+# One reusable encoder: avoids json.dumps' per-call option handling; `default=str`
+# keeps non-JSON field values (paths, enums, exceptions) from raising.
+_dumps = json.JSONEncoder(separators=(",", ":"), default=str).encode
+
+
+def _settings(logger: logging.Logger) -> _LogSettings:
+    settings = _SETTINGS.get(logger.name)
+    if settings is None:
+        # Logger configured outside get_logger: derive once from its handlers.
+        structured = any(isinstance(h.formatter, _JsonFormatter) for h in logger.handlers)
+        limit = next(
+            (f.max_field_chars for h in logger.handlers for f in h.filters if isinstance(f, RedactionFilter)), 0
+        )
+        settings = _SETTINGS.setdefault(logger.name, _LogSettings(structured, limit))
+    return settings
+
+
+def _bound(value: Any, limit: int) -> Any:
+    if isinstance(value, str) and len(value) > limit:
+        return f"{value[:limit]}...[{len(value) - limit} chars truncated]"
+    return value
 
 
 def log_event(logger: logging.Logger, event: LogEvent, level: int = logging.INFO, **fields: Any) -> None:
-    if any(isinstance(h.formatter, _JsonFormatter) for h in logger.handlers):
-        msg = json.dumps({"event": event.value, **fields})
+    # Formatting (and later redacting) large agent outputs is the expensive part,
+    # so skip it entirely when no handler would emit the record.
+    if not logger.isEnabledFor(level):
+        return
+    settings = _settings(logger)
+    if settings.max_field_chars:
+        fields = {k: _bound(v, settings.max_field_chars) for k, v in fields.items()}
+    if settings.structured:
+        msg = _dumps({"event": event.value, **fields})
     else:
         kv = " ".join(f"{k}={v}" for k, v in fields.items())
         msg = f"[{event.value}] {kv}" if kv else f"[{event.value}]"
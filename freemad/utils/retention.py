@@ -0,0 +1,488 @@
+"""Transcript retention: run index, archival and garbage collection.
+
+Loose transcripts live at `<dir>/transcript-YYYYMMDD-HHMMSS.{json,md}`. Old ones
+are packed into monthly zip archives (`<dir>/archive/transcripts-YYYYMM.zip`)
+that `read_transcript` still serves, and `<dir>/index.json` keeps one summary
+per run so listing never re-parses unchanged files. The index is validated
+against file sizes and mtimes on every refresh, so it is a cache: deleting it,
+or editing the directory by hand, only costs a rebuild.
+
+Run ages come from the timestamp in the file name, which survives copies and
+restores; the file mtime is used only when the name does not parse.
+
+Archives are rewritten to a temporary file and swapped in with `os.replace`;
+loose files are removed only after the archive holding them is in place.
+Writers hold `<dir>/.retention.lock` (where `fcntl` exists), so a CLI `gc`
+and the dashboard janitor never interleave, and temporary names are unique
+per process.
+"""
+
+from __future__ import annotations
+
+import os
+import re
+import threading
+import time
+import zipfile
+from contextlib import ExitStack, contextmanager
+from dataclasses import asdict, dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows: unique temp names still keep writers apart
+    fcntl = None  # type: ignore[assignment]
+
+from freemad.config import RetentionConfig
+from freemad.utils import jsonio
+
+TRANSCRIPT_FILE_PATTERN = re.compile(r"^transcript-(\d{6})(\d{2})-(\d{6})\.(json|md)$")
+INDEX_FILE = "index.json"
+INDEX_VERSION = 1
+ARCHIVE_DIR = "archive"
+LOCK_FILE = ".retention.lock"
+
+_DAY_SEC = 86400.0
+# Index refreshes and archive rewrites from the dashboard, its janitor and API calls.
+_LOCK = threading.RLock()
+_lock_depth = 0  # nesting of `_locked` in the thread holding `_LOCK`
+
+
+@dataclass(frozen=True)
+class GcReport:
+    deleted: List[str] = field(default_factory=list)
+    archived: List[str] = field(default_factory=list)
+    event_logs_deleted: List[str] = field(default_factory=list)
+    runs: int = 0  # runs left, loose and archived
+    bytes_before: int = 0
+    bytes_after: int = 0
+    dry_run: bool = False
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+@dataclass(frozen=True)
+class CacheGcReport:
+    deleted: int = 0
+    bytes_before: int = 0
+    bytes_after: int = 0
+    dry_run: bool = False
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+def archive_path_for(dirpath: str | Path, file: str) -> Path:
+    m = TRANSCRIPT_FILE_PATTERN.match(file)
+    if m is None:
+        raise ValueError(f"not a transcript file name: {file!r}")
+    return Path(dirpath) / ARCHIVE_DIR / f"transcripts-{m.group(1)}.zip"
+
+
+def _parse_ts(file: str) -> Optional[datetime]:
+    m = TRANSCRIPT_FILE_PATTERN.match(file)
+    if m is None:
+        return None
+    try:
+        return datetime.strptime(f"{m.group(1)}{m.group(2)}-{m.group(3)}", "%Y%m%d-%H%M%S")
+    except ValueError:
+        return None
+
+
+def _summarize(file: str, data: bytes, *, size: int, mtime: float, archive: Optional[str]) -> Dict[str, Any]:
+    obj: Any = {}
+    if file.endswith(".json"):
+        try:
+            obj = jsonio.loads(data)
+        except ValueError:
+            obj = {}  # listed with empty fields; the detail view reports the parse error
+    if not isinstance(obj, dict):
+        obj = {}
+    ts = _parse_ts(file)
+    return {
+        "file": file,
+        "timestamp": ts.isoformat() if ts else None,
+        "display_time": ts.strftime("%b %d, %Y %H:%M:%S") if ts else None,
+        "final_answer_id": obj.get("final_answer_id"),
+        "winning_agents": obj.get("winning_agents", []),
+        "rounds": max(0, len(obj.get("transcript", [])) - 1),
+        "scores": obj.get("scores", {}),
+        "metrics": obj.get("metrics", {}),
+        "bytes": size,
+        "created": ts.timestamp() if ts else mtime,
+        "archive": archive,
+    }
+
+
+@contextmanager
+def _locked(root: Path) -> Iterator[None]:
+    """`_LOCK` plus an exclusive lock on `root/LOCK_FILE` for other processes."""
+    global _lock_depth
+    with _LOCK, ExitStack() as stack:
+        if _lock_depth == 0 and fcntl is not None and root.is_dir():
+            fh = stack.enter_context(open(root / LOCK_FILE, "ab"))
+            fcntl.flock(fh, fcntl.LOCK_EX)  # released when the file is closed
+        _lock_depth += 1
+        try:
+            yield
+        finally:
+            _lock_depth -= 1
+
+
+def _tmp_path(path: Path) -> Path:
+    return path.with_name(f"{path.name}.{os.getpid()}.tmp")
+
+
+def _load_index(root: Path) -> Dict[str, Any]:
+    try:
+        data = jsonio.loads((root / INDEX_FILE).read_bytes())
+    except (OSError, ValueError):
+        data = None
+    if not isinstance(data, dict) or data.get("version") != INDEX_VERSION:
+        return {"version": INDEX_VERSION, "archives": {}, "runs": {}}
+    return data
+
+
+def _save_index(root: Path, index: Dict[str, Any]) -> None:
+    path = root / INDEX_FILE
+    tmp = _tmp_path(path)
+    tmp.write_bytes(jsonio.dumps_bytes(index))
+    os.replace(tmp, path)
+
+
+def _zip_mtime(info: zipfile.ZipInfo) -> float:
+    return time.mktime(info.date_time + (0, 0, -1))
+
+
+def refresh_index(dirpath: str | Path, *, rebuild: bool = False) -> Dict[str, Dict[str, Any]]:
+    """Run summaries keyed by file name, re-reading only files and archives that changed.
+
+    `rebuild` ignores the stored index and re-reads everything.
+    """
+    root = Path(dirpath)
+    if not root.is_dir():
+        return {}
+    with _locked(root):
+        old: Dict[str, Any] = _load_index(root) if not rebuild else {"version": INDEX_VERSION, "archives": {}, "runs": {}}
+        old_runs: Dict[str, Dict[str, Any]] = old["runs"]
+        archives: Dict[str, List[int]] = {}
+        runs: Dict[str, Dict[str, Any]] = {}
+
+        for zpath in sorted((root / ARCHIVE_DIR).glob("transcripts-*.zip")):
+            rel = f"{ARCHIVE_DIR}/{zpath.name}"
+            try:
+                st = zpath.stat()
+                stamp = [st.st_size, st.st_mtime_ns]
+                if old["archives"].get(rel) == stamp:
+                    runs.update((f, e) for f, e in old_runs.items() if e.get("archive") == rel)
+                else:
+                    with zipfile.ZipFile(zpath) as zf:
+                        members = {
+                            info.filename: _summarize(
+                                info.filename,
+                                zf.read(info),
+                                size=info.compress_size,
+                                mtime=_zip_mtime(info),
+                                archive=rel,
+                            )
+                            for info in zf.infolist()
+                            if TRANSCRIPT_FILE_PATTERN.match(info.filename)
+                        }
+                    runs.update(members)
+            except (OSError, zipfile.BadZipFile):
+                continue  # unreadable archive: skipped and retried on the next refresh
+            archives[rel] = stamp
+
+        for path in root.glob("transcript-*"):
+            name = path.name
+            if not TRANSCRIPT_FILE_PATTERN.match(name):
+                continue
+            try:
+                st = path.stat()
+                prev = old_runs.get(name)
+                if (
+                    prev is not None
+                    and prev.get("archive") is None
+                    and prev.get("bytes") == st.st_size
+                    and prev.get("mtime_ns") == st.st_mtime_ns
+                ):
+                    runs[name] = prev
+                    continue
+                entry = _summarize(name, path.read_bytes(), size=st.st_size, mtime=st.st_mtime, archive=None)
+            except FileNotFoundError:
+                continue  # removed while scanning
+            # A loose copy wins over an archived one (e.g. after a crash between archiving and unlinking).
+            runs[name] = {**entry, "mtime_ns": st.st_mtime_ns}
+
+        if rebuild or runs != old_runs or archives != old["archives"]:
+            _save_index(root, {"version": INDEX_VERSION, "archives": archives, "runs": runs})
+        return runs
+
+
+def read_transcript(dirpath: str | Path, file: str) -> Optional[bytes]:
+    """Raw transcript bytes from the loose file or its archive; None if the run does not exist."""
+    if not TRANSCRIPT_FILE_PATTERN.match(file):
+        return None
+    try:
+        return (Path(dirpath) / file).read_bytes()
+    except FileNotFoundError:
+        pass
+    try:
+        with zipfile.ZipFile(archive_path_for(dirpath, file)) as zf:
+            return zf.read(file)
+    except (FileNotFoundError, KeyError):
+        return None
+
+
+def _rewrite_archive(zpath: Path, add: Dict[str, Path], drop: Set[str]) -> None:
+    zpath.parent.mkdir(parents=True, exist_ok=True)
+    tmp = _tmp_path(zpath)
+    with zipfile.ZipFile(tmp, "w", compression=zipfile.ZIP_DEFLATED) as out:
+        if zpath.exists():
+            with zipfile.ZipFile(zpath) as src:
+                for info in src.infolist():
+                    if info.filename not in drop and info.filename not in add:
+                        out.writestr(info, src.read(info))
+        for name in sorted(add):
+            path = add[name]
+            info = zipfile.ZipInfo(name, date_time=time.localtime(path.stat().st_mtime)[:6])
+            info.compress_type = zipfile.ZIP_DEFLATED
+            out.writestr(info, path.read_bytes())
+        empty = not out.infolist()
+    if empty:
+        tmp.unlink()
+        zpath.unlink(missing_ok=True)
+    else:
+        os.replace(tmp, zpath)
+
+
+def _archive_runs(root: Path, files: Iterable[str]) -> None:
+    by_archive: Dict[Path, Dict[str, Path]] = {}
+    for name in files:
+        by_archive.setdefault(archive_path_for(root, name), {})[name] = root / name
+    for zpath, add in by_archive.items():
+        _rewrite_archive(zpath, add, set())
+        for path in add.values():
+            path.unlink(missing_ok=True)
+
+
+def _delete_runs(root: Path, entries: Iterable[Dict[str, Any]]) -> None:
+    by_archive: Dict[Path, Set[str]] = {}
+    for e in entries:
+        if e.get("archive") is None:
+            (root / e["file"]).unlink(missing_ok=True)
+        else:
+            by_archive.setdefault(root / e["archive"], set()).add(e["file"])
+    for zpath, names in by_archive.items():
+        _rewrite_archive(zpath, {}, names)
+
+
+def delete_run(dirpath: str | Path, file: str) -> bool:
+    """Remove a run, loose or archived; False if it did not exist."""
+    if not TRANSCRIPT_FILE_PATTERN.match(file):
+        return False
+    root = Path(dirpath)
+    with _locked(root):
+        removed = False
+        try:
+            (root / file).unlink()
+            removed = True
+        except FileNotFoundError:
+            pass
+        zpath = archive_path_for(root, file)
+        if zpath.exists():
+            with zipfile.ZipFile(zpath) as zf:
+                archived = file in zf.namelist()
+            if archived:
+                _rewrite_archive(zpath, {}, {file})
+                removed = True
+        return removed
+
+
+def _oldest_first(runs: Dict[str, Dict[str, Any]]) -> List[Dict[str, Any]]:
+    return sorted(runs.values(), key=lambda e: (e["created"], e["file"]))
+
+
+def _oldest_beyond(entries: List[Dict[str, Any]], keep: int) -> List[Dict[str, Any]]:
+    return entries[: max(0, len(entries) - keep)]
+
+
+def gc_transcripts(
+    dirpath: str | Path,
+    retention: RetentionConfig,
+    *,
+    events_dir: str | Path | None = None,
+    now: Optional[float] = None,
+    dry_run: bool = False,
+) -> GcReport:
+    """Apply `retention` to a transcripts directory.
+
+    Runs past `delete_after_days` or beyond `max_runs` are deleted first, then
+    old or excess loose runs are archived, then the oldest runs are deleted
+    until the total is under `max_bytes`. Event logs (`events_dir`, default
+    `<dir>/events`) older than `delete_after_days` go too. With `dry_run`
+    nothing is removed, and the byte figures ignore the savings of archiving.
+    """
+    root = Path(dirpath)
+    now = time.time() if now is None else now
+    with _locked(root):
+        entries = _oldest_first(refresh_index(root))
+        bytes_before = sum(e["bytes"] for e in entries)
+        doomed: Set[str] = set()
+        if retention.delete_after_days is not None:
+            cutoff = now - retention.delete_after_days * _DAY_SEC
+            doomed.update(e["file"] for e in entries if e["created"] < cutoff)
+        if retention.max_runs is not None:
+            kept = [e for e in entries if e["file"] not in doomed]
+            doomed.update(e["file"] for e in _oldest_beyond(kept, retention.max_runs))
+
+        loose = [e for e in entries if e["file"] not in doomed and e["archive"] is None]
+        to_archive: Set[str] = set()
+        if retention.archive_after_days is not None:
+            cutoff = now - retention.archive_after_days * _DAY_SEC
+            to_archive.update(e["file"] for e in loose if e["created"] < cutoff)
+        if retention.max_loose is not None:
+            to_archive.update(e["file"] for e in _oldest_beyond(loose, retention.max_loose))
+
+        if dry_run:
+            survivors = [e for e in entries if e["file"] not in doomed]
+        else:
+            _delete_runs(root, (e for e in entries if e["file"] in doomed))
+            _archive_runs(root, sorted(to_archive))
+            survivors = _oldest_first(refresh_index(root))
+
+        if retention.max_bytes is not None:
+            total = sum(e["bytes"] for e in survivors)
+            over: List[Dict[str, Any]] = []
+            for e in survivors:
+                if total <= retention.max_bytes:
+                    break
+                over.append(e)
+                total -= e["bytes"]
+            if over:
+                doomed.update(e["file"] for e in over)
+                if dry_run:
+                    survivors = survivors[len(over) :]
+                else:
+                    _delete_runs(root, over)
+                    survivors = _oldest_first(refresh_index(root))
+
+        event_logs = _gc_event_logs(Path(events_dir) if events_dir else root / "events", retention, now, dry_run)
+        return GcReport(
+            deleted=sorted(doomed),
+            archived=sorted(to_archive - doomed),
+            event_logs_deleted=event_logs,
+            runs=len(survivors),
+            bytes_before=bytes_before,
+            bytes_after=sum(e["bytes"] for e in survivors),
+            dry_run=dry_run,
+        )
+
+
+def _gc_event_logs(events_dir: Path, retention: RetentionConfig, now: float, dry_run: bool) -> List[str]:
+    if retention.delete_after_days is None or not events_dir.is_dir():
+        return []
+    cutoff = now - retention.delete_after_days * _DAY_SEC
+    deleted: List[str] = []
+    for path in sorted(events_dir.glob("*.jsonl")):
+        try:
+            if path.stat().st_mtime >= cutoff:
+                continue
+            if not dry_run:
+                path.unlink()
+        except FileNotFoundError:
+            continue
+        deleted.append(path.name)
+    return deleted
+
+
+def gc_cache(
+    cache_dir: str | Path,
+    retention: RetentionConfig,
+    *,
+    now: Optional[float] = None,
+    dry_run: bool = False,
+) -> CacheGcReport:
+    """Prune `DiskCache` entries by age, then least recently used first down to `cache_max_bytes`.
+
+    `DiskCache.get` touches an entry's mtime, so mtime order is recency order.
+    """
+    root = Path(cache_dir)
+    if not root.is_dir():
+        return CacheGcReport(dry_run=dry_run)
+    now = time.time() if now is None else now
+    files = []
+    for path in root.glob("*.json"):
+        try:
+            st = path.stat()
+        except FileNotFoundError:
+            continue
+        files.append((st.st_mtime, st.st_size, path))
+    files.sort()
+    bytes_before = total = sum(size for _, size, _ in files)
+    doomed: List[Path] = []
+    for mtime, size, path in files:
+        too_old = retention.cache_max_age_days is not None and mtime < now - retention.cache_max_age_days * _DAY_SEC
+        too_big = retention.cache_max_bytes is not None and total > retention.cache_max_bytes
+        if not (too_old or too_big):
+            continue
+        doomed.append(path)
+        total -= size
+    if not dry_run:
+        for path in doomed:
+            path.unlink(missing_ok=True)
+    return CacheGcReport(deleted=len(doomed), bytes_before=bytes_before, bytes_after=total, dry_run=dry_run)
+
+
+class TranscriptJanitor:
+    """Runs `gc_transcripts` (and `gc_cache` when given a cache dir) every `interval_sec` on a daemon thread."""
+
+    def __init__(
+        self,
+        transcripts_dir: str | Path,
+        retention: RetentionConfig,
+        interval_sec: float,
+        *,
+        cache_dir: str | Path | None = None,
+    ) -> None:
+        self.transcripts_dir = Path(transcripts_dir)
+        self.retention = retention
+        self.interval_sec = interval_sec
+        self.cache_dir = cache_dir
+        self.last_report: Optional[GcReport] = None
+        self.last_error: Optional[str] = None
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        if self._thread is not None or self.interval_sec <= 0:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._loop, name="freemad-transcript-janitor", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def run_once(self) -> Optional[GcReport]:
+        try:
+            report = gc_transcripts(self.transcripts_dir, self.retention)
+            if self.cache_dir is not None:
+                gc_cache(self.cache_dir, self.retention)
+        except Exception as e:  # a full disk or bad file must not kill the janitor
+            self.last_error = str(e)
+            return None
+        self.last_error = None
+        self.last_report = report
+        return report
+
+    def _loop(self) -> None:
+        # Wait first: startup should not block on a sweep of a large directory.
+        while not self._stop.wait(self.interval_sec):
+            self.run_once()
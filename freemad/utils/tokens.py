@@ -0,0 +1,237 @@
+"""Pluggable token counting for truncation, budgets and transcript metadata.
+
+Counters:
+- `approx`: the historical `len/4` heuristic (the default).
+- `regex`: offline estimate over a cl100k-style pre-tokenizer; counts CJK
+  characters individually and long words/punctuation runs by length.
+- `bpe`: exact byte-pair encoding using a tiktoken-format rank file
+  (`<base64 token> <rank>` per line), e.g. `cl100k_base.tiktoken`.
+
+All counters built through `get_token_counter` share an LRU of counts keyed by
+a hash of the text, so the same prompt is never tokenized twice.
+"""
+
+from __future__ import annotations
+
+import abc
+import base64
+from collections import OrderedDict
+import hashlib
+import heapq
+import math
+from pathlib import Path
+import re
+import threading
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from freemad.config import BudgetConfig, ConfigError
+from freemad.types import TokenCounterKind
+
+
+# Approximation of the cl100k_base pre-tokenizer using stdlib `re` classes:
+# [^\W\d_] ~ \p{L}, \d ~ \p{N}.
+_PRETOKEN = re.compile(
+    r"'(?i:[sdmt]|ll|ve|re)"
+    r"|(?:[^\r\n\w]|_)?[^\W\d_]+"
+    r"|\d{1,3}"
+    r"| ?(?:[^\s\w]|_)+[\r\n]*"
+    r"|\s*[\r\n]+"
+    r"|\s+(?!\S)"
+    r"|\s+"
+)
+_CJK = re.compile(r"[぀-ヿ㐀-䶿一-鿿가-힯豈-﫿]")
+
+
+class TokenCounter(abc.ABC):
+    name: str = ""
+
+    @abc.abstractmethod
+    def count(self, text: str) -> int:
+        """Number of tokens in `text`."""
+        ...
+
+    @abc.abstractmethod
+    def truncate(self, text: str, max_tokens: int) -> str:
+        """Longest prefix of `text` with at most `max_tokens` tokens."""
+        ...
+
+
+class ApproxTokenCounter(TokenCounter):
+    name = TokenCounterKind.APPROX.value
+
+    def count(self, text: str) -> int:
+        s = text or ""
+        return max(0, (len(s) + 3) // 4)
+
+    def truncate(self, text: str, max_tokens: int) -> str:
+        return (text or "")[: max(0, max_tokens) * 4]
+
+
+class _PieceTokenCounter(TokenCounter):
+    """Counts per pre-tokenizer piece; truncation cuts on piece boundaries."""
+
+    @abc.abstractmethod
+    def _piece_count(self, piece: str) -> int: ...
+
+    def _pieces(self, text: str) -> Iterator[Tuple[int, int]]:
+        for m in _PRETOKEN.finditer(text or ""):
+            yield m.start(), self._piece_count(m.group())
+
+    def count(self, text: str) -> int:
+        return sum(n for _, n in self._pieces(text))
+
+    def truncate(self, text: str, max_tokens: int) -> str:
+        used = 0
+        for start, n in self._pieces(text):
+            if used + n > max_tokens:
+                return text[:start]
+            used += n
+        return text
+
+
+class RegexTokenCounter(_PieceTokenCounter):
+    name = TokenCounterKind.REGEX.value
+
+    def _piece_count(self, piece: str) -> int:
+        cjk = len(_CJK.findall(piece))
+        if cjk:
+            return cjk + math.ceil((len(piece) - cjk) / 4)
+        body = piece.strip()
+        if not body:
+            return 1  # whitespace runs encode as a single token
+        if body[0].isalpha() or (len(body) > 1 and body[1].isalpha()):
+            # Common words are single tokens; long identifiers split every ~5 chars.
+            return 1 if len(body) <= 8 else math.ceil(len(body) / 5)
+        if body.isdigit():
+            return 1
+        return math.ceil(len(body) / 2)
+
+
+class BPETokenCounter(_PieceTokenCounter):
+    name = TokenCounterKind.BPE.value
+
+    def __init__(self, vocab_path: str | Path, piece_cache_size: int = 65536):
+        self.vocab_path = str(vocab_path)
+        self._ranks = load_bpe_ranks(vocab_path)
+        self._piece_cache: "OrderedDict[str, int]" = OrderedDict()
+        self._piece_cache_size = piece_cache_size
+        self._lock = threading.Lock()
+
+    def _piece_count(self, piece: str) -> int:
+        with self._lock:
+            cached = self._piece_cache.get(piece)
+            if cached is not None:
+                self._piece_cache.move_to_end(piece)
+                return cached
+        n = len(self._merge(piece.encode("utf-8")))
+        with self._lock:
+            self._piece_cache[piece] = n
+            if len(self._piece_cache) > self._piece_cache_size:
+                self._piece_cache.popitem(last=False)
+        return n
+
+    def _merge(self, data: bytes) -> List[bytes]:
+        # Lowest rank first, leftmost on ties. Parts are linked by start offset and
+        # candidate pairs wait in a heap, dropped lazily once a side was merged away.
+        if data in self._ranks:
+            return [data]
+        n = len(data)
+        parts: List[Optional[bytes]] = [data[i : i + 1] for i in range(n)]
+        nxt = list(range(1, n + 1))
+        prv = list(range(-1, n - 1))
+        heap: List[Tuple[int, int, bytes]] = []
+
+        def push(i: int) -> None:
+            j = nxt[i]
+            if j < n:
+                pair = (parts[i] or b"") + (parts[j] or b"")
+                rank = self._ranks.get(pair)
+                if rank is not None:
+                    heapq.heappush(heap, (rank, i, pair))
+
+        for i in range(n - 1):
+            push(i)
+        while heap:
+            _, i, pair = heapq.heappop(heap)
+            j = nxt[i]
+            left = parts[i]
+            if left is None or j >= n:
+                continue
+            right = parts[j]
+            if right is None or left + right != pair:
+                continue  # stale: a neighbour was merged since this pair was pushed
+            parts[i], parts[j] = pair, None
+            nxt[i] = nxt[j]
+            if nxt[j] < n:
+                prv[nxt[j]] = i
+            if prv[i] >= 0:
+                push(prv[i])
+            push(i)
+        return [p for p in parts if p is not None]
+
+
+def load_bpe_ranks(vocab_path: str | Path) -> Dict[bytes, int]:
+    path = Path(vocab_path)
+    if not path.is_file():
+        raise ConfigError(f"token vocab file not found: {path}")
+    ranks: Dict[bytes, int] = {}
+    with path.open("rb") as fh:
+        for line in fh:
+            line = line.strip()
+            if not line:
+                continue
+            token, rank = line.split()
+            ranks[base64.b64decode(token)] = int(rank)
+    return ranks
+
+
+class CachedTokenCounter(TokenCounter):
+    """Memoizes `count` per text hash; safe to share across agent threads."""
+
+    def __init__(self, inner: TokenCounter, max_entries: int = 4096):
+        self.inner = inner
+        self.name = inner.name
+        self._max_entries = max_entries
+        self._counts: "OrderedDict[bytes, int]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def count(self, text: str) -> int:
+        key = hashlib.blake2b((text or "").encode("utf-8", "surrogatepass"), digest_size=16).digest()
+        with self._lock:
+            cached = self._counts.get(key)
+            if cached is not None:
+                self._counts.move_to_end(key)
+                return cached
+        n = self.inner.count(text)
+        with self._lock:
+            self._counts[key] = n
+            if len(self._counts) > self._max_entries:
+                self._counts.popitem(last=False)
+        return n
+
+    def truncate(self, text: str, max_tokens: int) -> str:
+        return self.inner.truncate(text, max_tokens)
+
+
+_COUNTERS: Dict[Tuple[str, Optional[str]], TokenCounter] = {}
+_COUNTERS_LOCK = threading.Lock()
+
+
+def get_token_counter(budget: BudgetConfig) -> TokenCounter:
+    """Shared (cached) counter for `budget.token_counter`."""
+    key = (budget.token_counter.value, budget.token_vocab_path)
+    with _COUNTERS_LOCK:
+        counter = _COUNTERS.get(key)
+        if counter is None:
+            inner: TokenCounter
+            if budget.token_counter == TokenCounterKind.BPE:
+                if not budget.token_vocab_path:
+                    raise ConfigError("budget.token_vocab_path required for the bpe token counter")
+                inner = BPETokenCounter(budget.token_vocab_path)
+            elif budget.token_counter == TokenCounterKind.REGEX:
+                inner = RegexTokenCounter()
+            else:
+                inner = ApproxTokenCounter()
+            counter = CachedTokenCounter(inner)
+            _COUNTERS[key] = counter
+        return counter
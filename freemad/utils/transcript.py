@@ -1,10 +1,11 @@
 from __future__ import annotations
 
-import json
 import time
 from pathlib import Path
 from typing import Any
 
+from freemad.utils import jsonio
+
 
 def save_transcript(result: dict[str, Any], fmt: str, dirpath: str) -> Path:
     ts = time.strftime("%Y%m%d-%H%M%S")
@@ -12,7 +13,7 @@ def save_transcript(result: dict[str, Any], fmt: str, dirpath: str) -> Path:
     p.mkdir(parents=True, exist_ok=True)
     if fmt == "json":
         out = p / f"transcript-{ts}.json"
-        out.write_text(json.dumps(result, indent=2), encoding="utf-8")
+        out.write_text(jsonio.dumps(result, indent=True), encoding="utf-8")
         return out
     out = p / f"transcript-{ts}.md"
     lines = [
@@ -23,7 +24,7 @@ def save_transcript(result: dict[str, Any], fmt: str, dirpath: str) -> Path:
         "",
         "## Transcript (JSON)",
         "```json",
-        json.dumps(result, indent=2),
+        jsonio.dumps(result, indent=True),
         "```",
     ]
     out.write_text("\n".join(lines), encoding="utf-8")
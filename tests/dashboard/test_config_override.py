@@ -43,6 +43,8 @@ def make_app(tmpdir: Path) -> tuple[TestClient, Path]:
     override_base.write_text(BASE_YAML, encoding="utf-8")
     cfg = DashboardConfig(
         transcripts_dir=str(tmpdir / "t"),
+        task_store_path=tmpdir / "tasks.db",
+        task_artifacts_dir=tmpdir / "artifacts",
         override_base=override_base,
         override_path=override_path,
     )
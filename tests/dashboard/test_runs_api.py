@@ -15,7 +15,11 @@ from freemad.dashboard.app import create_app, DashboardConfig
 
 
 def _make_app(tmpdir: Path) -> TestClient:
-    cfg = DashboardConfig(transcripts_dir=str(tmpdir))
+    cfg = DashboardConfig(
+        transcripts_dir=str(tmpdir),
+        task_store_path=tmpdir / "tasks.db",
+        task_artifacts_dir=tmpdir / "artifacts",
+    )
     return TestClient(create_app(cfg))
 
 
@@ -16,7 +16,11 @@ from freemad.run_events import RunEvent, RunEventKind
 
 
 def test_websocket_missing_run_returns_1008(tmp_path: Path) -> None:
-    cfg = DashboardConfig(transcripts_dir=str(tmp_path))
+    cfg = DashboardConfig(
+        transcripts_dir=str(tmp_path),
+        task_store_path=tmp_path / "tasks.db",
+        task_artifacts_dir=tmp_path / "artifacts",
+    )
     client = TestClient(create_app(cfg))
     with client.websocket_connect("/ws/live-runs/missing") as ws:
         data = ws.receive()
@@ -25,7 +29,11 @@ def test_websocket_missing_run_returns_1008(tmp_path: Path) -> None:
 
 
 def test_websocket_heartbeat_on_idle(tmp_path: Path) -> None:
-    cfg = DashboardConfig(transcripts_dir=str(tmp_path))
+    cfg = DashboardConfig(
+        transcripts_dir=str(tmp_path),
+        task_store_path=tmp_path / "tasks.db",
+        task_artifacts_dir=tmp_path / "artifacts",
+    )
     app = create_app(cfg)
     mgr: LiveRunManager = app.state.live_manager  # type: ignore[attr-defined]
     run_id = "idle-run"
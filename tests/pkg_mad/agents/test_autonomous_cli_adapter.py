@@ -17,8 +17,8 @@ class DummyAdapter(CLIAdapter):
 
 def _build_adapter() -> DummyAdapter:
     cfg = Config(
-        agents=[],
-        security=SecurityConfig(cli_allowed_commands=["mycmd"]),
+        agents=(),
+        security=SecurityConfig(cli_allowed_commands=("mycmd",)),
         budget=BudgetConfig(max_agent_time_sec=10.0),
     )
     agent_cfg = AgentConfig(
@@ -1,11 +1,17 @@
 from __future__ import annotations
 
+from dataclasses import replace
+import shlex
+import sys
+import threading
+import time
 from types import SimpleNamespace
 from typing import Any, Iterator
 
 import pytest
 import subprocess
 
+from freemad.agents.base import AgentCancelled, cancel_scope
 from freemad.agents.cli_adapter import CLIAdapter
 from freemad.config import (
     AgentConfig,
@@ -19,8 +25,8 @@ from freemad.config import (
 
 def _base_config(cli_command: str, allowed: list[str]) -> tuple[Config, AgentConfig]:
     cfg = Config(
-        agents=[],
-        security=SecurityConfig(cli_allowed_commands=allowed),
+        agents=(),
+        security=SecurityConfig(cli_allowed_commands=tuple(allowed)),
         budget=BudgetConfig(max_agent_time_sec=5.0),
     )
     agent_cfg = AgentConfig(
@@ -53,6 +59,17 @@ def test_cli_timeout_bubbles_up(monkeypatch):
         adapter.generate("task")
 
 
+def test_cli_call_is_killed_when_its_cancel_scope_fires():
+    cfg, agent_cfg = _base_config(f"{shlex.quote(sys.executable)} -c 'import time; time.sleep(30)'", [sys.executable])
+    adapter = CLIAdapter(cfg, replace(agent_cfg, timeout=60.0))
+    cancel = threading.Event()
+    threading.Timer(0.2, cancel.set).start()
+    started = time.monotonic()
+    with cancel_scope(cancel), pytest.raises(AgentCancelled):
+        adapter.generate("task")
+    assert time.monotonic() - started < 5.0
+
+
 def test_cli_nonzero_return_surfaces_stderr(monkeypatch):
     cfg, agent_cfg = _base_config("safe", ["safe"])
     adapter = CLIAdapter(cfg, agent_cfg)
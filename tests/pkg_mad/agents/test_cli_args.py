@@ -15,8 +15,8 @@ class DummyAdapter(CLIAdapter):
 
 def test_cli_args_are_appended(monkeypatch):
     cfg = Config(
-        agents=[],
-        security=SecurityConfig(cli_allowed_commands=["mycmd"]),
+        agents=(),
+        security=SecurityConfig(cli_allowed_commands=("mycmd",)),
         budget=BudgetConfig(max_agent_time_sec=10.0),
     )
     agent_cfg = AgentConfig(
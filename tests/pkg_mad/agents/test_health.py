@@ -0,0 +1,90 @@
+import threading
+import time
+import unittest
+
+from freemad import Agent, AgentResponse, ConfigError, CritiqueResponse, Decision, HealthMonitor, Metadata
+from freemad import Orchestrator, compute_answer_id, load_config, register_agent
+from freemad.agents.base import HealthStatus
+from freemad.agents.health import HealthProber
+
+
+class _HealthAgent(Agent):
+    """Keeps its answer; health is down for ids starting with 'down' and takes 0.2s."""
+
+    probes = 0
+    lock = threading.Lock()
+
+    def generate(self, requirement: str) -> AgentResponse:
+        sol = f"SOL_{self.agent_cfg.id}"
+        return AgentResponse(self.agent_cfg.id, sol, "gen", compute_answer_id(sol), Metadata())
+
+    def critique_and_refine(self, requirement: str, own_response: str, peer_responses):
+        return CritiqueResponse(
+            self.agent_cfg.id, Decision.KEEP, False, own_response, "keep", compute_answer_id(own_response), Metadata()
+        )
+
+    def health(self) -> HealthStatus:
+        with _HealthAgent.lock:
+            _HealthAgent.probes += 1
+        time.sleep(0.2)
+        down = self.agent_cfg.id.startswith("down")
+        return HealthStatus(agent_id=self.agent_cfg.id, available=not down, message="down" if down else "ok")
+
+
+class TestHealthMonitor(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        register_agent("health_mock", _HealthAgent)
+
+    def _cfg(self, *ids, **health):
+        return load_config(
+            overrides={
+                "agents": [{"id": aid, "type": "health_mock"} for aid in ids],
+                "deadlines": {"min_agents": 1},
+                "health": {"skip_unavailable": True, **health},
+            }
+        )
+
+    def _agents(self, *ids):
+        return Orchestrator(self._cfg(*ids)).agents
+
+    def test_probes_run_concurrently_and_are_cached(self):
+        agents = self._agents("a1", "a2", "a3", "a4")
+        now = [100.0]
+        monitor = HealthMonitor(ttl_sec=10.0, clock=lambda: now[0])
+        _HealthAgent.probes = 0
+        t0 = time.perf_counter()
+        statuses = monitor.check(agents)
+        self.assertLess(time.perf_counter() - t0, 0.6)  # serial would take 0.8s
+        self.assertEqual(list(statuses), ["a1", "a2", "a3", "a4"])
+        self.assertTrue(all(s.available for s in statuses.values()))
+        monitor.check(agents)
+        self.assertEqual(_HealthAgent.probes, 4)
+        now[0] += 11.0
+        monitor.check(agents)
+        self.assertEqual(_HealthAgent.probes, 8)
+        self.assertEqual(monitor.snapshot()["a1"]["age_sec"], 0.0)
+
+    def test_orchestrator_skips_unavailable_agents(self):
+        out = Orchestrator(self._cfg("a1", "down1", "a2")).run("req", max_rounds=1)
+        self.assertEqual(out["skipped_agents"], {"down1": "down"})
+        for t in out["transcript"]:
+            self.assertEqual(set(t["agents"]), {"a1", "a2"})
+
+    def test_all_unavailable_raises(self):
+        with self.assertRaises(ConfigError):
+            Orchestrator(self._cfg("down1", "down2", ttl_sec=0.0)).run("req", max_rounds=1)
+
+    def test_prober_records_load_errors(self):
+        def boom():
+            raise ConfigError("bad config")
+
+        prober = HealthProber(HealthMonitor(), boom, interval_sec=0.01)
+        self.assertEqual(prober.probe_once(), {})
+        self.assertEqual(prober.last_error, "bad config")
+        prober.start()
+        prober.stop(timeout=1.0)
+
+
+if __name__ == "__main__":  # pragma: no cover
+    unittest.main()
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import json
 import sys
 import tempfile
 from pathlib import Path
@@ -53,3 +54,26 @@ def test_invalid_config_path_returns_error(capsys):
     assert rc == 2
     err = capsys.readouterr().err
     assert "config error" in err
+
+
+def test_resume_unknown_run_returns_error(capsys, tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    cfg = _make_config(tmp_path)
+    rc = main(["--config", str(cfg), "--resume", "no-such-run"])
+    assert rc == 2
+    assert "no checkpoint" in capsys.readouterr().err
+
+
+def test_transcripts_gc_prints_report(capsys, tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    cfg = _make_config(tmp_path)
+    runs = tmp_path / "runs"
+    runs.mkdir()
+    (runs / "transcript-20200101-000000.json").write_text('{"final_answer_id": "x"}', encoding="utf-8")
+    rc = main(["transcripts", "gc", "--config", str(cfg), "--dir", "runs", "--dry-run"])
+    assert rc == 0
+    report = json.loads(capsys.readouterr().out)
+    assert report["transcripts"]["archived"] == ["transcript-20200101-000000.json"]
+    assert report["transcripts"]["dry_run"] is True
+    assert (runs / "transcript-20200101-000000.json").exists()
+    assert (runs / "index.json").exists()
@@ -123,3 +123,63 @@ def test_task_answer_approve_pause_and_resume(capsys, tmp_path: Path) -> None:
     resume_payload = json.loads(capsys.readouterr().out)
     assert resume_payload["task_id"] == task_id
     assert resume_payload["status"] in {"waiting_for_human", "completed"}
+
+
+def test_task_worker_drains_enqueued_tasks(capsys, tmp_path: Path) -> None:
+    register_agent("quorum_mock", _QuorumMockAgent)
+    cfg_path = _write_task_config(tmp_path)
+    workspace = tmp_path / "workspace-worker"
+    workspace.mkdir()
+
+    task_ids = []
+    for goal in ("Solidify the first plan.", "Solidify the second plan."):
+        rc = main(
+            [
+                "task",
+                "start",
+                "--config",
+                str(cfg_path),
+                "--enqueue",
+                "--workspace-root",
+                str(workspace),
+                goal,
+            ]
+        )
+        assert rc == 0
+        payload = json.loads(capsys.readouterr().out)
+        assert payload["status"] == "pending"
+        task_ids.append(payload["task_id"])
+
+    rc = main(["task", "worker", "--config", str(cfg_path), "--once", "--worker-id", "worker-test"])
+    assert rc == 0
+    worker_payload = json.loads(capsys.readouterr().out)
+    assert worker_payload["worker_id"] == "worker-test"
+    assert sorted(item["task_id"] for item in worker_payload["tasks"]) == sorted(task_ids)
+    assert all(item["status"] == "completed" for item in worker_payload["tasks"])
+
+
+def test_task_compact_archives_events_and_keeps_snapshot(capsys, tmp_path: Path) -> None:
+    register_agent("quorum_mock", _QuorumMockAgent)
+    cfg_path = _write_task_config(tmp_path)
+    cfg = json.loads(cfg_path.read_text(encoding="utf-8"))
+    cfg["task"]["archive_dir"] = str(tmp_path / "archive")
+    cfg_path.write_text(json.dumps(cfg), encoding="utf-8")
+    workspace = tmp_path / "workspace-compact"
+    workspace.mkdir()
+
+    rc = main(["task", "start", "--config", str(cfg_path), "--workspace-root", str(workspace), "Solidify the plan."])
+    assert rc == 0
+    before = json.loads(capsys.readouterr().out)
+    task_id = before["task_id"]
+
+    rc = main(["task", "compact", "--config", str(cfg_path), "--keep", "1", task_id])
+    assert rc == 0
+    (compacted,) = json.loads(capsys.readouterr().out)["tasks"]
+    assert compacted["archived_events"] == len(before["events"]) - 1
+    assert compacted["archive_path"].endswith(".jsonl.gz")
+
+    rc = main(["task", "inspect", "--config", str(cfg_path), task_id])
+    assert rc == 0
+    after = json.loads(capsys.readouterr().out)
+    assert len(after["events"]) == 1
+    assert after["snapshot"] == before["snapshot"]
@@ -0,0 +1,36 @@
+import subprocess
+import sys
+import unittest
+from pathlib import Path
+
+import freemad
+
+ROOT = Path(__file__).resolve().parents[3]
+HEAVY = ("fastapi", "starlette", "jinja2", "anyio", "uvicorn")
+
+
+def _loaded_heavy_modules(code: str) -> list[str]:
+    probe = f"{code}\nimport sys\nprint(','.join(m for m in {HEAVY!r} if m in sys.modules))"
+    out = subprocess.run([sys.executable, "-c", probe], cwd=ROOT, check=True, capture_output=True, text=True)
+    return [m for m in out.stdout.strip().split(",") if m]
+
+
+class TestLazyImports(unittest.TestCase):
+    def test_package_and_cli_do_not_import_web_stack(self):
+        for code in ("import freemad", "import freemad.cli", "from freemad import Orchestrator, load_config"):
+            self.assertEqual(_loaded_heavy_modules(code), [], code)
+
+    def test_dashboard_exports_still_resolve(self):
+        self.assertIn("fastapi", _loaded_heavy_modules("from freemad import create_app"))
+
+    def test_every_public_name_resolves(self):
+        for name in freemad.__all__:
+            self.assertIsNotNone(getattr(freemad, name), name)
+        self.assertTrue(set(freemad.__all__) <= set(dir(freemad)))
+        self.assertEqual(freemad.bootstrap.__name__, "freemad.agents.bootstrap")
+        with self.assertRaises(AttributeError):
+            getattr(freemad, "not_exported")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -17,7 +17,7 @@ class TestConfig(unittest.TestCase):
         self.assertEqual(cfg.agents[0].id, "claude")
         self.assertEqual(cfg.agents[1].id, "codex")
         self.assertEqual(cfg.topology.type, "all_to_all")
-        self.assertEqual(cfg.scoring.weights, [20.0, 25.0, 30.0, 20.0])
+        self.assertEqual(cfg.scoring.weights, (20.0, 25.0, 30.0, 20.0))
         self.assertTrue(cfg.scoring.normalize)
         self.assertEqual(cfg.scoring.tie_break, "deterministic")
 
@@ -179,9 +179,9 @@ task:
                 self.assertEqual([role.value for role in cfg.agents[0].roles], ["planner", "reviewer"])
                 self.assertEqual([role.value for role in cfg.agents[1].roles], ["implementer", "verifier"])
                 self.assertTrue(cfg.task.tool_policy.allow_web_research)
-                self.assertEqual(cfg.task.tool_policy.allowed_write_roots, ["freemad", "tests"])
-                self.assertEqual(cfg.task.tool_policy.allowed_local_commands, ["python3", "pytest"])
-                self.assertEqual(cfg.task.tool_policy.verification_commands, ["pytest -q"])
+                self.assertEqual(cfg.task.tool_policy.allowed_write_roots, ("freemad", "tests"))
+                self.assertEqual(cfg.task.tool_policy.allowed_local_commands, ("python3", "pytest"))
+                self.assertEqual(cfg.task.tool_policy.verification_commands, ("pytest -q",))
             finally:
                 os.chdir(prev_cwd)
 
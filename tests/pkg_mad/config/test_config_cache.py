@@ -0,0 +1,84 @@
+import json
+import os
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+import yaml
+
+from freemad import ConfigError, clear_config_cache, load_config
+
+
+class TestConfigCache(unittest.TestCase):
+    def setUp(self):
+        clear_config_cache()
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+        self._prev_cwd = os.getcwd()
+        os.chdir(self._tmp.name)
+        self.addCleanup(os.chdir, self._prev_cwd)
+        self.path = Path(self._tmp.name) / "cfg.json"
+        self._write({"output": {"save_transcript": False}, "scoring": {"weights": [1.0, 2.0, 3.0, 4.0]}})
+
+    def _write(self, data):
+        self.path.write_text(json.dumps(data), encoding="utf-8")
+
+    def test_repeat_load_returns_cached_object(self):
+        first = load_config(path=str(self.path))
+        self.assertIs(load_config(path=str(self.path)), first)
+        self.assertIsNot(load_config(path=str(self.path), cache=False), first)
+
+    def test_cached_config_collections_are_immutable(self):
+        first = load_config(path=str(self.path))
+        with self.assertRaises(AttributeError):
+            first.security.cli_allowed_commands.append("sh")  # type: ignore[attr-defined]
+        self.assertIsInstance(first.agents, tuple)
+        self.assertIsInstance(first.task.tool_policy.allowed_local_commands, tuple)
+
+    def test_cache_hit_recreates_configured_dirs(self):
+        self._write({"output": {"save_transcript": True, "transcript_dir": "runs"}})
+        load_config(path=str(self.path))
+        runs = Path(self._tmp.name) / "runs"
+        runs.rmdir()
+        load_config(path=str(self.path))
+        self.assertTrue(runs.is_dir())
+
+    def test_file_edit_invalidates(self):
+        first = load_config(path=str(self.path))
+        self._write({"output": {"save_transcript": False}, "scoring": {"weights": [9.0, 2.0, 3.0, 4.0]}})
+        # Force a distinct mtime even on filesystems with coarse timestamps.
+        st = self.path.stat()
+        os.utime(self.path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+        second = load_config(path=str(self.path))
+        self.assertIsNot(second, first)
+        self.assertEqual(second.scoring.weights, (9.0, 2.0, 3.0, 4.0))
+
+    def test_overrides_are_part_of_the_key(self):
+        a = load_config(path=str(self.path), overrides={"deadlines": {"min_agents": 1}})
+        b = load_config(path=str(self.path), overrides={"deadlines": {"min_agents": 2}})
+        self.assertEqual((a.deadlines.min_agents, b.deadlines.min_agents), (1, 2))
+        self.assertIs(load_config(path=str(self.path), overrides={"deadlines": {"min_agents": 1}}), a)
+
+    def test_invalid_config_is_not_cached(self):
+        self._write({"scoring": {"weights": [1.0]}})
+        for _ in range(2):
+            with self.assertRaises(ConfigError):
+                load_config(path=str(self.path))
+
+    def test_unchanged_file_is_not_reread(self):
+        load_config(path=str(self.path))
+        with mock.patch.object(Path, "read_bytes", side_effect=AssertionError("re-read")):
+            load_config(path=str(self.path))
+
+    def test_yaml_uses_c_loader_when_available(self):
+        ypath = Path(self._tmp.name) / "cfg.yaml"
+        ypath.write_text("output:\n  save_transcript: false\n", encoding="utf-8")
+        with mock.patch("yaml.load", wraps=yaml.load) as spy:
+            load_config(path=str(ypath), cache=False)
+        loader = spy.call_args.kwargs["Loader"]
+        self.assertIs(loader, getattr(yaml, "CSafeLoader", yaml.SafeLoader))
+
+
+if __name__ == "__main__":  # pragma: no cover
+    unittest.main()
@@ -33,9 +33,17 @@ def _write_sample(tmp: Path) -> Path:
     return p
 
 
+def _dashboard_cfg(tmp: Path) -> DashboardConfig:
+    return DashboardConfig(
+        transcripts_dir=str(tmp),
+        task_store_path=tmp / "tasks.db",
+        task_artifacts_dir=tmp / "artifacts",
+    )
+
+
 def test_dashboard_endpoints(tmp_path: Path):
     _write_sample(tmp_path)
-    app = create_app(DashboardConfig(transcripts_dir=str(tmp_path)))
+    app = create_app(_dashboard_cfg(tmp_path))
     client = TestClient(app)
 
     r = client.get("/health")
@@ -58,3 +66,24 @@ def test_dashboard_endpoints(tmp_path: Path):
     html = r.text
     assert "initial reasoning" in html
     assert "Why this answer won" in html
+
+
+def test_dashboard_serves_and_deletes_archived_runs(tmp_path: Path):
+    from freemad import gc_transcripts
+    from freemad.config import RetentionConfig
+
+    _write_sample(tmp_path)
+    gc_transcripts(tmp_path, RetentionConfig(archive_after_days=0))
+    assert not (tmp_path / "transcript-20250101-120000.json").exists()
+    client = TestClient(create_app(_dashboard_cfg(tmp_path)))
+
+    runs = client.get("/api/runs").json()
+    assert [(r["file"], r["archived"], r["rounds"]) for r in runs] == [("transcript-20250101-120000.json", True, 1)]
+    r = client.get("/api/runs/transcript-20250101-120000.json")
+    assert r.status_code == 200
+    assert r.json()["final_answer_id"] == "abc123"
+    assert client.get("/runs/transcript-20250101-120000.json").status_code == 200
+
+    assert client.delete("/api/runs/transcript-20250101-120000.json").status_code == 200
+    assert client.get("/api/runs").json() == []
+    assert client.delete("/api/runs/transcript-20250101-120000.json").status_code == 404
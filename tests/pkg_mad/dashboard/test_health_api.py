@@ -0,0 +1,32 @@
+from pathlib import Path
+
+from fastapi.testclient import TestClient
+
+from freemad import DashboardConfig, create_app
+
+
+def test_agents_health_endpoint_refreshes_cache(tmp_path: Path):
+    override = tmp_path / "override.yaml"
+    override.write_text(
+        "agents:\n"
+        "  - {id: ghost, type: claude_code, cli_command: no-such-agent-cli}\n"
+        "  - {id: ghost2, type: openai_codex, cli_command: no-such-agent-cli}\n"
+        "security:\n"
+        "  cli_allowed_commands: [no-such-agent-cli]\n",
+        encoding="utf-8",
+    )
+    app = create_app(
+        DashboardConfig(
+            transcripts_dir=str(tmp_path / "t"),
+            task_store_path=tmp_path / "tasks.db",
+            task_artifacts_dir=tmp_path / "artifacts",
+            override_path=override,
+            health_probe_interval_sec=0,
+        )
+    )
+    client = TestClient(app)
+    body = client.get("/api/agents/health", params={"refresh": "true"}).json()
+    assert body["error"] is None
+    assert body["agents"]["ghost"]["available"] is False
+    assert "not found on PATH" in body["agents"]["ghost"]["message"]
+    assert client.get("/api/agents/health").json()["agents"]["ghost"]["stale"] is False
@@ -43,7 +43,13 @@ def test_live_run_websocket(tmp_path: Path):
     # Ensure agent type is registered
     register_agent("api_live", _APILiveAgent)
 
-    app = create_app(DashboardConfig(transcripts_dir=str(tmp_path)))
+    app = create_app(
+        DashboardConfig(
+            transcripts_dir=str(tmp_path),
+            task_store_path=tmp_path / "tasks.db",
+            task_artifacts_dir=tmp_path / "artifacts",
+        )
+    )
     client = TestClient(app)
 
     overrides = {
@@ -53,6 +59,7 @@ def test_live_run_websocket(tmp_path: Path):
         ],
         "deadlines": {"soft_timeout_ms": 50, "hard_timeout_ms": 100, "min_agents": 2},
         "budget": {"max_total_time_sec": 10, "max_round_time_sec": 2, "max_agent_time_sec": 2},
+        "output": {"save_transcript": False},
     }
 
     r = client.post(
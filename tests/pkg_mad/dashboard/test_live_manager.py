@@ -45,6 +45,7 @@ class TestLiveRunManager(unittest.TestCase):
                 ],
                 "deadlines": {"soft_timeout_ms": 50, "hard_timeout_ms": 100, "min_agents": 2},
                 "budget": {"max_total_time_sec": 10, "max_round_time_sec": 2, "max_agent_time_sec": 2},
+                "output": {"save_transcript": False},
             }
         )
         mgr = LiveRunManager()
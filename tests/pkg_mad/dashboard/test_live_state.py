@@ -116,5 +116,24 @@ class TestLiveState(unittest.TestCase):
         self.assertTrue(snap.completed)
 
 
+    def test_unchanged_fields_are_shared_between_snapshots(self) -> None:
+        run_id = "run-1"
+        snap = apply_event(
+            initial_snapshot(run_id),
+            RunEvent(kind=RunEventKind.SCORES_UPDATED, run_id=run_id, ts_ms=0, scores={"x": 1.0}, holders={"x": ["a1"]}),
+        )
+        nxt = apply_event(
+            snap, RunEvent(kind=RunEventKind.AGENT_CRITIQUE_STARTED, run_id=run_id, ts_ms=1, agent_id="a1")
+        )
+        self.assertIs(nxt.scores, snap.scores)
+        self.assertIs(nxt.holders, snap.holders)
+        self.assertIsNot(nxt.agents, snap.agents)
+        again = apply_event(
+            nxt, RunEvent(kind=RunEventKind.AGENT_CRITIQUE_STARTED, run_id=run_id, ts_ms=2, agent_id="a1")
+        )
+        self.assertIs(again.agents, nxt.agents)
+        self.assertFalse(hasattr(again, "__dict__"))
+        self.assertFalse(hasattr(again.agents["a1"], "__dict__"))
+
 if __name__ == "__main__":  # pragma: no cover
     unittest.main()
@@ -44,3 +44,21 @@ def test_task_state_reduces_stage_artifact_and_terminal_events() -> None:
     assert snapshot.status == TaskStatus.COMPLETED
     assert snapshot.completed is True
 
+
+def test_task_state_shares_artifact_counts_until_they_change() -> None:
+    task_id = "task-1"
+    snapshot = apply_task_event(
+        initial_task_snapshot(task_id),
+        TaskEvent(kind=TaskEventKind.ARTIFACT_CREATED, task_id=task_id, ts_ms=1, artifact_kind=ArtifactKind.RESEARCH_BUNDLE),
+    )
+    staged = apply_task_event(
+        snapshot, TaskEvent(kind=TaskEventKind.STAGE_STARTED, task_id=task_id, ts_ms=2, stage=TaskStage.RESEARCH)
+    )
+    assert staged.artifact_counts is snapshot.artifact_counts
+    grown = apply_task_event(
+        staged,
+        TaskEvent(kind=TaskEventKind.ARTIFACT_CREATED, task_id=task_id, ts_ms=3, artifact_kind=ArtifactKind.RESEARCH_BUNDLE),
+    )
+    assert grown.artifact_counts == {"research_bundle": 2}
+    assert staged.artifact_counts == {"research_bundle": 1}
+    assert not hasattr(grown, "__dict__")
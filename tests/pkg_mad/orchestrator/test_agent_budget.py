@@ -0,0 +1,97 @@
+import unittest
+
+from freemad import Agent, AgentResponse, CritiqueResponse, Decision, Metadata, Orchestrator
+from freemad import compute_answer_id, load_config, register_agent
+from freemad.run_events import RunEvent, RunObserver
+from freemad.types import RunEventKind
+
+
+class MockCostlyKeep(Agent):
+    """Keeps its answer; every call reports `cost` tokens."""
+
+    cost = 100
+
+    def _meta(self) -> Metadata:
+        return Metadata(tokens={"prompt": self.cost // 2, "output": self.cost - self.cost // 2})
+
+    def generate(self, requirement: str) -> AgentResponse:
+        sol = f"SOL_{self.agent_cfg.id}"
+        return AgentResponse(
+            agent_id=self.agent_cfg.id, solution=sol, reasoning="gen", answer_id=compute_answer_id(sol), metadata=self._meta()
+        )
+
+    def critique_and_refine(self, requirement: str, own_response: str, peer_responses):
+        return CritiqueResponse(
+            agent_id=self.agent_cfg.id,
+            decision=Decision.KEEP,
+            changed=False,
+            solution=own_response,
+            reasoning="keep",
+            answer_id=compute_answer_id(own_response),
+            metadata=self._meta(),
+        )
+
+
+class MockCheapKeep(MockCostlyKeep):
+    cost = 10
+
+
+class _Collect(RunObserver):
+    def __init__(self):
+        self.events = []
+
+    def on_event(self, event: RunEvent) -> None:
+        self.events.append(event)
+
+
+class TestAgentBudget(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        register_agent("mock_costly", MockCostlyKeep)
+        register_agent("mock_cheap", MockCheapKeep)
+
+    def _cfg(self, pipelined: bool = False, **budget):
+        return load_config(
+            overrides={
+                "agents": [{"id": "pricey", "type": "mock_costly"}, {"id": "cheap", "type": "mock_cheap"}],
+                "budget": budget,
+                "deadlines": {"pipelined": pipelined},
+            }
+        )
+
+    def test_over_budget_agent_is_carried_forward(self):
+        for pipelined in (False, True):
+            obs = _Collect()
+            out = Orchestrator(self._cfg(pipelined, max_tokens_per_agent=250), observer=obs).run("req", max_rounds=3)
+            self.assertEqual(len(out["transcript"]), 4)
+            # pricey: generation + 1 critique = 200; a third call would overrun 250
+            self.assertEqual(out["agent_spend"]["pricey"]["tokens"], 200)
+            self.assertEqual(out["agent_spend"]["pricey"]["skipped_rounds"], 2)
+            self.assertEqual(out["agent_spend"]["cheap"]["calls"], 4)
+            r3 = out["transcript"][3]["agents"]["pricey"]["response"]
+            self.assertEqual(r3["reasoning"], "budget carry-forward")
+            self.assertEqual(r3["decision"], Decision.KEEP.value)
+            finished = [
+                e for e in obs.events if e.kind == RunEventKind.AGENT_CRITIQUE_FINISHED and e.agent_id == "pricey"
+            ]
+            self.assertEqual(finished[-1].budget_remaining, {"pricey": {"tokens": 50}})
+            completed = [e for e in obs.events if e.kind == RunEventKind.ROUND_COMPLETED and e.round_index == 3]
+            self.assertEqual(completed[0].to_dict()["budget_remaining"]["cheap"], {"tokens": 210})
+
+    def test_prefer_cheaper_agents_under_total_budget(self):
+        cfg = self._cfg(max_total_tokens=300, prefer_cheaper_agents=True)
+        out = Orchestrator(cfg).run("req", max_rounds=3)
+        # 110 after generation; round 1 fits both (220), later rounds only the cheap agent
+        self.assertEqual(out["agent_spend"]["pricey"]["calls"], 2)
+        self.assertEqual(out["agent_spend"]["cheap"]["calls"], 4)
+        self.assertLessEqual(sum(s["tokens"] for s in out["agent_spend"].values()), 300)
+
+    def test_no_caps_keeps_default_behaviour(self):
+        obs = _Collect()
+        out = Orchestrator(self._cfg(), observer=obs).run("req", max_rounds=2)
+        self.assertEqual(out["agent_spend"]["pricey"]["skipped_rounds"], 0)
+        self.assertTrue(all(not e.budget_remaining for e in obs.events))
+
+
+if __name__ == "__main__":
+    unittest.main()
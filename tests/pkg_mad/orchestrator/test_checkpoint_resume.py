@@ -0,0 +1,139 @@
+import os
+import tempfile
+import unittest
+
+from freemad import Orchestrator, load_config, load_checkpoint
+from freemad import Agent, AgentResponse, CritiqueResponse, Metadata, compute_answer_id
+from freemad import Decision, register_agent
+from freemad.checkpoint import checkpoint_path
+from freemad.config import ConfigError
+
+# Critique calls made so far per agent id; `_CRASH_AT` simulates the process dying.
+_CALLS: dict = {}
+_CRASH_AT: dict = {}
+
+
+class _DriftAgent(Agent):
+    """a2 revises to a new answer every round; everyone else keeps theirs."""
+
+    def generate(self, requirement: str) -> AgentResponse:
+        sol = f"SOL_{self.agent_cfg.id}"
+        return AgentResponse(
+            agent_id=self.agent_cfg.id,
+            solution=sol,
+            reasoning="gen",
+            answer_id=compute_answer_id(sol),
+            metadata=Metadata(tokens={"prompt": 3, "output": 4}),
+        )
+
+    def critique_and_refine(self, requirement: str, own_response: str, peer_responses):
+        aid = self.agent_cfg.id
+        _CALLS[aid] = _CALLS.get(aid, 0) + 1
+        if _CRASH_AT.get(aid) == _CALLS[aid]:
+            raise KeyboardInterrupt
+        revise = aid == "a2"
+        sol = own_response + "!" if revise else own_response
+        return CritiqueResponse(
+            agent_id=aid,
+            decision=Decision.REVISE if revise else Decision.KEEP,
+            changed=revise,
+            solution=sol,
+            reasoning="drift" if revise else "keep",
+            answer_id=compute_answer_id(sol),
+            metadata=Metadata(tokens={"prompt": 1, "output": 2}),
+        )
+
+
+def _comparable(result: dict) -> dict:
+    keys = ("final_answer_id", "scores", "raw_scores", "winning_agents", "holders_history", "score_explainers", "metrics")
+    out = {k: result[k] for k in keys}
+    out["transcript"] = result["transcript"]
+    out["tokens"] = {aid: spend["tokens"] for aid, spend in result["agent_spend"].items()}
+    return out
+
+
+class TestCheckpointResume(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        register_agent("ckpt_drift", _DriftAgent)
+
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self._prev_cwd = os.getcwd()
+        os.chdir(self._tmp.name)
+        _CALLS.clear()
+        _CRASH_AT.clear()
+
+    def tearDown(self) -> None:
+        os.chdir(self._prev_cwd)
+        self._tmp.cleanup()
+
+    def _cfg(self, pipelined: bool = False, **checkpoint):
+        return load_config(
+            overrides={
+                "agents": [{"id": f"a{i}", "type": "ckpt_drift"} for i in (1, 2, 3)],
+                "deadlines": {"pipelined": pipelined},
+                # One worker: generation results (and score history) arrive in a fixed order.
+                "budget": {"max_concurrent_agents": 1},
+                "output": {"save_transcript": False, "include_topology_info": False},
+                "checkpoint": {"enabled": True, **checkpoint},
+            },
+            cache=False,
+        )
+
+    def _assert_resume_matches_uninterrupted(self, pipelined: bool) -> None:
+        expected = Orchestrator(self._cfg(pipelined)).run("req", max_rounds=4, run_id="full")
+        self.assertFalse(checkpoint_path(self._cfg(), "full").exists())  # removed once finished
+
+        _CALLS.clear()
+        _CRASH_AT["a2"] = 3  # dies during critique round 3
+        with self.assertRaises(KeyboardInterrupt):
+            Orchestrator(self._cfg(pipelined)).run("req", max_rounds=4, run_id="crashed")
+        ckpt = load_checkpoint(checkpoint_path(self._cfg(), "crashed"))
+        self.assertEqual(ckpt.round_index, 2)
+
+        _CRASH_AT.clear()
+        _CALLS.clear()
+        resumed = Orchestrator(self._cfg(pipelined)).resume("crashed")
+        self.assertEqual(_CALLS, {"a1": 2, "a2": 2, "a3": 2})  # only rounds 3 and 4 were called
+        self.assertEqual(resumed["run_id"], "crashed")
+        self.assertEqual(_comparable(resumed), _comparable(expected))
+
+    def test_resume_matches_uninterrupted_run(self) -> None:
+        self._assert_resume_matches_uninterrupted(pipelined=False)
+
+    def test_resume_matches_uninterrupted_pipelined_run(self) -> None:
+        self._assert_resume_matches_uninterrupted(pipelined=True)
+
+    def test_checkpoint_stores_solutions_once_and_can_extend_rounds(self) -> None:
+        Orchestrator(self._cfg(keep_completed=True)).run("req", max_rounds=1, run_id="r")
+        path = checkpoint_path(self._cfg(), "r")
+        ckpt = load_checkpoint(path)
+        self.assertEqual(ckpt.round_index, 1)
+        self.assertNotIn("solution", ckpt.to_dict()["transcript"][1]["agents"]["a1"]["response"])
+        self.assertEqual(ckpt.transcript[1]["agents"]["a2"]["response"]["solution"], "SOL_a2!")
+
+        _CALLS.clear()
+        out = Orchestrator(self._cfg(keep_completed=True)).resume("r", max_rounds=2)
+        self.assertEqual(len(out["transcript"]), 3)
+        self.assertEqual(_CALLS, {"a1": 1, "a2": 1, "a3": 1})
+        self.assertEqual(load_checkpoint(path).round_index, 2)
+
+    def test_resume_errors(self) -> None:
+        with self.assertRaises(ConfigError):
+            Orchestrator(self._cfg()).resume("missing")
+        Orchestrator(self._cfg(keep_completed=True)).run("req", max_rounds=1, run_id="r")
+        fewer = load_config(
+            overrides={
+                "agents": [{"id": "a1", "type": "ckpt_drift"}, {"id": "a2", "type": "ckpt_drift"}],
+                "output": {"save_transcript": False},
+                "checkpoint": {"enabled": True},
+            },
+            cache=False,
+        )
+        with self.assertRaises(ConfigError):
+            Orchestrator(fewer).resume("r")
+
+
+if __name__ == "__main__":  # pragma: no cover
+    unittest.main()
@@ -0,0 +1,110 @@
+import unittest
+
+from freemad import AgentResponse, ConfigError, Metadata, Orchestrator, ScoreTracker, load_config, register_agent
+from freemad import compute_answer_id
+from freemad.stopping import AllKeepPolicy, RoundOutcome
+from freemad.types import Decision, RoundType
+
+from tests.pkg_mad.orchestrator.test_orchestrator import MockKeepAgent, MockReviseToFirstPeer
+
+
+class MockTokenKeep(MockKeepAgent):
+    def generate(self, requirement: str) -> AgentResponse:
+        return AgentResponse(
+            agent_id=self.agent_cfg.id,
+            solution=self._sol,
+            reasoning="gen",
+            answer_id=compute_answer_id(self._sol),
+            metadata=Metadata(tokens={"prompt": 50, "output": 50}),
+        )
+
+
+class TestEarlyStopping(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        register_agent("mock_keep", MockKeepAgent)
+        register_agent("mock_revise", MockReviseToFirstPeer)
+        register_agent("mock_token_keep", MockTokenKeep)
+
+    def _cfg(self, agents, **stopping):
+        return load_config(
+            overrides={
+                "agents": [{"id": aid, "type": kind} for aid, kind in agents],
+                "stopping": stopping,
+            }
+        )
+
+    def test_default_runs_all_rounds(self):
+        cfg = self._cfg([("a1", "mock_keep"), ("a2", "mock_keep")])
+        out = Orchestrator(cfg).run("req", max_rounds=3)
+        self.assertEqual(len(out["transcript"]), 4)
+        self.assertIsNone(out["early_stop_reason"])
+
+    def test_all_keep_stops_after_min_rounds(self):
+        cfg = self._cfg([("a1", "mock_keep"), ("a2", "mock_keep")], policies=["all_keep"], min_rounds=2)
+        out = Orchestrator(cfg).run("req", max_rounds=5)
+        self.assertEqual(len(out["transcript"]), 3)  # round 0 + two critique rounds
+        self.assertEqual(out["early_stop_reason"], "all_agents_kept")
+
+    def test_all_keep_does_not_fire_while_an_agent_revises(self):
+        cfg = self._cfg([("a1", "mock_keep"), ("a2", "mock_revise")], policies=["all_keep"])
+        out = Orchestrator(cfg).run("req", max_rounds=3)
+        # a2 answers REVISE every round, so the debate runs to max_rounds
+        self.assertEqual(len(out["transcript"]), 4)
+        self.assertIsNone(out["early_stop_reason"])
+
+    def test_token_budget_policy_stops_without_enforcement(self):
+        cfg = load_config(
+            overrides={
+                "agents": [{"id": "a1", "type": "mock_token_keep"}, {"id": "a2", "type": "mock_token_keep"}],
+                "budget": {"max_total_tokens": 150, "enforce_total_tokens": False},
+                "stopping": {"policies": ["token_budget"], "min_rounds": 0},
+            }
+        )
+        out = Orchestrator(cfg).run("req", max_rounds=3)
+        self.assertEqual(len(out["transcript"]), 1)
+        self.assertEqual(out["early_stop_reason"], "token_budget_exhausted")
+
+    def test_invalid_stopping_config_rejected(self):
+        with self.assertRaises(ConfigError):
+            self._cfg([("a1", "mock_keep")], policies=["never"])
+        with self.assertRaises(ConfigError):
+            self._cfg([("a1", "mock_keep")], policies=["all_keep", "all_keep"])
+        with self.assertRaises(ConfigError):
+            self._cfg([("a1", "mock_keep")], min_rounds=-1)
+
+
+class TestAllKeepPolicy(unittest.TestCase):
+    def _check(self, decisions):
+        outcome = RoundOutcome(round_index=1, round_type=RoundType.CRITIQUE, decisions=decisions)
+        return AllKeepPolicy().check(outcome, next_round=2, max_rounds=3)
+
+    def test_agent_that_timed_out_does_not_block_stopping(self):
+        # a3 timed out: its carried-forward answer has no decision in the round.
+        self.assertEqual(self._check({"a1": Decision.KEEP, "a2": Decision.KEEP}), "all_agents_kept")
+        self.assertIsNone(self._check({"a1": Decision.KEEP, "a2": Decision.REVISE}))
+
+    def test_round_without_any_decision_never_fires(self):
+        self.assertIsNone(self._check({}))
+
+
+class TestUnassailableLeader(unittest.TestCase):
+    def _tracker(self, normalize: bool) -> ScoreTracker:
+        cfg = load_config(overrides={"scoring": {"weights": [100.0, 1.0, 1.0, 1.0], "normalize": normalize}})
+        st = ScoreTracker(cfg)
+        st.record_initial(agent_id="a1", answer_id="X", round_idx=0)
+        st.record_initial(agent_id="a2", answer_id="X", round_idx=0)
+        st.record_initial(agent_id="a3", answer_id="Y", round_idx=0)
+        return st
+
+    def test_raw_lead_larger_than_remaining_swing(self):
+        st = self._tracker(normalize=False)
+        self.assertEqual(st.unassailable_leader(next_round=1, max_rounds=2, num_agents=3), "X")
+
+    def test_normalized_lead_is_not_safe(self):
+        st = self._tracker(normalize=True)
+        self.assertIsNone(st.unassailable_leader(next_round=1, max_rounds=2, num_agents=3))
+
+
+if __name__ == "__main__":  # pragma: no cover
+    unittest.main()
@@ -0,0 +1,143 @@
+import json
+import os
+import tempfile
+import threading
+import time
+import unittest
+from pathlib import Path
+
+from freemad import Orchestrator, load_config
+from freemad import Agent, AgentResponse, CritiqueResponse, Metadata, compute_answer_id
+from freemad import Decision, FanOutObserver, JsonlEventSink, RunEvent, RunEventKind, RunObserver, register_agent
+from freemad import read_event_log, rebuild_transcript
+
+
+class _KeepAgent(Agent):
+    def generate(self, requirement: str) -> AgentResponse:
+        sol = f"SOLUTION_{self.agent_cfg.id}"
+        return AgentResponse(
+            agent_id=self.agent_cfg.id, solution=sol, reasoning="gen", answer_id=compute_answer_id(sol), metadata=Metadata()
+        )
+
+    def critique_and_refine(self, requirement: str, own_response: str, peer_responses):
+        return CritiqueResponse(
+            agent_id=self.agent_cfg.id,
+            decision=Decision.KEEP,
+            changed=False,
+            solution=own_response,
+            reasoning="keep",
+            answer_id=compute_answer_id(own_response),
+            metadata=Metadata(),
+        )
+
+
+class _FailingCritique(_KeepAgent):
+    def critique_and_refine(self, requirement: str, own_response: str, peer_responses):
+        raise KeyboardInterrupt  # the process is going down mid-round
+
+
+class _BlockingObserver(RunObserver):
+    def __init__(self) -> None:
+        self.release = threading.Event()
+        self.events: list = []
+
+    def on_event(self, event: RunEvent) -> None:
+        self.release.wait(5)
+        self.events.append(event)
+
+
+def _event(i: int) -> RunEvent:
+    return RunEvent(kind=RunEventKind.SCORES_UPDATED, run_id="r", ts_ms=i, scores={"x": float(i)})
+
+
+class TestEventLog(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        register_agent("eventlog_keep", _KeepAgent)
+        register_agent("eventlog_crash", _FailingCritique)
+
+    def setUp(self) -> None:
+        # Config-managed directories must stay under the working directory.
+        self._tmp = tempfile.TemporaryDirectory()
+        self._prev_cwd = os.getcwd()
+        os.chdir(self._tmp.name)
+
+    def tearDown(self) -> None:
+        os.chdir(self._prev_cwd)
+        self._tmp.cleanup()
+
+    def _cfg(self, agent_type: str = "eventlog_keep"):
+        return load_config(
+            overrides={
+                "agents": [{"id": "a1", "type": agent_type}, {"id": "a2", "type": "eventlog_keep"}],
+                "output": {"event_log": True, "save_transcript": False, "transcript_dir": "out"},
+            },
+            cache=False,
+        )
+
+    def test_run_writes_every_event_and_rebuilds_transcript(self) -> None:
+        out = Orchestrator(self._cfg()).run("req", max_rounds=2, run_id="run-1")
+        path = Path(out["event_log"])
+        self.assertEqual(path, Path("out") / "events" / "run-1.jsonl")
+        lines = [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines()]
+        self.assertEqual(lines[0]["kind"], "run_started")
+        self.assertEqual(lines[-1]["kind"], "run_completed")
+        rebuilt = rebuild_transcript(read_event_log(path))
+        self.assertTrue(rebuilt["completed"])
+        self.assertEqual(rebuilt["final_answer_id"], out["final_answer_id"])
+        self.assertEqual([r["round"] for r in rebuilt["transcript"]], [0, 1, 2])
+        self.assertEqual(rebuilt["transcript"][1]["agents"]["a1"]["decision"], "KEEP")
+
+    def test_crashed_run_leaves_partial_log(self) -> None:
+        with self.assertRaises(KeyboardInterrupt):
+            Orchestrator(self._cfg("eventlog_crash")).run("req", max_rounds=2, run_id="run-2")
+        path = Path("out") / "events" / "run-2.jsonl"
+        with open(path, "a", encoding="utf-8") as fh:
+            fh.write('{"kind": "round_sta')  # torn write
+        rebuilt = rebuild_transcript(read_event_log(path))
+        self.assertFalse(rebuilt["completed"])
+        self.assertEqual(rebuilt["error"], "KeyboardInterrupt")
+        self.assertEqual(set(rebuilt["transcript"][0]["agents"]), {"a1", "a2"})
+        self.assertTrue(rebuilt["transcript"][0]["completed"])
+
+    def test_sink_flush_and_group_commit(self) -> None:
+        sink = JsonlEventSink(Path("sub") / "r.jsonl", fsync=False, batch_size=4)
+        for i in range(10):
+            sink.on_event(_event(i))
+        self.assertTrue(sink.flush(timeout=5))
+        self.assertEqual([e.ts_ms for e in read_event_log(sink.path)], list(range(10)))
+        sink.close()
+        sink.on_event(_event(99))  # ignored once closed
+        self.assertEqual(len(read_event_log(sink.path)), 10)
+
+    def test_async_fanout_does_not_block_on_slow_observer(self) -> None:
+        slow = _BlockingObserver()
+        fast = _BlockingObserver()
+        fast.release.set()
+        fan = FanOutObserver([slow, fast], async_dispatch=True, queue_size=2)
+        started = time.monotonic()
+        for i in range(10):
+            fan.on_event(_event(i))  # returns immediately although `slow` is stuck
+        self.assertLess(time.monotonic() - started, 1.0)
+        self.assertGreater(fan.dropped, 0)
+        slow.release.set()
+        fan.close(timeout=5)
+        self.assertEqual(len(slow.events) + len(fast.events) + fan.dropped, 20)
+        self.assertEqual([e.ts_ms for e in slow.events], sorted(e.ts_ms for e in slow.events))
+
+    def test_async_fanout_close_times_out_on_stuck_observer(self) -> None:
+        stuck = _BlockingObserver()
+        fan = FanOutObserver([stuck], async_dispatch=True, queue_size=2)
+        fan.on_event(_event(0))
+        time.sleep(0.05)  # in flight
+        fan.on_event(_event(1))
+        fan.on_event(_event(2))
+        started = time.monotonic()
+        fan.close(timeout=0.2)
+        self.assertLess(time.monotonic() - started, 1.0)
+        self.assertEqual(fan.dropped, 2)
+        stuck.release.set()
+
+
+if __name__ == "__main__":  # pragma: no cover
+    unittest.main()
@@ -141,6 +141,19 @@ class TestOrchestrator(unittest.TestCase):
         other_score = min(scores.values())
         self.assertGreater(adopted_score, other_score)
 
+    def test_transcript_response_dicts_keep_their_format(self):
+        cfg = load_config(overrides={"agents": [{"id": "a1", "type": "mock_keep"}, {"id": "a2", "type": "mock_revise"}]})
+        out = Orchestrator(cfg).run("do X", max_rounds=1)
+        gen = out["transcript"][0]["agents"]["a1"]["response"]
+        self.assertEqual(
+            list(gen), ["agent_id", "solution", "reasoning", "decision", "changed", "answer_id", "metadata"]
+        )
+        self.assertEqual(gen["decision"], "KEEP")
+        self.assertEqual(gen["metadata"], {"timings": {}, "tokens": {}})
+        crit = out["transcript"][1]["agents"]["a2"]["response"]
+        self.assertEqual((crit["decision"], crit["changed"]), ("REVISE", True))
+        self.assertEqual(crit["solution"], "SOLUTION_A1")
+
     def test_deadline_soft_then_hard_not_hit(self):
         # soft=100ms, hard=300ms; one agent delays 150ms, so soft is hit but hard is not
         cfg = load_config(
@@ -179,6 +192,20 @@ class TestOrchestrator(unittest.TestCase):
         # Transcript contains 1 generation + 3 critique rounds
         self.assertEqual(len(out["transcript"]), 4)
 
+    def test_whitespace_canonicalization_merges_answers(self):
+        for mode, expected in (("exact", 2), ("whitespace", 1)):
+            cfg = load_config(
+                overrides={
+                    "agents": [{"id": "a1", "type": "mock_keep"}, {"id": "a2", "type": "mock_keep"}],
+                    "scoring": {"canonicalization": mode},
+                }
+            )
+            orch = Orchestrator(cfg)
+            orch.agents["a1"]._sol = "x = 1  \ny = 2"  # type: ignore[attr-defined]
+            orch.agents["a2"]._sol = "x = 1\n\n\ny = 2"  # type: ignore[attr-defined]
+            out = orch.run("do W", max_rounds=1)
+            self.assertEqual(len(out["scores"]), expected)
+
     def test_early_stop_reason_round_budget(self):
         # Use delayed agents and a tight per-round budget to force early stop
         cfg = load_config(
@@ -0,0 +1,86 @@
+import time
+import unittest
+
+from freemad import Agent, AgentResponse, CritiqueResponse, Decision, Metadata, Orchestrator
+from freemad import compute_answer_id, load_config, register_agent
+
+from tests.pkg_mad.orchestrator.test_orchestrator import MockKeepAgent, MockReviseToFirstPeer
+
+
+class MockSlowKeep(Agent):
+    """Keeps its answer but takes 0.3s per critique call."""
+
+    def generate(self, requirement: str) -> AgentResponse:
+        sol = f"SLOW_{self.agent_cfg.id}"
+        return AgentResponse(
+            agent_id=self.agent_cfg.id,
+            solution=sol,
+            reasoning="gen",
+            answer_id=compute_answer_id(sol),
+            metadata=Metadata(),
+        )
+
+    def critique_and_refine(self, requirement: str, own_response: str, peer_responses):
+        time.sleep(0.3)
+        return CritiqueResponse(
+            agent_id=self.agent_cfg.id,
+            decision=Decision.KEEP,
+            changed=False,
+            solution=own_response,
+            reasoning="keep",
+            answer_id=compute_answer_id(own_response),
+            metadata=Metadata(),
+        )
+
+
+class TestPipelinedRounds(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        register_agent("mock_keep", MockKeepAgent)
+        register_agent("mock_revise", MockReviseToFirstPeer)
+        register_agent("mock_slow_keep", MockSlowKeep)
+
+    def _cfg(self, agents, pipelined: bool, **deadlines):
+        return load_config(
+            overrides={
+                "agents": [{"id": aid, "type": kind} for aid, kind in agents],
+                "deadlines": {"pipelined": pipelined, **deadlines},
+            }
+        )
+
+    def test_matches_barrier_mode_when_answers_are_stable(self):
+        agents = [("a1", "mock_keep"), ("a2", "mock_keep"), ("a3", "mock_keep")]
+        barrier = Orchestrator(self._cfg(agents, False)).run("req", max_rounds=3)
+        pipelined = Orchestrator(self._cfg(agents, True)).run("req", max_rounds=3)
+        self.assertEqual(len(pipelined["transcript"]), 4)
+        self.assertEqual(pipelined["final_answer_id"], barrier["final_answer_id"])
+        self.assertEqual(pipelined["scores"], barrier["scores"])
+        for b, p in zip(barrier["transcript"], pipelined["transcript"]):
+            self.assertEqual(p["scores"], b["scores"])
+
+    def test_fast_agents_run_ahead_of_straggler(self):
+        agents = [("a1", "mock_revise"), ("a2", "mock_revise"), ("slow", "mock_slow_keep")]
+        cfg = self._cfg(agents, True, min_agents=2, soft_timeout_ms=5000, hard_timeout_ms=10000)
+        out = Orchestrator(cfg).run("req", max_rounds=3)
+        self.assertEqual([t["round"] for t in out["transcript"]], [0, 1, 2, 3])
+        for t in out["transcript"][1:]:
+            self.assertEqual(set(t["agents"].keys()), {"a1", "a2", "slow"})
+        # Fast agents started round 2 before the straggler's round-1 call returned,
+        # so they saw its round-0 solution; the straggler itself never runs ahead.
+        round2 = out["transcript"][2]["agents"]
+        self.assertEqual(round2["a1"]["peers_seen_rounds"], {"slow": 0})
+        self.assertEqual(round2["a2"]["peers_seen_rounds"], {"slow": 0})
+        self.assertNotIn("peers_seen_rounds", round2["slow"])
+
+    def test_hard_deadline_carries_straggler_forward(self):
+        agents = [("a1", "mock_keep"), ("slow", "mock_slow_keep")]
+        cfg = self._cfg(agents, True, min_agents=1, soft_timeout_ms=50, hard_timeout_ms=100)
+        out = Orchestrator(cfg).run("req", max_rounds=2)
+        self.assertEqual(len(out["transcript"]), 3)
+        slow_r1 = out["transcript"][1]["agents"]["slow"]["response"]
+        self.assertEqual(slow_r1["decision"], Decision.KEEP.value)
+        self.assertTrue(out["transcript"][1]["deadline_hit_hard"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -20,3 +20,61 @@ def test_critique_prompt_has_required_markers_and_rules():
     # Peer numbering guidance
     assert "Peer #1" in p and "Peer #2" in p
 
+
+
+def test_critique_prompt_groups_peers_with_the_same_answer():
+    p = build_critique_prompt("Do X", own_solution="S1", peer_solutions=["P1", "P2", "P1", "S1"])
+    assert "Peers #1, #3 (2 agents):\nP1" in p
+    assert "Peer #2:\nP2" in p
+    assert p.count("P1") == 1
+    assert "Peer #4: same answer as your prior solution." in p
+
+
+def test_critique_prompt_caps_peer_text_with_diff_fallback():
+    own = "\n".join(f"line {i}" for i in range(200))
+    peer = own.replace("line 100", "line one hundred")
+    p = build_critique_prompt("Do X", own_solution=own, peer_solutions=[peer, "short"], max_peer_tokens=60)
+    assert "Peer #1 (diff against your prior solution):" in p
+    assert "+line one hundred" in p
+    assert "Peer #2:\nshort" in p
+    peer_part = p.split("Peer solutions (anonymized):\n", 1)[1]
+    assert "line 150" not in peer_part
+
+
+def test_critique_prompt_budget_shrinks_peers_first_and_keeps_contract():
+    requirement = "Write a function that adds two numbers."
+    own = "```python\ndef add(a, b):\n    return a + b\n```"
+    peers = ["\n".join(f"# peer line {i}" for i in range(400))]
+    p = build_critique_prompt(requirement, own, peers, max_tokens=400)
+    assert "DECISION:" in p and "REVISED_SOLUTION:" in p and "REASONING:" in p
+    assert "Requirement:\n" + requirement in p
+    assert "Your prior solution:\n" + own in p
+    assert "peer line 0" in p and "peer line 399" not in p
+
+
+def test_critique_prompt_budget_omits_peers_and_closes_fences_when_tight():
+    own = "```python\n" + "\n".join(f"x_{i} = {i}" for i in range(300)) + "\n```"
+    p = build_critique_prompt("Do X", own, ["P1", "P2"], max_tokens=200)
+    assert p.index("DECISION:") < p.index("Requirement:\nDo X")
+    assert "2 peer solution(s) omitted" in p
+    own_part = p.split("Your prior solution:\n", 1)[1].split("\n\nPeer solutions", 1)[0]
+    body = own_part.split("\n\n[TRUNCATED", 1)[0]
+    assert body.rstrip().endswith("```")
+    assert sum(1 for line in body.splitlines() if line.startswith("```")) == 2
+
+
+def test_critique_prompt_keeps_own_solution_under_a_very_tight_budget():
+    requirement = "\n".join(f"requirement line {i}" for i in range(200))
+    own = "\n".join(f"own_line_{i} = {i}" for i in range(200))
+    p = build_critique_prompt(requirement, own, ["P1"], max_tokens=120)
+    own_part = p.split("Your prior solution:\n", 1)[1].split("\n\nPeer solutions", 1)[0]
+    assert "own_line_0 = 0" in own_part
+    assert "DECISION:" in p and "REASONING:" in p
+
+
+def test_generation_prompt_budget_trims_requirement_only():
+    requirement = "\n".join(f"requirement line {i}" for i in range(500))
+    p = build_generation_prompt(requirement, max_tokens=120)
+    assert "SOLUTION:" in p and "REASONING:" in p
+    assert "requirement line 0" in p and "requirement line 499" not in p
+    assert "[TRUNCATED at ~" in p
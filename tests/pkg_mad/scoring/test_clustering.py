@@ -0,0 +1,100 @@
+import random
+import unittest
+
+from freemad import AnswerClusterer, ClusteringConfig, ConfigError, Orchestrator, ScoreTracker
+from freemad import load_config, register_agent
+
+from tests.pkg_mad.orchestrator.test_orchestrator import MockKeepAgent
+
+
+def _text(seed: int, words: int = 300) -> str:
+    rnd = random.Random(seed)
+    return " ".join(f"w{rnd.randrange(2000)}" for _ in range(words))
+
+
+def _edit(text: str) -> str:
+    words = text.split()
+    words[len(words) // 2] = "changed"
+    return " ".join(words)
+
+
+class TestAnswerClusterer(unittest.TestCase):
+    def test_near_duplicates_share_a_cluster(self):
+        answers = {}
+        for i in range(20):
+            base = _text(i)
+            answers[f"a{i:02d}"] = base
+            answers[f"b{i:02d}"] = _edit(base)
+        clusterer = AnswerClusterer(ClusteringConfig(enabled=True))
+        clusterer.add_many(answers)
+        clusters = clusterer.clusters()
+        self.assertEqual(len(clusters), 20)
+        for i in range(20):
+            self.assertEqual(clusters[f"a{i:02d}"], [f"a{i:02d}", f"b{i:02d}"])
+
+    def test_representative_is_best_scored_member(self):
+        clusterer = AnswerClusterer(ClusteringConfig(enabled=True))
+        base = _text(1)
+        clusterer.add("x", base)
+        clusterer.add("y", _edit(base))
+        self.assertEqual(clusterer.clusters({"x": 1.0, "y": 2.0}), {"y": ["x", "y"]})
+
+    def test_signature_similarity_tracks_overlap(self):
+        clusterer = AnswerClusterer(ClusteringConfig(enabled=True))
+        a = clusterer.signature(_text(3))
+        self.assertEqual(clusterer.similarity(a, clusterer.signature(_text(3))), 1.0)
+        self.assertLess(clusterer.similarity(a, clusterer.signature(_text(4))), 0.2)
+
+    def test_pooled_scores(self):
+        cfg = load_config(overrides={"scoring": {"normalize": True}})
+        st = ScoreTracker(cfg)
+        st.record_initial(agent_id="a1", answer_id="X", round_idx=0)
+        st.record_initial(agent_id="a2", answer_id="X2", round_idx=0)
+        st.record_initial(agent_id="a3", answer_id="Y", round_idx=0)
+        pooled = st.get_pooled_scores({"X": ["X", "X2"], "Y": ["Y"]})
+        w1 = cfg.scoring.weights[0]
+        self.assertAlmostEqual(pooled["X"], 2 * w1 / 2)
+        self.assertAlmostEqual(pooled["Y"], w1)
+
+    def test_invalid_config_rejected(self):
+        with self.assertRaises(ConfigError):
+            load_config(overrides={"clustering": {"num_perm": 64, "bands": 10}})
+        with self.assertRaises(ConfigError):
+            load_config(overrides={"clustering": {"threshold": 0}})
+
+
+class TestClusteredSelection(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        register_agent("mock_keep", MockKeepAgent)
+
+    def _run(self, enabled: bool) -> dict:
+        cfg = load_config(
+            overrides={
+                "agents": [{"id": aid, "type": "mock_keep"} for aid in ("a1", "a2", "a3")],
+                "scoring": {"normalize": False},
+                "clustering": {"enabled": enabled},
+            }
+        )
+        orch = Orchestrator(cfg)
+        base = _text(7)
+        orch.agents["a1"]._sol = "A" + _text(8)  # type: ignore[attr-defined]
+        orch.agents["a2"]._sol = base  # type: ignore[attr-defined]
+        orch.agents["a3"]._sol = _edit(base)  # type: ignore[attr-defined]
+        return orch.run("req", max_rounds=1)
+
+    def test_pooled_cluster_wins_selection(self):
+        plain = self._run(False)
+        self.assertEqual(plain["answer_clusters"], {})
+        self.assertEqual(len(plain["winning_agents"]), 1)
+
+        pooled = self._run(True)
+        self.assertEqual(set(pooled["winning_agents"]), {"a2", "a3"})
+        self.assertEqual(len(pooled["scores"]), 2)
+        self.assertIn(pooled["final_answer_id"], pooled["answer_clusters"])
+        self.assertEqual(len(pooled["answer_clusters"][pooled["final_answer_id"]]), 2)
+        self.assertAlmostEqual(pooled["metrics"]["agreement_rate"], 2 / 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,3 +1,4 @@
+import re
 import unittest
 
 from freemad import Redactor
@@ -12,6 +13,17 @@ class TestSecurityBudget(unittest.TestCase):
         self.assertIn("[REDACTED]", out)
         self.assertNotIn("sk-ABC123", out)
 
+    def test_redaction_prefilter_matches_plain_substitution(self):
+        patterns = [r"sk-[A-Za-z0-9_\-]+", r"(?i)api[_-]?key\s*[:=]\s*\S+", r"token=(\w)\1+", r"\d{3}-\d{4}"]
+        texts = ["no secrets here", "sk-ABC api_key: hunter2 Token=aaaa token=aaaa API-KEY=zz 555-1234", ""]
+        r = Redactor(patterns)
+        for text in texts:
+            expected = text
+            for p in patterns:
+                expected = re.sub(p, "[REDACTED]", expected)
+            self.assertEqual(r.redact(text), expected)
+        self.assertEqual(r.redact("plain"), "plain")
+
     def test_enforce_size(self):
         text = "x" * 10
         out, truncated = enforce_size(text, max_size=5, label="solution")
@@ -19,6 +31,15 @@ class TestSecurityBudget(unittest.TestCase):
         self.assertTrue(out.endswith("solution]"))
         self.assertTrue(out.startswith("x" * 5))
 
+    def test_enforce_size_cuts_at_line_and_closes_code_fence(self):
+        text = "```python\n" + "\n".join(f"value_{i} = {i}" for i in range(50)) + "\n```"
+        out, truncated = enforce_size(text, max_size=120, label="solution")
+        self.assertTrue(truncated)
+        body = out.split("\n\n[TRUNCATED", 1)[0]
+        self.assertTrue(body.endswith("\n```"))
+        for line in body.splitlines()[1:-1]:
+            self.assertRegex(line, r"^value_\d+ = \d+$")
+
     def test_budget_guard(self):
         guard = BudgetGuard(max_total_time_sec=0.05, max_round_time_sec=0.05)
         guard.check_total()
@@ -0,0 +1,41 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+from freemad.task_events import TaskEvent
+from freemad.tasks.compaction import compact_task_events, load_task_snapshot
+from freemad.tasks.store import TaskStore
+from freemad.types import ArtifactKind, TaskEventKind, TaskStage, TaskType
+
+
+def test_load_task_snapshot_folds_only_events_after_stored_snapshot(tmp_path: Path) -> None:
+    store = TaskStore(tmp_path / "tasks.db", tmp_path / "artifacts")
+    task = store.create_task("Long task", TaskType.PLAN, "/repo")
+    for i in range(5):
+        store.append_event(
+            TaskEvent(
+                kind=TaskEventKind.ARTIFACT_CREATED,
+                task_id=task.task_id,
+                ts_ms=i,
+                artifact_kind=ArtifactKind.RESEARCH_BUNDLE,
+            )
+        )
+
+    snapshot, seq = load_task_snapshot(store, task.task_id, snapshot_every=3)
+    assert snapshot.artifact_counts == {"research_bundle": 5}
+    stored = store.get_state_snapshot(task.task_id)
+    assert stored is not None and stored[0] == seq
+
+    store.append_event(TaskEvent(kind=TaskEventKind.STAGE_STARTED, task_id=task.task_id, ts_ms=6, stage=TaskStage.DRAFT_PLAN))
+    snapshot, _ = load_task_snapshot(store, task.task_id, snapshot_every=3)
+    assert snapshot.current_stage == TaskStage.DRAFT_PLAN
+    assert snapshot.artifact_counts == {"research_bundle": 5}
+
+    result = compact_task_events(store, task.task_id, archive_dir=tmp_path / "archive", keep_recent=2)
+    assert result["archived_events"] == 4
+    assert [event.ts_ms for event in store.list_events(task.task_id)] == [4, 6]
+    assert [event.ts_ms for event in store.list_archived_events(task.task_id, tmp_path / "archive")] == [0, 1, 2, 3]
+
+    compacted, _ = load_task_snapshot(store, task.task_id, snapshot_every=3)
+    assert compacted == snapshot
+    store.close()
@@ -3,6 +3,8 @@ from __future__ import annotations
 import json
 from pathlib import Path
 import threading
+import time
+from typing import Any
 
 from freemad import (
     Agent,
@@ -24,6 +26,7 @@ from freemad import (
     register_agent,
     SourceRecord,
 )
+from freemad.agents.base import AgentCancelled, current_cancel_event
 from freemad.tasks.models import FileWrite
 
 
@@ -467,3 +470,201 @@ def test_partition_work_items_groups_only_non_overlapping_scopes(tmp_path: Path)
     assert len(groups) == 2
     assert len(groups[0]) == 2
     assert len(groups[1]) == 1
+
+
+class _SlowReviewerMockAgent(_QuorumMockAgent):
+    release = threading.Event()
+
+    def act(self, request: TaskRequest) -> TaskResponse:
+        if request.role == TaskRole.REVIEWER and request.stage == TaskStage.PLAN_REVIEW and self.agent_cfg.id == "reviewer-slow":
+            _SlowReviewerMockAgent.release.wait(timeout=5.0)
+            return TaskResponse(
+                agent_id=self.agent_cfg.id,
+                stage=request.stage,
+                role=request.role,
+                content="Late rejection",
+                review_decision=ReviewDecision.REJECT,
+            )
+        return super().act(request)
+
+
+def test_plan_review_quorum_resolves_before_slow_reviewer(tmp_path: Path) -> None:
+    register_agent("slow_review_mock", _SlowReviewerMockAgent)
+    _SlowReviewerMockAgent.release = threading.Event()
+    cfg = load_config(
+        overrides={
+            "agents": [
+                {"id": "researcher-a", "type": "slow_review_mock", "roles": ["researcher"]},
+                {"id": "planner-a", "type": "slow_review_mock", "roles": ["planner"]},
+                {"id": "reviewer-slow", "type": "slow_review_mock", "roles": ["reviewer"]},
+                {"id": "reviewer-a", "type": "slow_review_mock", "roles": ["reviewer"]},
+                {"id": "reviewer-b", "type": "slow_review_mock", "roles": ["reviewer"]},
+            ],
+            "task": {
+                "store_path": str(tmp_path / "quorum.db"),
+                "artifacts_dir": str(tmp_path / "quorum-artifacts"),
+                "review_quorum": 3,
+                "tool_policy": {"allow_local_commands": False},
+            },
+        }
+    )
+    workspace = tmp_path / "workspace-quorum"
+    workspace.mkdir()
+
+    orch = TaskOrchestrator(cfg)
+    task = orch.create_task(goal="Approve the plan by quorum.", task_type=TaskType.PLAN, workspace_root=str(workspace))
+    try:
+        result = orch.run(task.task_id)
+    finally:
+        _SlowReviewerMockAgent.release.set()
+
+    assert result.status == TaskStatus.COMPLETED
+    attempt = next(a for a in result.stage_attempts if a.stage == TaskStage.PLAN_REVIEW)
+    assert set(attempt.reviewer_agent_ids) == {"reviewer-a", "reviewer-b"}
+    assert set(attempt.reviewer_latency_ms) == {"reviewer-a", "reviewer-b"}
+    assert attempt.to_dict()["reviewer_latency_ms"]["reviewer-a"] >= 0.0
+
+
+class _VotingReviewerMockAgent(_QuorumMockAgent):
+    """Plan reviewers vote per `votes[agent_id]`: a ReviewDecision, "raise", "block" (wait for `release`)
+    or "cancellable" (wait until the call's cancel scope fires)."""
+
+    votes: dict = {}
+    release = threading.Event()
+
+    def act(self, request: TaskRequest) -> TaskResponse:
+        vote = self.votes.get(self.agent_cfg.id)
+        if request.stage != TaskStage.PLAN_REVIEW or vote is None:
+            return super().act(request)
+        if vote == "raise":
+            raise RuntimeError("reviewer crashed")
+        if vote == "block":
+            self.release.wait(timeout=5.0)
+            vote = ReviewDecision.REJECT
+        if vote == "cancellable":
+            cancel = current_cancel_event()
+            if cancel is not None and cancel.wait(timeout=5.0):
+                raise AgentCancelled("review no longer needed")
+            vote = ReviewDecision.REJECT
+        return TaskResponse(
+            agent_id=self.agent_cfg.id,
+            stage=request.stage,
+            role=request.role,
+            content=f"vote {vote.value}",
+            review_decision=vote,
+        )
+
+
+def _voting_orchestrator(tmp_path: Path, votes: dict, **overrides: Any) -> tuple:
+    register_agent("voting_review_mock", _VotingReviewerMockAgent)
+    _VotingReviewerMockAgent.votes = votes
+    _VotingReviewerMockAgent.release = threading.Event()
+    cfg = load_config(
+        overrides={
+            "agents": [
+                {"id": "researcher-a", "type": "voting_review_mock", "roles": ["researcher"]},
+                {"id": "planner-a", "type": "voting_review_mock", "roles": ["planner"]},
+            ]
+            + [{"id": aid, "type": "voting_review_mock", "roles": ["reviewer"]} for aid in votes],
+            "task": {
+                "store_path": str(tmp_path / "votes.db"),
+                "artifacts_dir": str(tmp_path / "votes-artifacts"),
+                "review_quorum": len(votes),
+                "tool_policy": {"allow_local_commands": False},
+            },
+            **overrides,
+        }
+    )
+    workspace = tmp_path / "workspace-votes"
+    workspace.mkdir(parents=True)
+    orch = TaskOrchestrator(cfg)
+    task = orch.create_task(goal="Review by vote.", task_type=TaskType.PLAN, workspace_root=str(workspace))
+    return orch, task, [orch.agents[aid] for aid in votes]
+
+
+def test_review_quorum_revise_and_reject_majorities(tmp_path: Path) -> None:
+    orch, task, reviewers = _voting_orchestrator(
+        tmp_path,
+        {"r1": ReviewDecision.REVISE, "r2": ReviewDecision.REVISE, "r3": ReviewDecision.APPROVE},
+    )
+    assert orch._run_review_quorum(task, TaskStage.PLAN_REVIEW, reviewers).decision == ReviewDecision.REVISE
+
+    orch, task, reviewers = _voting_orchestrator(
+        tmp_path / "reject",
+        {"r1": ReviewDecision.REJECT, "r2": ReviewDecision.REVISE, "r3": ReviewDecision.REJECT},
+    )
+    review = orch._run_review_quorum(task, TaskStage.PLAN_REVIEW, reviewers)
+    assert review.decision == ReviewDecision.REJECT
+    assert review.failed == {}
+
+
+def test_review_quorum_early_decision_abandons_running_reviewer(tmp_path: Path) -> None:
+    orch, task, reviewers = _voting_orchestrator(
+        tmp_path,
+        {"r1": ReviewDecision.APPROVE, "r2": ReviewDecision.APPROVE, "r3": "block"},
+    )
+    finished = threading.Event()
+    invoke = orch._invoke_agent
+
+    def _tracked_invoke(agent, *args, **kwargs):
+        try:
+            return invoke(agent, *args, **kwargs)
+        finally:
+            if agent.agent_cfg.id == "r3":
+                finished.set()
+
+    orch._invoke_agent = _tracked_invoke  # type: ignore[method-assign]
+    review = orch._run_review_quorum(task, TaskStage.PLAN_REVIEW, reviewers)
+    assert review.decision == ReviewDecision.APPROVE
+    assert review.cancelled_agent_ids == ("r3",)
+
+    _VotingReviewerMockAgent.release.set()
+    assert finished.wait(timeout=5.0)
+    scope = orch._checkpoint_scope(task, TaskStage.PLAN_REVIEW)
+    assert orch.store.get_checkpoint(task.task_id, scope, "agent:reviewer:r1:") is not None
+    assert orch.store.get_checkpoint(task.task_id, scope, "agent:reviewer:r3:") is None
+
+
+def test_review_quorum_early_decision_cancels_running_reviewer(tmp_path: Path) -> None:
+    orch, task, reviewers = _voting_orchestrator(
+        tmp_path,
+        {"r1": ReviewDecision.APPROVE, "r2": ReviewDecision.APPROVE, "r3": "cancellable"},
+    )
+    outcome: dict = {}
+    finished = threading.Event()
+    invoke = orch._invoke_agent
+
+    def _tracked_invoke(agent, *args, **kwargs):
+        try:
+            return invoke(agent, *args, **kwargs)
+        except AgentCancelled as exc:
+            outcome[agent.agent_cfg.id] = exc
+            raise
+        finally:
+            if agent.agent_cfg.id == "r3":
+                finished.set()
+
+    orch._invoke_agent = _tracked_invoke  # type: ignore[method-assign]
+    started = time.monotonic()
+    review = orch._run_review_quorum(task, TaskStage.PLAN_REVIEW, reviewers)
+    assert review.decision == ReviewDecision.APPROVE
+    assert finished.wait(timeout=2.0)  # without `release`: the call itself was cancelled
+    assert time.monotonic() - started < 2.0
+    assert isinstance(outcome.get("r3"), AgentCancelled)
+
+
+def test_review_quorum_counts_raising_reviewer_as_failed_vote(tmp_path: Path) -> None:
+    orch, task, reviewers = _voting_orchestrator(
+        tmp_path,
+        {"r1": "raise", "r2": ReviewDecision.APPROVE, "r3": ReviewDecision.APPROVE},
+        budget={"max_concurrent_agents": 1},  # r1 fails before the approvals decide the review
+    )
+    review = orch._run_review_quorum(task, TaskStage.PLAN_REVIEW, reviewers)
+    assert review.decision == ReviewDecision.APPROVE
+    assert review.failed == {"r1": "reviewer crashed"}
+    assert {agent_id for agent_id, _ in review.responses} == {"r2", "r3"}
+
+    result = orch.run(task.task_id)
+    assert result.status == TaskStatus.COMPLETED
+    attempt = next(a for a in result.stage_attempts if a.stage == TaskStage.PLAN_REVIEW)
+    assert "r1: review failed: reviewer crashed" in attempt.decision_reason
@@ -3,6 +3,8 @@ from __future__ import annotations
 from dataclasses import replace
 from pathlib import Path
 
+import pytest
+
 from freemad import (
     Agent,
     AgentResponse,
@@ -23,6 +25,7 @@ from freemad import (
     load_config,
     register_agent,
 )
+from freemad.tasks.compaction import compact_task_events
 from tests.pkg_mad.tasks.test_orchestrator import _QuorumMockAgent
 
 
@@ -147,7 +150,8 @@ def test_task_restart_and_resume_rebuilds_same_waiting_state(tmp_path: Path) ->
     assert resumed.current_stage == TaskStage.PLAN_REVIEW
 
 
-def test_task_resume_injects_human_input_and_approval_into_feedback(tmp_path: Path) -> None:
+@pytest.mark.parametrize("compact", [False, True])
+def test_task_resume_injects_human_input_and_approval_into_feedback(tmp_path: Path, compact: bool) -> None:
     register_agent("human_feedback_mock", _HumanFeedbackMockAgent)
     cfg = load_config(
         overrides={
@@ -201,9 +205,77 @@ def test_task_resume_injects_human_input_and_approval_into_feedback(tmp_path: Pa
             message="plan_review",
         )
     )
+    if compact:
+        compacted = compact_task_events(orch.store, task.task_id, archive_dir=tmp_path / "archive", keep_recent=0)
+        assert compacted["archived_events"] > 0
+    assert orch._feedback_for_task(task.task_id) == ("HUMAN_INPUT: Use SQLite.", "HUMAN_APPROVAL: plan_review")
     orch.store.update_task(replace(waiting, status=TaskStatus.RUNNING))
 
     resumed = orch.run(task.task_id)
 
     assert resumed.status == TaskStatus.COMPLETED
     assert resumed.current_stage == TaskStage.FINALIZE
+
+
+class _CrashingImplementerMockAgent(_QuorumMockAgent):
+    calls: dict[str, int] = {}
+    crash_once: set[str] = set()
+
+    def act(self, request: TaskRequest) -> TaskResponse:
+        if request.role == TaskRole.IMPLEMENTER and request.work_item is not None:
+            item_id = request.work_item.work_item_id
+            type(self).calls[item_id] = type(self).calls.get(item_id, 0) + 1
+            if item_id in type(self).crash_once:
+                type(self).crash_once.discard(item_id)
+                raise RuntimeError(f"implementer crashed on {item_id}")
+        return super().act(request)
+
+
+def test_resume_after_crash_reruns_only_unfinished_work_items(tmp_path: Path) -> None:
+    register_agent("crashing_mock", _CrashingImplementerMockAgent)
+    _CrashingImplementerMockAgent.calls = {}
+    _CrashingImplementerMockAgent.crash_once = {"w-2"}
+    cfg = load_config(
+        overrides={
+            "agents": [
+                {"id": "researcher-a", "type": "crashing_mock", "roles": ["researcher"]},
+                {"id": "planner-a", "type": "crashing_mock", "roles": ["planner"]},
+                {"id": "reviewer-a", "type": "crashing_mock", "roles": ["reviewer"]},
+                {"id": "implementer-a", "type": "crashing_mock", "roles": ["implementer"]},
+                {"id": "verifier-a", "type": "crashing_mock", "roles": ["verifier"]},
+            ],
+            "task": {
+                "store_path": str(tmp_path / "tasks.db"),
+                "artifacts_dir": str(tmp_path / "artifacts"),
+                "tool_policy": {
+                    "allowed_write_roots": ["src"],
+                    "allow_local_commands": False,
+                },
+            },
+        }
+    )
+    workspace = tmp_path / "workspace"
+    (workspace / "src").mkdir(parents=True)
+
+    orch = TaskOrchestrator(cfg)
+    task = orch.create_task(goal="Implement the approved code plan.", task_type=TaskType.CODE, workspace_root=str(workspace))
+    crashed = orch.run(task.task_id)
+
+    assert crashed.status == TaskStatus.FAILED
+    assert crashed.current_stage == TaskStage.EXECUTE
+    assert _CrashingImplementerMockAgent.calls == {"w-1": 1, "w-2": 1}
+
+    restarted = TaskOrchestrator(cfg)
+    restarted.store.update_task(replace(crashed, status=TaskStatus.RUNNING, error=None))
+    result = restarted.run(task.task_id)
+
+    assert result.status == TaskStatus.COMPLETED
+    assert _CrashingImplementerMockAgent.calls == {"w-1": 1, "w-2": 2}
+    assert (workspace / "src" / "alpha.txt").read_text(encoding="utf-8") == "alpha\n"
+    assert (workspace / "src" / "beta.txt").read_text(encoding="utf-8") == "beta\n"
+    started = [
+        event.work_item_id
+        for event in restarted.store.list_events(task.task_id)
+        if event.kind == TaskEventKind.WORK_ITEM_STARTED and event.work_item_id is not None
+    ]
+    assert sorted(started) == ["w-1", "w-2", "w-2"]
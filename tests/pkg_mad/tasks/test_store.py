@@ -152,6 +152,40 @@ class TestTaskStore(unittest.TestCase):
             self.assertEqual(work_items[0].write_scope, ("freemad/tasks/store.py",))
             reopened.close()
 
+    def test_task_leases_are_exclusive_until_released_or_expired(self):
+        from freemad.tasks.store import TaskStore
+        from freemad.types import TaskType
+
+        with tempfile.TemporaryDirectory() as tmp:
+            db_path = Path(tmp) / "tasks.db"
+            store_a = TaskStore(db_path, Path(tmp) / "artifacts")
+            store_b = TaskStore(db_path, Path(tmp) / "artifacts")
+            first = store_a.create_task("First", TaskType.PLAN, "/repo")
+            second = store_a.create_task("Second", TaskType.PLAN, "/repo")
+
+            claimed_a = store_a.claim_task("worker-a", lease_ms=60000)
+            claimed_b = store_b.claim_task("worker-b", lease_ms=60000)
+
+            assert claimed_a is not None and claimed_b is not None
+            self.assertEqual({claimed_a.task_id, claimed_b.task_id}, {first.task_id, second.task_id})
+            self.assertIsNone(store_b.claim_task("worker-b", lease_ms=60000))
+            self.assertIsNone(store_b.claim_task("worker-b", lease_ms=60000, task_id=claimed_a.task_id))
+            self.assertTrue(store_a.renew_lease(claimed_a.task_id, "worker-a", lease_ms=60000))
+            self.assertFalse(store_b.renew_lease(claimed_a.task_id, "worker-b", lease_ms=60000))
+
+            # A zero-length renewal simulates a worker that stopped heartbeating.
+            store_a.renew_lease(claimed_a.task_id, "worker-a", lease_ms=0)
+            self.assertEqual(store_b.reclaim_expired_leases(), [claimed_a.task_id])
+            reclaimed = store_b.claim_task("worker-b", lease_ms=60000)
+            assert reclaimed is not None
+            self.assertEqual(reclaimed.task_id, claimed_a.task_id)
+            self.assertFalse(store_a.renew_lease(claimed_a.task_id, "worker-a", lease_ms=60000))
+
+            store_b.release_lease(claimed_b.task_id, "worker-b")
+            self.assertIsNone(store_b.get_lease(claimed_b.task_id))
+            store_a.close()
+            store_b.close()
+
 
 if __name__ == "__main__":  # pragma: no cover
     unittest.main()
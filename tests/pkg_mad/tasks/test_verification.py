@@ -0,0 +1,130 @@
+from __future__ import annotations
+
+import os
+from pathlib import Path
+import subprocess
+import sys
+import time
+
+import pytest
+
+from freemad import TaskType, load_config
+from freemad.tasks.store import TaskStore
+from freemad.tasks.verification import VerificationRunner
+
+
+def _runner(tmp_path: Path, commands: list[str]) -> tuple[VerificationRunner, TaskStore]:
+    cfg = load_config(
+        overrides={
+            "task": {
+                "store_path": str(tmp_path / "state" / "tasks.db"),
+                "artifacts_dir": str(tmp_path / "state" / "artifacts"),
+                "tool_policy": {
+                    "allowed_local_commands": [sys.executable],
+                    "verification_commands": commands,
+                },
+            }
+        }
+    )
+    store = TaskStore(cfg.task.store_path, cfg.task.artifacts_dir)
+    return VerificationRunner(cfg, store), store
+
+
+def test_verification_commands_run_concurrently_and_cache_passing_results(tmp_path: Path) -> None:
+    workspace = tmp_path / "workspace"
+    workspace.mkdir()
+    (workspace / "module.py").write_text("VALUE = 1\n", encoding="utf-8")
+    sleep = f"{sys.executable} -c \"import time; time.sleep(0.5); print('ok')\""
+    commands = [sleep, sleep + " ", f"{sys.executable} -c \"import sys; sys.exit(3)\""]
+    runner, store = _runner(tmp_path, commands)
+    task = store.create_task("verify", TaskType.CODE, str(workspace))
+
+    started = time.perf_counter()
+    first = runner.run(task, commands)
+    elapsed = time.perf_counter() - started
+
+    assert elapsed < 1.0
+    assert [result.returncode for result in first] == [0, 0, 3]
+    assert not any(result.cached for result in first)
+    assert "ok" in first[0].output
+    assert first[0].artifact is not None
+    report = Path(first[0].artifact.path).read_text(encoding="utf-8")
+    assert "Return code: 0" in report
+
+    second = runner.run(task, commands)
+    assert [result.cached for result in second] == [True, True, False]
+    assert second[0].output == first[0].output
+
+    (workspace / "module.py").write_text("VALUE = 2\n", encoding="utf-8")
+    third = runner.run(task, commands)
+    assert not any(result.cached for result in third)
+    store.close()
+
+
+def test_verification_output_keeps_head_and_tail_within_limit(tmp_path: Path) -> None:
+    workspace = tmp_path / "workspace"
+    workspace.mkdir()
+    command = f"{sys.executable} -c \"print('start'); print('x' * 200000); print('end')\""
+    runner, store = _runner(tmp_path, [command])
+    task = store.create_task("verify", TaskType.CODE, str(workspace))
+
+    (result,) = runner.run(task, [command])
+
+    assert result.truncated
+    assert result.output.startswith("start")
+    assert result.output.rstrip().endswith("end")
+    assert len(result.output) < runner.cfg.security.max_solution_size + 100
+    store.close()
+
+
+def test_verification_cache_tracks_installed_packages_and_is_pruned(tmp_path: Path) -> None:
+    workspace = tmp_path / "workspace"
+    site_packages = workspace / ".venv" / "lib" / "python3.11" / "site-packages"
+    site_packages.mkdir(parents=True)
+    command = f"{sys.executable} -c \"print('ok')\""
+    runner, store = _runner(tmp_path, [command])
+    task = store.create_task("verify", TaskType.CODE, str(workspace))
+
+    runner.run(task, [command])
+    assert [r.cached for r in runner.run(task, [command])] == [True]
+    (site_packages / "newdep").mkdir()  # a dependency installed into the skipped .venv
+    os.utime(site_packages, ns=(0, site_packages.stat().st_mtime_ns + 1_000_000))
+    assert [r.cached for r in runner.run(task, [command])] == [False]
+
+    for i in range(3):  # plus the two results cached by the runs above
+        time.sleep(0.002)
+        store.save_verification_result(f"key-{i}", command="c", returncode=0, output="")
+    assert store.prune_verification_cache(max_entries=2) == 3
+    assert store.get_verification_result("key-1") is not None
+    assert store.get_verification_result("key-2") is not None
+    assert store.get_verification_result("key-0") is None
+    time.sleep(0.01)
+    assert store.prune_verification_cache(max_age_ms=0) == 2
+    store.close()
+
+
+def test_verification_without_output_pipe_raises_and_kills(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    workspace = tmp_path / "workspace"
+    workspace.mkdir()
+    command = f"{sys.executable} -c \"print('ok')\""
+    runner, store = _runner(tmp_path, [command])
+    task = store.create_task("verify", TaskType.CODE, str(workspace))
+    killed: list[bool] = []
+
+    class _NoPipe:
+        stdout = None
+
+        def __init__(self, *args: object, **kwargs: object) -> None:
+            pass
+
+        def kill(self) -> None:
+            killed.append(True)
+
+        def wait(self) -> int:
+            return -9
+
+    monkeypatch.setattr(subprocess, "Popen", _NoPipe)
+    with pytest.raises(OSError, match="no output pipe"):
+        runner.run(task, [command])
+    assert killed == [True]
+    store.close()
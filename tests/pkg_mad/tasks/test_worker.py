@@ -0,0 +1,33 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+from freemad import TaskOrchestrator, TaskStatus, TaskType
+from freemad.tasks.worker import TaskWorker
+from tests.pkg_mad.tasks.test_orchestrator import _build_cfg
+
+
+def test_worker_records_a_task_that_raises_and_keeps_serving(tmp_path: Path) -> None:
+    orch = TaskOrchestrator(_build_cfg(tmp_path))
+    workspace = tmp_path / "workspace"
+    workspace.mkdir()
+    broken = orch.create_task(goal="Broken store step.", task_type=TaskType.PLAN, workspace_root=str(workspace))
+    healthy = orch.create_task(goal="Plan normally.", task_type=TaskType.PLAN, workspace_root=str(workspace))
+    step = orch.step
+
+    def _step(task_id: str):
+        if task_id == broken.task_id:
+            raise RuntimeError("store unavailable")
+        return step(task_id)
+
+    orch.step = _step  # type: ignore[method-assign]
+    worker = TaskWorker(orch, worker_id="w1", concurrency=1)
+
+    driven = worker.drain()
+
+    assert sorted(driven) == sorted([broken.task_id, healthy.task_id])
+    assert worker.errors == {broken.task_id: "RuntimeError: store unavailable"}
+    healthy_task = orch.get_task(healthy.task_id)
+    assert healthy_task is not None and healthy_task.status == TaskStatus.COMPLETED
+    broken_task = orch.get_task(broken.task_id)
+    assert broken_task is not None and broken_task.status == TaskStatus.FAILED  # not reclaimed on every poll
@@ -51,6 +51,98 @@ class TestTopology(unittest.TestCase):
         self.assertEqual(peers["b"], ["a"])
         self.assertEqual(peers["c"], ["a"])
 
+    def test_k_reviewers_rotate_per_round(self):
+        agents = [{"id": f"a{i}", "type": "claude_code"} for i in range(20)]
+        cfg = load_config(overrides={"agents": agents, "topology": {"type": "k_reviewers", "k": 2, "seed": 7}})
+        t = build_topology(cfg)
+        ids = [f"a{i}" for i in range(20)]
+        rounds = [t.assign_peers(ids, round_idx=r) for r in (1, 2, 3)]
+        self.assertNotEqual(rounds[0], rounds[1])
+        self.assertEqual(build_topology(cfg).assign_peers(ids, round_idx=2), rounds[1])
+        fixed = build_topology(
+            load_config(
+                overrides={"agents": agents, "topology": {"type": "k_reviewers", "k": 2, "seed": 7, "rotate": False}}
+            )
+        )
+        self.assertEqual(fixed.assign_peers(ids, round_idx=1), fixed.assign_peers(ids, round_idx=2))
+
+    def _agents(self, n):
+        return [{"id": f"a{i}", "type": "claude_code"} for i in range(n)]
+
+    def test_sparse_topologies_bound_degree_and_report_stats(self):
+        ids = [f"a{i}" for i in range(100)]
+        for topology in (
+            {"type": "expander", "k": 4},
+            {"type": "small_world", "k": 4, "rewire_p": 0.2},
+            {"type": "rotating", "k": 4},
+        ):
+            cfg = load_config(overrides={"agents": self._agents(100), "topology": topology})
+            t = build_topology(cfg)
+            peers = t.assign_peers(ids, round_idx=1)
+            for a in ids:
+                self.assertLessEqual(len(peers[a]), 4)
+                self.assertNotIn(a, peers[a])
+            stats = t.info()["stats"]
+            self.assertEqual(stats["agents"], 100)
+            self.assertLessEqual(stats["max_out_degree"], 4)
+            self.assertGreater(stats["coverage"], 0.9)
+
+    def test_degenerate_sizes_still_report_stats(self):
+        for topology, n in (
+            ({"type": "ring"}, 2),
+            ({"type": "expander", "k": 2}, 3),
+            ({"type": "small_world", "k": 2, "rewire_p": 0.2}, 3),
+        ):
+            cfg = load_config(overrides={"agents": self._agents(n), "topology": topology})
+            t = build_topology(cfg)
+            ids = [f"a{i}" for i in range(n)]
+            self.assertEqual(t.assign_peers(ids), {a: [b for b in ids if b != a] for a in ids})
+            stats = t.info()["stats"]
+            self.assertEqual(stats["agents"], n)
+            self.assertEqual(stats["max_out_degree"], n - 1)
+            self.assertEqual(stats["coverage"], 1.0)
+
+    def test_rotating_covers_all_pairs(self):
+        cfg = load_config(overrides={"agents": self._agents(7), "topology": {"type": "rotating", "k": 2}})
+        t = build_topology(cfg)
+        ids = [f"a{i}" for i in range(7)]
+        for r in (1, 2, 3):
+            t.assign_peers(ids, round_idx=r)
+        self.assertEqual(t.info()["stats"]["pair_coverage"], 1.0)
+
+    def test_hierarchical_clusters_and_leaders(self):
+        cfg = load_config(
+            overrides={"agents": self._agents(9), "topology": {"type": "hierarchical", "cluster_size": 3}}
+        )
+        t = build_topology(cfg)
+        ids = [f"a{i}" for i in range(9)]
+        peers = t.assign_peers(ids, round_idx=0)
+        self.assertEqual(peers["a1"], ["a0", "a2"])
+        self.assertEqual(set(peers["a0"]), {"a1", "a2", "a3", "a6"})
+        rotated = t.assign_peers(ids, round_idx=1)
+        self.assertEqual(set(rotated["a1"]), {"a0", "a2", "a4", "a7"})
+
+    def test_adaptive_shows_top_answers_plus_exploration(self):
+        cfg = load_config(
+            overrides={"agents": self._agents(8), "topology": {"type": "adaptive", "k": 2, "explore": 1, "seed": 3}}
+        )
+        t = build_topology(cfg)
+        ids = [f"a{i}" for i in range(8)]
+        holders = {"A": ["a0", "a1"], "B": ["a2", "a3"], "C": ["a4"], "D": ["a5"], "E": ["a6", "a7"]}
+        owner = {agent: ans for ans, agents in holders.items() for agent in agents}
+        t.observe_debate({"A": 9.0, "B": 7.0, "C": 5.0, "D": 1.0, "E": 0.5}, holders)
+        peers = t.assign_peers(ids, round_idx=1)
+        for a in ids:
+            seen = [owner[p] for p in peers[a]]
+            self.assertNotIn(a, peers[a])
+            self.assertEqual(len(seen), 3)
+            expected_top = [ans for ans in ("A", "B", "C") if ans != owner[a]][:2]
+            self.assertEqual(seen[:2], expected_top)
+            self.assertIn(seen[2], {"C", "D", "E"} - {owner[a]} - set(expected_top))
+        info = t.info()
+        self.assertEqual([row["answer_id"] for row in info["ranked"]], ["A", "B", "C"])
+        self.assertTrue(set(info["explored"]) <= {"C", "D", "E"})
+
 
 if __name__ == "__main__":  # pragma: no cover
     unittest.main()
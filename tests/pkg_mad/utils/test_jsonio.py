@@ -0,0 +1,75 @@
+import json
+import os
+import subprocess
+import sys
+import unittest
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+
+from freemad import RunEvent, RunEventKind
+from freemad.types import RoundType
+from freemad.utils import jsonio
+
+
+class TestJsonIO(unittest.TestCase):
+    def test_round_trip_matches_stdlib(self):
+        obj = {"b": [1, 2.5, None, True], "a": {"x": "ünï", "y": []}, "3": (1, 2)}
+        text = jsonio.dumps(obj, sort_keys=True)
+        self.assertEqual(jsonio.loads(text), json.loads(json.dumps(obj, sort_keys=True)))
+        self.assertLess(text.index('"3"'), text.index('"a"'))
+        self.assertEqual(jsonio.loads(jsonio.dumps_bytes(obj)), jsonio.loads(text))
+        self.assertEqual(jsonio.loads(jsonio.dumps({3: "int key"})), {"3": "int key"})
+
+    def test_indent_pretty_prints(self):
+        self.assertEqual(jsonio.dumps({"a": [1]}, indent=True), json.dumps({"a": [1]}, indent=2))
+
+    def test_stdlib_fallbacks(self):
+        big = {"n": 2**80}
+        self.assertEqual(jsonio.loads(jsonio.dumps(big)), big)
+        self.assertTrue(str(jsonio.loads("[NaN]")[0]) == "nan")
+        with self.assertRaises(json.JSONDecodeError):
+            jsonio.loads("{not json")
+
+    def test_non_finite_floats_match_stdlib(self):
+        obj = {"a": [1.0, float("nan")], "b": float("inf"), "c": None}
+        self.assertEqual(jsonio.dumps(obj), json.dumps(obj))
+        self.assertEqual(jsonio.dumps_bytes([float("-inf")]), b"[-Infinity]")
+
+    def test_dataclasses_and_datetimes_match_stdlib(self):
+        @dataclass
+        class Point:
+            x: int
+
+        for value in (Point(1), datetime(2026, 1, 2, 3, 4, 5)):
+            with self.assertRaises(TypeError):
+                json.dumps({"v": value})
+            if jsonio.BACKEND != "msgspec":  # msgspec encodes both natively (documented)
+                with self.assertRaises(TypeError):
+                    jsonio.dumps({"v": value})
+        self.assertEqual(jsonio.loads(jsonio.dumps({"v": Point(1)}, default=vars)), {"v": {"x": 1}})
+        stamp = [datetime(2026, 1, 2)]
+        self.assertEqual(jsonio.dumps(stamp, default=str), json.dumps(stamp, default=str))
+
+    def test_encode_event_matches_to_dict(self):
+        ev = RunEvent(
+            kind=RunEventKind.ROUND_STARTED, run_id="r", ts_ms=1, round_index=1, round_type=RoundType.CRITIQUE
+        )
+        self.assertEqual(json.loads(jsonio.encode(ev, wrap="event")), {"event": ev.to_dict()})
+        self.assertEqual(json.loads(jsonio.encode(ev)), ev.to_dict())
+
+    def test_backend_can_be_forced_to_stdlib(self):
+        root = Path(__file__).resolve().parents[3]
+        out = subprocess.run(
+            [sys.executable, "-c", "from freemad.utils import jsonio; print(jsonio.BACKEND, jsonio.dumps({'a': 1}))"],
+            cwd=root,
+            env={**os.environ, "FREEMAD_JSON_BACKEND": "stdlib"},
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        self.assertEqual(out.stdout.strip(), 'stdlib {"a": 1}')
+
+
+if __name__ == "__main__":  # pragma: no cover
+    unittest.main()
@@ -2,11 +2,14 @@ from __future__ import annotations
 
 import json
 import logging
+import logging.handlers
 import tempfile
+import threading
 
 from freemad import Config, ConfigError
 from freemad.config import load_config
-from freemad.utils.logger import get_logger, log_event, RedactionFilter
+from freemad.utils import logger as logger_mod
+from freemad.utils.logger import flush_logs, get_logger, log_event, RedactionFilter
 from freemad.types import LogEvent
 
 
@@ -28,6 +31,7 @@ def test_structured_logging_and_redaction(tmp_path) -> None:
     )
     logger = _fresh_logger(cfg)
     log_event(logger, LogEvent.RUN_START, secret="secret123", visible="ok")
+    flush_logs()
     text = log_file.read_text(encoding="utf-8")
     data = json.loads(text)
     # redaction filter should scrub "secret"
@@ -44,6 +48,69 @@ def test_plain_logging_includes_event_label(tmp_path) -> None:
     )
     logger = _fresh_logger(cfg)
     log_event(logger, LogEvent.RUN_START, run_id="abc")
+    flush_logs()
     text = log_file.read_text(encoding="utf-8")
     assert "[run_start]" in text
     assert "run_id=abc" in text
+
+
+def test_disabled_level_skips_formatting(tmp_path) -> None:
+    log_file = tmp_path / "out.log"
+    cfg = load_config(overrides={"logging": {"file": str(log_file), "console": False, "level": "INFO"}})
+    logger = _fresh_logger(cfg)
+
+    class _Loud:
+        def __str__(self) -> str:  # pragma: no cover - must not be called
+            raise AssertionError("formatted a disabled DEBUG event")
+
+    log_event(logger, LogEvent.COMMAND, level=logging.DEBUG, stdout=_Loud())
+    flush_logs()
+    assert log_file.read_text(encoding="utf-8") == ""
+
+
+def test_long_fields_are_bounded_and_redacted_once(tmp_path) -> None:
+    log_file = tmp_path / "out.log"
+    cfg = load_config(
+        overrides={
+            "logging": {"file": str(log_file), "console": False, "max_field_chars": 50},
+            "security": {"redact_patterns": [r"sk-[A-Za-z0-9]+", r"(?i)api[_-]?key=\S+"]},
+        }
+    )
+    logger = _fresh_logger(cfg)
+    log_event(logger, LogEvent.COMMAND, stdout="sk-abc API_KEY=xyz " + "x" * 500)
+    flush_logs()
+    text = log_file.read_text(encoding="utf-8")
+    assert "sk-abc" not in text and "xyz" not in text
+    assert text.count("[REDACTED]") == 2
+    assert "chars truncated]" in text
+    assert len(text) < 200
+
+
+def test_records_are_written_off_the_calling_thread(tmp_path) -> None:
+    log_file = tmp_path / "out.log"
+    cfg = load_config(overrides={"logging": {"file": str(log_file), "console": False}})
+    logger = _fresh_logger(cfg)
+    assert [type(h) for h in logger.handlers] == [logging.handlers.QueueHandler]
+    writers = []
+    sink = logging.Handler()
+    sink.emit = lambda record: writers.append(threading.current_thread())  # type: ignore[method-assign]
+    listener = logger_mod._LISTENERS["freemad"]
+    listener.handlers = (*listener.handlers, sink)
+    log_event(logger, LogEvent.RUN_START, run_id="abc")
+    flush_logs()
+    assert writers and writers[0] is not threading.current_thread()
+    assert "run_id=abc" in log_file.read_text(encoding="utf-8")
+
+
+def test_log_file_rotates_by_size(tmp_path) -> None:
+    log_file = tmp_path / "out.log"
+    cfg = load_config(
+        overrides={"logging": {"file": str(log_file), "console": False, "max_bytes": 200, "backup_count": 2}}
+    )
+    logger = _fresh_logger(cfg)
+    for i in range(20):
+        log_event(logger, LogEvent.RUN_START, run_id=f"run-{i:02d}")
+    flush_logs()
+    assert (tmp_path / "out.log.1").exists()
+    assert not (tmp_path / "out.log.3").exists()
+    assert "run-19" in log_file.read_text(encoding="utf-8")
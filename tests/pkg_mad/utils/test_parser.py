@@ -2,7 +2,8 @@ import unittest
 
 from freemad import parse_generation, parse_critique
 from freemad import Decision
-from freemad import canonicalize_solution, compute_answer_id
+from freemad import CanonicalizationMode, canonicalize_solution, compute_answer_id
+from freemad import ConfigError, load_config
 
 
 class TestParser(unittest.TestCase):
@@ -116,6 +117,37 @@ console.log('B')
 ```
 """))
 
+    def test_unterminated_and_bad_header_fences_are_ignored(self):
+        self.assertEqual(canonicalize_solution("```py thing\nx\n```"), "```py thing\nx\n```")
+        self.assertEqual(canonicalize_solution("````python\nx = 1\n```"), "x = 1")
+        self.assertEqual(canonicalize_solution("```python\nx = 1"), "```python\nx = 1")
+
+
+class TestCanonicalizationModes(unittest.TestCase):
+    def test_exact_keeps_whitespace_differences(self):
+        self.assertNotEqual(compute_answer_id("a  \nb"), compute_answer_id("a\nb"))
+
+    def test_whitespace_mode_ignores_trailing_spaces_and_blank_lines(self):
+        mode = CanonicalizationMode.WHITESPACE
+        self.assertEqual(compute_answer_id("a  \n\n\n\nb\t\n\n", mode), compute_answer_id("a\n\nb", mode))
+        # indentation is meaningful and kept
+        self.assertNotEqual(compute_answer_id("if x:\n    a", mode), compute_answer_id("if x:\na", mode))
+
+    def test_python_ast_mode_ignores_formatting_and_comments(self):
+        mode = CanonicalizationMode.PYTHON_AST
+        a = "```python\ndef f(x):\n    # add one\n    return (x+1)\n```"
+        b = "```python\ndef f( x ):\n\n    return x + 1\n```"
+        self.assertEqual(compute_answer_id(a, mode), compute_answer_id(b, mode))
+        self.assertNotEqual(compute_answer_id(a), compute_answer_id(b))
+        # prose falls back to whitespace normalization
+        self.assertEqual(canonicalize_solution("not python  \n", mode), "not python")
+
+    def test_config_flag(self):
+        cfg = load_config(overrides={"scoring": {"canonicalization": "whitespace"}})
+        self.assertEqual(cfg.scoring.canonicalization, CanonicalizationMode.WHITESPACE)
+        with self.assertRaises(ConfigError):
+            load_config(overrides={"scoring": {"canonicalization": "fuzzy"}})
+
 
 if __name__ == "__main__":  # pragma: no cover
     unittest.main()
@@ -0,0 +1,154 @@
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+import unittest
+from pathlib import Path
+
+from freemad import gc_transcripts, read_transcript
+from freemad.config import ConfigError, RetentionConfig, load_config
+from freemad.utils.retention import INDEX_FILE, LOCK_FILE, delete_run, gc_cache, refresh_index
+
+_DAY = 86400.0
+NOW = time.mktime((2026, 3, 10, 12, 0, 0, 0, 0, -1))
+
+
+def _name(age_days: float) -> str:
+    return time.strftime("transcript-%Y%m%d-%H%M%S.json", time.localtime(NOW - age_days * _DAY))
+
+
+def _write_run(root: Path, age_days: float, final: str = "a1", pad: int = 0) -> Path:
+    """A run whose file-name timestamp (what retention ages by) is `age_days` before NOW."""
+    path = root / _name(age_days)
+    data = {"final_answer_id": final, "winning_agents": ["x"], "scores": {final: 1.0}, "transcript": [{}, {}], "pad": "z" * pad}
+    path.write_text(json.dumps(data), encoding="utf-8")
+    return path
+
+
+class TestTranscriptRetention(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self._tmp.name)
+
+    def tearDown(self) -> None:
+        self._tmp.cleanup()
+
+    def test_old_runs_are_archived_and_still_readable(self) -> None:
+        old = _write_run(self.root, age_days=37, final="old").name  # 2026-02-01
+        new = _write_run(self.root, age_days=1, final="new").name
+        report = gc_transcripts(self.root, RetentionConfig(archive_after_days=7), now=NOW)
+
+        self.assertEqual(report.archived, [old])
+        self.assertFalse((self.root / old).exists())
+        self.assertTrue((self.root / "archive" / "transcripts-202602.zip").exists())
+        data = read_transcript(self.root, old)
+        assert data is not None
+        self.assertEqual(json.loads(data)["final_answer_id"], "old")
+
+        runs = refresh_index(self.root)
+        self.assertEqual(runs[old]["archive"], "archive/transcripts-202602.zip")
+        self.assertEqual(runs[old]["final_answer_id"], "old")
+        self.assertIsNone(runs[new]["archive"])
+        self.assertEqual(report.runs, 2)
+
+    def test_max_loose_archives_oldest_first(self) -> None:
+        names = [_write_run(self.root, age_days=age).name for age in (3, 2, 1)]
+        report = gc_transcripts(self.root, RetentionConfig(archive_after_days=None, max_loose=1), now=NOW)
+        self.assertEqual(report.archived, names[:2])
+        self.assertTrue((self.root / names[2]).exists())
+
+    def test_deletion_by_age_count_and_bytes(self) -> None:
+        names = [_write_run(self.root, age_days=age, pad=1000).name for age in (40, 20, 10, 5, 1)]
+        events = self.root / "events"
+        events.mkdir()
+        old_log = events / "old-run.jsonl"
+        old_log.write_text("{}\n", encoding="utf-8")
+        os.utime(old_log, (NOW - 60 * _DAY, NOW - 60 * _DAY))
+        (events / "new-run.jsonl").write_text("{}\n", encoding="utf-8")
+
+        retention = RetentionConfig(archive_after_days=None, max_loose=None, delete_after_days=30, max_runs=3)
+        dry = gc_transcripts(self.root, retention, now=NOW, dry_run=True)
+        self.assertEqual(dry.deleted, names[:2])  # 40 days old; oldest beyond max_runs
+        self.assertTrue((self.root / names[0]).exists())
+        self.assertTrue(old_log.exists())
+
+        report = gc_transcripts(self.root, retention, now=NOW)
+        self.assertEqual(report.deleted, dry.deleted)
+        self.assertEqual(report.event_logs_deleted, ["old-run.jsonl"])
+        self.assertEqual(report.runs, 3)
+
+        size = (self.root / names[4]).stat().st_size
+        capped = gc_transcripts(self.root, RetentionConfig(archive_after_days=None, max_bytes=size * 2), now=NOW)
+        self.assertEqual(capped.deleted, [names[2]])
+        self.assertLessEqual(capped.bytes_after, size * 2)
+        self.assertEqual(sorted(refresh_index(self.root)), names[3:])
+
+    def test_delete_archived_run_and_drop_empty_archive(self) -> None:
+        name = _write_run(self.root, age_days=60).name  # 2026-01-09
+        gc_transcripts(self.root, RetentionConfig(), now=NOW)
+        self.assertTrue(delete_run(self.root, name))
+        self.assertFalse((self.root / "archive" / "transcripts-202601.zip").exists())
+        self.assertFalse(delete_run(self.root, name))
+        self.assertIsNone(read_transcript(self.root, name))
+        self.assertEqual(refresh_index(self.root), {})
+
+    def test_index_only_rereads_changed_files_and_can_be_rebuilt(self) -> None:
+        path = _write_run(self.root, age_days=1, final="first")
+        self.assertEqual(refresh_index(self.root)[path.name]["final_answer_id"], "first")
+        stored = json.loads((self.root / INDEX_FILE).read_text(encoding="utf-8"))
+        stored["runs"][path.name]["final_answer_id"] = "from-index"
+        (self.root / INDEX_FILE).write_text(json.dumps(stored), encoding="utf-8")
+        self.assertEqual(refresh_index(self.root)[path.name]["final_answer_id"], "from-index")  # unchanged file
+        self.assertEqual(refresh_index(self.root, rebuild=True)[path.name]["final_answer_id"], "first")
+
+        path.write_text(json.dumps({"final_answer_id": "second"}), encoding="utf-8")
+        self.assertEqual(refresh_index(self.root)[path.name]["final_answer_id"], "second")
+        (self.root / INDEX_FILE).write_text("not json", encoding="utf-8")
+        self.assertEqual(refresh_index(self.root)[path.name]["final_answer_id"], "second")
+
+    @unittest.skipIf(sys.platform == "win32", "the lock file needs fcntl")
+    def test_gc_waits_for_another_process_holding_the_lock(self) -> None:
+        name = _write_run(self.root, age_days=37).name
+        holder = (
+            "import fcntl, sys, time\n"
+            "fh = open(sys.argv[1], 'ab'); fcntl.flock(fh, fcntl.LOCK_EX)\n"
+            "print('locked', flush=True); time.sleep(0.5)"
+        )
+        proc = subprocess.Popen(
+            [sys.executable, "-c", holder, str(self.root / LOCK_FILE)], stdout=subprocess.PIPE, text=True
+        )
+        try:
+            assert proc.stdout is not None
+            self.assertEqual(proc.stdout.readline().strip(), "locked")
+            started = time.monotonic()
+            report = gc_transcripts(self.root, RetentionConfig(archive_after_days=7), now=NOW)
+            self.assertGreaterEqual(time.monotonic() - started, 0.3)
+        finally:
+            proc.communicate()
+        self.assertEqual(report.archived, [name])
+        self.assertEqual([p.name for p in (self.root / "archive").iterdir()], ["transcripts-202602.zip"])
+
+    def test_cache_gc_by_age_then_lru_bytes(self) -> None:
+        cache = self.root / "cache"
+        cache.mkdir()
+        for i, age in enumerate((40, 3, 2, 1)):
+            p = cache / f"{i}.json"
+            p.write_text('{"raw": "' + "x" * 90 + '"}', encoding="utf-8")
+            os.utime(p, (NOW - age * _DAY, NOW - age * _DAY))
+        size = (cache / "0.json").stat().st_size
+        report = gc_cache(cache, RetentionConfig(cache_max_age_days=30, cache_max_bytes=size * 2), now=NOW)
+        self.assertEqual(report.deleted, 2)
+        self.assertEqual(sorted(p.name for p in cache.iterdir()), ["2.json", "3.json"])
+
+    def test_retention_config_validation(self) -> None:
+        cfg = load_config(overrides={"retention": {"max_runs": 10, "archive_after_days": None}}, cache=False)
+        self.assertEqual(cfg.retention.max_runs, 10)
+        self.assertIsNone(cfg.retention.archive_after_days)
+        with self.assertRaises(ConfigError):
+            load_config(overrides={"retention": {"max_bytes": -1}}, cache=False)
+
+
+if __name__ == "__main__":  # pragma: no cover
+    unittest.main()
@@ -1,6 +1,6 @@
 import unittest
 
-from freemad import TokenBudget, BudgetExceeded
+from freemad import AgentBudgetLedger, TokenBudget, BudgetExceeded
 
 
 class TestTokenBudget(unittest.TestCase):
@@ -19,5 +19,40 @@ class TestTokenBudget(unittest.TestCase):
             tb.add(3)
 
 
+class TestAgentBudgetLedger(unittest.TestCase):
+    def test_agent_over_its_token_cap_is_not_admitted(self):
+        ledger = AgentBudgetLedger(["a1", "a2"], max_tokens=250)
+        for _ in range(2):
+            ledger.record_tokens("a1", 100)
+            ledger.record_tokens("a2", 10)
+        # a1 has 50 left but its calls cost 100 on average
+        self.assertEqual(ledger.admit(["a1", "a2"]), ["a2"])
+        self.assertEqual(ledger.remaining("a1"), {"tokens": 50})
+        ledger.record_skip("a1")
+        self.assertEqual(ledger.snapshot()["a1"]["skipped_rounds"], 1)
+
+    def test_time_cap_uses_mean_call_time(self):
+        ledger = AgentBudgetLedger(["a1"], max_time_sec=1.0)
+        ledger.record_tokens("a1", 0)
+        ledger.record_time("a1", 0.6)
+        self.assertEqual(ledger.admit(["a1"]), [])
+
+    def test_prefer_cheaper_fills_remaining_total_budget(self):
+        total = TokenBudget(max_total_tokens=300)
+        ledger = AgentBudgetLedger(["a1", "a2", "a3"], total=total, prefer_cheaper=True)
+        for aid, cost in (("a1", 100), ("a2", 20), ("a3", 50)):
+            ledger.record_tokens(aid, cost)
+            total.add(cost)
+        # 130 tokens left: a2 (20) and a3 (50) fit, a1 (100) would overrun
+        self.assertEqual(ledger.admit(["a1", "a2", "a3"]), ["a2", "a3"])
+
+    def test_disabled_ledger_admits_everyone(self):
+        ledger = AgentBudgetLedger(["a1"], total=TokenBudget(None))
+        ledger.record_tokens("a1", 10**6)
+        self.assertFalse(ledger.enabled)
+        self.assertEqual(ledger.admit(["a1"]), ["a1"])
+        self.assertEqual(ledger.remaining("a1"), {})
+
+
 if __name__ == "__main__":  # pragma: no cover
     unittest.main()
@@ -0,0 +1,95 @@
+import base64
+import random
+from pathlib import Path
+
+import pytest
+
+from freemad import ConfigError, load_config, truncate_to_tokens
+from freemad.utils.tokens import (
+    ApproxTokenCounter,
+    BPETokenCounter,
+    CachedTokenCounter,
+    RegexTokenCounter,
+    get_token_counter,
+)
+
+
+def _write_vocab(path: Path, merges: list[bytes]) -> None:
+    tokens = [bytes([i]) for i in range(256)] + merges
+    lines = [f"{base64.b64encode(tok).decode()} {rank}" for rank, tok in enumerate(tokens)]
+    path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+
+
+def test_regex_counter_handles_words_code_and_cjk():
+    counter = RegexTokenCounter()
+    assert counter.count("the quick brown fox jumps") == 5
+    assert counter.count("") == 0
+    cjk = "多智能体辩论系统"
+    assert counter.count(cjk) == len(cjk)
+    assert counter.count(cjk) > ApproxTokenCounter().count(cjk)
+
+
+def test_piece_truncation_respects_limit():
+    counter = RegexTokenCounter()
+    text = " ".join(f"word{i}" for i in range(100))
+    cut = counter.truncate(text, 10)
+    assert counter.count(cut) <= 10
+    assert text.startswith(cut)
+    out, truncated = truncate_to_tokens(text, 10, label="prompt", counter=counter)
+    assert truncated and out.startswith(cut) and "[TRUNCATED at 10 tokens: prompt]" in out
+
+
+def test_bpe_counter_applies_merges_by_rank(tmp_path: Path):
+    vocab = tmp_path / "tiny.tiktoken"
+    _write_vocab(vocab, [b"ab", b"abc", b" abc"])
+    counter = BPETokenCounter(vocab)
+    assert counter.count("abc") == 1
+    assert counter.count("abc abc") == 2
+    assert counter.count("abd") == 2  # "ab" + "d"
+    assert counter.count("xyz") == 3
+
+
+def _naive_merge(ranks: dict[bytes, int], data: bytes) -> list[bytes]:
+    parts = [data[i : i + 1] for i in range(len(data))]
+    while len(parts) > 1:
+        pairs = [(ranks[a + b], i) for i, (a, b) in enumerate(zip(parts, parts[1:])) if a + b in ranks]
+        if not pairs:
+            break
+        _, i = min(pairs)
+        parts[i : i + 2] = [parts[i] + parts[i + 1]]
+    return parts
+
+
+def test_bpe_merge_matches_naive_greedy_merge(tmp_path: Path):
+    vocab = tmp_path / "tiny.tiktoken"
+    _write_vocab(vocab, [b"aa", b"ab", b"ba", b"aab", b"abab", b"aaaa", b"bab", b"abb"])
+    counter = BPETokenCounter(vocab)
+    rng = random.Random(7)
+    for _ in range(300):
+        data = bytes(rng.choice(b"ab") for _ in range(rng.randint(1, 40)))
+        assert counter._merge(data) == _naive_merge(counter._ranks, data)
+
+
+def test_cached_counter_and_config(tmp_path: Path):
+    calls = []
+
+    class Counting(ApproxTokenCounter):
+        def count(self, text: str) -> int:
+            calls.append(text)
+            return super().count(text)
+
+    cached = CachedTokenCounter(Counting())
+    assert cached.count("hello world") == cached.count("hello world")
+    assert len(calls) == 1
+
+    cfg = load_config()
+    assert get_token_counter(cfg.budget) is get_token_counter(cfg.budget)
+    assert get_token_counter(cfg.budget).name == "approx"
+    with pytest.raises(ConfigError):
+        load_config(overrides={"budget": {"token_counter": "bpe"}})
+    with pytest.raises(ConfigError):
+        load_config(overrides={"budget": {"token_counter": "words"}})
+    vocab = tmp_path / "tiny.tiktoken"
+    _write_vocab(vocab, [])
+    bpe_cfg = load_config(overrides={"budget": {"token_counter": "bpe", "token_vocab_path": str(vocab)}})
+    assert get_token_counter(bpe_cfg.budget).count("abc") == 3